@@ -1,22 +1,38 @@
 """리밸런싱 자동화 진입점.
 
 핵심 흐름 (자세한 다이어그램은 docs/ARCHITECTURE.md):
+0. Sheets(+allocation 시트)·BigQuery·KIS 클라이언트 동시 초기화 (src/startup.py)
 1. 실행 모드 결정 (ARCH-002):
    - --force: is_trading_day / is_already_executed 외부 호출 자체 스킵
    - --test:  is_already_executed만 스킵, 주문/BQ 적재 모두 미실행
    - 일반:    is_trading_day AND NOT is_already_executed
-2. run_id 발급 (uuid4 hex, ARCH-003) + BQ에 'started' marker 적재 (sentinel)
+2. run_id 발급 (uuid4 hex, ARCH-003) + run_state에 'started' 기록 (sentinel, src/run_state)
 3. StaticAllocator.run() — 일반 계좌는 매도→대기→매수 주문, IRP는 plan만 반환
-4. 결과 발송:
-   - 일반: format_rebalancing_summary(전·후 분모 분리, ARCH-006) + BigQuery 적재 + 'completed' marker
-   - IRP:  format_irp_plan_summary + Sheets {account_type}_action_plan 덮어쓰기 (BQ 미적재)
+4. 결과 발송 — Slack·Sheets·BigQuery sink 동시 실행 (src/sinks.py, sink별 재시도·마감):
+   - 일반: format_rebalancing_summary(전·후 분모 분리, ARCH-006) ∥ BigQuery 적재 → run_state 'completed'
+   - IRP:  format_irp_plan_summary ∥ Sheets {account_type}_action_plan 덮어쓰기 (BQ 미적재)
 
-좀비 run 자동 stale: started marker 30분 경과 후 completed/trade row가 없으면
-다음 cron이 자동 재시도 (BigQueryClient.is_already_executed 참조).
+멀티 계좌 배치 (--account_types ISA,PPA,IRP): 한 프로세스에서 Sheets 핸들·BigQuery 클라이언트·
+거래일 조회를 공유하고, 계좌별 StaticAllocator를 동시에 실행한 뒤 Slack 다이제스트 1건으로 발송한다.
+KIS app key는 계좌별이라 rate limit도 서로 독립. 계좌별 초기화(KIS 클라이언트·allocation 시트) 실패는
+그 계좌만 실패로 다이제스트에 싣고 나머지 계좌는 그대로 실행한다.
+
+크래시 재개: 일반 계좌 주문은 실행 저널(src/journal.py)에 기록되고, 결과 전달까지 끝나야 저널을 지운다.
+재시작 시 30분 안의 미완료 저널이 있으면 중복 실행 확인 없이 같은 run_id로 이어서 실행한다
+(기록된 계획 사용, 결과가 있는 주문은 재주문하지 않음).
+
+좀비 run 자동 stale: started 후 30분 경과해도 completed가 아니면 다음 cron이 자동 재시도
+(RunStateStore.is_already_executed 참조). 저장소는 RUN_STATE_BACKEND — BigQuery run_state 테이블
+(기본) 또는 로컬 SQLite.
 """
 import argparse
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+
+import pandas as pd
 import pytz
 from dotenv import load_dotenv
 load_dotenv()
@@ -25,98 +41,361 @@ from src.logger import get_logger
 from src.config.env import GOOGLE_SHEET_URL
 from src.sheets.client import GoogleSheetsClient
 from src.bigquery.client import BigQueryClient
+from src.kis.client import KISClient
+from src.run_state import RunStateStore, make_run_state_store
 from src.allocation import StaticAllocator
+from src.journal import ExecutionJournal, find_unfinished_journal, open_journal
+from src.sinks import Sink, dispatch
+from src.startup import init_concurrently
 from src.slack.client import slack_notify, format_rebalancing_summary, format_irp_plan_summary
 
 logger = get_logger(__name__)
 
+# 결과 sink별 재시도·마감. BigQuery는 결정적 job_id·insertId, Sheets는 덮어쓰기라 재시도해도 중복 없음.
+# Slack 발송은 멱등이 아니므로(응답 유실 후 재시도 = 같은 메시지 중복 게시) 재시도하지 않는다.
+_SINK_OPTIONS = {
+    'slack': {'max_attempts': 1, 'timeout_seconds': 60},
+    'sheets': {'max_attempts': 3, 'timeout_seconds': 120},
+    'bigquery': {'max_attempts': 3, 'timeout_seconds': 300},
+}
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
-    parser.add_argument('--account_type', type=str, required=True)
+    accounts = parser.add_mutually_exclusive_group(required=True)
+    accounts.add_argument('--account_type', type=str)
+    accounts.add_argument(
+        '--account_types', type=lambda v: [a.strip() for a in v.split(',') if a.strip()],
+        help='쉼표 구분 계좌 목록 (예: ISA,PPA,IRP) — 한 프로세스에서 동시 실행',
+    )
     parser.add_argument('--test', action='store_true', default=False)
     parser.add_argument('--force', action='store_true', default=False)
     return parser.parse_args()
 
 
-def main() -> None:
-    kst = pytz.timezone('Asia/Seoul')
-    kst_now = datetime.now(kst)
-    kst_date = kst_now.date()
-    args = _parse_args()
+@dataclass
+class _AccountRun:
+    """계좌 1건의 실행 결과. result가 None이면 실행 조건 불충족으로 스킵."""
+    account_type: str
+    is_irp: bool
+    run_id: Optional[str] = None
+    result: Optional[pd.DataFrame] = None
+    remaining_cash: int = 0
+    error: Optional[BaseException] = None
+    journal: Optional[ExecutionJournal] = None
 
+
+def _load_allocations(
+    account_types: list[str], errors: Optional[dict[str, BaseException]] = None,
+) -> tuple[GoogleSheetsClient, dict[str, pd.DataFrame]]:
+    """Sheets 클라이언트 생성 → 계좌별 allocation 시트 조회 (실제 의존 관계라 한 작업 안에서 순차 실행).
+
+    errors가 주어지면 계좌별 시트 조회 실패를 {account_type: 예외}로 모으고 나머지 계좌를 계속 조회한다
+    (배치 모드). None이면 첫 실패를 그대로 전파. Sheets 클라이언트 생성 실패는 항상 전파.
+    """
     gs_client = GoogleSheetsClient(url=GOOGLE_SHEET_URL)
-    bq_client = None if args.test else BigQueryClient()
+    allocations = {}
+    for account_type in account_types:
+        try:
+            allocation_info = gs_client.get_df_from_google_sheets(f'{account_type}_allocation')
+            allocation_info['ticker'] = allocation_info['ticker'].astype(str)
+            allocation_info['weight'] = allocation_info['weight'].astype(float)
+        except Exception as e:
+            if errors is None:
+                raise
+            logger.exception('[%s] allocation 시트 조회 실패', account_type)
+            errors[account_type] = e
+            continue
+        allocations[account_type] = allocation_info
+    return gs_client, allocations
 
-    allocation_info = gs_client.get_df_from_google_sheets(f'{args.account_type}_allocation')
-    allocation_info['ticker'] = allocation_info['ticker'].astype(str)
-    allocation_info['weight'] = allocation_info['weight'].astype(float)
 
-    allocator = StaticAllocator(account_type=args.account_type, allocation_info=allocation_info, is_test=args.test)
-    is_irp = allocator.planner.kis_client.is_irp()
+def _capture_error(factory: Callable[[], Any]) -> Callable[[], Any]:
+    """팩토리 예외를 결과값으로 바꾼다 — 계좌별 초기화 실패가 배치 전체 초기화를 중단시키지 않도록."""
+    def _factory() -> Any:
+        try:
+            return factory()
+        except Exception as e:
+            return e
+    return _factory
 
-    # ARCH-002: 실행 모드 결정을 외부 조회 앞으로 이동.
-    # --force 시에는 is_market_open / is_already_executed 외부 호출 자체를 건너뛴다.
-    # is_already_executed는 IRP일 때도 의미 없어 스킵 (BQ 거래 이력 부재 — cron으로 빈도 제어).
+
+def _check_market_open(args: argparse.Namespace, allocator: StaticAllocator, kst_date: date) -> bool:
+    """ARCH-002: --force면 거래일 조회 자체를 건너뛴다. --test는 정보 로깅용으로 조회."""
     if args.force:
-        is_market_open = True
-        already_executed = False
         logger.info('--force 모드: 외부 조건(is_market_open/is_already_executed) 무시하고 실행')
-    elif args.test:
-        is_market_open = allocator.is_trading_day(kst_date)
+        return True
+    is_market_open = allocator.is_trading_day(kst_date)
+    logger.info('is_market_open: %s', is_market_open)
+    return is_market_open
+
+
+def _check_already_executed(
+    args: argparse.Namespace, account_type: str, is_irp: bool, run_state: Optional[RunStateStore], kst_date: date,
+) -> bool:
+    """--force/--test는 스킵. IRP도 BQ 거래 이력이 없어 의미 없으므로 스킵 (cron으로 빈도 제어)."""
+    if args.force or args.test:
+        already_executed = False
+    elif is_irp:
         already_executed = False
+        logger.info('IRP 계좌: is_already_executed 체크 스킵 (BQ 거래 이력 부재). cron으로 빈도 제어.')
     else:
-        is_market_open = allocator.is_trading_day(kst_date)
-        if is_irp:
-            already_executed = False
-            logger.info('IRP 계좌: is_already_executed 체크 스킵 (BQ 거래 이력 부재). cron으로 빈도 제어.')
-        else:
-            already_executed = bq_client.is_already_executed(args.account_type, kst_date)
+        already_executed = run_state.is_already_executed(account_type, kst_date)
+    logger.info('[%s] is_already_executed: %s', account_type, already_executed)
+    return already_executed
 
-    logger.info('is_market_open: %s', is_market_open)
-    logger.info('is_already_executed: %s', already_executed)
-
-    if args.test or args.force or (is_market_open and not already_executed):
-        # ARCH-003: 실행 단위 식별자(run_id)를 발급해 BQ에 marker + trade_log 모두 동일 그룹으로 묶는다.
-        run_id = uuid.uuid4().hex
-        logger.info('run_id 발급: %s (account_type=%s)', run_id, args.account_type)
-
-        # 주문 시작 sentinel: BQ에 'started' marker 적재 → 이후 크래시해도 다음 실행이 이 marker로 중복 인지.
-        # IRP·is_test는 BQ 적재 없으므로 marker도 스킵.
-        if bq_client is not None and not is_irp:
-            bq_client.append_run_marker(run_id, args.account_type, status='started')
-
-        result, remaining_cash = allocator.run()
-
-        if is_irp:
-            # IRP: 플랜만 생성됨. Sheets에 IRP_action_plan으로 덮어쓰기, BigQuery 적재 스킵.
-            sheet_name = f'{args.account_type}_action_plan'
-            gs_client.overwrite_dataframe(sheet_name, result)
-            sheet_url = gs_client.get_worksheet_url(sheet_name)
-            logger.info('IRP plan written to %s sheet', sheet_name)
-
-            summary = format_irp_plan_summary(
-                plan_df=result,
-                account_type=args.account_type,
-                dt=kst_now,
-                sheet_url=sheet_url,
-            )
-            slack_notify(f'[{args.account_type}] IRP 리밸런싱 플랜 생성', summary)
-        else:
-            trade_log_url = gs_client.get_worksheet_url(f'{args.account_type}_trade_log')
-            summary = format_rebalancing_summary(
-                result_df=result,
-                remaining_cash=remaining_cash,
-                account_type=args.account_type,
-                dt=kst_now,
-                trade_log_url=trade_log_url,
+
+def _execute_account(
+    args: argparse.Namespace,
+    account_type: str,
+    allocator: StaticAllocator,
+    run_state: Optional[RunStateStore],
+    kst_date: date,
+    is_market_open: bool,
+) -> _AccountRun:
+    """중복 실행 확인 → started marker → StaticAllocator.run(). 결과 발송·적재는 호출부 담당.
+
+    미완료 실행 저널이 있으면(직전 실행 크래시) 중복 실행 확인·started 기록 없이 그 run_id로 재개한다.
+    """
+    is_irp = allocator.planner.kis_client.is_irp()
+    run = _AccountRun(account_type=account_type, is_irp=is_irp)
+    # 주문이 없는 --test·IRP는 저널도 없음.
+    uses_journal = not args.test and not is_irp
+    if uses_journal and (args.force or is_market_open):
+        run.journal = find_unfinished_journal(account_type)
+    if run.journal is not None:
+        run.run_id = run.journal.run_id
+        logger.info('[%s] 미완료 저널 재개: run_id=%s', account_type, run.run_id)
+        run.result, run.remaining_cash = allocator.run(journal=run.journal)
+        return run
+
+    already_executed = _check_already_executed(args, account_type, is_irp, run_state, kst_date)
+    if not (args.test or args.force or (is_market_open and not already_executed)):
+        return run
+
+    # ARCH-003: 실행 단위 식별자(run_id)를 발급해 run_state 행 + trade_log 모두 동일 그룹으로 묶는다.
+    run.run_id = uuid.uuid4().hex
+    logger.info('run_id 발급: %s (account_type=%s)', run.run_id, account_type)
+
+    # 주문 시작 sentinel: run_state에 'started' 기록 → 이후 크래시해도 다음 실행이 이 행으로 중복 인지.
+    # IRP·is_test는 BQ 적재 없으므로 sentinel도 스킵.
+    if run_state is not None and not is_irp:
+        run_state.mark_run(run.run_id, account_type, status='started')
+
+    if uses_journal:
+        run.journal = open_journal(account_type, run.run_id)
+    run.result, run.remaining_cash = allocator.run(journal=run.journal)
+    return run
+
+
+def _write_action_plan(run: _AccountRun, gs_client: GoogleSheetsClient) -> None:
+    """IRP: 플랜만 생성됨. Sheets에 {account_type}_action_plan으로 덮어쓰기 (BigQuery 적재 스킵)."""
+    sheet_name = f'{run.account_type}_action_plan'
+    gs_client.overwrite_dataframe(sheet_name, run.result)
+    logger.info('IRP plan written to %s sheet', sheet_name)
+
+
+def _summarize(run: _AccountRun, gs_client: GoogleSheetsClient, kst_now: datetime) -> tuple[str, str]:
+    """실행 결과를 Slack (제목, 본문)으로 만든다."""
+    if run.is_irp:
+        # action_plan 탭 URL. 탭이 처음 만들어지는 실행에서는 스프레드시트 기본 URL.
+        sheet_url = gs_client.get_worksheet_url(f'{run.account_type}_action_plan')
+        summary = format_irp_plan_summary(
+            plan_df=run.result,
+            account_type=run.account_type,
+            dt=kst_now,
+            sheet_url=sheet_url,
+        )
+        return f'[{run.account_type}] IRP 리밸런싱 플랜 생성', summary
+
+    trade_log_url = gs_client.get_worksheet_url(f'{run.account_type}_trade_log')
+    summary = format_rebalancing_summary(
+        result_df=run.result,
+        remaining_cash=run.remaining_cash,
+        account_type=run.account_type,
+        dt=kst_now,
+        trade_log_url=trade_log_url,
+    )
+    return f'[{run.account_type}] 리밸런싱 완료', summary
+
+
+def _persist(run: _AccountRun, bq_client: Optional[BigQueryClient], run_state: Optional[RunStateStore]) -> None:
+    """일반 계좌 trade_log 적재 + run_state completed. IRP·--test는 적재 없음.
+
+    재시도 안전: trade_log는 run_id로 만든 load job ID, completed는 insertId로 중복 적재를 막는다.
+    """
+    if run.is_irp or bq_client is None:
+        return
+    bq_client.append_trade_log(
+        run.result, account_type=run.account_type, run_id=run.run_id, job_id=f'trade_log_{run.run_id}',
+    )
+    # 완료 sentinel — 같은 run_id를 started → completed로
+    if run_state is not None:
+        run_state.mark_run(run.run_id, run.account_type, status='completed')
+
+
+def _deliver(
+    runs: list[_AccountRun],
+    gs_client: GoogleSheetsClient,
+    bq_client: Optional[BigQueryClient],
+    run_state: Optional[RunStateStore],
+    kst_now: datetime,
+    digest_title: Optional[str] = None,
+) -> list[BaseException]:
+    """실행 결과를 Slack·Sheets·BigQuery sink로 동시에 전달하고, 실패 목록을 반환한다 (전파는 호출부).
+
+    digest_title이 None이면 단일 계좌(runs[0]) 메시지, 있으면 계좌별 section을 모은 다이제스트 1건.
+    """
+    delivered = [run for run in runs if run.error is None and run.result is not None]
+    if not delivered and all(run.error is None for run in runs):
+        return []
+    summary_errors: dict[str, BaseException] = {}
+
+    def _slack() -> None:
+        if digest_title is None:
+            slack_notify(*_summarize(delivered[0], gs_client, kst_now), raise_errors=True)
+            return
+        sections = []
+        for run in runs:
+            error = run.error
+            if error is None and run.result is not None:
+                try:
+                    sections.append(_summarize(run, gs_client, kst_now)[1])
+                    continue
+                except Exception as e:
+                    logger.exception('[%s] 결과 요약 실패', run.account_type)
+                    error = summary_errors[run.account_type] = e
+            if error is not None:
+                sections.append(f'*[{run.account_type}] 리밸런싱 실패* — `{type(error).__name__}: {error}`')
+        slack_notify(digest_title, sections, raise_errors=True)
+
+    def _sheets() -> None:
+        for run in plans:
+            _write_action_plan(run, gs_client)
+
+    def _bigquery() -> None:
+        for run in trades:
+            _persist(run, bq_client, run_state)
+
+    plans = [run for run in delivered if run.is_irp]
+    trades = [run for run in delivered if not run.is_irp]
+    sinks = [Sink('slack', _slack, **_SINK_OPTIONS['slack'])]
+    if plans:
+        sinks.append(Sink('sheets', _sheets, **_SINK_OPTIONS['sheets']))
+    if trades and bq_client is not None:
+        sinks.append(Sink('bigquery', _bigquery, **_SINK_OPTIONS['bigquery']))
+    outcomes = dispatch(sinks)
+    return list(summary_errors.values()) + [outcome.error for outcome in outcomes.values() if not outcome.ok]
+
+
+def _run_single(args: argparse.Namespace, kst_now: datetime) -> None:
+    kst_date = kst_now.date()
+
+    # Sheets(+allocation 시트) / BigQuery / KIS 토큰은 서로 독립 → 동시 초기화 후 planner 생성 시점에 합류.
+    clients = init_concurrently({
+        'sheets': lambda: _load_allocations([args.account_type]),
+        'bigquery': None if args.test else BigQueryClient,
+        'kis': lambda: KISClient(args.account_type),
+    })
+    gs_client, allocations = clients['sheets']
+    bq_client = clients['bigquery']
+    run_state = None if args.test else make_run_state_store(bq_client)
+
+    allocator = StaticAllocator(
+        account_type=args.account_type, allocation_info=allocations[args.account_type], is_test=args.test,
+        kis_client=clients['kis'],
+    )
+
+    # ARCH-002: 실행 모드 결정을 외부 조회 앞으로 이동.
+    # --force 시에는 is_market_open / is_already_executed 외부 호출 자체를 건너뛴다.
+    is_market_open = _check_market_open(args, allocator, kst_date)
+    run = _execute_account(args, args.account_type, allocator, run_state, kst_date, is_market_open)
+    if run.result is None:
+        return
+
+    errors = _deliver([run], gs_client, bq_client, run_state, kst_now)
+    if errors:
+        raise errors[0]
+    if run.journal is not None:
+        run.journal.complete()
+
+
+def _run_batch(args: argparse.Namespace, kst_now: datetime) -> None:
+    """여러 계좌를 한 프로세스에서 실행: 공유 클라이언트 + 계좌별 동시 실행 + Slack 다이제스트 1건."""
+    kst_date = kst_now.date()
+    account_types = list(dict.fromkeys(args.account_types))
+    logger.info('멀티 계좌 배치 실행: %s', account_types)
+
+    # 공유 클라이언트(Sheets·BigQuery) 실패는 전체 중단, 계좌별(KIS·allocation 시트) 실패는 그 계좌만 실패로 수집.
+    init_errors: dict[str, BaseException] = {}
+    factories = {
+        'sheets': lambda: _load_allocations(account_types, errors=init_errors),
+        'bigquery': None if args.test else BigQueryClient,
+    }
+    for account_type in account_types:
+        factories[f'kis:{account_type}'] = _capture_error(lambda a=account_type: KISClient(a))
+    clients = init_concurrently(factories)
+    gs_client, allocations = clients['sheets']
+    bq_client = clients['bigquery']
+    run_state = None if args.test else make_run_state_store(bq_client)
+
+    allocators: dict[str, StaticAllocator] = {}
+    for account_type in account_types:
+        kis_client = clients[f'kis:{account_type}']
+        if isinstance(kis_client, BaseException):
+            logger.error('[%s] KIS 클라이언트 초기화 실패: %r', account_type, kis_client)
+            init_errors.setdefault(account_type, kis_client)
+        if account_type in init_errors:
+            continue
+        try:
+            allocators[account_type] = StaticAllocator(
+                account_type=account_type, allocation_info=allocations[account_type], is_test=args.test,
+                kis_client=kis_client,
             )
-            slack_notify(f'[{args.account_type}] 리밸런싱 완료', summary)
+        except Exception as e:
+            logger.exception('[%s] StaticAllocator 생성 실패', account_type)
+            init_errors[account_type] = e
+    # 거래일은 계좌와 무관 → 초기화에 성공한 첫 계좌 클라이언트로 1회만 조회.
+    is_market_open = bool(allocators) and _check_market_open(args, next(iter(allocators.values())), kst_date)
+
+    def _execute(account_type: str) -> _AccountRun:
+        if account_type in init_errors:
+            # 초기화 실패 계좌는 KIS 클라이언트가 없을 수 있어 IRP 여부를 알 수 없다 — 결과가 없어 분기에 쓰이지 않음.
+            return _AccountRun(account_type=account_type, is_irp=False, error=init_errors[account_type])
+        allocator = allocators[account_type]
+        try:
+            return _execute_account(args, account_type, allocator, run_state, kst_date, is_market_open)
+        except Exception as e:
+            # 한 계좌 실패가 다른 계좌 주문·적재를 막지 않도록 결과로 수집 후 마지막에 전파.
+            logger.exception('[%s] 리밸런싱 실패', account_type)
+            return _AccountRun(account_type=account_type, is_irp=allocator.planner.kis_client.is_irp(), error=e)
+
+    with ThreadPoolExecutor(max_workers=len(account_types), thread_name_prefix='account') as pool:
+        runs = list(pool.map(_execute, account_types))
 
-            if bq_client is not None:
-                bq_client.append_trade_log(result, account_type=args.account_type, run_id=run_id)
-                # 완료 sentinel — 감사 흔적용 (started/completed 페어로 run 추적 가능)
-                bq_client.append_run_marker(run_id, args.account_type, status='completed')
+    errors = [run.error for run in runs if run.error is not None]
+    sink_errors = _deliver(
+        runs, gs_client, bq_client, run_state, kst_now, digest_title=f'[{",".join(account_types)}] 리밸런싱 결과',
+    )
+    # 결과 전달까지 끝난 계좌만 저널 종료. 실패 계좌 저널은 남겨 다음 실행이 재개.
+    if not sink_errors:
+        for run in runs:
+            if run.error is None and run.journal is not None:
+                run.journal.complete()
+    errors += sink_errors
+    if errors:
+        raise errors[0]
+
+
+def main() -> None:
+    kst = pytz.timezone('Asia/Seoul')
+    kst_now = datetime.now(kst)
+    args = _parse_args()
+
+    if args.account_types:
+        _run_batch(args, kst_now)
+    else:
+        _run_single(args, kst_now)
 
 
 if __name__ == '__main__':
@@ -10,11 +10,16 @@
 - IRP 분기: `kis_client.is_irp()`이면 executor 호출 자체를 스킵하고 plan_df만
   반환 (반환 시그니처는 `(plan_df, 0)` 동일 유지). main.py가 IRP plan을 Sheets
   `{account_type}_action_plan`으로 덮어쓴다.
+- `kis_client` 주입: main.py가 Sheets·BigQuery와 동시에 초기화한 KISClient를 넘기면
+  토큰 확인·발급을 다시 하지 않는다.
+- 실행 저널: `run(journal=...)`이면 계획을 저널에 기록하고, 재개 실행(저널에 계획이 이미 있음)은
+  다시 계획하지 않고 기록된 계획으로 executor를 이어서 실행한다.
 """
 from typing import Optional
 
 import pandas as pd
 
+from src.journal import ExecutionJournal
 from src.kis.client import KISClient
 from src.logger import get_logger, log_method_call
 from src.planner import PortfolioPlanner
@@ -40,7 +45,12 @@ class StaticAllocator:
         allocation_info: pd.DataFrame,
         is_test: bool = False,
         policy: Optional[ExecutionPolicy] = None,
+        kis_client: Optional[KISClient] = None,
     ) -> None:
+        """
+        Args:
+            kis_client: 미리 초기화된 KISClient (main.py 동시 초기화). None이면 여기서 생성.
+        """
         self.account_type = account_type
         self.allocation_info = allocation_info
         self.is_test = is_test
@@ -51,7 +61,7 @@ class StaticAllocator:
             self.policy.sell_to_buy_wait_seconds,
             self.policy.buy_cash_safety_ratio,
         )
-        kis_client = KISClient(account_type)
+        kis_client = kis_client or KISClient(account_type)
         self.planner = PortfolioPlanner(
             kis_client, allocation_info, account_type, policy=self.policy,
         )
@@ -63,20 +73,29 @@ class StaticAllocator:
         return self.planner.kis_client.is_trading_day(date)
 
     @log_method_call
-    def run(self) -> tuple[pd.DataFrame, int]:
+    def run(self, journal: Optional[ExecutionJournal] = None) -> tuple[pd.DataFrame, int]:
         """리밸런싱 전체 플로우를 실행하고 (플랜+결과 DataFrame, 잔여 예수금) 튜플을 반환한다.
 
         IRP(개인형 퇴직연금, postfix='29') 계좌는 KIS API로 자동 매매 불가 — 사용자가
         KIS 앱에서 수동으로 거래해야 하므로 거래 실행은 스킵하고 플랜만 반환한다.
         반환 시그니처는 동일 (plan_df, 0).
+
+        Args:
+            journal: 실행 저널. 기록된 계획이 있으면 재계획 없이 그 계획으로 이어서 실행.
         """
-        total_info = self.planner.get_rebalancing_plan()
+        if journal is not None and journal.plan is not None:
+            total_info = journal.plan
+            logger.info('저널 재개: 기록된 계획 사용 (run_id=%s)', journal.run_id)
+        else:
+            total_info = self.planner.get_rebalancing_plan()
+            if journal is not None:
+                journal.record_plan(total_info)
         logger.info('total_info:\n%s', total_info.to_string())
 
         if self.planner.kis_client.is_irp():
             logger.info('IRP 계좌: 자동 매매 불가 — executor 스킵, 플랜만 반환')
             return total_info, 0
 
-        trade_log, remaining_cash = self.executor.run_rebalancing(plan_df=total_info)
+        trade_log, remaining_cash = self.executor.run_rebalancing(plan_df=total_info, journal=journal)
         result = total_info.merge(trade_log, on='ticker', how='outer')
         return result, remaining_cash
@@ -0,0 +1,279 @@
+"""정적 자산배분 백테스트 (StaticAllocator 정책 재현).
+
+allocation 시트(ticker·weight)를 바꾸기 전에 과거 일별 종가로 같은 리밸런싱 규칙을 돌려 보고
+평가금액 곡선·회전율을 확인한다. 계획은 실거래와 같은 계산식(`planning_kernel`·`optimizer`·
+허용 범위)으로 세우고, 체결은 `OrderExecutor`의 규칙을 따른다.
+
+핵심 설계:
+- 계획: 리밸런싱일마다 그날 종가·보유 수량·예수금으로 `planning_kernel.compute_rebalance_arrays`와
+  `planning_kernel.apply_policy`(planner_mode='optimize'·drift band·min_trade_value)를 호출 → buffer_cash 차감
+  목표 금액·정수 수량·방향이 실거래 플래너와 같다. DataFrame을 만들지 않는 배열 경로라 일별
+  리밸런싱도 리밸런싱 1회당 수십 μs.
+- 체결: 종가 체결 가정. 매도 먼저(보유 수량 한도) → 매수는 계획 순서대로 잔여 현금 ×
+  buy_cash_safety_ratio 안에서 정수 수량 (executor의 잔여 현금 추적과 동일). 수수료·매도 세금 차감.
+- 매수 수량 단가: 실거래 executor는 시장가 매수 수량을 `psbl_qty_calc_unpr`(가능수량계산단가 =
+  기준가 기준 상한가)로 나눠 잡는다. `limit_up_sizing=True`(기본)면 전일 종가(첫날은 당일 종가)의
+  KRX 상한가(`price_rule.upper_limit_price`)로 수량 상한을 계산하고 체결은 종가로 한다 → 실거래처럼
+  잔여 현금이 남는다. False면 종가 × (1 + 수수료)로 나눠 실거래보다 현금을 더 많이 쓴다.
+- 현금: 예수금은 `prvs_rcdl_excc_amt`(D+2 예수금) 의미로 추적 — 당일 매도 대금이 바로 매수 재원과
+  총자산에 들어간다 (실거래 executor가 매도 대금 반영 후 매수하는 것과 같음). 결제 완료 현금
+  (D+0, `settled_cash`)은 거래일 기준 2영업일 뒤 반영으로 별도 계산해 함께 돌려준다.
+- 벡터화: 리밸런싱 사이에는 보유 수량이 고정이므로 일별 평가금액은 수량 행렬(리밸런싱일 값 ffill) ×
+  가격 행렬 한 번으로 계산한다. 루프는 리밸런싱일 수(월별이면 10년 120회)만큼만 돈다.
+- 가격 입력: 날짜 index × ticker 컬럼 종가 DataFrame. `load_yfinance_prices`는 yfinance로 받아 오는
+  선택 로더 (yfinance 지연 import — 백테스트 본체는 의존하지 않는다).
+"""
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.kis.price_rule import upper_limit_price
+from src.logger import get_logger
+from src.planning_kernel import apply_policy, compute_rebalance_arrays, needs_policy_pass, validate_weights
+from src.policy import DEFAULT_EXECUTION_POLICY, ExecutionPolicy
+
+logger = get_logger(__name__)
+
+# KRX 결제 주기 (T+2).
+SETTLEMENT_LAG_DAYS = 2
+TRADING_DAYS_PER_YEAR = 252
+_REBALANCE_FREQS = ('W', 'M', 'Q', 'Y')
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """백테스트 설정.
+
+    Attributes:
+        initial_cash: 시작 예수금(원).
+        rebalance: 리밸런싱 주기. 'W'/'M'/'Q'/'Y'는 각 기간의 첫 거래일, 정수 n은 n거래일마다.
+            첫 거래일(초기 매수)은 항상 리밸런싱.
+        fee_rate: 매수·매도 수수료율 (체결 금액 대비).
+        sell_tax_rate: 매도 거래세율 (국내 ETF는 0).
+        policy: 계획·체결에 쓰는 실행 정책 (buffer_cash·buy_cash_safety_ratio·planner_mode·허용 범위).
+        limit_up_sizing: True면 매수 수량 상한을 전일 종가 기준 상한가로 계산 (실거래
+            psbl_qty_calc_unpr와 같은 방식). False면 종가 × (1 + fee_rate) 기준 — 실거래보다 현금 사용이 많다.
+    """
+
+    initial_cash: int = 10_000_000
+    rebalance: Union[str, int] = 'M'
+    fee_rate: float = 0.00015
+    sell_tax_rate: float = 0.0
+    policy: ExecutionPolicy = field(default=DEFAULT_EXECUTION_POLICY)
+    limit_up_sizing: bool = True
+
+    def __post_init__(self) -> None:
+        if self.initial_cash <= self.policy.buffer_cash:
+            raise ValueError(f"initial_cash는 buffer_cash보다 커야 합니다: {self.initial_cash}")
+        if isinstance(self.rebalance, str):
+            if self.rebalance not in _REBALANCE_FREQS:
+                raise ValueError(f"rebalance는 {_REBALANCE_FREQS} 또는 양의 정수여야 합니다: {self.rebalance!r}")
+        elif not (isinstance(self.rebalance, int) and self.rebalance >= 1):
+            raise ValueError(f"rebalance는 {_REBALANCE_FREQS} 또는 양의 정수여야 합니다: {self.rebalance!r}")
+        if not (0.0 <= self.fee_rate < 0.1):
+            raise ValueError(f"fee_rate는 [0, 0.1) 범위여야 합니다: {self.fee_rate}")
+        if not (0.0 <= self.sell_tax_rate < 0.1):
+            raise ValueError(f"sell_tax_rate는 [0, 0.1) 범위여야 합니다: {self.sell_tax_rate}")
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과.
+
+    Attributes:
+        daily: 일별 equity(총자산)·cash(D+2 예수금)·settled_cash(D+0)·holdings_value.
+        holdings: 리밸런싱일별 체결 후 보유 수량 (index=date, columns=ticker).
+        trades: 체결 내역 (date, ticker, side, quantity, price, value, cost).
+        turnover: 리밸런싱일별 회전율 = (매수 + 매도 금액) / 2 / 거래 전 총자산.
+    """
+
+    daily: pd.DataFrame
+    holdings: pd.DataFrame
+    trades: pd.DataFrame
+    turnover: pd.Series
+
+    def summary(self) -> dict:
+        """총수익률·CAGR·연 변동성·최대 낙폭·연 회전율·거래 비용 합계."""
+        equity = self.daily['equity']
+        years = max(len(equity) - 1, 1) / TRADING_DAYS_PER_YEAR
+        total_return = equity.iloc[-1] / equity.iloc[0] - 1
+        returns = equity.pct_change().dropna()
+        drawdown = equity / equity.cummax() - 1
+        return {
+            'total_return': float(total_return),
+            'cagr': float((1 + total_return) ** (1 / years) - 1),
+            'annual_volatility': float(returns.std() * np.sqrt(TRADING_DAYS_PER_YEAR)) if len(returns) > 1 else 0.0,
+            'max_drawdown': float(drawdown.min()),
+            'annual_turnover': float(self.turnover.sum() / years),
+            'total_cost': float(self.trades['cost'].sum()) if not self.trades.empty else 0.0,
+            'rebalances': int(len(self.turnover)),
+        }
+
+
+def _rebalance_positions(index: pd.DatetimeIndex, rebalance: Union[str, int]) -> np.ndarray:
+    """리밸런싱할 거래일 위치 (첫 거래일 포함, 오름차순)."""
+    if isinstance(rebalance, int):
+        return np.arange(0, len(index), rebalance)
+    period = index.to_period(rebalance)
+    first = ~pd.Series(period).duplicated().to_numpy()
+    first[0] = True
+    return np.flatnonzero(first)
+
+
+def run_backtest(
+    allocation_info: pd.DataFrame,
+    prices: pd.DataFrame,
+    config: Optional[BacktestConfig] = None,
+) -> BacktestResult:
+    """과거 일별 종가로 정적 자산배분 리밸런싱을 재현한다.
+
+    Args:
+        allocation_info: 목표 비중 (ticker, weight) — Sheets allocation 탭과 같은 형식.
+        prices: 일별 종가 (index=거래일, columns=ticker). allocation 종목이 모두 있어야 하며, 결측은
+            직전 값으로 채우고 모든 종목 가격이 생긴 첫 날부터 시작한다.
+        config: 백테스트 설정. None이면 기본값.
+
+    Returns:
+        BacktestResult
+    """
+    config = config or BacktestConfig()
+    policy = config.policy
+    allocation = allocation_info[['ticker', 'weight']].reset_index(drop=True)
+    tickers = list(allocation['ticker'])
+    if allocation['ticker'].duplicated().any():
+        raise ValueError(f"ticker 중복이 있습니다: {allocation.loc[allocation['ticker'].duplicated(), 'ticker'].tolist()}")
+    validate_weights('backtest', dict(zip(tickers, allocation['weight'])))
+    missing = [t for t in tickers if t not in prices.columns]
+    if missing:
+        raise ValueError(f"가격 데이터에 없는 allocation 종목: {missing}")
+
+    price_frame = prices[tickers].sort_index().ffill()
+    valid = price_frame.notna().all(axis=1) & (price_frame > 0).all(axis=1)
+    if not valid.any():
+        raise ValueError("모든 allocation 종목의 가격이 있는 거래일이 없습니다.")
+    price_frame = price_frame.loc[valid.idxmax():]
+    if not valid.loc[price_frame.index].all():
+        raise ValueError("시작일 이후 0 이하 가격이 있습니다.")
+    index = price_frame.index
+    price_matrix = price_frame.to_numpy(dtype=float)
+    # 상한가 기준가 = 전일 종가 (첫 거래일은 당일 종가)
+    base_matrix = np.vstack([price_matrix[:1], price_matrix[:-1]])
+    weight = allocation['weight'].to_numpy(dtype=float)
+    all_rows = np.arange(len(tickers))
+    no_liquidation = np.zeros(len(tickers), dtype=bool)
+    post_process = needs_policy_pass(policy)
+
+    positions = _rebalance_positions(index, config.rebalance)
+    quantity = np.zeros(len(tickers), dtype=np.int64)
+    cash = float(config.initial_cash)
+    cash_flows = np.zeros(len(index))        # 거래일 기준 순현금흐름 (매도 +, 매수 −)
+    holdings_rows, trades, turnover = [], [], []
+
+    for pos in positions:
+        price = price_matrix[pos]
+        day = index[pos]
+        holding_value = quantity * price
+        equity_before = cash + float(holding_value.sum())
+        if equity_before <= policy.buffer_cash:
+            raise ValueError(f"{day.date()}: 총 평가금액({equity_before:,.0f}원)이 버퍼 이하입니다.")
+        target_base = float(np.trunc(equity_before - policy.buffer_cash))
+        columns = compute_rebalance_arrays(
+            weight=weight, current_price=price, current_quantity=quantity, current_value=holding_value,
+            liquidate=no_liquidation, total_value=equity_before, target_base=target_base,
+        )
+        if post_process:
+            apply_policy(columns, all_rows, no_liquidation, price, quantity, holding_value,
+                         equity_before, target_base, policy)
+        # get_rebalancing_plan과 같은 required_value 오름차순 (sell 먼저, 매수는 필요 금액 작은 순)
+        order = np.argsort(columns['required_value'], kind='stable')
+        required_quantity = columns['required_quantity']
+        direction = columns['required_transaction']
+        traded = 0.0
+        flow = 0.0
+
+        # 매도 먼저: 대금은 D+2 예수금에 즉시 반영 (prvs_rcdl_excc_amt)
+        for i in order[direction[order] == 'sell']:
+            qty = int(min(required_quantity[i], quantity[i]))
+            if qty <= 0:
+                continue
+            value = qty * price[i]
+            cost = value * (config.fee_rate + config.sell_tax_rate)
+            quantity[i] -= qty
+            cash += value - cost
+            flow += value - cost
+            traded += value
+            trades.append((day, tickers[i], 'sell', qty, price[i], value, cost))
+
+        # 매수: 계획 순서대로 잔여 현금 × buy_cash_safety_ratio 안에서 정수 수량
+        for i in order[direction[order] == 'buy']:
+            unit = price[i] * (1 + config.fee_rate)
+            if config.limit_up_sizing:
+                unit = max(unit, float(upper_limit_price(base_matrix[pos, i])))
+            qty = int(min(required_quantity[i], cash * policy.buy_cash_safety_ratio // unit))
+            if qty <= 0:
+                continue
+            value = qty * price[i]
+            cost = value * config.fee_rate
+            quantity[i] += qty
+            cash -= value + cost
+            flow -= value + cost
+            traded += value
+            trades.append((day, tickers[i], 'buy', qty, price[i], value, cost))
+
+        cash_flows[pos] = flow
+        holdings_rows.append((day, quantity.copy(), cash))
+        turnover.append(traded / 2 / equity_before)
+
+    # ---- 일별 평가 (벡터) --------------------------------------------------- #
+    rebalance_days = index[positions]
+    holdings = pd.DataFrame([q for _, q, _ in holdings_rows], index=rebalance_days, columns=tickers)
+    daily_quantity = holdings.reindex(index).ffill().to_numpy(dtype=float)
+    daily_cash = pd.Series([c for _, _, c in holdings_rows], index=rebalance_days).reindex(index).ffill()
+    holdings_value = (daily_quantity * price_matrix).sum(axis=1)
+    # D+0 결제 완료 현금: 거래일 현금흐름이 SETTLEMENT_LAG_DAYS 거래일 뒤에 반영
+    settled_flows = np.concatenate([np.zeros(SETTLEMENT_LAG_DAYS), cash_flows[:-SETTLEMENT_LAG_DAYS or None]])[:len(index)]
+    settled_cash = config.initial_cash + np.cumsum(settled_flows)
+
+    daily = pd.DataFrame({
+        'equity': daily_cash.to_numpy() + holdings_value,
+        'cash': daily_cash.to_numpy(),
+        'settled_cash': settled_cash,
+        'holdings_value': holdings_value,
+    }, index=index)
+    trade_log = pd.DataFrame(trades, columns=['date', 'ticker', 'side', 'quantity', 'price', 'value', 'cost'])
+    logger.info(
+        '백테스트 %s ~ %s: 거래일 %s, 리밸런싱 %s회, 체결 %s건',
+        index[0].date(), index[-1].date(), len(index), len(positions), len(trade_log),
+    )
+    return BacktestResult(
+        daily=daily,
+        holdings=holdings,
+        trades=trade_log,
+        turnover=pd.Series(turnover, index=rebalance_days, name='turnover'),
+    )
+
+
+def load_yfinance_prices(
+    tickers: Iterable[str], start: str, end: Optional[str] = None, suffix: str = '.KS',
+) -> pd.DataFrame:
+    """yfinance로 KRX 종목의 수정 종가를 받아 run_backtest 입력 형식(index=날짜, columns=ticker)으로 반환.
+
+    Args:
+        tickers: KRX 단축코드 (6자리).
+        suffix: Yahoo 심볼 접미사 ('.KS' 유가증권, '.KQ' 코스닥).
+    """
+    import yfinance as yf   # 선택 의존성: 가격을 직접 넘기는 백테스트·테스트는 import하지 않는다
+
+    tickers = list(dict.fromkeys(tickers))
+    symbols = [f'{t}{suffix}' for t in tickers]
+    data = yf.download(symbols, start=start, end=end, auto_adjust=True, progress=False)
+    close = data['Close'] if isinstance(data.columns, pd.MultiIndex) else data[['Close']]
+    if not isinstance(data.columns, pd.MultiIndex):
+        close.columns = symbols
+    close = close.rename(columns=dict(zip(symbols, tickers)))
+    missing = [t for t in tickers if t not in close.columns or close[t].isna().all()]
+    if missing:
+        raise ValueError(f"yfinance에서 가격을 받지 못한 종목: {missing}")
+    return close[tickers]
@@ -1,9 +1,10 @@
 """BigQuery 거래 이력 적재 및 중복 실행 방지 (ARCH-003).
 
 핵심 설계:
-- run_id + row_type sentinel: 모든 trade row는 `run_id` + `row_type='trade'`로
-  라벨. main.py가 주문 직전·후에 `append_run_marker()`로 `row_type='run_marker'`
-  + `run_status='started'/'completed'` sentinel을 적재.
+- run_id + row_type 라벨: 모든 trade row는 `run_id` + `row_type='trade'`로 라벨.
+  started/completed sentinel은 `src/run_state`(run_state 테이블)가 기록한다. trade_log의
+  `row_type='run_marker'` 행은 그 이전 실행이 남긴 이력으로, `is_already_executed`(전환 기간
+  판정)가 읽기만 한다.
 - `is_already_executed`: run_id 단위로 그룹핑한 후 다음 중 하나라도 만족하면
   차단 — (a) 정상 완료(trade 또는 completed marker), (b) 진행 중(started 후
   STALE_MINUTES=30분 미경과), (c) row_type IS NULL (마이그레이션 전 행).
@@ -12,15 +13,21 @@
 - 스키마 자동 확장: `LoadJobConfig.schema_update_options=ALLOW_FIELD_ADDITION`
   로 신규 컬럼(run_id/row_type/run_status/requested_quantity/filled_quantity)을
   첫 적재 시 BQ가 자동 추가 (ALTER 직접 실행 불필요).
+- 스캔 비용: `is_already_executed`는 파티션 컬럼 `reg_date`로 within_days 파티션만 읽고,
+  테이블은 `account_type, run_id`로 클러스터링 → 이력이 쌓여도 스캔 바이트 일정.
+  클러스터링은 1회성 마이그레이션(`ensure_clustering`, `test/migrate_trade_log_clustering.py`)으로
+  적용 — 생성자에서 호출하면 cold start마다 get_table 왕복이 추가된다.
+  `estimate_already_executed_bytes`로 dry run 확인.
+- 쓰기 경로 분리: 소량 행(run_state 이벤트)은 `stream_rows`(스트리밍 insert, insertId로
+  재시도 중복 제거) → 수십 ms. 대량 trade_log는 종전대로 load job(무료, 스키마 자동 확장).
+- 지연 import: google-cloud-bigquery(+pyarrow)·google-auth는 메서드 안에서 import →
+  --test·IRP 실행처럼 BigQueryClient를 만들지 않는 경로는 모듈 import 비용을 치르지 않는다.
 """
+import time
 from datetime import datetime, timedelta
 
 import pandas as pd
 import pytz
-from google.api_core.exceptions import NotFound
-from google.auth import default
-from google.cloud import bigquery
-from google.oauth2.service_account import Credentials
 
 from src.config.env import BQ_DATASET_ID, BQ_PROJECT_ID, EXECUTE_ENV, GCP_KEY_PATH
 from src.logger import get_logger
@@ -35,9 +42,19 @@ _BQ_SCOPES = ['https://www.googleapis.com/auth/bigquery']
 # 향후 ExecutionPolicy로 옮길 수 있게 모듈 상수로 보관.
 STALE_MINUTES = 30
 
+# 실패한 trade_log load job을 `{job_id}_{attempt}`로 재제출하는 최대 job ID 수 (원래 ID 포함).
+MAX_TRADE_LOG_JOB_ATTEMPTS = 5
+
+# is_already_executed가 거르는(account_type)·묶는(run_id) 컬럼. reg_date 파티션 안에서 블록 프루닝.
+CLUSTERING_FIELDS = ['account_type', 'run_id']
+
 
 class BigQueryClient:
     def __init__(self) -> None:
+        from google.auth import default
+        from google.cloud import bigquery
+        from google.oauth2.service_account import Credentials
+
         if EXECUTE_ENV == 'LOCAL':
             credentials = Credentials.from_service_account_file(GCP_KEY_PATH, scopes=_BQ_SCOPES)
         else:
@@ -46,11 +63,15 @@ class BigQueryClient:
         self.client = bigquery.Client(project=BQ_PROJECT_ID, credentials=credentials)
         self._table_ref = f'{BQ_PROJECT_ID}.{BQ_DATASET_ID}.trade_log'
 
-    def append_trade_log(self, df: pd.DataFrame, account_type: str, run_id: str = None) -> None:
+    def append_trade_log(self, df: pd.DataFrame, account_type: str, run_id: str = None, job_id: str = None) -> None:
         """df에 account_type/update_dt/reg_date/run_id/row_type='trade' 컬럼을 추가해 BigQuery에 WRITE_APPEND 적재.
 
         ARCH-003: run_id를 받아 모든 행에 동일하게 박는다 (sentinel marker와 같은 run_id 그룹).
         row_type='trade'는 run_marker와 구별하기 위한 명시적 라벨.
+
+        job_id를 주면 load job ID로 사용한다 — 같은 job_id로 재시도하면 새로 적재하지 않고 먼저 제출된
+        job의 완료를 기다리므로, 응답 유실 후 재시도해도 trade 행이 중복되지 않는다. 먼저 제출된 job이
+        실패했으면 `{job_id}_{attempt}`로 다시 제출한다.
         """
         tmp = df.copy()
         now_kst = datetime.now(pytz.timezone('Asia/Seoul'))
@@ -61,6 +82,7 @@ class BigQueryClient:
             tmp['run_id'] = run_id
         tmp['row_type'] = 'trade'
 
+        from google.cloud import bigquery
         job_config = bigquery.LoadJobConfig(
             write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
             # ARCH-004: 새 컬럼(requested_quantity, filled_quantity 등)이 자동 추가되도록 허용.
@@ -76,64 +98,85 @@ class BigQueryClient:
             ),
         )
 
-        job = self.client.load_table_from_dataframe(tmp, self._table_ref, job_config=job_config)
+        job = self._submit_trade_log_job(tmp, job_config, job_id)
         job.result()
         logger.info('trade_log append 완료: %d rows → %s', len(tmp), self._table_ref)
 
-    def append_run_marker(self, run_id: str, account_type: str, status: str) -> None:
-        """주문 시작/완료 sentinel을 trade_log에 1행 적재 (ARCH-003).
+    def _submit_trade_log_job(self, df: pd.DataFrame, job_config, job_id: str = None):
+        """trade_log load job 제출. job_id 충돌 시 기존 job이 살아 있거나 성공했을 때만 그 job을 쓴다.
 
-        is_already_executed가 trade row가 없어도 run_marker만으로 중복 실행을 인지하도록.
-        예: 'started' 마커 적재 후 주문 도중 크래시 → 다음 실행은 marker로 detect하여 skip.
-
-        Args:
-            run_id (str): main.py에서 발급한 실행 단위 식별자 (uuid).
-            account_type (str): 계좌 식별자.
-            status (str): 'started' 또는 'completed'.
+        기존 job이 실패(DONE + error_result)했으면 행이 적재되지 않았으므로 `{job_id}_{attempt}`로
+        다시 제출한다. 접미사도 결정적이라 이후 재시도는 같은 순서로 기존 job을 찾아 재사용한다.
         """
-        now_kst = datetime.now(pytz.timezone('Asia/Seoul'))
-        df = pd.DataFrame([{
-            'run_id': run_id,
-            'row_type': 'run_marker',
-            'run_status': status,
-            'account_type': account_type,
-            'update_dt': now_kst,
-            'reg_date': now_kst.date(),
-        }])
-        job_config = bigquery.LoadJobConfig(
-            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-            schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION],
-            schema=[
-                bigquery.SchemaField('update_dt', 'TIMESTAMP'),
-                bigquery.SchemaField('reg_date', 'DATE'),
-            ],
-            time_partitioning=bigquery.TimePartitioning(
-                type_=bigquery.TimePartitioningType.DAY,
-                field='reg_date',
-            ),
-        )
-        job = self.client.load_table_from_dataframe(df, self._table_ref, job_config=job_config)
-        job.result()
-        logger.info('run_marker append: run_id=%s, status=%s, account_type=%s', run_id, status, account_type)
-
-    def is_already_executed(self, account_type: str, target_date, within_days: int = 7) -> bool:
-        """trade_log 테이블에서 account_type 기준으로 within_days 이내 실행 여부를 조회.
-
-        ARCH-003 + Codex P0 #1·#2: run_id 단위로 그룹핑한 후 다음 중 하나라도 해당하면 차단:
-        - (a) trade row 또는 completed marker가 있음 → 정상 완료 run
-        - (b) started marker만 있고 STALE_MINUTES 안 지남 → 진행 중인 run (동시 실행 방지)
-        - (c) row_type IS NULL인 옛날 행 → 마이그레이션 전 호환
-
-        started 후 STALE_MINUTES(30분) 지났는데 completed/trade가 없으면 좀비 run으로
-        판정하여 다음 cron이 재시도 가능 (개발자 수동 정리 불필요).
+        from google.api_core.exceptions import Conflict
+        if job_id is None:
+            return self.client.load_table_from_dataframe(df, self._table_ref, job_config=job_config)
+        for attempt in range(MAX_TRADE_LOG_JOB_ATTEMPTS):
+            attempt_id = job_id if attempt == 0 else f'{job_id}_{attempt}'
+            try:
+                return self.client.load_table_from_dataframe(df, self._table_ref, job_config=job_config, job_id=attempt_id)
+            except Conflict:
+                job = self.client.get_job(attempt_id)
+            if job.state in ('PENDING', 'RUNNING') or (job.state == 'DONE' and job.error_result is None):
+                logger.info('trade_log load job 이미 제출됨 → 기존 job 대기: %s (%s)', attempt_id, job.state)
+                return job
+            logger.warning('trade_log load job %s 실패 이력 → 새 job ID로 재제출: %s', attempt_id, job.error_result)
+        raise RuntimeError(f'trade_log load job 재제출 한도 초과: {job_id} (시도 {MAX_TRADE_LOG_JOB_ATTEMPTS}회)')
+
+    def stream_rows(self, table_ref: str, rows: list[dict], row_ids: list[str]) -> None:
+        """소량 행을 스트리밍 insert로 적재 (load job 대기 없이 수십 ms).
+
+        row_ids는 insertId — 네트워크 재시도로 같은 요청이 두 번 도달해도 BigQuery가 한 번만 적재.
+        스트리밍 버퍼에 있는 행은 UPDATE/MERGE할 수 없으므로 append-only 기록에만 사용한다.
+
+        Raises:
+            google.api_core.exceptions.NotFound: 테이블 미존재.
+            RuntimeError: 행 단위 insert 오류 (스키마 불일치 등).
+        """
+        started = time.perf_counter()
+        errors = self.client.insert_rows_json(table_ref, rows, row_ids=row_ids)
+        if errors:
+            raise RuntimeError(f'BigQuery 스트리밍 insert 실패 ({table_ref}): {errors}')
+        logger.info('stream_rows: %d rows → %s (%.0fms)', len(rows), table_ref, (time.perf_counter() - started) * 1000)
+
+    def ensure_clustering(self) -> bool:
+        """trade_log 테이블 클러스터링을 `CLUSTERING_FIELDS`로 맞춘다 (멱등).
+
+        is_already_executed는 account_type·run_id로 거르고 묶으므로, 파티션(reg_date) 안에서도
+        해당 블록만 읽도록 클러스터링한다. 변경은 이후 적재분부터 적용 (BQ 자동 재클러스터링).
+        테이블 미존재(첫 실행) 시 아무것도 하지 않고 False. 실행 경로에서는 호출하지 않는다 —
+        `test/migrate_trade_log_clustering.py`로 1회 적용 (bigquery.tables.update 권한 필요).
+
+        Returns:
+            bool: 클러스터링 설정을 변경했으면 True.
         """
+        from google.api_core.exceptions import NotFound
+        try:
+            table = self.client.get_table(self._table_ref)
+        except NotFound:
+            return False
+        if list(table.clustering_fields or []) == CLUSTERING_FIELDS:
+            return False
+        table.clustering_fields = CLUSTERING_FIELDS
+        self.client.update_table(table, ['clustering_fields'])
+        logger.info('trade_log 클러스터링 설정: %s → %s', self._table_ref, CLUSTERING_FIELDS)
+        return True
+
+    def _already_executed_query(self, account_type: str, target_date, within_days: int, dry_run: bool = False):
+        """is_already_executed 쿼리와 QueryJobConfig. dry_run=True면 스캔 바이트 추정용."""
+        from google.cloud import bigquery
         cutoff = (
             datetime.combine(target_date, datetime.min.time()) - timedelta(days=within_days - 1)
             if hasattr(target_date, 'year')
             else target_date - timedelta(days=within_days - 1)
         )
         cutoff_str = cutoff.strftime('%Y-%m-%d') if hasattr(cutoff, 'strftime') else str(cutoff)
+        target_str = target_date.strftime('%Y-%m-%d') if hasattr(target_date, 'strftime') else str(target_date)
 
+        # reg_date(KST 날짜, 파티션 컬럼) 필터로 target_date까지 within_days 파티션만 스캔한다.
+        # reg_date(KST) >= DATE(update_dt)(UTC)이므로 update_dt 조건을 만족하는 행은 모두 reg_date 하한도
+        # 만족 → 결과는 종전과 동일하고 파티션 프루닝만 추가된다. 상한(target_date)은 당일 판정에선
+        # 미래 파티션이 없어 결과가 같고, 과거 기준일 조회(벤치마크)도 within_days 구간으로 고정한다.
         query = f"""
             WITH runs AS (
               SELECT
@@ -141,7 +184,8 @@ class BigQueryClient:
                 MAX(IF(row_type='trade' OR run_status='completed', 1, 0)) AS has_terminal,
                 MIN(IF(run_status='started', update_dt, NULL)) AS started_at
               FROM `{self._table_ref}`
-              WHERE account_type = @account_type
+              WHERE reg_date BETWEEN @cutoff_date AND @target_date
+                AND account_type = @account_type
                 AND DATE(update_dt) >= @cutoff_date
                 AND (row_type IN ('run_marker','trade') OR row_type IS NULL)
               GROUP BY run_id
@@ -162,9 +206,29 @@ class BigQueryClient:
             query_parameters=[
                 bigquery.ScalarQueryParameter('account_type', 'STRING', account_type),
                 bigquery.ScalarQueryParameter('cutoff_date', 'DATE', cutoff_str),
+                bigquery.ScalarQueryParameter('target_date', 'DATE', target_str),
                 bigquery.ScalarQueryParameter('stale_minutes', 'INT64', STALE_MINUTES),
-            ]
+            ],
+            dry_run=dry_run,
+            use_query_cache=not dry_run,
         )
+        return query, job_config
+
+    def is_already_executed(self, account_type: str, target_date, within_days: int = 7) -> bool:
+        """trade_log 테이블에서 account_type 기준으로 within_days 이내 실행 여부를 조회.
+
+        ARCH-003 + Codex P0 #1·#2: run_id 단위로 그룹핑한 후 다음 중 하나라도 해당하면 차단:
+        - (a) trade row 또는 completed marker가 있음 → 정상 완료 run
+        - (b) started marker만 있고 STALE_MINUTES 안 지남 → 진행 중인 run (동시 실행 방지)
+        - (c) row_type IS NULL인 옛날 행 → 마이그레이션 전 호환
+
+        started 후 STALE_MINUTES(30분) 지났는데 completed/trade가 없으면 좀비 run으로
+        판정하여 다음 cron이 재시도 가능 (개발자 수동 정리 불필요).
+
+        reg_date 파티션 필터로 within_days 구간만 스캔 → 이력이 쌓여도 스캔 바이트 일정.
+        """
+        from google.api_core.exceptions import NotFound
+        query, job_config = self._already_executed_query(account_type, target_date, within_days)
 
         try:
             result = self.client.query(query, job_config=job_config).result()
@@ -179,3 +243,9 @@ class BigQueryClient:
             # 테이블 미존재 = 첫 실행
             logger.info('trade_log 테이블 미존재, 첫 실행으로 간주: %s', self._table_ref)
             return False
+
+    def estimate_already_executed_bytes(self, account_type: str, target_date, within_days: int = 7) -> int:
+        """is_already_executed 쿼리의 스캔 바이트를 dry run으로 추정 (과금·실행 없음)."""
+        query, job_config = self._already_executed_query(account_type, target_date, within_days, dry_run=True)
+        job = self.client.query(query, job_config=job_config)
+        return int(job.total_bytes_processed or 0)
@@ -11,6 +11,13 @@ SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
 SLACK_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID")
 BQ_PROJECT_ID = os.getenv('BQ_PROJECT_ID', '')
 BQ_DATASET_ID = os.getenv('BQ_DATASET_ID', 'asset_allocation')
+# 거래일 캘린더 캐시 위치. 비어 있으면 로컬 파일(PROJECT_ROOT/kis_calendar/), gs://...면 GCS.
+TRADING_CALENDAR_URI = os.getenv('TRADING_CALENDAR_URI', '')
+# 중복 실행 방지 상태 저장소. 'bigquery'(기본, run_state 테이블) 또는 'sqlite'(로컬 파일, 클라우드 불필요).
+RUN_STATE_BACKEND = os.getenv('RUN_STATE_BACKEND', 'bigquery')
+RUN_STATE_SQLITE_PATH = os.getenv('RUN_STATE_SQLITE_PATH', '')
+# 주문 실행 저널 GCS 동기화 위치 (gs://bucket/prefix). 비어 있으면 로컬 파일(PROJECT_ROOT/execution_journal/)만.
+EXECUTION_JOURNAL_URI = os.getenv('EXECUTION_JOURNAL_URI', '')
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
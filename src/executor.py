@@ -11,14 +11,38 @@
   `transaction_quantity`는 deprecated alias = filled (3개월 후 제거).
 - 실패 주문 차감 보호 (ARCH-008): 매수 루프의 잔여 차감을 `filled * calc_price`로
   계산. 실패 주문은 filled=0이라 차감 0 → 잔여 보존.
+- 결제 대기 (settlement_wait_mode): 'fixed'는 고정 sleep, 'poll'은 매수 가능 한도를
+  지수 백오프로 폴링해 예상 매도 대금이 반영되는 즉시 매수 단계로 진행. 실제 소요
+  시간은 `last_settlement_seconds`에 기록.
+- 매도 동시 제출: `sell_max_workers` > 1이면 매도 주문을 스레드 풀로 동시 제출.
+  결과는 plan 순서로 정렬 → transaction_order·requested/filled 스키마 결정적.
+  매도 주문 body는 선조회 수량으로 미리 확정되므로 해시키도 루프 전에 선발급.
+- 가능 수량 선조회: 매도 단계 시작 전 매도 종목, 매수 단계 시작 전 매수 종목의
+  inquire-psbl-* 응답을 `AsyncKISClient`로 동시 조회해 종목별 왕복 지연을 겹친다.
+  잔여 현금 기반 수량 산정(ARCH-008)은 종전처럼 주문 순서대로 직렬 수행.
+- 로컬 보수단가 (`policy.orderable_price_mode='local'`): 매수 가능 조회는 psbl_qty_calc_unpr(시장가 =
+  상한가)만 쓰므로, 플래너 시세 조회가 받아 둔 당일 상한가(`KISClient.upper_limit_price`)로 매수 종목별
+  조회를 생략한다. 앞쪽 `orderable_verify_sample` 종목과 상한가를 모르는 종목만 KIS로 조회하고, 표본의
+  로컬 값이 KIS보다 낮으면(과소 추정 → 잔여 현금 과대 추적) 나머지 종목도 KIS 조회로 되돌린다.
 - is_test=True: KIS 호출 자체 스킵, requested=filled=0. 의도 수량은
   plan_row['required_quantity'] 입력값에 보존.
+- 체결 확인 (`policy.reconcile_fills`): 매도·매수 단계가 끝나면 접수된 주문번호 전체를 당일
+  주문체결 조회(inquire-daily-ccld) 한 번의 페이지 순회로 확인해 `filled_quantity`를 실제 체결
+  수량으로, `avg_fill_price`를 평균 체결가로 갱신한다 (주문별 조회 없음). 매도 체결 결과는 결제
+  대기 목표(예상 매도 대금)에 그대로 반영된다.
+- 실행 저널 (`src/journal.py`): journal이 주어지면 주문 전 제출(write-ahead)·주문 후 결과를 기록.
+  재개 실행에서는 결과가 기록된 주문을 재사용하고(재주문·현금 재차감 없음), 제출 기록만 있는 주문은
+  'in_doubt'로 두고 재주문하지 않는다. 매도 대금 반영 대기를 마친 run은 대기도 건너뛰고, 아직이면
+  재사용한 매도의 대금은 재시작 후 읽은 기준선에 포함된 것으로 보고 폴링 목표에서 뺀다.
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import pandas as pd
 
-from src.kis.client import KISClient
+from src.kis.async_client import fetch_orderable_concurrently
+from src.journal import ExecutionJournal, order_key
+from src.kis.client import KISAPIError, KISClient
 from src.logger import get_logger, log_method_call
 from src.policy import DEFAULT_EXECUTION_POLICY, ExecutionPolicy
 
@@ -43,29 +67,68 @@ class OrderExecutor:
         self.account_type = account_type
         self.is_test = is_test
         self.policy = policy or DEFAULT_EXECUTION_POLICY
+        # 직전 run_rebalancing의 sell → buy 결제 대기 소요 시간(초). 대기하지 않았으면 None.
+        self.last_settlement_seconds: Optional[float] = None
+        self._journal: Optional[ExecutionJournal] = None
 
     @log_method_call
-    def run_rebalancing(self, plan_df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    def run_rebalancing(
+        self, plan_df: pd.DataFrame, journal: Optional[ExecutionJournal] = None,
+    ) -> tuple[pd.DataFrame, int]:
         """리밸런싱 플랜에 따라 매도 → 매수 순서로 주문을 실행한다.
 
         매도를 먼저 실행해 예수금을 확보한 뒤 매수를 진행한다.
         sell/buy 사이에는 체결 후 예수금 반영 대기를 위해 sleep한다.
+        journal: 주문 제출·결과를 기록할 실행 저널. 재개 실행이면 기록된 주문은 재사용.
         """
+        self._journal = journal
         sells = plan_df[plan_df['required_transaction'] == 'sell']
         buys = plan_df[plan_df['required_transaction'] == 'buy']
 
         cash_before_sell = self.kis_client.fetch_domestic_cash_balance()
         logger.info('sell 시작 전 예수금: %s', cash_before_sell)
 
-        result = []
-        for i in sells.index:
-            result.append(self._execute_order(sells.loc[i].to_dict(), i))
+        # 재개 실행에서 이미 대기를 마쳤으면 다시 기다리지 않는다.
+        already_settled = journal is not None and journal.has_mark('settled')
+        poll_settlement = (
+            self.policy.settlement_wait_mode == 'poll' and not sells.empty and not buys.empty
+            and not already_settled
+        )
+        # 폴링 기준선: 매도 전 매수 가능 한도 (스냅샷 메모이즈 값이라 추가 왕복은 최대 1회)
+        orderable_before_sell = self.kis_client.fetch_buy_orderable_cash() if poll_settlement else None
+        self.last_settlement_seconds = None
+
+        result = self._execute_sells(sells)
+        self._reconcile_fills('sell', result)
+        expected_proceeds = 0.0
+        sell_prices = sells['current_price'] if 'current_price' in sells else [None] * len(result)
+        for order_result, price in zip(result, sell_prices):
+            # 저널에서 재사용한 매도는 재시작 후 읽은 기준선(orderable_before_sell)에 대금이 이미 포함될 수
+            # 있으므로 목표에 다시 더하지 않는다 (이중 계상 → 도달할 수 없는 목표로 마감까지 대기).
+            if order_result.get('resumed'):
+                continue
+            # 체결 확인된 주문은 실제 평균 체결가, 아니면 계획 단가로 예상 매도 대금 산정
+            fill_price = order_result.get('avg_fill_price')
+            if fill_price is None:
+                fill_price = price
+            if pd.notna(fill_price):
+                expected_proceeds += order_result['filled_quantity'] * float(fill_price)
 
         # sell이 하나라도 있었고 buy도 있을 때만 대기. sell-only 또는 buy-only 시나리오는 skip.
-        if sells.shape[0] > 0 and buys.shape[0] > 0:
+        if already_settled:
+            logger.info('저널 재개: 매도 대금 반영 대기 완료 기록 → 대기 생략')
+        elif poll_settlement:
+            self.last_settlement_seconds = self._wait_for_settlement(orderable_before_sell, expected_proceeds)
+        elif sells.shape[0] > 0 and buys.shape[0] > 0:
             wait_seconds = self.policy.sell_to_buy_wait_seconds
             logger.info('sell 완료. %s초 대기 후 buy 시작.', wait_seconds)
             time.sleep(wait_seconds)
+            # 대기 중 반영된 매도 대금을 읽도록 계좌 스냅샷을 명시적으로 폐기 (주문 시에도 폐기되지만
+            # 대기 전에 누군가 조회했다면 반영 전 값이 남아 있을 수 있다)
+            self.kis_client.invalidate_account_snapshot()
+            self.last_settlement_seconds = float(wait_seconds)
+        if journal is not None and self.last_settlement_seconds is not None:
+            journal.mark('settled')
 
         cash_before_buy = self.kis_client.fetch_domestic_cash_balance()
         logger.info('buy 시작 전 예수금: %s', cash_before_buy)
@@ -76,13 +139,22 @@ class OrderExecutor:
             remaining_cash = self.kis_client.fetch_buy_orderable_cash()
         else:
             remaining_cash = cash_before_buy
+        buy_enables = self._prefetch_orderable('buy', buys)
+        buy_results = []
         for i in buys.index:
-            order_result = self._execute_order(buys.loc[i].to_dict(), i, available_cash=remaining_cash)
+            row = buys.loc[i].to_dict()
+            order_result = self._execute_order(
+                row, i, available_cash=remaining_cash, enable=buy_enables.get(row['ticker']),
+            )
             # ARCH-008: 체결 성공한 수량(filled_quantity)만 차감 → 실패·skip 주문은 잔여 보존.
             # calc_price(보수단가) × filled_quantity 사용. calc_price ≥ 실제 체결가이므로
             # 우리 추적 잔여 ≤ KIS 실제 잔여 → 미수 위험 0.
-            remaining_cash -= order_result['filled_quantity'] * order_result['calc_price']
-            result.append(order_result)
+            # 저널에서 재사용한 주문은 재시작 후 조회한 한도에 이미 반영되어 있으므로 차감하지 않는다.
+            if not order_result.get('resumed'):
+                remaining_cash -= order_result['filled_quantity'] * order_result['calc_price']
+            buy_results.append(order_result)
+        self._reconcile_fills('buy', buy_results)
+        result.extend(buy_results)
         cash_after_buy = self.kis_client.fetch_domestic_cash_balance()
         logger.info('buy 완료 후 예수금: %s', cash_after_buy)
 
@@ -91,20 +163,184 @@ class OrderExecutor:
         _result_columns = [
             'ticker', 'enable_quantity',
             'requested_quantity', 'filled_quantity', 'transaction_quantity',  # transaction_quantity = filled (deprecated)
+            'avg_fill_price',
             'skipped_reason', 'is_success', 'response_msg', 'transaction_order',
         ]
-        return pd.DataFrame(result, columns=_result_columns), cash_after_buy
+        trade_log = pd.DataFrame(result, columns=_result_columns)
+        # 체결 확인 전·미체결은 None → float(NaN)로 고정해 BigQuery 적재 시 FLOAT64로 추론되게 한다.
+        trade_log['avg_fill_price'] = trade_log['avg_fill_price'].astype(float)
+        return trade_log, cash_after_buy
+
+    def _execute_sells(self, sells: pd.DataFrame) -> list:
+        """매도 주문을 실행해 plan 순서(sells.index)대로 결과를 반환한다.
+
+        매도끼리는 서로 독립이므로 policy.sell_max_workers > 1이면 스레드 풀로 동시 제출한다
+        (가능 수량 조회 → 해시키 → 주문). 요청 수는 KISClient의 rate limiter가 한도 이내로
+        조절하고, 결과는 제출 순서와 무관하게 plan 순서로 정렬되어 transaction_order와
+        requested/filled 스키마가 직렬 실행과 동일하다.
+
+        어느 주문이 예외를 내면 이미 제출된 주문은 끝까지 처리한 뒤 첫 예외를 전파한다.
+        """
+        sell_enables = self._prefetch_orderable('sell', sells)
+        items = [(i, sells.loc[i].to_dict()) for i in sells.index]
+        self._prefetch_sell_hashkeys([item for item in items if not self._journaled('sell', item[1]['ticker'])], sell_enables)
+
+        def run(item: tuple) -> dict:
+            i, row = item
+            return self._execute_order(row, i, enable=sell_enables.get(row['ticker']))
+
+        workers = min(self.policy.sell_max_workers, len(items))
+        if workers <= 1:
+            return [run(item) for item in items]
+        logger.info('sell %s건 동시 제출 (workers=%s)', len(items), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sell-order') as pool:
+            return list(pool.map(run, items))
+
+    def _prefetch_sell_hashkeys(self, items: list, sell_enables: dict) -> None:
+        """선조회한 매도 가능 수량으로 주문 body를 미리 만들어 해시키를 확보한다.
+
+        매도 수량은 min(계획 수량, 매도 가능 수량)으로 주문 전에 확정되므로 body가 실제 주문과
+        일치한다. (매수는 잔여 현금에 따라 수량이 주문마다 정해져 미리 만들 수 없다.)
+        선발급 실패는 치명적이지 않으므로 경고만 남기고 주문 시점 발급으로 진행.
+        """
+        if self.is_test or not sell_enables:
+            return
+        planned = []
+        for _, row in items:
+            enable = sell_enables.get(row['ticker'])
+            qty = min(int(row['required_quantity']), int(enable['ord_psbl_qty'])) if enable else 0
+            if qty > 0:
+                planned.append({'ticker': row['ticker'], 'ord_qty': qty, 'ord_dvsn': '01'})
+        if not planned:
+            return
+        try:
+            self.kis_client.prefetch_hashkeys(planned)
+        except KISAPIError as e:
+            logger.warning('매도 해시키 선발급 실패 — 주문 시점 발급으로 진행: %s', e)
+
+    def _wait_for_settlement(self, baseline_cash: int, expected_proceeds: float) -> float:
+        """매도 대금이 매수 가능 한도에 반영될 때까지 지수 백오프로 폴링한다.
+
+        첫 조회는 즉시 수행하므로 KIS가 바로 반영하면 왕복 1회 만에 끝난다. 마감을 넘기면
+        경고만 남기고 진행 — 매수 수량은 그 시점 한도 기준으로 산정되므로 미수 위험은 없다.
+
+        Returns:
+            float: 실제 대기한 시간(초).
+        """
+        policy = self.policy
+        target = baseline_cash + expected_proceeds * policy.settlement_expected_ratio
+        start = time.monotonic()
+        deadline = start + policy.settlement_poll_timeout_seconds
+        interval = policy.settlement_poll_initial_seconds
+        polls = 0
+        while True:
+            cash = self.kis_client.fetch_buy_orderable_cash(refresh=True)
+            polls += 1
+            now = time.monotonic()
+            if cash >= target:
+                elapsed = now - start
+                logger.info(
+                    '매도 대금 반영 확인: %.2f초, 폴링 %s회 (orderable=%s, target=%s)',
+                    elapsed, polls, f'{cash:,}', f'{target:,.0f}',
+                )
+                return elapsed
+            if now >= deadline:
+                elapsed = now - start
+                logger.warning(
+                    '매도 대금 반영 대기 마감(%.1f초) — 현재 한도로 매수 진행 (orderable=%s, target=%s)',
+                    elapsed, f'{cash:,}', f'{target:,.0f}',
+                )
+                return elapsed
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 2, policy.settlement_poll_max_interval_seconds)
+
+    def _journaled(self, transaction_type: str, ticker: str) -> bool:
+        """재개 실행에서 이미 결과가 있거나 제출 기록이 있는 주문인지 (다시 주문하지 않는 대상)."""
+        journal = self._journal
+        if journal is None:
+            return False
+        key = order_key(transaction_type, ticker)
+        return journal.result_for(key) is not None or journal.in_doubt_quantity(key) is not None
 
-    def _execute_order(self, plan_row: dict, order_index: int, available_cash: Optional[int] = None) -> dict:
+    def _prefetch_orderable(self, transaction_type: str, orders: pd.DataFrame) -> dict:
+        """주문 대상 종목의 매수/매도 가능 조회를 동시에 수행해 {ticker: output}으로 반환."""
+        if orders.empty:
+            return {}
+        if transaction_type == 'buy' and self.policy.orderable_price_mode == 'local' and not self.is_test:
+            return self._local_buy_enables(orders)
+        if not self.policy.prefetch_orderable:
+            return {}
+        tickers = [t for t in orders['ticker'] if not self._journaled(transaction_type, t)]
+        if not tickers:
+            return {}
+        return fetch_orderable_concurrently(self.kis_client, transaction_type, tickers)
+
+    def _local_buy_enables(self, buys: pd.DataFrame) -> dict:
+        """매수 보수단가를 로컬 산정해 {ticker: {'psbl_qty_calc_unpr': 단가}}로 반환 (KIS 응답과 같은 키).
+
+        로컬 단가는 플래너의 시세 조회가 받아 둔 당일 상한가(`KISClient.upper_limit_price`) — 현재가가
+        아닌 기준가에서 정해지므로 당일 하락 종목도 과소 추정하지 않는다. 상한가를 모르는 종목과 앞쪽
+        orderable_verify_sample 종목은 한 번의 동시 조회로 KIS에서 받아 그 응답을 그대로 쓰고, 표본은
+        로컬 값과 대조한다. 로컬 값이 KIS보다 낮은 종목이 있으면 나머지 종목도 KIS 선조회로 되돌린다.
+        """
+        policy = self.policy
+        tickers = [t for t in buys['ticker'] if not self._journaled('buy', t)]
+        if not tickers:
+            return {}
+        local = {}
+        for ticker in tickers:
+            limit = self.kis_client.upper_limit_price(ticker)
+            if limit:
+                local[ticker] = int(limit)
+        sample = tickers[:policy.orderable_verify_sample]
+        to_fetch = sample + [t for t in tickers[len(sample):] if t not in local]
+        verified = fetch_orderable_concurrently(self.kis_client, 'buy', to_fetch)
+
+        under = {}
+        for ticker in sample:
+            kis_price = int(verified[ticker]['psbl_qty_calc_unpr'])
+            if ticker in local and local[ticker] < kis_price:
+                under[ticker] = (local[ticker], kis_price)
+        rest = [ticker for ticker in tickers if ticker not in verified]
+        if under:
+            logger.warning('로컬 보수단가가 KIS보다 낮음 — 매수 가능 조회를 KIS로 되돌림 (local, kis): %s', under)
+            if policy.prefetch_orderable and rest:
+                verified.update(fetch_orderable_concurrently(self.kis_client, 'buy', rest))
+            return verified
+
+        enables = dict(verified)
+        for ticker in rest:
+            enables[ticker] = {'psbl_qty_calc_unpr': local[ticker]}
+        logger.info(
+            '매수 보수단가 로컬 산정: %s종목 (KIS 조회 %s종목, 조회 생략 %s건)', len(tickers), len(verified), len(rest),
+        )
+        return enables
+
+    def _execute_order(
+        self,
+        plan_row: dict,
+        order_index: int,
+        available_cash: Optional[int] = None,
+        enable: Optional[dict] = None,
+    ) -> dict:
         """단일 종목의 주문을 실행하고 결과를 dict로 반환한다.
 
         실제 주문 수량은 계획 수량과 주문 가능 수량 중 작은 값을 사용한다.
         is_test=True이거나 주문 가능 수량이 0이면 API를 호출하지 않는다.
+        enable: 선조회한 매수/매도 가능 응답. None이면 여기서 조회.
         """
+        journal = self._journal
+        key = order_key(plan_row['required_transaction'], plan_row['ticker'])
+        if journal is not None:
+            resumed = self._resume_from_journal(journal, key, plan_row['ticker'], order_index)
+            if resumed is not None:
+                return resumed
+
         enable_qty, calc_price = self._get_orderable_qty(
             ticker=plan_row['ticker'],
             transaction_type=plan_row['required_transaction'],
             available_cash=available_cash,
+            enable=enable,
         )
         # 계획 수량이 실제 가능 수량을 초과할 수 있으므로 min으로 제한
         transaction_qty = min(plan_row['required_quantity'], enable_qty)
@@ -125,6 +361,8 @@ class OrderExecutor:
             response = None
         else:
             skipped_reason = None
+            if journal is not None:
+                journal.record_submitted(key, transaction_qty)   # write-ahead: 주문 전에 먼저 기록
             response = self.kis_client.create_domestic_order(
                 plan_row['required_transaction'], plan_row['ticker'],
                 ord_qty=transaction_qty, ord_dvsn='01',
@@ -135,7 +373,7 @@ class OrderExecutor:
 
         # calc_price는 buys 루프에서 보수 차감용으로만 사용. _result_columns에는 포함되지 않으므로
         # 출력 DataFrame(Slack/BigQuery/Sheets)에는 영향 없다.
-        return {
+        result = {
             'ticker': plan_row['ticker'],
             'enable_quantity': enable_qty,
             'requested_quantity': requested_qty,
@@ -147,22 +385,105 @@ class OrderExecutor:
             # P1 #4: KIS 실패 응답에 msg1 부재 가능 → .get()으로 KeyError 방지
             'response_msg': response.get('msg1') if response else None,
             'transaction_order': order_index,  # 실행 순서 (Google Sheets 기록용)
+            # 체결 확인(_reconcile_fills) 전에는 평균 체결가를 모른다. order_no는 체결 조회 키 (출력 컬럼 아님).
+            'avg_fill_price': None,
+            'order_no': (response.get('output') or {}).get('ODNO') if is_success else None,
+        }
+        if journal is not None:
+            journal.record_result(key, result)
+        return result
+
+    @staticmethod
+    def _resume_from_journal(journal: ExecutionJournal, key: str, ticker: str, order_index: int) -> Optional[dict]:
+        """재개 실행: 기록된 결과는 그대로, 응답 없이 끊긴 제출은 in_doubt로 반환. 해당 없으면 None."""
+        prior = journal.result_for(key)
+        if prior is not None:
+            logger.info('[%s] 저널 재개: 기록된 주문 결과 재사용 (filled=%s)', key, prior['filled_quantity'])
+            return {**prior, 'transaction_order': order_index, 'resumed': True}
+        in_doubt_qty = journal.in_doubt_quantity(key)
+        if in_doubt_qty is None:
+            return None
+        # 제출 후 응답 전에 끊김 → KIS 접수 여부 불명. 중복 주문을 피하려 재주문하지 않는다.
+        logger.warning('[%s] 저널 재개: 응답 없는 제출(%s주) → 재주문하지 않고 in_doubt 처리', key, in_doubt_qty)
+        return {
+            'ticker': ticker,
+            'enable_quantity': None,
+            'requested_quantity': in_doubt_qty,
+            'filled_quantity': 0,
+            'transaction_quantity': 0,
+            'calc_price': None,
+            'skipped_reason': 'in_doubt',
+            'is_success': None,
+            'response_msg': None,
+            'transaction_order': order_index,
+            'avg_fill_price': None,
+            'order_no': None,
+            'resumed': True,
         }
 
-    def _get_orderable_qty(self, ticker: str, transaction_type: str, available_cash: Optional[int] = None) -> tuple[int, Optional[int]]:
+    def _reconcile_fills(self, transaction_type: str, results: list) -> None:
+        """단계 종료 후 실제 체결 수량·평균 체결가를 주문 결과 dict에 반영한다 (제자리 갱신).
+
+        주문번호가 있는(KIS가 접수한) 주문만 대상이며, 당일 주문체결 조회 한 번의 페이지 순회로 모두
+        확인한다. 미체결 잔량이 남은 주문이 있으면 `fill_poll_interval_seconds` 간격으로
+        `fill_poll_timeout_seconds`까지 다시 조회한다. 조회 실패나 목록에 없는 주문은 종전 값(접수 수량
+        전량 체결)을 유지 — 체결 확인은 정확도 보강일 뿐 주문 흐름을 막지 않는다.
+        """
+        if self.is_test or not self.policy.reconcile_fills:
+            return
+        pending = {str(r['order_no']).lstrip('0'): r for r in results if r.get('order_no')}
+        if not pending:
+            return
+        reconciled = {}
+        deadline = time.monotonic() + self.policy.fill_poll_timeout_seconds
+        sweeps = 0
+        while pending:
+            try:
+                fills = self.kis_client.fetch_daily_order_fills(list(pending))
+            except KISAPIError as e:
+                logger.warning('%s 체결 조회 실패 — 접수 수량으로 기록: %s', transaction_type, e)
+                break
+            sweeps += 1
+            for no, fill in fills.items():
+                order_result = pending[no]
+                order_result['filled_quantity'] = fill['filled_quantity']
+                order_result['transaction_quantity'] = fill['filled_quantity']  # deprecated alias = filled
+                order_result['avg_fill_price'] = fill['avg_price'] if fill['filled_quantity'] > 0 else None
+                reconciled[no] = order_result
+                if fill['remaining_quantity'] == 0 or fill['filled_quantity'] >= order_result['requested_quantity']:
+                    del pending[no]
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(self.policy.fill_poll_interval_seconds)
+        if pending:
+            logger.warning('%s 체결 미확정 %s건 (미체결 잔량 또는 조회 목록 누락): %s',
+                           transaction_type, len(pending), [r['ticker'] for r in pending.values()])
+        logger.info('%s 체결 확인: %s건 반영 (조회 %s회)', transaction_type, len(reconciled), sweeps)
+        if self._journal is not None:
+            for order_result in reconciled.values():
+                self._journal.record_result(order_key(transaction_type, order_result['ticker']), order_result)
+
+    def _get_orderable_qty(
+        self,
+        ticker: str,
+        transaction_type: str,
+        available_cash: Optional[int] = None,
+        enable: Optional[dict] = None,
+    ) -> tuple[int, Optional[int]]:
         """매수 또는 매도 가능 수량을 조회한다.
 
         매수의 경우:
         - available_cash가 전달되면 해당 값을 기준으로 수량을 계산한다 (연속 매수 시 잔여 현금 추적용).
         - 전달되지 않으면 prvs_rcdl_excc_amt(D+2 예수금) 기준으로 폴백한다.
         가능수량 산정 단가는 inquire-psbl-order의 psbl_qty_calc_unpr을 그대로 사용한다.
+        enable(선조회 응답)이 주어지면 KIS 재조회 없이 그 응답을 사용한다.
 
         Returns:
             (qty, calc_price): 매수의 경우 calc_price는 inquire-psbl-order의
             psbl_qty_calc_unpr(보수단가). 매도는 calc_price=None.
         """
         if transaction_type == 'buy':
-            result = self.kis_client.fetch_domestic_enable_buy(ticker=ticker, ord_dvsn='01')
+            result = enable if enable is not None else self.kis_client.fetch_domestic_enable_buy(ticker=ticker, ord_dvsn='01')
             calc_price = int(result['psbl_qty_calc_unpr'])
             if available_cash is not None:
                 cash_balance = available_cash
@@ -176,6 +497,7 @@ class OrderExecutor:
             )
             return qty, calc_price
         elif transaction_type == 'sell':
-            qty = int(self.kis_client.fetch_domestic_enable_sell(ticker=ticker)['ord_psbl_qty'])
+            result = enable if enable is not None else self.kis_client.fetch_domestic_enable_sell(ticker=ticker)
+            qty = int(result['ord_psbl_qty'])
             return qty, None
         raise ValueError(f"transaction_type must be 'buy' or 'sell', got: {transaction_type!r}")
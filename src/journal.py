@@ -0,0 +1,278 @@
+"""주문 실행 저널 — 크래시 후 재시작 시 중단 지점부터 이어서 실행.
+
+`run_rebalancing` 도중 프로세스가 죽으면 흔적은 run_state의 'started'뿐이라, STALE_MINUTES(30분)가
+지나 좀비로 판정될 때까지 재시도가 막히고 그 뒤에는 처음부터 다시 계획했다. 본 모듈은 계획·주문 제출·
+KIS 응답을 발생 즉시 append-only JSONL 파일에 기록(fsync)하고, 재시작한 실행이 같은 run_id로
+이어서 진행하게 한다.
+
+핵심 설계:
+- 파일: `{directory}/{account_type}_{run_id}.jsonl`, 한 줄 = 이벤트 1건.
+  `run_started` → `plan` → (`order_submitted` → `order_result`)* → `mark`(단계 완료) …
+  결과 전달(sink)까지 끝나면 `complete()`가 파일을 지운다 → 남아 있는 파일 = 미완료 run.
+- write-ahead: KIS 주문 전 `order_submitted`를 먼저 기록. 재개 시 결과가 기록된 주문은 결과를
+  재사용하고(재주문 없음), 제출 기록만 있는 주문은 체결 여부를 알 수 없으므로 재주문하지 않고
+  'in_doubt'로 표시한다 (중복 주문 방지가 우선).
+- 재개 범위: run_started 후 `max_age_seconds`(기본 STALE_MINUTES) 이내의 미완료 저널만 이어서
+  실행. 그보다 오래된 저널은 `.abandoned`로 바꿔 두고 종전처럼 새로 계획한다.
+- GCS 동기화(선택): `EXECUTION_JOURNAL_URI=gs://...`면 이벤트마다 저널 파일을 GCS 객체로 덮어써서
+  컨테이너가 사라져도 다음 실행이 내려받아 재개한다 (google-cloud-storage 지연 import).
+- 크래시로 마지막 줄이 잘렸으면 그 줄만 버리고 읽는다.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+from src.bigquery.client import STALE_MINUTES
+from src.config.env import EXECUTION_JOURNAL_URI, PROJECT_ROOT
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_SUFFIX = '.jsonl'
+
+
+def _json_default(value):
+    # numpy 스칼라(int64·bool_ 등)는 파이썬 기본 타입으로, 그 외(Timestamp 등)는 문자열로.
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def order_key(transaction_type: str, ticker: str) -> str:
+    """저널에서 주문을 식별하는 키. 한 run에서 종목별 매수·매도는 각각 최대 1건."""
+    return f'{transaction_type}:{ticker}'
+
+
+class GCSJournalMirror:
+    """저널 파일을 `gs://bucket/prefix/<파일명>`으로 미러링.
+
+    Args:
+        uri: `gs://bucket[/prefix]`.
+        client: 주입할 google.cloud.storage.Client. None이면 첫 사용 시 기본 자격 증명으로 생성.
+    """
+
+    def __init__(self, uri: str, client=None) -> None:
+        if not uri.startswith('gs://'):
+            raise ValueError(f"GCS URI는 gs://로 시작해야 합니다: {uri}")
+        bucket, _, prefix = uri[len('gs://'):].partition('/')
+        if not bucket:
+            raise ValueError(f"GCS bucket이 비어 있습니다: {uri}")
+        self.bucket_name = bucket
+        self.prefix = prefix.strip('/')
+        self._client = client
+
+    def _bucket(self):
+        if self._client is None:
+            from google.cloud import storage
+            self._client = storage.Client()
+        return self._client.bucket(self.bucket_name)
+
+    def _name(self, filename: str) -> str:
+        return f'{self.prefix}/{filename}' if self.prefix else filename
+
+    def upload(self, path: Path) -> None:
+        self._bucket().blob(self._name(path.name)).upload_from_filename(str(path))
+
+    def delete(self, filename: str) -> None:
+        from google.api_core.exceptions import NotFound
+        try:
+            self._bucket().blob(self._name(filename)).delete()
+        except NotFound:
+            pass
+
+    def download_all(self, account_type: str, directory: Path) -> None:
+        """account_type의 미완료 저널을 directory로 내려받는다 (로컬에 이미 있으면 건너뜀)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        bucket = self._bucket()
+        for blob in bucket.list_blobs(prefix=self._name(f'{account_type}_')):
+            filename = blob.name.rsplit('/', 1)[-1]
+            if filename.endswith(JOURNAL_SUFFIX) and not (directory / filename).exists():
+                blob.download_to_filename(str(directory / filename))
+
+
+class ExecutionJournal:
+    """run 1건의 append-only 실행 저널. 생성은 `open` / `find_unfinished`로."""
+
+    def __init__(self, path: Path, events: list, mirror: Optional[GCSJournalMirror] = None) -> None:
+        self.path = Path(path)
+        self.mirror = mirror
+        self._lock = threading.Lock()
+        self._events: list = []
+        self._plan: Optional[list] = None
+        self._submitted: dict = {}
+        self._results: dict = {}
+        self._marks: set = set()
+        for event in events:
+            self._apply(event)
+        header = self._events[0] if self._events else {}
+        self.run_id: str = header.get('run_id', '')
+        self.account_type: str = header.get('account_type', '')
+        self.started_at: float = header.get('ts', 0.0)
+
+    # ------------------------------------------------------------------ #
+    # 생성·탐색                                                              #
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def open(
+        cls, directory: Path, account_type: str, run_id: str,
+        mirror: Optional[GCSJournalMirror] = None, clock: Callable[[], float] = time.time,
+    ) -> 'ExecutionJournal':
+        """새 run의 저널을 만든다."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        journal = cls(directory / f'{account_type}_{run_id}{JOURNAL_SUFFIX}', [], mirror=mirror)
+        journal.run_id, journal.account_type, journal.started_at = run_id, account_type, clock()
+        journal._append({'event': 'run_started', 'run_id': run_id, 'account_type': account_type, 'ts': journal.started_at})
+        return journal
+
+    @classmethod
+    def load(cls, path: Path, mirror: Optional[GCSJournalMirror] = None) -> 'ExecutionJournal':
+        events = []
+        lines = Path(path).read_text(encoding='utf-8').splitlines()
+        for n, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                if n == len(lines) - 1:
+                    logger.warning('저널 마지막 줄 손상(쓰는 중 크래시) — 무시: %s', path)
+                    break
+                raise
+        return cls(path, events, mirror=mirror)
+
+    @classmethod
+    def find_unfinished(
+        cls, directory: Path, account_type: str,
+        max_age_seconds: float = STALE_MINUTES * 60,
+        mirror: Optional[GCSJournalMirror] = None, clock: Callable[[], float] = time.time,
+    ) -> Optional['ExecutionJournal']:
+        """account_type의 가장 최근 미완료 저널. max_age_seconds보다 오래된 저널은 abandon 처리."""
+        directory = Path(directory)
+        if mirror is not None:
+            mirror.download_all(account_type, directory)
+        if not directory.exists():
+            return None
+        journals = [cls.load(path, mirror=mirror) for path in directory.glob(f'{account_type}_*{JOURNAL_SUFFIX}')]
+        journals.sort(key=lambda j: j.started_at, reverse=True)
+        found = None
+        for journal in journals:
+            if found is None and clock() - journal.started_at <= max_age_seconds:
+                found = journal
+            else:
+                journal.abandon()
+        if found is not None:
+            logger.info('미완료 저널 발견 → 재개: run_id=%s, 결과 기록 %d건, 미확인 제출 %d건',
+                        found.run_id, len(found._results), len(found.in_doubt_keys()))
+        return found
+
+    # ------------------------------------------------------------------ #
+    # 기록                                                                  #
+    # ------------------------------------------------------------------ #
+
+    def _apply(self, event: dict) -> None:
+        self._events.append(event)
+        kind = event.get('event')
+        if kind == 'plan':
+            self._plan = event['records']
+        elif kind == 'order_submitted':
+            self._submitted[event['key']] = event['quantity']
+        elif kind == 'order_result':
+            self._results[event['key']] = event['result']
+        elif kind == 'mark':
+            self._marks.add(event['name'])
+
+    def _append(self, event: dict) -> None:
+        line = json.dumps(event, ensure_ascii=False, default=_json_default)
+        with self._lock:
+            with self.path.open('a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(event)
+            if self.mirror is not None:
+                try:
+                    self.mirror.upload(self.path)
+                except Exception as e:
+                    # 로컬 저널은 이미 기록됨 — 동기화 실패가 주문 흐름을 막지 않게 경고만.
+                    logger.warning('저널 GCS 동기화 실패: %s', e)
+
+    def record_plan(self, plan_df: pd.DataFrame) -> None:
+        self._append({'event': 'plan', 'records': json.loads(plan_df.to_json(orient='records', force_ascii=False))})
+
+    def record_submitted(self, key: str, quantity: int) -> None:
+        """KIS 주문 직전 기록 (write-ahead)."""
+        self._append({'event': 'order_submitted', 'key': key, 'quantity': int(quantity), 'ts': time.time()})
+
+    def record_result(self, key: str, result: dict) -> None:
+        self._append({'event': 'order_result', 'key': key, 'result': result, 'ts': time.time()})
+
+    def mark(self, name: str) -> None:
+        """단계 완료 표시 (예: 'settled' — 매도 대금 반영 대기 완료)."""
+        self._append({'event': 'mark', 'name': name, 'ts': time.time()})
+
+    # ------------------------------------------------------------------ #
+    # 조회                                                                  #
+    # ------------------------------------------------------------------ #
+
+    @property
+    def plan(self) -> Optional[pd.DataFrame]:
+        return pd.DataFrame(self._plan) if self._plan is not None else None
+
+    def result_for(self, key: str) -> Optional[dict]:
+        return self._results.get(key)
+
+    def in_doubt_quantity(self, key: str) -> Optional[int]:
+        """제출 기록은 있지만 응답이 없는 주문의 수량. 해당 없으면 None."""
+        if key in self._submitted and key not in self._results:
+            return self._submitted[key]
+        return None
+
+    def in_doubt_keys(self) -> list:
+        return [key for key in self._submitted if key not in self._results]
+
+    def has_mark(self, name: str) -> bool:
+        return name in self._marks
+
+    # ------------------------------------------------------------------ #
+    # 종료                                                                  #
+    # ------------------------------------------------------------------ #
+
+    def complete(self) -> None:
+        """결과 전달까지 끝난 run의 저널 삭제 (로컬 + GCS)."""
+        self.path.unlink(missing_ok=True)
+        if self.mirror is not None:
+            self.mirror.delete(self.path.name)
+        logger.info('저널 완료: run_id=%s', self.run_id)
+
+    def abandon(self) -> None:
+        """재개 범위를 벗어난 저널을 `.abandoned`로 보관 (다시 탐색되지 않음)."""
+        if self.path.exists():
+            self.path.rename(self.path.with_suffix('.abandoned'))
+        if self.mirror is not None:
+            self.mirror.delete(self.path.name)
+        logger.warning('오래된 미완료 저널 보관 처리: %s', self.path.name)
+
+
+def _default_location() -> tuple[Path, Optional[GCSJournalMirror]]:
+    directory = PROJECT_ROOT / 'execution_journal'
+    mirror = GCSJournalMirror(EXECUTION_JOURNAL_URI) if EXECUTION_JOURNAL_URI.startswith('gs://') else None
+    return directory, mirror
+
+
+def open_journal(account_type: str, run_id: str) -> ExecutionJournal:
+    """기본 위치(PROJECT_ROOT/execution_journal, EXECUTION_JOURNAL_URI면 GCS 동기화)에 새 저널."""
+    directory, mirror = _default_location()
+    return ExecutionJournal.open(directory, account_type, run_id, mirror=mirror)
+
+
+def find_unfinished_journal(account_type: str) -> Optional[ExecutionJournal]:
+    """기본 위치에서 재개할 미완료 저널 탐색."""
+    directory, mirror = _default_location()
+    return ExecutionJournal.find_unfinished(directory, account_type, mirror=mirror)
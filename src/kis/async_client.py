@@ -0,0 +1,180 @@
+"""KISClient의 asyncio 변형.
+
+플래너의 종목별 현재가 조회, 실행기의 주문 가능 수량 조회는 종목마다 독립적인
+왕복 요청이다. 순차 호출하면 지연이 종목 수에 비례하므로, 본 모듈은 같은 메서드
+표면을 코루틴으로 노출하고 여러 종목 조회를 동시에 내보내는 fan-out 헬퍼를 제공한다.
+
+핵심 설계:
+- 동기 KISClient 래핑: HTTP·토큰·rt_cd 검증(ARCH-005)은 그대로 재사용하고, 각 호출을
+  `asyncio.to_thread`로 워커 스레드에서 실행한다. 예외(`KISAPIError` 포함)는 변환 없이
+  그대로 전파된다.
+- 동시성 상한: `asyncio.Semaphore(max_concurrency)`. 기본값은 커넥션 풀 크기
+  (`DEFAULT_POOL_MAXSIZE`)와 같아 풀 고갈 없이 keep-alive 커넥션을 재사용한다.
+- 속도 제한: 래핑한 클라이언트의 `KISRateLimiter`가 스레드 안전하므로 fan-out 요청도
+  app key 한도 이내로 자동 조절된다 (한도 초과분은 limiter에서 대기).
+- 동기 호출부(planner/executor)는 `run_sync`로 코루틴을 실행한다.
+"""
+import asyncio
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from src.kis.client import DEFAULT_POOL_MAXSIZE, KISClient
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def run_sync(coro):
+    """동기 코드에서 코루틴을 실행하고 결과를 반환한다.
+
+    이미 이벤트 루프가 돌고 있는 스레드에서는 asyncio.run이 RuntimeError를 내므로,
+    그런 호출부는 AsyncKISClient 코루틴을 직접 await해야 한다.
+    """
+    return asyncio.run(coro)
+
+
+class AsyncKISClient:
+    """KISClient와 같은 메서드를 코루틴으로 제공하는 비동기 래퍼.
+
+    Args:
+        client: 래핑할 동기 KISClient (인증·세션·rate limiter 공유).
+        max_concurrency: 동시에 진행할 KIS 요청 수 상한.
+    """
+
+    def __init__(self, client: KISClient, max_concurrency: int = DEFAULT_POOL_MAXSIZE) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency >= 1이어야 합니다: {max_concurrency}")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        # Semaphore는 이벤트 루프마다 새로 만든다 (run_sync가 호출마다 새 루프를 띄우므로).
+        self._semaphores: dict = {}
+
+    @classmethod
+    async def create(cls, account_type: str, max_concurrency: int = DEFAULT_POOL_MAXSIZE, **kwargs) -> 'AsyncKISClient':
+        """KISClient 생성(토큰 확인·발급 포함)을 워커 스레드에서 수행한 뒤 래핑한다."""
+        client = await asyncio.to_thread(KISClient, account_type, **kwargs)
+        return cls(client, max_concurrency=max_concurrency)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            self._semaphores = {loop: asyncio.Semaphore(self.max_concurrency)}
+            sem = self._semaphores[loop]
+        return sem
+
+    async def _call(self, method_name: str, *args, **kwargs):
+        """동기 클라이언트 메서드를 동시성 상한 안에서 워커 스레드로 실행한다."""
+        method = getattr(self.client, method_name)
+        async with self._semaphore():
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    def close(self) -> None:
+        self.client.close()
+
+    # ------------------------------------------------------------------ #
+    # KISClient 메서드 표면                                                  #
+    # ------------------------------------------------------------------ #
+
+    def is_irp(self) -> bool:
+        return self.client.is_irp()
+
+    async def issue_hashkey(self, data: dict) -> str:
+        return await self._call('issue_hashkey', data)
+
+    async def fetch_domestic_cash_breakdown(self) -> dict:
+        return await self._call('fetch_domestic_cash_breakdown')
+
+    async def fetch_domestic_cash_balance(self) -> int:
+        return await self._call('fetch_domestic_cash_balance')
+
+    async def fetch_domestic_stock_balance(self) -> dict:
+        return await self._call('fetch_domestic_stock_balance')
+
+    async def fetch_oversea_balance(self, exchange_code: str = "NAS") -> dict:
+        return await self._call('fetch_oversea_balance', exchange_code)
+
+    async def fetch_oversea_cash_balance(self, foreign_currency: bool = True) -> dict:
+        return await self._call('fetch_oversea_cash_balance', foreign_currency)
+
+    async def fetch_domestic_total_balance(self) -> pd.DataFrame:
+        return await self._call('fetch_domestic_total_balance')
+
+    async def fetch_oversea_total_balance(self, exchange_code: str = "NAS") -> pd.DataFrame:
+        return await self._call('fetch_oversea_total_balance', exchange_code)
+
+    async def fetch_domestic_enable_buy(self, ticker: str, ord_dvsn: str = '01', price: int = -1) -> dict:
+        return await self._call('fetch_domestic_enable_buy', ticker=ticker, ord_dvsn=ord_dvsn, price=price)
+
+    async def fetch_buy_orderable_cash(self) -> int:
+        return await self._call('fetch_buy_orderable_cash')
+
+    async def fetch_domestic_enable_sell(self, ticker: str) -> dict:
+        return await self._call('fetch_domestic_enable_sell', ticker=ticker)
+
+    async def fetch_domestic_price(self, market_code: str, symbol: str) -> dict:
+        return await self._call('fetch_domestic_price', market_code, symbol)
+
+    async def fetch_oversea_price(self, symbol: str, exchange_code: str = "NAS") -> dict:
+        return await self._call('fetch_oversea_price', symbol, exchange_code)
+
+    async def fetch_price(self, ticker: str) -> float:
+        return await self._call('fetch_price', ticker)
+
+    async def fetch_holiday(self, base_dt: str) -> list:
+        return await self._call('fetch_holiday', base_dt)
+
+    async def create_domestic_order(self, transaction_type: str, ticker: str, ord_qty: int, ord_dvsn: str, price: int = -1) -> dict:
+        return await self._call(
+            'create_domestic_order', transaction_type, ticker, ord_qty=ord_qty, ord_dvsn=ord_dvsn, price=price,
+        )
+
+    # ------------------------------------------------------------------ #
+    # fan-out 헬퍼                                                           #
+    # ------------------------------------------------------------------ #
+
+    async def fetch_prices(self, tickers: Iterable[str]) -> dict:
+        """여러 종목의 현재가를 동시에 조회한다.
+
+        Returns:
+            dict: {ticker: 현재가(float)}. 입력 순서 유지, 중복 ticker는 1회만 조회.
+        Raises:
+            KISAPIError: 어느 한 종목이라도 조회에 실패하면 그대로 전파.
+        """
+        unique = list(dict.fromkeys(tickers))
+        prices = await asyncio.gather(*(self.fetch_price(t) for t in unique))
+        return dict(zip(unique, prices))
+
+    async def fetch_orderable(self, transaction_type: str, tickers: Iterable[str]) -> dict:
+        """여러 종목의 매수/매도 가능 조회(inquire-psbl-order / inquire-psbl-sell)를 동시에 수행한다.
+
+        매수는 시장가(ord_dvsn='01') 기준. 수량 산정(잔여 현금 추적)은 호출부 책임이며,
+        여기서는 종목별 원본 응답(output)만 모은다.
+
+        Returns:
+            dict: {ticker: KIS output dict}. 입력 순서 유지.
+        """
+        unique = list(dict.fromkeys(tickers))
+        if transaction_type == 'buy':
+            calls = (self.fetch_domestic_enable_buy(ticker=t, ord_dvsn='01') for t in unique)
+        elif transaction_type == 'sell':
+            calls = (self.fetch_domestic_enable_sell(ticker=t) for t in unique)
+        else:
+            raise ValueError(f"transaction_type must be 'buy' or 'sell', got: {transaction_type!r}")
+        outputs = await asyncio.gather(*calls)
+        return dict(zip(unique, outputs))
+
+
+def fetch_prices_concurrently(client: KISClient, tickers: Iterable[str], max_concurrency: Optional[int] = None) -> dict:
+    """동기 호출부용: 종목별 현재가를 동시에 조회해 {ticker: price}로 반환."""
+    async_client = AsyncKISClient(client, max_concurrency=max_concurrency or DEFAULT_POOL_MAXSIZE)
+    return run_sync(async_client.fetch_prices(tickers))
+
+
+def fetch_orderable_concurrently(
+    client: KISClient, transaction_type: str, tickers: Iterable[str], max_concurrency: Optional[int] = None,
+) -> dict:
+    """동기 호출부용: 종목별 매수/매도 가능 조회를 동시에 수행해 {ticker: output}으로 반환."""
+    async_client = AsyncKISClient(client, max_concurrency=max_concurrency or DEFAULT_POOL_MAXSIZE)
+    return run_sync(async_client.fetch_orderable(transaction_type, tickers))
@@ -0,0 +1,101 @@
+"""KIS 시세·주문가능 조회 단기 캐시.
+
+한 번의 리밸런싱 안에서 planner가 현재가를 조회하고, 수 초 뒤 executor가 같은 종목의
+매수/매도 가능 조회를 다시 호출한다. 값이 거의 변하지 않는 짧은 구간의 중복 왕복을
+없애기 위해 `KISClient`가 본 캐시를 소유한다.
+
+핵심 설계:
+- 키: `(endpoint, ticker)`. endpoint는 논리 이름('price', 'inquire-psbl-order' 등).
+- TTL 상한(`ttl_seconds`)과 크기 상한(`max_entries`, LRU 축출)을 함께 적용.
+  ttl_seconds=0이면 저장하지 않는다 (캐시 비활성).
+- 명시적 무효화: 주문(`create_domestic_order`) 직후 전체 무효화 → 예수금·매도가능
+  수량처럼 주문으로 바뀌는 값이 stale하게 남지 않는다.
+- hit/miss 카운터로 효과를 관측 (`stats()`).
+- 스레드 안전: AsyncKISClient fan-out이 워커 스레드에서 동시에 접근하므로 Lock 사용.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+DEFAULT_QUOTE_TTL_SECONDS = 5.0
+DEFAULT_QUOTE_CACHE_MAX_ENTRIES = 256
+
+_MISSING = object()
+
+
+class QuoteCache:
+    """TTL + 크기 상한 LRU 캐시.
+
+    Args:
+        ttl_seconds: 항목 유효 시간(초). 0이면 캐시 비활성.
+        max_entries: 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목부터 축출.
+        clock: 단조 시계 (테스트 주입용).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_QUOTE_TTL_SECONDS,
+        max_entries: int = DEFAULT_QUOTE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds >= 0이어야 합니다: {ttl_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries >= 1이어야 합니다: {max_entries}")
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, endpoint: str, ticker: str, default: Any = None) -> Any:
+        """유효한 항목이면 값을, 없거나 만료됐으면 default를 반환한다 (hit/miss 집계)."""
+        key = (endpoint, ticker)
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, endpoint: str, ticker: str, value: Any) -> None:
+        if self.ttl_seconds == 0:
+            return
+        key = (endpoint, ticker)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, endpoint: str, ticker: str, fetch: Callable[[], Any]) -> Any:
+        """캐시 hit이면 값을, miss면 fetch() 결과를 저장 후 반환한다. fetch 예외는 그대로 전파."""
+        value = self.get(endpoint, ticker, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.set(endpoint, ticker, value)
+        return value
+
+    def invalidate(self, endpoint: Optional[str] = None, ticker: Optional[str] = None) -> None:
+        """조건에 맞는 항목을 제거한다. 인자가 모두 None이면 전체 제거."""
+        with self._lock:
+            if endpoint is None and ticker is None:
+                self._entries.clear()
+                return
+            for key in [
+                k for k in self._entries
+                if (endpoint is None or k[0] == endpoint) and (ticker is None or k[1] == ticker)
+            ]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
@@ -0,0 +1,246 @@
+"""KRX 거래일 캘린더 — 휴장일 조회(CTCA0903R) 월 단위 영속 캐시.
+
+종전 `KISClient.is_trading_day`는 실행마다 `fetch_holiday`(KIS 권장: 1일 1회 호출)를 부르고
+반환 목록을 선형 탐색했다. 휴장일 정보는 거의 변하지 않으므로 한 번 받은 결과를 월 단위 파일로
+저장해 두고, 스케줄링 판단(`is_trading_day`·`next_trading_day`·`settlement_date`)은 메모리
+날짜 인덱스에서 네트워크 호출 없이 답한다.
+
+핵심 설계:
+- 저장 단위는 월(YYYYMM) — `{'fetched_at': 'YYYY-MM-DD', 'days': {'YYYYMMDD': {...}}}`.
+  저장소는 `LocalCalendarStore`(파일, 원자적 교체) 또는 `GCSCalendarStore`(Cloud Run처럼
+  컨테이너 파일시스템이 매번 비는 환경용, google-cloud-storage 지연 import).
+- 증분 갱신: 조회 대상 날짜가 캐시에 없을 때만 그 날짜부터 `fetch_holiday`를 호출하고, 응답에
+  포함된 모든 날짜를 해당 월 파일에 병합한다. 이미 지난 달은 확정으로 보고, 아직 남은 날이 있는
+  달은 `refresh_days`(기본 7일)가 지나면 오늘 이후 구간만 다시 받는다 (임시공휴일 지정 반영).
+- 거래일 판정은 종전과 동일: `opnd_yn == 'Y' and sttl_day_yn == 'Y'`. 응답에 없는 날짜는 False.
+"""
+import calendar as _calendar
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+CALENDAR_REFRESH_DAYS = 7
+# 한 번의 판정에서 허용하는 fetch_holiday 최대 호출 수 (KIS 호출 예산 보호).
+MAX_FETCHES_PER_LOOKUP = 3
+# next_trading_day / settlement_date 탐색 상한 (설·추석 연휴를 넉넉히 포함).
+MAX_LOOKAHEAD_DAYS = 31
+
+_DATE_FMT = '%Y%m%d'
+_KEPT_FIELDS = ('opnd_yn', 'sttl_day_yn', 'bzdy_yn', 'tr_day_yn')
+
+
+def kst_today() -> date:
+    """KST 기준 오늘. Cloud Run 컨테이너는 UTC라 `date.today()`는 00~09시 KST에 전날을 돌려준다."""
+    return datetime.now(ZoneInfo('Asia/Seoul')).date()
+
+
+def _month_key(d: date) -> str:
+    return d.strftime('%Y%m')
+
+
+class LocalCalendarStore:
+    """월별 캘린더를 `directory/trading_calendar_YYYYMM.json`으로 보관."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, month: str) -> Path:
+        return self.directory / f'trading_calendar_{month}.json'
+
+    def load(self, month: str) -> Optional[dict]:
+        path = self._path(month)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            logger.warning('거래일 캘린더 캐시 파싱 실패 — 재조회: %s', path)
+            return None
+
+    def save(self, month: str, payload: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(month)
+        tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, path)   # 동시 실행 프로세스가 반쯤 쓴 파일을 읽지 않도록 원자적 교체
+
+
+class GCSCalendarStore:
+    """월별 캘린더를 `gs://bucket/prefix/trading_calendar_YYYYMM.json`으로 보관.
+
+    Args:
+        uri: `gs://bucket[/prefix]`.
+        client: 주입할 google.cloud.storage.Client. None이면 첫 사용 시 기본 자격 증명으로 생성.
+    """
+
+    def __init__(self, uri: str, client=None) -> None:
+        if not uri.startswith('gs://'):
+            raise ValueError(f"GCS URI는 gs://로 시작해야 합니다: {uri}")
+        bucket, _, prefix = uri[len('gs://'):].partition('/')
+        if not bucket:
+            raise ValueError(f"GCS bucket이 비어 있습니다: {uri}")
+        self.bucket_name = bucket
+        self.prefix = prefix.strip('/')
+        self._client = client
+
+    def _blob(self, month: str):
+        if self._client is None:
+            from google.cloud import storage
+            self._client = storage.Client()
+        name = f'trading_calendar_{month}.json'
+        return self._client.bucket(self.bucket_name).blob(f'{self.prefix}/{name}' if self.prefix else name)
+
+    def load(self, month: str) -> Optional[dict]:
+        from google.api_core.exceptions import NotFound
+        try:
+            return json.loads(self._blob(month).download_as_text())
+        except NotFound:
+            return None
+        except json.JSONDecodeError:
+            logger.warning('거래일 캘린더 캐시(GCS) 파싱 실패 — 재조회: %s', month)
+            return None
+
+    def save(self, month: str, payload: dict) -> None:
+        self._blob(month).upload_from_string(
+            json.dumps(payload, indent=2, sort_keys=True), content_type='application/json',
+        )
+
+
+class TradingCalendar:
+    """거래일 판정을 월 단위 캐시 + 메모리 날짜 인덱스로 제공한다.
+
+    Args:
+        fetch_holiday: base_dt(YYYYMMDD) 이후 날짜별 휴장 정보 목록을 반환 (`KISClient.fetch_holiday`).
+        store: 월별 영속 저장소. None이면 프로세스 메모리에만 보관.
+        refresh_days: 남은 날이 있는 달의 캐시를 신뢰하는 기간.
+        today: 오늘 날짜 제공자 (기본 KST, 테스트 주입용).
+    """
+
+    def __init__(
+        self,
+        fetch_holiday: Callable[[str], list],
+        store=None,
+        refresh_days: int = CALENDAR_REFRESH_DAYS,
+        today: Callable[[], date] = kst_today,
+    ) -> None:
+        if refresh_days < 0:
+            raise ValueError(f"refresh_days >= 0이어야 합니다: {refresh_days}")
+        self._fetch_holiday = fetch_holiday
+        self.store = store
+        self.refresh_days = refresh_days
+        self._today = today
+        self._lock = threading.RLock()
+        self._months: dict = {}   # YYYYMM → payload (검증 완료분만)
+        self._days: dict = {}     # date → (개장 여부, 결제일 여부)
+        self.fetch_count = 0
+
+    # ------------------------------------------------------------------ #
+    # 캐시                                                                  #
+    # ------------------------------------------------------------------ #
+
+    def _is_fresh(self, month: str, payload: dict) -> bool:
+        if not payload.get('fetched_at') or 'days' not in payload:
+            return False
+        fetched_at = datetime.strptime(payload['fetched_at'], '%Y-%m-%d').date()
+        year, mon = int(month[:4]), int(month[4:])
+        month_end = date(year, mon, _calendar.monthrange(year, mon)[1])
+        # 이미 지난 달은 확정 (과거 날짜의 휴장 여부는 판단에 영향 없음). 그 외에는 refresh_days 이내만 신뢰.
+        today = self._today()
+        return month_end < today or (today - fetched_at).days < self.refresh_days
+
+    def _index(self, payload: dict) -> None:
+        for day_str, info in payload['days'].items():
+            day = datetime.strptime(day_str, _DATE_FMT).date()
+            self._days[day] = (info.get('opnd_yn') == 'Y', info.get('sttl_day_yn') == 'Y')
+
+    def _load_month(self, month: str) -> Optional[dict]:
+        """메모리 → 저장소 순으로 신선한 월 캐시를 찾는다. 없거나 오래됐으면 None."""
+        if month in self._months:
+            return self._months[month]
+        payload = self.store.load(month) if self.store is not None else None
+        if payload is None or not self._is_fresh(month, payload):
+            return None
+        self._months[month] = payload
+        self._index(payload)
+        return payload
+
+    def _merge(self, rows: list) -> None:
+        """fetch_holiday 응답을 월별로 나눠 병합하고 저장소에 기록."""
+        fetched_at = self._today().strftime('%Y-%m-%d')
+        touched = {}
+        for row in rows:
+            day_str = row.get('bass_dt')
+            if not day_str:
+                continue
+            month = day_str[:6]
+            if month not in touched:
+                base = self._months.get(month)
+                if base is None and self.store is not None:
+                    base = self.store.load(month)
+                touched[month] = {'fetched_at': fetched_at, 'days': dict((base or {}).get('days', {}))}
+            touched[month]['days'][day_str] = {k: row[k] for k in _KEPT_FIELDS if k in row}
+        for month, payload in touched.items():
+            self._months[month] = payload
+            self._index(payload)
+            if self.store is not None:
+                self.store.save(month, payload)
+
+    def _ensure(self, target: date) -> None:
+        with self._lock:
+            payload = self._load_month(_month_key(target))
+            if payload is not None and target.strftime(_DATE_FMT) in payload['days']:
+                return
+            # 같은 달의 오늘~target 구간도 함께 갱신되도록 시작점을 당긴다 (지난 날짜는 확정이라 제외).
+            start = min(target, max(self._today(), target.replace(day=1)))
+            for _ in range(MAX_FETCHES_PER_LOOKUP):
+                rows = self._fetch_holiday(start.strftime(_DATE_FMT))
+                self.fetch_count += 1
+                self._merge(rows)
+                if target in self._days:
+                    return
+                fetched = [r['bass_dt'] for r in rows if r.get('bass_dt')]
+                last = datetime.strptime(max(fetched), _DATE_FMT).date() if fetched else None
+                if last is None or last < start:
+                    break
+                start = last + timedelta(days=1)
+            logger.warning('휴장일 조회 결과에 %s 없음 — 비거래일로 간주', target)
+
+    # ------------------------------------------------------------------ #
+    # 조회                                                                  #
+    # ------------------------------------------------------------------ #
+
+    def is_trading_day(self, target: date) -> bool:
+        """개장일이면서 결제일인지 (주문 실행 가능 여부 판단용)."""
+        self._ensure(target)
+        is_open, is_settlement = self._days.get(target, (False, False))
+        return is_open and is_settlement
+
+    def next_trading_day(self, target: date) -> date:
+        """target 다음(미포함) 첫 거래일."""
+        for offset in range(1, MAX_LOOKAHEAD_DAYS + 1):
+            candidate = target + timedelta(days=offset)
+            if self.is_trading_day(candidate):
+                return candidate
+        raise ValueError(f"{target} 이후 {MAX_LOOKAHEAD_DAYS}일 안에 거래일이 없습니다.")
+
+    def settlement_date(self, trade_date: date, days: int = 2) -> date:
+        """체결일 기준 결제일 (기본 T+2). 결제일(sttl_day_yn='Y')만 센다."""
+        if days < 1:
+            raise ValueError(f"days >= 1이어야 합니다: {days}")
+        remaining = days
+        for offset in range(1, MAX_LOOKAHEAD_DAYS + 1):
+            candidate = trade_date + timedelta(days=offset)
+            self._ensure(candidate)
+            if self._days.get(candidate, (False, False))[1]:
+                remaining -= 1
+                if remaining == 0:
+                    return candidate
+        raise ValueError(f"{trade_date} 이후 {MAX_LOOKAHEAD_DAYS}일 안에 T+{days} 결제일이 없습니다.")
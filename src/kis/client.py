@@ -16,16 +16,47 @@
 
 - 응답 형식 정규화: `_normalize_output1/output2`로 ISA(list)/IRP(dict) 응답 차이를
   통일. `_require_int / _optional_int`로 silent failure 방지.
+
+- 커넥션 풀: 모든 HTTP 호출(토큰·해시키 포함)은 클라이언트가 소유한 단일
+  `requests.Session`(keep-alive + HTTPAdapter 풀)을 공유한다. 호출마다 TCP+TLS
+  핸드셰이크를 반복하지 않도록 하기 위함. 풀 크기는 `build_http_session` 인자로 조정.
+
+- 속도 제한: `_get/_post/issue_hashkey`는 요청 직전 `KISRateLimiter`(app key 단위 token
+  bucket, src/kis/rate_limit.py)에서 토큰을 확보한다. 버킷 상태는 토큰 캐시 옆
+  `kis_token_ratelimit_*.json`에 두어 같은 app key를 쓰는 프로세스끼리 공유.
+
+- 시세 캐시: 현재가·매수/매도 가능 조회는 `QuoteCache`(src/kis/cache.py, 짧은 TTL)에
+  `(endpoint, ticker)`로 저장해 한 실행 안의 중복 왕복을 없앤다. 주문 직후 전체 무효화.
+
+- 계좌 스냅샷: 잔고 페이지·매수 가능 현금은 `AccountSnapshot`(src/kis/snapshot.py)이
+  주문 전까지 한 번만 조회해 보관. output1/output2·예수금 요약·총잔고 모두 스냅샷에서 산출.
+
+- 거래일 캘린더: `is_trading_day`·`next_trading_day`·`settlement_date`는 `TradingCalendar`
+  (src/kis/calendar.py)가 휴장일 조회 결과를 월 단위 파일(로컬 또는 GCS)로 캐시해 답한다
+  → 캐시가 있는 달은 CTCA0903R 호출 0회.
+- 주문 해시키: `hashkey_provider`(src/kis/hashkey.py)가 발급. 기본은 첫 주문에서 원격
+  결과로 검증한 뒤 로컬 계산하는 `LocalHashkeyProvider`(불일치 시 원격 폴백).
+  `prefetch_hashkeys`로 주문 루프 전에 미리 받아 둘 수 있다.
 """
+import hashlib
 import os
 import requests
 import json
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Iterable, Optional
 from zoneinfo import ZoneInfo
 from datetime import date, datetime
 
 import pandas as pd
-from src.config.env import PROJECT_ROOT, load_kis_auth_config
+from src.config.env import PROJECT_ROOT, TRADING_CALENDAR_URI, load_kis_auth_config
+from src.kis.cache import QuoteCache
+from src.kis.calendar import GCSCalendarStore, LocalCalendarStore, TradingCalendar
+from src.kis.hashkey import LocalHashkeyProvider, RemoteHashkeyProvider
+from src.kis.price_rule import upper_limit_price
+from src.kis.snapshot import AccountSnapshot
+from src.kis.rate_limit import (
+    DEFAULT_BURST, DEFAULT_RATE_PER_SECOND, MOCK_BURST, MOCK_RATE_PER_SECOND, KISRateLimiter,
+)
 from src.logger import get_logger, log_method_call
 
 logger = get_logger(__name__)
@@ -34,6 +65,9 @@ logger = get_logger(__name__)
 # nrcvb_buy_amt 자체는 종목 무관 계좌 단위 상수임이 실험으로 확정됨 (test/dump_isa_orderable.py).
 DUMMY_TICKER_FOR_ORDERABLE_CASH = '005930'  # 삼성전자, 상장폐지 위험 사실상 없음
 
+# 관심종목(멀티종목) 시세조회 1회 호출당 최대 종목 수 (FHKST11300006, 모의투자 미지원).
+MULTI_PRICE_MAX_TICKERS = 30
+
 
 # === KIS HTTP 견고성 (ARCH-005) =========================================== #
 # 모든 KIS API 호출은 본 모듈의 _request/_parse_json/_check_rt_cd 경로를
@@ -42,6 +76,42 @@ DUMMY_TICKER_FOR_ORDERABLE_CASH = '005930'  # 삼성전자, 상장폐지 위험
 
 DEFAULT_REQUEST_TIMEOUT = 10  # seconds. 외부 API 응답 대기 상한.
 
+# 커넥션 풀 설정. KIS는 단일 호스트(openapi.koreainvestment.com)라 호스트별 풀 1~2개면 충분하고,
+# 호스트당 유지 커넥션 수(pool_maxsize)가 동시 요청 상한을 결정한다.
+DEFAULT_POOL_CONNECTIONS = 2   # 캐시할 호스트별 풀 개수 (실전/모의 base_url)
+DEFAULT_POOL_MAXSIZE = 10      # 호스트당 keep-alive 커넥션 상한
+
+
+def build_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+) -> requests.Session:
+    """KIS 호출용 keep-alive 세션을 생성한다.
+
+    Args:
+        pool_connections: 캐시할 호스트별 커넥션 풀 개수.
+        pool_maxsize: 호스트당 유지할 최대 커넥션 수 (동시 요청 상한).
+        pool_block: True면 풀이 가득 찼을 때 새 커넥션을 만들지 않고 대기.
+
+    재시도는 하지 않는다(max_retries=0) — 주문 POST가 중복 전송되면 안 되므로
+    실패는 종전처럼 KISAPIError로 호출부에 그대로 노출한다.
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError(
+            f"pool_connections/pool_maxsize는 1 이상이어야 합니다: {pool_connections}/{pool_maxsize}"
+        )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=0,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class KISAPIError(RuntimeError):
     """KIS API 호출 실패 도메인 예외.
@@ -127,7 +197,26 @@ class KISClient():
     tr_id는 환경에 따라 달라지며, 각 메서드에서 self.mock으로 분기한다.
     '''
     @log_method_call
-    def __init__(self, account_type: str) -> None:
+    def __init__(
+        self,
+        account_type: str,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[KISRateLimiter] = None,
+        endpoint_weights: Optional[dict] = None,
+        quote_cache: Optional[QuoteCache] = None,
+        hashkey_provider=None,
+    ) -> None:
+        """
+        Args:
+            session: 공유할 keep-alive 세션. None이면 첫 호출 시 생성.
+            rate_limiter: 주입할 limiter. None이면 app key 단위 기본 limiter 생성.
+            endpoint_weights: 기본 limiter의 {path: 소비 토큰 수}. rate_limiter를 주입하면 무시.
+            quote_cache: 시세·주문가능 조회 캐시. None이면 기본 TTL 캐시를 생성.
+            hashkey_provider: 주문 해시키 제공자. None이면 검증형 LocalHashkeyProvider.
+        """
+        # 호출자가 세션을 주입하면 그대로 공유 (여러 계좌 클라이언트가 한 풀을 쓰는 경우 등).
+        self._session = session
+        self._quote_cache = quote_cache
         self.auth_config = load_kis_auth_config(account_type)
         self.acc_no = self.auth_config.account_number
         # KIS API는 계좌번호를 앞 8자리(prefix)와 뒤 2자리(postfix)로 분리해서 전달한다
@@ -142,8 +231,81 @@ class KISClient():
         self.token_file = PROJECT_ROOT / f'kis_token_{account_type}.json'
         self.access_token = None
 
+        self.rate_limiter = rate_limiter or self._default_rate_limiter(endpoint_weights)
+        self._hashkey_provider = hashkey_provider or LocalHashkeyProvider(self)
+
         self.initialize_access_token()
 
+    @property
+    def session(self) -> requests.Session:
+        """모든 KIS 엔드포인트가 공유하는 keep-alive 세션.
+
+        __init__을 거치지 않은 인스턴스(__new__ 기반 테스트 등)에서도 동작하도록 지연 생성.
+        """
+        if getattr(self, '_session', None) is None:
+            self._session = build_http_session()
+        return self._session
+
+    @property
+    def quote_cache(self) -> QuoteCache:
+        """시세·주문가능 조회 단기 캐시. __new__ 기반 인스턴스에서도 동작하도록 지연 생성."""
+        if getattr(self, '_quote_cache', None) is None:
+            self._quote_cache = QuoteCache()
+        return self._quote_cache
+
+    @property
+    def account_snapshot(self) -> AccountSnapshot:
+        """주문 전까지 유효한 계좌 스냅샷 (잔고 페이지·매수 가능 현금 지연 조회)."""
+        if getattr(self, '_account_snapshot', None) is None:
+            self._account_snapshot = AccountSnapshot(
+                load_pages=self._fetch_domestic_balance_pages,
+                load_orderable_cash=self._fetch_buy_orderable_cash,
+            )
+        return self._account_snapshot
+
+    @property
+    def hashkey_provider(self):
+        """주문 해시키 제공자. __init__을 거치지 않은 인스턴스는 원격 발급(종전 동작)으로 지연 생성."""
+        if getattr(self, '_hashkey_provider', None) is None:
+            self._hashkey_provider = RemoteHashkeyProvider(self)
+        return self._hashkey_provider
+
+    def invalidate_account_snapshot(self) -> None:
+        """계좌 스냅샷을 폐기한다. 다음 잔고·매수 가능 조회는 KIS에서 다시 가져온다.
+
+        매수 가능 한도 로더는 inquire-psbl-order 캐시를 거치므로 더미 ticker 항목도 함께 버린다
+        (남겨두면 TTL 안의 재조회가 스냅샷만 새로 만들고 값은 캐시의 옛 응답을 돌려준다).
+        """
+        self._account_snapshot = None
+        self.quote_cache.invalidate('inquire-psbl-order', DUMMY_TICKER_FOR_ORDERABLE_CASH)
+
+    def close(self) -> None:
+        """풀에 유지 중인 커넥션을 정리한다. 이후 호출 시 세션은 다시 생성된다."""
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+            self._session = None
+
+    def _default_rate_limiter(self, endpoint_weights: Optional[dict] = None) -> KISRateLimiter:
+        """app key 단위 공유 버킷. 상태 파일명은 app key 해시로 구분 (키 원문은 디스크에 남기지 않음).
+
+        endpoint_weights는 호출자가 KISClient 생성 시 지정한다. 모듈 기본 가중치는 두지 않음 —
+        KIS는 엔드포인트 구분 없이 건수로 한도를 세므로 기본은 모든 path 1.
+        """
+        key_digest = hashlib.sha256(self.auth_config.app_key.encode('utf-8')).hexdigest()[:12]
+        return KISRateLimiter(
+            rate_per_second=MOCK_RATE_PER_SECOND if self.mock else DEFAULT_RATE_PER_SECOND,
+            burst=MOCK_BURST if self.mock else DEFAULT_BURST,
+            state_file=self.token_file.with_name(f'kis_token_ratelimit_{key_digest}.json'),
+            endpoint_weights=endpoint_weights,
+        )
+
+    def _throttle(self, path: str) -> None:
+        """요청 직전 rate limit 토큰 확보. limiter 미설정(__new__ 기반 테스트 등)이면 통과."""
+        limiter = getattr(self, 'rate_limiter', None)
+        if limiter is not None:
+            limiter.acquire(path)
+
     # ------------------------------------------------------------------ #
     # 인증                                                                  #
     # ------------------------------------------------------------------ #
@@ -202,7 +364,7 @@ class KISClient():
             "appsecret": self.auth_config.app_secret,
         }
         try:
-            resp = requests.post(url, headers=headers, json=body, timeout=DEFAULT_REQUEST_TIMEOUT)
+            resp = self.session.post(url, headers=headers, json=body, timeout=DEFAULT_REQUEST_TIMEOUT)
         except requests.RequestException as e:
             raise KISAPIError(
                 f"KIS 토큰 발급 요청 실패: {type(e).__name__}", path=path,
@@ -263,8 +425,9 @@ class KISClient():
             "appSecret": self.auth_config.app_secret,
             "User-Agent": "Mozilla/5.0"
         }
+        self._throttle(path)
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 url, headers=headers, data=json.dumps(data),
                 timeout=DEFAULT_REQUEST_TIMEOUT,
             )
@@ -300,6 +463,8 @@ class KISClient():
     # HTTP 헬퍼 (ARCH-005)                                                  #
     # ------------------------------------------------------------------ #
     # 외부 호출은 모두 _get/_post를 통과한다.
+    # - 전송: self.session(keep-alive 풀) 공유 → 호출마다 핸드셰이크 반복 없음
+    # - 속도 제한: self.rate_limiter(token bucket)로 app key 한도 이내 유지
     # - timeout: DEFAULT_REQUEST_TIMEOUT 강제 → 무한 hang 방지
     # - raise_for_status: 4xx/5xx를 HTTPError로 가시화
     # - RequestException(타임아웃·DNS·연결 거부 등): KISAPIError로 감쌈
@@ -308,8 +473,9 @@ class KISClient():
     def _get(self, path: str, tr_id: str, params: dict, **extra) -> requests.Response:
         """공통 GET 요청 헬퍼. timeout + raise_for_status 적용, 실패 시 KISAPIError."""
         url = f"{self.base_url}/{path}"
+        self._throttle(path)
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 url,
                 headers=self._headers(tr_id, **extra),
                 params=params,
@@ -330,8 +496,9 @@ class KISClient():
     def _post(self, path: str, tr_id: str, data: dict, **extra) -> requests.Response:
         """공통 POST 요청 헬퍼. timeout + raise_for_status 적용, 실패 시 KISAPIError."""
         url = f"{self.base_url}/{path}"
+        self._throttle(path)
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 url,
                 headers=self._headers(tr_id, **extra),
                 data=json.dumps(data),
@@ -497,7 +664,7 @@ class KISClient():
 
         참고: docs/kis_cash_guide.md
         """
-        output2 = _normalize_output2(self._domestic_balance_page()['output2'])
+        output2 = self.account_snapshot.cash_output2
         return {
             # 필수 — silent failure 방지 (누락 시 KeyError로 즉시 실패)
             'dnca_tot_amt':       _require_int(output2, 'dnca_tot_amt'),
@@ -535,22 +702,26 @@ class KISClient():
 
     @log_method_call
     def fetch_domestic_stock_balance(self) -> dict:
-        """국내 보유 주식 잔고를 전체 페이지 조회해 반환한다.
+        """국내 보유 주식 잔고를 전체 페이지 조회해 반환한다 (계좌 스냅샷 기준).
 
         Returns:
             dict: output1(보유 종목 목록), output2(계좌 요약)
         """
-        output = {'output1': [], 'output2': []}
+        snapshot = self.account_snapshot
+        return {'output1': snapshot.output1, 'output2': snapshot.output2}
+
+    def _fetch_domestic_balance_pages(self) -> list:
+        """잔고 전체 페이지를 조회해 [(output1 list, output2 dict), ...]로 반환 (스냅샷 로더)."""
+        pages = []
         fk100, nk100 = "", ""
         while True:
             data = self._domestic_balance_page(fk100, nk100)
-            output['output1'].extend(_normalize_output1(data['output1']))
-            output['output2'].append(_normalize_output2(data['output2']))
+            pages.append((_normalize_output1(data['output1']), _normalize_output2(data['output2'])))
             # tr_cont가 'D' 또는 'E'이면 마지막 페이지
             if data['tr_cont'] in ('D', 'E'):
                 break
             fk100, nk100 = data['ctx_area_fk100'], data['ctx_area_nk100']
-        return output
+        return pages
 
     @log_method_call
     def _domestic_balance_page(self, ctx_area_fk100: str = "", ctx_area_nk100: str = "") -> dict:
@@ -756,10 +927,17 @@ class KISClient():
             params['ACCA_DVSN_CD'] = '00'   # IRP 적립금구분(전체)
         else:
             params['OVRS_ICLD_YN'] = 'N'    # ISA·연금저축 전용 (IRP doc에 없음)
-        return self._get_json(self._orderable_url(), self._orderable_tr_id(), params)['output']
+
+        def fetch() -> dict:
+            return self._get_json(self._orderable_url(), self._orderable_tr_id(), params)['output']
+
+        # 시장가 조회만 캐시 (지정가는 주문단가별로 응답이 달라 키가 모호해짐)
+        if ord_dvsn != '01':
+            return fetch()
+        return self.quote_cache.get_or_fetch('inquire-psbl-order', ticker, fetch)
 
     @log_method_call
-    def fetch_buy_orderable_cash(self) -> int:
+    def fetch_buy_orderable_cash(self, refresh: bool = False) -> int:
         """미수 없는 매수 가능 한도를 반환한다.
 
         ISA·연금저축(PPA): inquire-psbl-order의 nrcvb_buy_amt(미수없는 매수 가능 금액)를 사용.
@@ -774,8 +952,17 @@ class KISClient():
         - 잔고/총자산 산정 → fetch_domestic_cash_balance (prvs_rcdl_excc_amt, KIS tot_evlu_amt 정의 일치)
         - 실제 매수 한도 → 본 함수
 
+        계좌 스냅샷에 메모이즈되며 주문 시 무효화된다. refresh=True면 스냅샷과 더미 ticker의
+        inquire-psbl-order 캐시 항목을 버리고 KIS에서 재조회.
+
         참고: docs/kis_cash_guide.md
         """
+        if refresh:
+            self.invalidate_account_snapshot()
+        return self.account_snapshot.orderable_cash
+
+    def _fetch_buy_orderable_cash(self) -> int:
+        """inquire-psbl-order로 미수 없는 매수 가능 한도를 조회한다 (스냅샷 로더)."""
         enable = self.fetch_domestic_enable_buy(
             ticker=DUMMY_TICKER_FOR_ORDERABLE_CASH, ord_dvsn='01',
         )
@@ -791,9 +978,12 @@ class KISClient():
             'ACNT_PRDT_CD': self.acc_no_postfix,
             'PDNO': ticker,
         }
-        return self._get_json(
-            "uapi/domestic-stock/v1/trading/inquire-psbl-sell", "TTTC8408R", params,
-        )['output']
+        return self.quote_cache.get_or_fetch(
+            'inquire-psbl-sell', ticker,
+            lambda: self._get_json(
+                "uapi/domestic-stock/v1/trading/inquire-psbl-sell", "TTTC8408R", params,
+            )['output'],
+        )
 
     @log_method_call
     def fetch_domestic_price(self, market_code: str, symbol: str) -> dict:
@@ -834,7 +1024,104 @@ class KISClient():
         ticker는 KRX 단축코드(6자리 영숫자, 영문자 섞인 신규 ETF/ETN 코드 포함)를 그대로
         넘긴다. 유효하지 않은 코드면 KIS API가 에러를 반환한다.
         """
-        return float(self.fetch_domestic_price('J', ticker)['output']['stck_prpr'])
+        return self.quote_cache.get_or_fetch('price', ticker, lambda: self._fetch_single_price(ticker))
+
+    def _fetch_single_price(self, ticker: str) -> float:
+        """현재가 단건 조회. 응답의 상한가(stck_mxpr, 없으면 기준가 stck_sdpr로 산정)도 기록."""
+        output = self.fetch_domestic_price('J', ticker)['output']
+        self._record_upper_limit(ticker, _optional_int(output, 'stck_mxpr'), _optional_int(output, 'stck_sdpr'))
+        return float(output['stck_prpr'])
+
+    def upper_limit_price(self, ticker: str) -> Optional[int]:
+        """이번 실행에서 시세 조회(fetch_price·fetch_prices)로 받은 당일 상한가(원). 없으면 None.
+
+        시장가 매수의 가능수량계산단가(psbl_qty_calc_unpr)가 상한가이므로, 로컬 보수단가
+        (`ExecutionPolicy.orderable_price_mode='local'`)가 종목별 inquire-psbl-order 대신 사용한다.
+        상한가는 당일 고정이라 TTL 캐시가 아닌 클라이언트 수명 동안 보관 (실행 1회 = 거래일 1일).
+        """
+        return getattr(self, '_upper_limit_prices', {}).get(ticker)
+
+    def _record_upper_limit(self, ticker: str, upper: int, base: int = 0) -> None:
+        """상한가 기록. 응답에 상한가가 없으면 기준가로 KRX 규칙(`price_rule.upper_limit_price`) 산정."""
+        if upper <= 0 and base > 0:
+            upper = upper_limit_price(base)
+        if upper > 0:
+            if getattr(self, '_upper_limit_prices', None) is None:
+                self._upper_limit_prices = {}
+            self._upper_limit_prices[ticker] = upper
+
+    @log_method_call
+    def fetch_prices(self, tickers: Iterable[str]) -> pd.Series:
+        """여러 국내(KRX) 종목의 현재가를 한 번에 조회한다.
+
+        실전 환경은 관심종목(멀티종목) 시세조회(FHKST11300006)로 최대 30종목씩 묶어 조회하고,
+        모의투자(미지원)이거나 멀티 조회가 실패·누락한 종목은 단건 조회(fetch_price)를
+        AsyncKISClient로 동시 실행해 채운다. 단건 조회 실패는 KISAPIError로 그대로 전파.
+
+        Returns:
+            pd.Series: ticker(index, 중복 제거·입력 순서 유지) → 현재가(float64).
+        """
+        unique = list(dict.fromkeys(tickers))
+        cache = self.quote_cache
+        prices: dict = {}
+        for t in unique:
+            cached = cache.get('price', t)
+            if cached is not None:
+                prices[t] = cached
+        to_fetch = [t for t in unique if t not in prices]
+        if to_fetch and not getattr(self, 'mock', False):
+            for start in range(0, len(to_fetch), MULTI_PRICE_MAX_TICKERS):
+                chunk = to_fetch[start:start + MULTI_PRICE_MAX_TICKERS]
+                try:
+                    fetched = self._fetch_multi_prices(chunk)
+                except KISAPIError as e:
+                    logger.warning('멀티종목 시세조회 실패 — 단건 조회로 폴백: %s', e)
+                    continue
+                for t, price in fetched.items():
+                    cache.set('price', t, price)
+                prices.update(fetched)
+
+        missing = [t for t in unique if t not in prices]
+        if missing:
+            # async_client가 본 모듈을 import하므로 순환 방지를 위해 지연 import
+            from src.kis.async_client import fetch_prices_concurrently
+            prices.update(fetch_prices_concurrently(self, missing))
+
+        return pd.Series(
+            [prices[t] for t in unique],
+            index=pd.Index(unique, name='ticker'),
+            dtype='float64',
+            name='current_price',
+        )
+
+    def _fetch_multi_prices(self, tickers: list) -> dict:
+        """관심종목(멀티종목) 시세조회 1회. 응답에 없거나 가격이 비정상(0·빈값)인 종목은 제외.
+
+        응답의 상한가(inter2_mxpr)는 `upper_limit_price`용으로 기록한다.
+        """
+        if len(tickers) > MULTI_PRICE_MAX_TICKERS:
+            raise ValueError(f"멀티종목 시세조회는 최대 {MULTI_PRICE_MAX_TICKERS}종목: {len(tickers)}")
+        params = {}
+        for i, ticker in enumerate(tickers, start=1):
+            params[f'FID_COND_MRKT_DIV_CODE_{i}'] = 'J'
+            params[f'FID_INPUT_ISCD_{i}'] = ticker
+        payload = self._get_json(
+            "uapi/domestic-stock/v1/quotations/intstock-multprice", "FHKST11300006", params,
+            custtype="P",
+        )
+        requested = set(tickers)
+        prices = {}
+        for row in _normalize_output1(payload.get('output')):
+            ticker = row.get('inter_shrn_iscd')
+            price = _optional_int(row, 'inter2_prpr')
+            if ticker in requested and price > 0:
+                prices[ticker] = float(price)
+                # 상한가가 없으면 전일 종가로 산정 — 권리락 등으로 기준가가 조정되는 날은 전일 종가 ≥ 기준가라
+                # 실제 상한가보다 크거나 같게(보수적으로) 나온다.
+                self._record_upper_limit(
+                    ticker, _optional_int(row, 'inter2_mxpr'), _optional_int(row, 'inter2_prdy_clpr'),
+                )
+        return prices
 
     # ------------------------------------------------------------------ #
     # 휴장일 조회                                                            #
@@ -859,14 +1146,29 @@ class KISClient():
             custtype="P",
         )['output']
 
+    @property
+    def trading_calendar(self) -> TradingCalendar:
+        """휴장일 월 단위 영속 캐시. 계좌와 무관하므로 저장소는 모든 계좌가 공유한다."""
+        if getattr(self, '_trading_calendar', None) is None:
+            if TRADING_CALENDAR_URI.startswith('gs://'):
+                store = GCSCalendarStore(TRADING_CALENDAR_URI)
+            else:
+                store = LocalCalendarStore(TRADING_CALENDAR_URI or PROJECT_ROOT / 'kis_calendar')
+            self._trading_calendar = TradingCalendar(self.fetch_holiday, store=store)
+        return self._trading_calendar
+
     def is_trading_day(self, target_date: date) -> bool:
-        """해당 날짜가 개장일이면서 결제일인지 확인한다 (주문 실행 가능 여부 판단용)."""
-        base_dt = target_date.strftime('%Y%m%d')
-        holidays = self.fetch_holiday(base_dt)
-        today = next((h for h in holidays if h['bass_dt'] == base_dt), None)
-        if today is None:
-            return False
-        return today['opnd_yn'] == 'Y' and today['sttl_day_yn'] == 'Y'
+        """해당 날짜가 개장일이면서 결제일인지 확인한다 (주문 실행 가능 여부 판단용).
+
+        캐시에 해당 월이 있으면 네트워크 호출 없음 (`trading_calendar` 참조).
+        """
+        return self.trading_calendar.is_trading_day(target_date)
+
+    def next_trading_day(self, target_date: date) -> date:
+        return self.trading_calendar.next_trading_day(target_date)
+
+    def settlement_date(self, trade_date: date, days: int = 2) -> date:
+        return self.trading_calendar.settlement_date(trade_date, days)
 
     # ------------------------------------------------------------------ #
     # 주문                                                                  #
@@ -890,6 +1192,95 @@ class KISClient():
             price (int): 지정가 주문 시 주문단가. 시장가(ord_dvsn='01')이면 무시된다.
         """
         tr_id = self._order_tr_id(transaction_type)
+        data = self.build_order_body(ticker, ord_qty, ord_dvsn, price)
+        # 주문 API는 request body 위변조 방지를 위해 해시키 서명이 필수 (prefetch된 값이면 왕복 없음)
+        hashkey = self.hashkey_provider.get(data)
+        try:
+            # rt_cd != '0'이어도 raise하지 않는다 — executor가 is_success=False로 기록해야
+            # 부분 실패가 영속 저장소·Slack에 가시화된다 (ARCH-008과 일관).
+            return self._post_json(
+                "uapi/domestic-stock/v1/trading/order-cash", tr_id, data,
+                validate_rt_cd=False, custtype="P", hashkey=hashkey,
+            )
+        finally:
+            # 주문(성공·실패·전송 오류 모두)은 예수금·가능수량을 바꿀 수 있으므로 캐시 전체 무효화
+            self.quote_cache.invalidate()
+            self.invalidate_account_snapshot()
+
+    # ------------------------------------------------------------------ #
+    # 체결 조회                                                              #
+    # ------------------------------------------------------------------ #
+
+    def fetch_daily_order_fills(self, order_nos: Iterable[str], trade_date: Optional[date] = None) -> dict:
+        """당일 주문체결(inquire-daily-ccld)을 한 번의 페이지 순회로 조회해 주문번호별 체결 현황을 반환한다.
+
+        주문마다 조회하지 않고 계좌의 당일 주문 목록을 최신순으로 넘기며 order_nos를 모으고,
+        모두 찾으면 남은 페이지는 읽지 않는다.
+
+        Args:
+            order_nos: 조회할 주문번호(ODNO). 앞자리 0 유무는 구분하지 않는다.
+            trade_date: 주문일. None이면 오늘(KST).
+
+        Returns:
+            dict: {주문번호(앞자리 0 제거): {'ticker', 'order_quantity', 'filled_quantity',
+            'remaining_quantity', 'avg_price'}}. 목록에 없는 주문번호는 키가 없다.
+        """
+        wanted = {str(no).lstrip('0') for no in order_nos if no}
+        fills: dict = {}
+        if not wanted:
+            return fills
+        day = (trade_date or datetime.now(ZoneInfo('Asia/Seoul')).date()).strftime('%Y%m%d')
+        fk100, nk100 = "", ""
+        while True:
+            data = self._daily_ccld_page(day, fk100, nk100)
+            for row in _normalize_output1(data.get('output1')):
+                no = str(row.get('odno', '')).lstrip('0')
+                if no not in wanted:
+                    continue
+                avg_price = row.get('avg_prvs')
+                fills[no] = {
+                    'ticker': row.get('pdno'),
+                    'order_quantity': _optional_int(row, 'ord_qty'),
+                    'filled_quantity': _optional_int(row, 'tot_ccld_qty'),
+                    'remaining_quantity': _optional_int(row, 'rmn_qty'),
+                    'avg_price': float(avg_price) if avg_price not in (None, '') else None,
+                }
+            # 찾을 주문을 모두 찾았거나 마지막 페이지(tr_cont 'D'/'E')면 종료
+            if len(fills) == len(wanted) or data['tr_cont'] in ('D', 'E'):
+                return fills
+            fk100, nk100 = data['ctx_area_fk100'], data['ctx_area_nk100']
+
+    @log_method_call
+    def _daily_ccld_page(self, day: str, ctx_area_fk100: str = "", ctx_area_nk100: str = "") -> dict:
+        """주식일별주문체결조회 단일 페이지 (TTTC8001R / 모의 VTTC8001R, 3개월 이내). 최신 주문부터."""
+        params = {
+            'CANO': self.acc_no_prefix,
+            'ACNT_PRDT_CD': self.acc_no_postfix,
+            'INQR_STRT_DT': day,
+            'INQR_END_DT': day,
+            'SLL_BUY_DVSN_CD': '00',   # 매도·매수 전체
+            'INQR_DVSN': '00',         # 역순 (최신 주문 먼저)
+            'PDNO': '',
+            'CCLD_DVSN': '00',         # 체결·미체결 전체
+            'ORD_GNO_BRNO': '',
+            'ODNO': '',
+            'INQR_DVSN_3': '00',
+            'INQR_DVSN_1': '',
+            'CTX_AREA_FK100': ctx_area_fk100,
+            'CTX_AREA_NK100': ctx_area_nk100,
+        }
+        path = 'uapi/domestic-stock/v1/trading/inquire-daily-ccld'
+        tr_id = 'VTTC8001R' if self.mock else 'TTTC8001R'
+        # 연속 조회는 요청 헤더 tr_cont='N'
+        extra = {'tr_cont': 'N'} if ctx_area_fk100 or ctx_area_nk100 else {}
+        res = self._get(path, tr_id, params, **extra)
+        data = self._parse_json(res, path=path, tr_id=tr_id)
+        self._check_rt_cd(data, path=path, tr_id=tr_id)
+        data['tr_cont'] = res.headers['tr_cont']
+        return data
+
+    def build_order_body(self, ticker: str, ord_qty: int, ord_dvsn: str, price: int = -1) -> dict:
+        """주문(order-cash) request body. 해시키 서명 대상이므로 주문·prefetch가 같은 헬퍼를 쓴다."""
         unpr = "0" if ord_dvsn == "01" else str(price)  # 시장가이면 단가를 "0"으로 전달
         data = {
             "CANO": self.acc_no_prefix,
@@ -902,11 +1293,17 @@ class KISClient():
         if self._is_pension():
             # IRP 매수가능조회와 일관되게 ACCA_DVSN_CD='00' 추가 (보수적)
             data["ACCA_DVSN_CD"] = "00"
-        # 주문 API는 request body 위변조 방지를 위해 해시키 서명이 필수
-        hashkey = self.issue_hashkey(data)
-        # rt_cd != '0'이어도 raise하지 않는다 — executor가 is_success=False로 기록해야
-        # 부분 실패가 영속 저장소·Slack에 가시화된다 (ARCH-008과 일관).
-        return self._post_json(
-            "uapi/domestic-stock/v1/trading/order-cash", tr_id, data,
-            validate_rt_cd=False, custtype="P", hashkey=hashkey,
-        )
\ No newline at end of file
+        return data
+
+    def prefetch_hashkeys(self, orders: list) -> None:
+        """주문 루프 전에 예정 주문들의 해시키를 미리 확보한다.
+
+        Args:
+            orders: [{'ticker', 'ord_qty', 'ord_dvsn', 'price'(선택)}, ...].
+                body가 실제 주문과 한 글자라도 다르면 해당 주문은 다시 발급받는다 (정합성 영향 없음).
+        """
+        bodies = [
+            self.build_order_body(o['ticker'], o['ord_qty'], o['ord_dvsn'], o.get('price', -1))
+            for o in orders
+        ]
+        self.hashkey_provider.prefetch(bodies)
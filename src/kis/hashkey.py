@@ -0,0 +1,164 @@
+"""주문 해시키 제공자.
+
+주문 API(order-cash)는 request body를 해시키로 서명해야 하는데, 종전에는 주문마다
+`uapi/hashkey`를 먼저 호출해 주문당 왕복이 두 번이었다. 본 모듈은 해시키 발급을
+제공자 객체 뒤로 숨겨 (1) 로컬 계산이 가능하면 왕복을 없애고 (2) 아니면 주문 루프 전에
+필요한 해시키를 동시에 미리 받아 두도록 한다.
+
+핵심 설계:
+- `RemoteHashkeyProvider`: 기존 `KISClient.issue_hashkey` 호출. body 문자열 단위 캐시와
+  스레드 풀 기반 `prefetch` 제공.
+- `LocalHashkeyProvider`: KIS 해시 방식은 공개 문서가 없으므로 후보 방식
+  (`CANDIDATE_SCHEMES`)을 첫 사용 시 원격 결과와 대조해 일치하는 방식을 채택한다.
+  하나도 일치하지 않으면 이후 전부 원격으로 폴백 (검증 전에는 로컬 값을 절대 쓰지 않음).
+- 해시 대상은 실제 전송 문자열과 동일한 `json.dumps(body)` — `_post`·`issue_hashkey`와
+  같은 직렬화를 공유해야 서명이 유효하다.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PREFETCH_WORKERS = 4
+
+
+def serialize_body(data: dict) -> str:
+    """주문 body 직렬화. KISClient._post / issue_hashkey의 전송 형식과 동일해야 한다."""
+    return json.dumps(data)
+
+
+def _sha256_hex(secret: str, payload: str) -> str:
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _hmac_sha256_hex(secret: str, payload: str) -> str:
+    return hmac.new(secret.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def _hmac_sha256_b64(secret: str, payload: str) -> str:
+    digest = hmac.new(secret.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+# 로컬 재현 후보. 원격 결과와 대조해 일치하는 것만 사용한다.
+CANDIDATE_SCHEMES: dict = {
+    'sha256_hex': _sha256_hex,
+    'hmac_sha256_hex': _hmac_sha256_hex,
+    'hmac_sha256_b64': _hmac_sha256_b64,
+}
+
+
+class RemoteHashkeyProvider:
+    """`uapi/hashkey` 원격 발급. 같은 body는 한 번만 발급받는다.
+
+    Args:
+        client: issue_hashkey(data)를 제공하는 KISClient.
+        max_workers: prefetch 동시 발급 스레드 수.
+    """
+
+    def __init__(self, client, max_workers: int = DEFAULT_PREFETCH_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers >= 1이어야 합니다: {max_workers}")
+        self.client = client
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._cache: dict = {}
+
+    def get(self, data: dict) -> str:
+        """body의 해시키를 반환한다. prefetch된 값이 있으면 왕복 없이 반환."""
+        key = serialize_body(data)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        hashkey = self.client.issue_hashkey(data)
+        with self._lock:
+            self._cache[key] = hashkey
+        return hashkey
+
+    def prefetch(self, bodies: Iterable[dict]) -> None:
+        """주문 루프 전에 여러 body의 해시키를 동시에 발급받아 캐시한다. 실패는 예외로 전파."""
+        pending = list({serialize_body(b): b for b in bodies}.values())
+        with self._lock:
+            pending = [b for b in pending if serialize_body(b) not in self._cache]
+        if not pending:
+            return
+        workers = min(self.max_workers, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hashkey') as pool:
+            list(pool.map(self.get, pending))
+
+
+class LocalHashkeyProvider:
+    """해시키를 로컬 계산하되, 첫 사용 시 원격 결과로 방식을 검증한다.
+
+    검증 결과:
+    - 후보 방식 중 하나가 원격 값과 일치 → 이후 로컬 계산 (왕복 0회).
+    - 모두 불일치 → 경고 후 이후 전부 `remote`로 폴백.
+
+    Args:
+        client: auth_config.app_secret과 issue_hashkey를 제공하는 KISClient.
+        remote: 검증·폴백용 원격 제공자. None이면 RemoteHashkeyProvider(client).
+        schemes: {이름: (secret, payload) -> hash} 후보. None이면 CANDIDATE_SCHEMES.
+    """
+
+    def __init__(
+        self,
+        client,
+        remote: Optional[RemoteHashkeyProvider] = None,
+        schemes: Optional[dict] = None,
+    ) -> None:
+        self.client = client
+        self.remote = remote or RemoteHashkeyProvider(client)
+        self.schemes = dict(schemes or CANDIDATE_SCHEMES)
+        self._lock = threading.Lock()
+        self._verified = False
+        self.scheme_name: Optional[str] = None   # 검증 통과한 방식. None + _verified=True면 폴백 상태.
+
+    @property
+    def is_local(self) -> bool:
+        """검증을 통과해 로컬 계산 중인지 여부."""
+        return self._verified and self.scheme_name is not None
+
+    def _verify(self, data: dict) -> None:
+        with self._lock:
+            if self._verified:
+                return
+            remote_hash = self.remote.get(data)
+            payload = serialize_body(data)
+            secret = self.client.auth_config.app_secret
+            for name, scheme in self.schemes.items():
+                if hmac.compare_digest(scheme(secret, payload), remote_hash):
+                    self.scheme_name = name
+                    logger.info('해시키 로컬 계산 검증 통과 (scheme=%s) — 이후 uapi/hashkey 호출 생략', name)
+                    break
+            else:
+                logger.warning('해시키 로컬 계산 방식이 원격 결과와 불일치 — uapi/hashkey 원격 발급으로 폴백')
+            self._verified = True
+
+    def _local(self, data: dict) -> str:
+        scheme: Callable = self.schemes[self.scheme_name]
+        return scheme(self.client.auth_config.app_secret, serialize_body(data))
+
+    def get(self, data: dict) -> str:
+        if not self._verified:
+            self._verify(data)
+        if self.is_local:
+            return self._local(data)
+        return self.remote.get(data)
+
+    def prefetch(self, bodies: Iterable[dict]) -> None:
+        """검증을 먼저 끝낸 뒤, 로컬이면 할 일 없음 / 폴백이면 원격 동시 발급."""
+        bodies = list(bodies)
+        if not bodies:
+            return
+        if not self._verified:
+            self._verify(bodies[0])
+        if not self.is_local:
+            self.remote.prefetch(bodies)
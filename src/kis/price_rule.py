@@ -0,0 +1,52 @@
+"""KRX 호가단위·가격제한폭 규칙 — 시장가 매수 보수단가(상한가) 로컬 산정.
+
+`OrderExecutor`는 매수마다 inquire-psbl-order(`fetch_domestic_enable_buy`)를 호출해
+`psbl_qty_calc_unpr`(가능수량계산단가)만 읽고, 수량은 자체 추적한 잔여 현금으로 다시 계산한다.
+시장가 주문의 가능수량계산단가는 KIS가 가격제한폭 상단(상한가)으로 증거금을 잡는 단가이므로
+시세 응답의 상한가 또는 기준가 + KRX 규칙으로 로컬에서 얻을 수 있다
+(`ExecutionPolicy.orderable_price_mode='local'`, `KISClient.upper_limit_price`).
+
+핵심 설계:
+- 호가단위: KRX 유가증권·코스닥 공통 가격대별 호가단위 (2023-01-25 개편 기준). ETF·ETN은 더 작은
+  호가단위(5원)를 쓰지만 종목 유형을 알 수 없으므로 주식 표를 적용한다.
+- 상한가: 기준가 × (1 + 가격제한폭 30%)를 호가단위로 절사하는 KRX 규칙. 기준은 반드시 기준가(전일
+  종가·권리락 조정가)여야 한다 — 현재가 기준은 당일 하락 종목에서 실제 상한가보다 낮게 나와 잔여
+  현금을 과대 추적한다.
+- 순수 함수: KIS 호출·검증은 호출부(KISClient·OrderExecutor) 책임.
+"""
+import math
+
+# KRX 일일 가격제한폭 (기준가 대비 ±30%).
+KRX_PRICE_LIMIT_RATIO = 0.30
+
+# (가격대 상한(미만), 호가단위). 마지막 구간(500,000원 이상)은 1,000원.
+_TICK_TABLE = (
+    (2_000, 1),
+    (5_000, 5),
+    (20_000, 10),
+    (50_000, 50),
+    (200_000, 100),
+    (500_000, 500),
+)
+_TOP_TICK = 1_000
+
+
+def tick_size(price: float) -> int:
+    """가격대별 호가단위(원)."""
+    for upper, tick in _TICK_TABLE:
+        if price < upper:
+            return tick
+    return _TOP_TICK
+
+
+def round_down_to_tick(price: float) -> int:
+    """호가단위로 절사한 가격. 절사 결과는 항상 해당 가격대 이하의 유효 호가."""
+    tick = tick_size(price)
+    return int(math.floor(price / tick + 1e-9) * tick)
+
+
+def upper_limit_price(base_price: float, limit_ratio: float = KRX_PRICE_LIMIT_RATIO) -> int:
+    """상한가 = 기준가 × (1 + limit_ratio)를 호가단위로 절사 (KRX 규칙)."""
+    if base_price <= 0:
+        raise ValueError(f'base_price는 0보다 커야 합니다: {base_price}')
+    return round_down_to_tick(base_price * (1 + limit_ratio))
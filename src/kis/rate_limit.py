@@ -0,0 +1,150 @@
+"""KIS REST 호출 속도 제한 (token bucket).
+
+KIS는 app key 단위로 초당 요청 수를 제한한다 (실전 20건/초, 모의 2건/초). 한도를
+넘으면 `EGW00201`(초당 거래건수 초과)로 거절되고, 이는 `KISAPIError`로 드러난다.
+본 모듈은 `KISClient._get/_post`가 요청 직전에 토큰을 확보하도록 해 한도까지는
+쓰되 넘지는 않게 한다.
+
+핵심 설계:
+- app key 단위 token bucket: 초당 `rate_per_second`개 토큰 보충, 최대 `burst`개 적립.
+  임의의 1초 구간 요청 수 상한 = rate_per_second + burst → 기본값(18 + 2)이 실전 한도 20과 일치.
+- 엔드포인트 가중치: path별 소비 토큰 수(`endpoint_weights`, 기본 1). 무거운 조회에
+  더 큰 비용을 매길 수 있다.
+- 프로세스 간 공유: `state_file`이 주어지면 버킷 상태(tokens, updated_at)를 JSON 파일에
+  두고 `fcntl.flock`으로 잠가 갱신 → 같은 app key를 쓰는 여러 프로세스가 한 예산을 나눠 쓴다.
+  fcntl이 없는 환경(Windows)에서는 프로세스 내 공유로 축소 (best-effort).
+- 스레드 안전: 프로세스 내 호출은 threading.Lock으로 직렬화. 대기(sleep)는 잠금 밖에서.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows — 파일 잠금 없이 프로세스 내 공유만
+    fcntl = None
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 실전 한도 20건/초 = rate 18 + burst 2. 모의투자 한도는 2건/초 = rate 1 + burst 1.
+DEFAULT_RATE_PER_SECOND = 18.0
+DEFAULT_BURST = 2
+MOCK_RATE_PER_SECOND = 1.0
+MOCK_BURST = 1
+
+# 부동소수 오차로 0.9999999…개 토큰 때문에 극소 대기를 반복하지 않도록 하는 허용 오차.
+_TOKEN_EPSILON = 1e-9
+
+
+class KISRateLimiter:
+    """app key 단위 token bucket.
+
+    Args:
+        rate_per_second: 초당 보충 토큰 수.
+        burst: 버킷 최대 적립 토큰 수 (순간 허용 요청 수).
+        state_file: 프로세스 간 공유 상태 파일. None이면 프로세스 내 메모리 상태만 사용.
+        endpoint_weights: {path: 소비 토큰 수}. 미등록 path는 1.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        state_file: Optional[Path] = None,
+        endpoint_weights: Optional[dict] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError(f"rate_per_second > 0이어야 합니다: {rate_per_second}")
+        if burst < 1:
+            raise ValueError(f"burst >= 1이어야 합니다: {burst}")
+        self.rate_per_second = float(rate_per_second)
+        self.burst = burst
+        self.state_file = Path(state_file) if state_file is not None else None
+        self.endpoint_weights = dict(endpoint_weights or {})
+        for path, weight in self.endpoint_weights.items():
+            if not (0 < weight <= burst):
+                raise ValueError(f"endpoint weight는 (0, burst] 범위여야 합니다: {path}={weight}")
+        # clock은 wall clock(time.time)이어야 프로세스 간 상태 파일의 updated_at을 비교할 수 있다.
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    def weight_for(self, path: str) -> float:
+        """path의 소비 토큰 수. 미등록 path는 1."""
+        return self.endpoint_weights.get(path, 1)
+
+    def acquire(self, path: str = '') -> float:
+        """path 호출에 필요한 토큰을 확보할 때까지 대기한다.
+
+        Returns:
+            float: 실제 대기한 시간(초). 즉시 통과면 0.0.
+        """
+        weight = self.weight_for(path)
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._try_consume(weight)
+            if wait <= 0:
+                if waited > 0:
+                    logger.debug('rate limit 대기 %.3fs (path=%s)', waited, path)
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+    def _try_consume(self, weight: float) -> float:
+        """토큰 소비를 시도한다. 성공이면 0, 부족하면 필요한 대기 시간(초)을 반환."""
+        if self.state_file is None or fcntl is None:
+            self._tokens, self._updated_at, wait = self._refill_and_take(
+                self._tokens, self._updated_at, weight,
+            )
+            return wait
+        with self._locked_state() as state:
+            state['tokens'], state['updated_at'], wait = self._refill_and_take(
+                state['tokens'], state['updated_at'], weight,
+            )
+        return wait
+
+    def _refill_and_take(self, tokens: float, updated_at: float, weight: float) -> tuple[float, float, float]:
+        now = self._clock()
+        # 시계 역행(다른 프로세스의 미래 시각 기록 등)은 보충 0으로 취급
+        elapsed = max(0.0, now - updated_at)
+        tokens = min(float(self.burst), tokens + elapsed * self.rate_per_second)
+        if tokens + _TOKEN_EPSILON >= weight:
+            return max(0.0, tokens - weight), now, 0.0
+        return tokens, now, (weight - tokens) / self.rate_per_second
+
+    @contextmanager
+    def _locked_state(self):
+        """상태 파일을 배타 잠금으로 열고 state dict를 yield. 블록 종료 시 기록 후 잠금 해제."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with self.state_file.open('a+', encoding='utf-8') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                state = self._parse_state(f.read())
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _parse_state(self, raw: str) -> dict:
+        """상태 파일 파싱. 비어 있거나 손상되면 가득 찬 버킷으로 초기화."""
+        try:
+            data = json.loads(raw) if raw else {}
+            return {'tokens': float(data['tokens']), 'updated_at': float(data['updated_at'])}
+        except (ValueError, KeyError, TypeError):
+            if raw:
+                logger.warning('rate limit 상태 파일 손상 — 초기화: %s', self.state_file)
+            return {'tokens': float(self.burst), 'updated_at': self._clock()}
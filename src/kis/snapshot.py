@@ -0,0 +1,68 @@
+"""계좌 스냅샷 — 잔고 페이지·매수 가능 현금의 실행 단위 메모이제이션.
+
+`fetch_domestic_total_balance`는 잔고 전체 페이지를 조회한 뒤 예수금 산정을 위해 첫
+페이지를 다시 조회하고, `fetch_buy_orderable_cash`는 계좌 단위 상수(nrcvb_buy_amt)를
+얻으려고 매번 inquire-psbl-order를 호출한다. 주문이 없는 동안 이 값들은 변하지 않으므로
+`KISClient`가 본 스냅샷을 하나 보유하고 주문 시 폐기한다.
+
+핵심 설계:
+- 지연 로딩: 잔고 페이지와 매수 가능 현금은 각각 처음 필요할 때 한 번만 조회.
+  (잔고만 쓰는 호출부가 inquire-psbl-order까지 부르지 않도록 분리)
+- 무효화는 소유자(KISClient) 책임: `create_domestic_order` 직후 스냅샷 자체를 버린다.
+- 반환값은 복사본 → 호출부가 수정해도 스냅샷은 오염되지 않음.
+"""
+import threading
+from typing import Callable, Optional
+
+
+class AccountSnapshot:
+    """한 계좌의 잔고 페이지·매수 가능 현금을 주문 전까지 보관하는 스냅샷.
+
+    Args:
+        load_pages: 잔고 전체 페이지를 조회해 [(output1 list, output2 dict), ...]로 반환.
+        load_orderable_cash: 미수 없는 매수 가능 한도(int)를 조회.
+    """
+
+    def __init__(
+        self,
+        load_pages: Callable[[], list],
+        load_orderable_cash: Callable[[], int],
+    ) -> None:
+        self._load_pages = load_pages
+        self._load_orderable_cash = load_orderable_cash
+        self._lock = threading.Lock()
+        self._pages: Optional[list] = None
+        self._orderable_cash: Optional[int] = None
+
+    def _ensure_pages(self) -> list:
+        with self._lock:
+            if self._pages is None:
+                self._pages = self._load_pages()
+            return self._pages
+
+    @property
+    def output1(self) -> list:
+        """전 페이지 보유 종목 목록 (정규화 완료)."""
+        return [dict(row) for output1, _ in self._ensure_pages() for row in output1]
+
+    @property
+    def output2(self) -> list:
+        """페이지별 계좌 요약 (정규화 완료)."""
+        return [dict(output2) for _, output2 in self._ensure_pages()]
+
+    @property
+    def cash_output2(self) -> dict:
+        """예수금·평가금액 요약 (첫 페이지 output2)."""
+        pages = self._ensure_pages()
+        return dict(pages[0][1]) if pages else {}
+
+    @property
+    def orderable_cash(self) -> int:
+        with self._lock:
+            if self._orderable_cash is None:
+                self._orderable_cash = self._load_orderable_cash()
+            return self._orderable_cash
+
+    @property
+    def pages_loaded(self) -> bool:
+        return self._pages is not None
@@ -0,0 +1,171 @@
+"""정수 주식 수 최적화 (planner_mode='optimize').
+
+`planning_kernel`은 종목마다 필요 금액 / 현재가를 0 방향으로 절사해 수량을 정한다. 종목별로
+따로 버린 끝수가 그대로 남는 현금이 되고, 결과가 목표 비중에 가장 가까운 정수 포트폴리오라는
+보장도 없다. 본 모듈은 종목 전체의 목표 수량을 함께 골라 목표 금액과의 제곱 오차 합
+(= 목표 비중 대비 추적 오차)을 최소화한다.
+
+핵심 설계:
+- 변수: 종목별 리밸런싱 후 보유 수량 q (정수, >= 0). 목적함수: Σ (q·price − target_value)².
+- 제약 (실행기가 실제로 체결할 수 있는 계획만):
+  - 보유 평가 Σ q·price ≤ budget (= 총자산 − buffer_cash → 거래 후 buffer_cash 이상 현금 보존)
+  - 매수 금액 ≤ buy_cash_safety_ratio × (자유 현금 + 매도 대금) — executor의 매수 가능 수량 산정과 동일한 마진
+- 엔진: 절사 해(실행 가능하면) 또는 내림 해에서 출발 → 제약 위반 시 비용 대비 오차 증가가 가장 작은
+  매수 1주씩 취소 → 오차를 줄이는 1주 추가를 가성비(오차 감소/금액) 순으로 채움 → 1주 추가·제거·
+  교환(i −1주, j +1주) 중 가장 좋은 이동을 개선이 없을 때까지 반복 (NumPy n×n 행렬로 한 번에 평가).
+  출발점보다 나빠지지 않으므로 절사 방식 대비 오차가 같거나 작다 (전역 최적 보장은 없는 지역 최적).
+  50종목 수 ms, 이동 평가가 n²이라 수백 종목부터는 수백 ms.
+- 순수 함수: 가격 검증·미등록 종목(전량 매도) 처리는 호출부(PortfolioPlanner) 책임.
+"""
+import numpy as np
+
+# 지역 탐색 이동 횟수 상한 (종목 수 배수). 실제로는 종목 수 이내에서 수렴한다.
+MAX_MOVES_PER_POSITION = 20
+
+
+def tracking_error(quantity: np.ndarray, price: np.ndarray, target_value: np.ndarray) -> float:
+    """목적함수 Σ (q·price − target_value)²."""
+    deviation = np.asarray(quantity) * np.asarray(price) - np.asarray(target_value)
+    return float(deviation @ deviation)
+
+
+class _Lots:
+    """탐색 상태: 수량·편차·매수/매도 금액을 증분 갱신."""
+
+    def __init__(self, quantity, price, target_value, current_quantity, free_cash, budget, safety_ratio):
+        self.q = quantity.astype(np.int64)
+        self.p = price
+        self.t = target_value
+        self.c = current_quantity
+        self.free_cash = free_cash
+        self.budget = budget
+        self.ratio = safety_ratio
+        self.refresh()
+
+    def refresh(self) -> None:
+        delta = (self.q - self.c) * self.p
+        self.d = self.q * self.p - self.t
+        self.hold = float(self.q @ self.p)
+        self.buys = float(delta[delta > 0].sum())
+        self.sells = float(-delta[delta < 0].sum())
+
+    def _within(self, hold: float, buys: float, sells: float) -> bool:
+        # 부동소수 오차로 경계값이 튀지 않도록 1원 미만 허용
+        return hold <= self.budget + 1e-6 and buys <= self.ratio * (self.free_cash + sells) + 1e-6
+
+    def feasible(self) -> bool:
+        return self._within(self.hold, self.buys, self.sells)
+
+    def move(self, i: int, step: int) -> None:
+        self.q[i] += step
+        self.refresh()
+
+    # ---- 1주 이동의 오차 변화와 제약 변화 (벡터) ---------------------------- #
+
+    def add_effects(self):
+        """각 종목 +1주: (오차 변화, 매수 변화, 매도 변화)."""
+        gain = 2 * self.d * self.p + self.p ** 2
+        buying = self.q >= self.c   # 추가분이 매수(현재 이상) 또는 매도 축소
+        return gain, np.where(buying, self.p, 0.0), np.where(buying, 0.0, -self.p)
+
+    def remove_effects(self):
+        """각 종목 −1주: (오차 변화, 매수 변화, 매도 변화). 수량 0이면 오차 변화 inf."""
+        gain = np.where(self.q > 0, -2 * self.d * self.p + self.p ** 2, np.inf)
+        bought = self.q > self.c
+        return gain, np.where(bought, -self.p, 0.0), np.where(bought, 0.0, self.p)
+
+
+def optimize_integer_lots(
+    target_value: np.ndarray,
+    price: np.ndarray,
+    current_quantity: np.ndarray,
+    free_cash: float,
+    budget: float,
+    safety_ratio: float = 1.0,
+    initial_quantity: np.ndarray = None,
+) -> np.ndarray:
+    """목표 금액과의 제곱 오차 합이 작은 리밸런싱 후 보유 수량(정수)을 종목 전체에서 함께 고른다.
+
+    Args:
+        target_value: 종목별 목표 금액 (weight × (총자산 − buffer_cash)).
+        price: 현재가 (> 0).
+        current_quantity: 현재 보유 수량.
+        free_cash: 최적화 대상 외 현금 (예수금 + 미등록 종목 전량 매도 대금).
+        budget: 리밸런싱 후 최적화 대상 종목 보유 평가 상한 (총자산 − buffer_cash).
+        safety_ratio: 매수 금액 ≤ safety_ratio × (free_cash + 매도 대금).
+        initial_quantity: 출발 해 (예: 절사 방식 결과). 제약을 만족할 때만 사용.
+
+    Returns:
+        np.ndarray: 리밸런싱 후 보유 수량 (int64).
+    """
+    price = np.asarray(price, dtype=float)
+    target_value = np.asarray(target_value, dtype=float)
+    current_quantity = np.asarray(current_quantity).astype(np.int64)
+    if price.size == 0:
+        return current_quantity.copy()
+    if not (price > 0).all():
+        raise ValueError('price는 모두 0보다 커야 합니다.')
+
+    floor = np.floor(np.maximum(target_value, 0.0) / price)
+    lots = _Lots(floor, price, target_value, current_quantity, float(free_cash), float(budget), float(safety_ratio))
+    if initial_quantity is not None:
+        start = _Lots(np.asarray(initial_quantity), price, target_value, current_quantity,
+                      float(free_cash), float(budget), float(safety_ratio))
+        if start.feasible() and tracking_error(start.q, price, target_value) < tracking_error(lots.q, price, target_value):
+            lots = start
+
+    # 1) 제약 위반 해소: 매수 1주 취소 중 (오차 증가 / 풀리는 금액)이 가장 작은 것부터.
+    while not lots.feasible():
+        gain, _, _ = lots.remove_effects()
+        candidates = np.where(lots.q > lots.c, gain / price, np.inf)
+        i = int(np.argmin(candidates))
+        if not np.isfinite(candidates[i]):
+            break   # 매수가 없는데도 위반 = 입력 자체가 불가능 (현재 보유가 budget 초과) → 그대로 반환
+        lots.move(i, -1)
+
+    # 2) 탐욕 채우기: 오차를 줄이는 1주 추가를 (오차 감소 / 금액) 순으로, 제약이 허락하는 동안.
+    while True:
+        gain, d_buy, d_sell = lots.add_effects()
+        ok = (gain < 0) & (lots.hold + price <= lots.budget + 1e-6) & (
+            lots.buys + d_buy <= lots.ratio * (lots.free_cash + lots.sells + d_sell) + 1e-6
+        )
+        if not ok.any():
+            break
+        i = int(np.argmin(np.where(ok, gain / price, np.inf)))
+        lots.move(i, +1)
+
+    # 3) 지역 탐색: 1주 추가·제거·교환 중 오차 감소가 가장 큰 이동을 반복.
+    n = price.size
+    for _ in range(MAX_MOVES_PER_POSITION * n):
+        add_gain, add_buy, add_sell = lots.add_effects()
+        rem_gain, rem_buy, rem_sell = lots.remove_effects()
+
+        add_ok = (lots.hold + price <= lots.budget + 1e-6) & (
+            lots.buys + add_buy <= lots.ratio * (lots.free_cash + lots.sells + add_sell) + 1e-6
+        )
+        best_add = np.where(add_ok, add_gain, np.inf)
+        best_rem = rem_gain   # 제거는 두 제약을 항상 완화
+
+        # 교환: 행 i(−1주), 열 j(+1주). 같은 종목 교환은 무의미.
+        swap_gain = rem_gain[:, None] + add_gain[None, :]
+        swap_ok = (lots.hold - price[:, None] + price[None, :] <= lots.budget + 1e-6) & (
+            lots.buys + rem_buy[:, None] + add_buy[None, :]
+            <= lots.ratio * (lots.free_cash + lots.sells + rem_sell[:, None] + add_sell[None, :]) + 1e-6
+        )
+        swap_gain = np.where(swap_ok, swap_gain, np.inf)
+        np.fill_diagonal(swap_gain, np.inf)
+
+        options = (best_add.min(), best_rem.min(), swap_gain.min())
+        best = int(np.argmin(options))
+        # 상대 허용 오차: 부동소수 반올림으로 같은 상태를 오가는 것을 막는다.
+        if not options[best] < -1e-9 * max(1.0, float(price.max()) ** 2):
+            break
+        if best == 0:
+            lots.move(int(np.argmin(best_add)), +1)
+        elif best == 1:
+            lots.move(int(np.argmin(best_rem)), -1)
+        else:
+            i, j = np.unravel_index(int(np.argmin(swap_gain)), swap_gain.shape)
+            lots.q[i] -= 1
+            lots.move(int(j), +1)
+    return lots.q
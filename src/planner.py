@@ -10,14 +10,30 @@
 - weight 합계 > 1.0, 음수, 중복 ticker 등 사전 검증.
 - `current_pct`는 buffer 미차감 총자산 기준으로 계산 (Slack 후 비중 분모와 일치
   하도록 보존, ARCH-006).
+- 현재가 조회는 `KISClient.fetch_prices` 일괄 조회 (멀티종목 시세 1회/30종목, 미지원·누락
+  종목은 AsyncKISClient 동시 단건 조회) → 종목 수에 비례하는 직렬 왕복 제거.
+- 목표·필요 금액/수량/방향 계산은 `planning_kernel.compute_rebalance_arrays` 한 번의 NumPy
+  연산으로 처리 (미등록 종목도 같은 테이블에 전량 매도 마스크로 포함, 행 단위 lambda 없음).
+- `policy.planner_mode='optimize'`: 절사 수량 대신 `optimizer.optimize_integer_lots`가 allocation
+  종목 수량을 함께 결정 (목표 비중 대비 오차 최소, buffer_cash·buy_cash_safety_ratio 제약).
+  목표·필요 금액 컬럼은 그대로 두고 required_quantity·required_transaction만 바뀐다.
+- 허용 범위(`drift_band_abs_pct`·`drift_band_rel`·`min_trade_value`): 범위 안 종목과 소액 주문은
+  수량 0·방향 None으로 바꿔 executor가 가능 수량 조회·해시키·주문을 아예 하지 않게 한다.
+- optimize·허용 범위 후처리는 `planning_kernel.optimize_quantities`·`drop_within_drift_band` 공용
+  구현을 호출 (scenario·backtest와 같은 코드 → 계획 규칙이 갈라지지 않음).
+- what-if 일괄 평가(`evaluate_scenarios`): 시세·잔고를 1회만 조회하고 `src/scenario.py`가 시나리오
+  M개(대체 비중·정책·가격)의 계획을 한 번의 배열 연산으로 계산해 세로로 쌓아 반환.
 """
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from src.kis.client import KISClient
 from src.logger import get_logger, log_method_call
+from src.planning_kernel import compute_rebalance_arrays, drop_within_drift_band, optimize_quantities
 from src.policy import DEFAULT_EXECUTION_POLICY, ExecutionPolicy
+from src.scenario import Scenario, evaluate_scenarios
 
 logger = get_logger(__name__)
 
@@ -60,11 +76,18 @@ class PortfolioPlanner:
             raise ValueError(f"weight 합계가 1.0을 초과합니다: {weight_sum:.4f}")
 
     @log_method_call
-    def _create_total_info(self, allocation: pd.DataFrame, balance: pd.DataFrame) -> pd.DataFrame:
+    def _create_total_info(
+        self,
+        allocation: pd.DataFrame,
+        balance: pd.DataFrame,
+        unallocated: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
         """목표 비중과 현재 잔고를 합산해 종목별 거래 계획을 계산한다.
 
         총 잔고 금액을 기준으로 목표 금액(target_value)을 산출하고,
         현재 금액과의 차이로 필요 거래 수량과 방향(buy/sell)을 결정한다.
+        `unallocated`(allocation 미등록 보유 종목)가 주어지면 같은 테이블 뒤에 붙여
+        전량 매도 행으로 함께 계산한다 (planning_kernel 1회 호출).
         """
         buffer_cash = self.policy.buffer_cash
         total_balance_value = balance['current_value'].sum()
@@ -82,16 +105,59 @@ class PortfolioPlanner:
         if not invalid_prices.empty:
             raise ValueError(f"유효하지 않은 가격(0 또는 NaN)이 있는 종목: {invalid_prices['ticker'].tolist()}")
 
-        # 리밸런싱 후 최소 예수금 버퍼 확보를 위해 정책의 buffer_cash를 차감한 금액을 기준으로 목표 금액을 계산한다.
-        result['target_value'] = result['weight'] * int(total_balance_value - buffer_cash)
+        n_allocated = len(result)
+        if unallocated is not None and not unallocated.empty:
+            unallocated = unallocated.copy()
+            unallocated['category_1'] = None
+            unallocated['category_2'] = None
+            unallocated['weight'] = 0.0
+            result = pd.concat([result, unallocated[result.columns]], ignore_index=True)
+        liquidate = np.arange(len(result)) >= n_allocated
 
-        result['required_value'] = result['target_value'] - result['current_value']
+        # 리밸런싱 후 최소 예수금 버퍼 확보를 위해 정책의 buffer_cash를 차감한 금액을 기준으로 목표 금액을 계산한다.
         # 수량은 절댓값으로 계산 (방향은 required_transaction으로 별도 표현)
-        result['required_quantity'] = abs((result['required_value'] / result['current_price']).astype(int))
-        result['required_transaction'] = result['required_value'].apply(lambda x: 'buy' if x > 0 else 'sell' if x < 0 else None)
-        result['current_pct'] = result['current_value'] / total_balance_value * 100
+        columns = compute_rebalance_arrays(
+            weight=result['weight'].to_numpy(),
+            current_price=result['current_price'].to_numpy(),
+            current_quantity=result['current_quantity'].to_numpy(),
+            current_value=result['current_value'].to_numpy(),
+            liquidate=liquidate,
+            total_value=total_balance_value,
+            target_base=int(total_balance_value - buffer_cash),
+        )
+        if self.policy.planner_mode == 'optimize':
+            self._optimize_quantities(result, columns, n_allocated, total_balance_value, int(total_balance_value - buffer_cash))
+        self._apply_drift_bands(result, columns, liquidate, total_balance_value)
+        for name, values in columns.items():
+            result[name] = values
         return result
 
+    def _optimize_quantities(
+        self, table: pd.DataFrame, columns: dict, n_allocated: int, total_value: float, target_base: int,
+    ) -> None:
+        """allocation 종목(앞 n_allocated행)의 수량·방향을 정수 최적화 결과로 교체 (planning_kernel 공용 구현)."""
+        price = table['current_price'].to_numpy(dtype=float)
+        truncated, optimized = optimize_quantities(
+            columns, np.arange(n_allocated), price,
+            table['current_quantity'].to_numpy(), table['current_value'].to_numpy(dtype=float),
+            total_value, target_base, self.policy.buy_cash_safety_ratio,
+        )
+        allocated_price = price[:n_allocated]
+        logger.info(
+            'planner_mode=optimize: 버퍼 외 잔여 현금 %s원(절사) → %s원',
+            f'{target_base - float(truncated @ allocated_price):,.0f}',
+            f'{target_base - float(optimized @ allocated_price):,.0f}',
+        )
+
+    def _apply_drift_bands(self, table: pd.DataFrame, columns: dict, liquidate: np.ndarray, total_value: float) -> None:
+        """허용 범위 안 종목·최소 거래 금액 미만 주문을 제거 (planning_kernel 공용 구현). 정책 미설정이면 no-op."""
+        skipped = drop_within_drift_band(
+            columns, np.arange(len(table)), liquidate, table['current_price'].to_numpy(dtype=float),
+            total_value, self.policy,
+        )
+        if len(skipped):
+            logger.info('허용 범위 안·소액 주문 %s건 제외: %s', len(skipped), table['ticker'].iloc[skipped].tolist())
+
     @log_method_call
     def get_rebalancing_plan(self) -> pd.DataFrame:
         """현재 잔고와 목표 비중을 바탕으로 리밸런싱 플랜 DataFrame을 생성한다.
@@ -100,32 +166,44 @@ class PortfolioPlanner:
         (음수 required_value = sell, 양수 = buy)
         """
         allocation_info = self.allocation_info.copy()
-        allocation_info['current_price'] = allocation_info['ticker'].apply(self.kis_client.fetch_price)
+        prices = self.kis_client.fetch_prices(allocation_info['ticker'])
+        allocation_info['current_price'] = allocation_info['ticker'].map(prices)
 
         full_balance = self.kis_client.fetch_domestic_total_balance()
 
         # stock_nm, current_price는 allocation_info 기준을 사용하므로 잔고에서 제거
         balance_info = full_balance.drop(columns=['stock_nm', 'current_price'])
 
-        result = self._create_total_info(allocation=allocation_info, balance=balance_info)
-
         # allocation에 없는 종목(CASH 제외)은 전량 매도 대상으로 추가
         unallocated = full_balance[
             ~full_balance['ticker'].isin(allocation_info['ticker']) &
             (full_balance['ticker'] != 'CASH')
-        ].copy()
+        ]
         if not unallocated.empty:
             logger.info('allocation 미등록 종목 전량 매도 대상: %s', unallocated['ticker'].tolist())
-            total_balance = full_balance['current_value'].sum()
-            unallocated['category_1'] = None
-            unallocated['category_2'] = None
-            unallocated['weight'] = 0.0
-            unallocated['target_value'] = 0.0
-            unallocated['required_value'] = -unallocated['current_value']
-            unallocated['required_quantity'] = unallocated['current_quantity'].astype(int)
-            unallocated['required_transaction'] = 'sell'
-            unallocated['current_pct'] = unallocated['current_value'] / total_balance * 100
-            result = pd.concat([result, unallocated[result.columns]], ignore_index=True)
+
+        result = self._create_total_info(allocation=allocation_info, balance=balance_info, unallocated=unallocated)
 
         result = result.sort_values(by='required_value', ascending=True).reset_index(drop=True)
         return result
+
+    @log_method_call
+    def evaluate_scenarios(self, scenarios: Sequence[Scenario]) -> pd.DataFrame:
+        """what-if 시나리오별 리밸런싱 계획을 한 번에 계산한다 (주문·알림 없음).
+
+        현재가(allocation ∪ 시나리오 비중 종목)와 잔고를 각각 1회만 조회하고, 모든 시나리오를
+        `src.scenario.evaluate_scenarios`로 일괄 계산한다. 시나리오 수와 무관하게 KIS 호출 수는 같다.
+
+        Returns:
+            pd.DataFrame: scenario 컬럼 + get_rebalancing_plan과 같은 계획 컬럼 (시나리오 순서대로 쌓음).
+        """
+        tickers = list(self.allocation_info['ticker']) + [
+            t for s in scenarios if s.weights is not None for t in s.weights
+        ]
+        prices = self.kis_client.fetch_prices(tickers)
+        full_balance = self.kis_client.fetch_domestic_total_balance()
+        result = evaluate_scenarios(
+            scenarios, self.allocation_info, full_balance, prices.to_dict(), self.policy,
+        )
+        logger.info('시나리오 %s개 평가 완료 (%s행)', len(scenarios), len(result))
+        return result
@@ -0,0 +1,232 @@
+"""리밸런싱 계산 커널 (NumPy 벡터화).
+
+PortfolioPlanner가 잔고·목표 비중을 한 테이블로 정렬(align)한 뒤, 종목별 목표 금액·필요
+금액·필요 수량·방향·현재 비중을 한 번의 배열 연산으로 계산한다. 행 단위 lambda와
+미등록 종목용 별도 copy/concat 경로를 없애 수천~수만 종목 규모에서도 선형 비용만 든다.
+
+핵심 설계:
+- 입력은 정렬된 1차원 배열. `liquidate` 마스크가 True인 행(allocation 미등록 종목)은
+  목표 0원·보유 수량 전량 매도로 계산한다.
+- 출력은 종전 DataFrame 경로와 값·dtype이 동일하도록 맞춘다
+  (수량은 0 방향 절사 후 절댓값 int64, 방향은 'buy'/'sell'/None object 배열).
+- 순수 함수: 검증(가격 유효성, 버퍼 초과)은 호출부(PortfolioPlanner) 책임.
+- 허용 범위(drift band): `within_drift_band`가 목표 비중 대비 이탈이 허용 범위 안이거나 거래 금액이
+  최소 거래 금액 미만인 행을 마스크로 돌려준다.
+- 정책 후처리: `optimize_quantities`(planner_mode='optimize')·`drop_within_drift_band`가
+  `compute_rebalance_arrays` 결과를 행 인덱스 단위로 제자리 갱신한다. PortfolioPlanner·scenario·
+  backtest가 모두 이 구현(`apply_policy`)을 쓴다 → 세 경로의 계획 규칙이 갈라지지 않는다.
+"""
+from typing import Mapping, Tuple
+
+import numpy as np
+
+from src.optimizer import optimize_integer_lots
+from src.policy import ExecutionPolicy
+
+_BUY = np.array('buy', dtype=object)
+_SELL = np.array('sell', dtype=object)
+
+
+def compute_rebalance_arrays(
+    weight: np.ndarray,
+    current_price: np.ndarray,
+    current_quantity: np.ndarray,
+    current_value: np.ndarray,
+    liquidate: np.ndarray,
+    total_value: float,
+    target_base: int,
+) -> dict:
+    """정렬된 종목 배열로 리밸런싱 계획 컬럼을 계산한다.
+
+    Args:
+        weight: 목표 비중 (미등록 종목은 무시).
+        current_price: 현재가. liquidate=False 행은 > 0이어야 한다.
+        current_quantity: 보유 수량.
+        current_value: 보유 평가금액.
+        liquidate: True면 전량 매도 행.
+        total_value: current_pct 분모 (buffer 미차감 총자산).
+        target_base: 목표 금액 산정 기준 (총자산 - buffer_cash, 정수).
+
+    Returns:
+        dict: target_value, required_value, required_quantity, required_transaction, current_pct.
+    """
+    liquidate = np.asarray(liquidate, dtype=bool)
+    current_value = np.asarray(current_value)
+    target_value = np.asarray(weight) * target_base
+    if liquidate.any():
+        target_value = np.where(liquidate, 0.0, target_value)
+    required_value = target_value - current_value
+
+    # 전량 매도 행은 가격이 0일 수 있으므로 나눗셈 분모를 1로 바꿔 경고 없이 계산 후 버린다.
+    safe_price = np.where(liquidate, 1.0, current_price)
+    rebalance_qty = np.abs((required_value / safe_price).astype(np.int64))
+    required_quantity = np.where(
+        liquidate, np.asarray(current_quantity).astype(np.int64), rebalance_qty,
+    ).astype(np.int64)
+
+    required_transaction = np.select(
+        [liquidate, required_value > 0, required_value < 0],
+        [_SELL, _BUY, _SELL],
+        default=None,
+    ).astype(object)
+
+    return {
+        'target_value': target_value,
+        'required_value': required_value,
+        'required_quantity': required_quantity,
+        'required_transaction': required_transaction,
+        'current_pct': current_value / total_value * 100,
+    }
+
+
+def within_drift_band(
+    current_pct: np.ndarray,
+    target_pct: np.ndarray,
+    trade_value: np.ndarray,
+    liquidate: np.ndarray,
+    abs_band_pct: float = 0.0,
+    rel_band: float = 0.0,
+    min_trade_value: float = 0.0,
+) -> np.ndarray:
+    """거래하지 않아도 되는 행 마스크.
+
+    허용 폭 = abs_band_pct(%p)와 rel_band × 목표 비중 중 설정된(> 0) 값, 둘 다 설정되면 작은 쪽
+    (어느 한쪽이라도 넘으면 리밸런싱 — 5/25 규칙과 같은 방식). 둘 다 0이면 허용 폭 없음.
+    |현재 비중 − 목표 비중| ≤ 허용 폭이거나 거래 금액 < min_trade_value이면 True.
+    전량 매도 행(liquidate)은 항상 False.
+
+    Args:
+        current_pct / target_pct: 총자산 대비 현재·목표 비중(%).
+        trade_value: 계획 거래 금액 (수량 × 현재가).
+    """
+    liquidate = np.asarray(liquidate, dtype=bool)
+    drift = np.abs(np.asarray(current_pct) - np.asarray(target_pct))
+    bands = []
+    if abs_band_pct > 0:
+        bands.append(np.full(drift.shape, float(abs_band_pct)))
+    if rel_band > 0:
+        bands.append(rel_band * np.asarray(target_pct))
+    inside = drift <= np.minimum.reduce(bands) if bands else np.zeros(drift.shape, dtype=bool)
+    small = np.asarray(trade_value) < min_trade_value
+    return (inside | small) & ~liquidate
+
+
+def validate_weights(name: str, weights: Mapping[str, float]) -> None:
+    """{ticker: weight} 검증 — 비어 있음·NaN·음수·합계 1.0 초과 거부 (PortfolioPlanner와 같은 규칙)."""
+    values = np.array(list(weights.values()), dtype=float)
+    if not weights:
+        raise ValueError(f"[{name}] weights가 비어 있습니다.")
+    if np.isnan(values).any() or (values < 0).any():
+        raise ValueError(f"[{name}] weights에 빈 값(NaN) 또는 음수 값이 있습니다.")
+    if values.sum() > 1.0 + 1e-9:
+        raise ValueError(f"[{name}] weight 합계가 1.0을 초과합니다: {values.sum():.4f}")
+
+
+def has_drift_band(policy: ExecutionPolicy) -> bool:
+    """허용 범위·최소 거래 금액 중 하나라도 설정됐는지."""
+    return policy.drift_band_abs_pct > 0 or policy.drift_band_rel > 0 or policy.min_trade_value > 0
+
+
+def needs_policy_pass(policy: ExecutionPolicy) -> bool:
+    """`apply_policy`가 계획을 바꿀 수 있는 정책인지 (아니면 호출을 건너뛴다)."""
+    return policy.planner_mode == 'optimize' or has_drift_band(policy)
+
+
+def optimize_quantities(
+    columns: dict,
+    rows: np.ndarray,
+    price: np.ndarray,
+    current_quantity: np.ndarray,
+    current_value: np.ndarray,
+    total_value: float,
+    target_base: float,
+    safety_ratio: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """allocation 행(rows)의 수량·방향을 정수 최적화 결과로 교체 (columns 제자리 갱신).
+
+    rows 밖의 행(미등록 종목 전량 매도)은 그대로 두고, 그 매도 대금은 예수금과 함께 매수
+    재원(free_cash)으로 본다. 절사 결과를 출발 해로 넘겨 최적화 결과가 그보다 나빠지지 않게 한다.
+
+    Args:
+        rows: 포트폴리오 하나의 allocation 행 인덱스.
+        price / current_quantity / current_value: columns와 같은 길이의 전체 행 배열.
+        total_value: 포트폴리오 총자산 (buffer 미차감).
+        target_base: 목표 금액 산정 기준 (총자산 - buffer_cash).
+        safety_ratio: 매수 재원 안전 비율 (`buy_cash_safety_ratio`).
+
+    Returns:
+        (절사 목표 수량, 최적화 목표 수량) — rows 순서, 호출부 로그용.
+    """
+    current = np.asarray(current_quantity)[rows].astype(np.int64)
+    quantity = columns['required_quantity'][rows]
+    truncated = current + np.where(columns['required_transaction'][rows] == 'sell', -quantity, quantity)
+    optimized = optimize_integer_lots(
+        target_value=columns['target_value'][rows],
+        price=np.asarray(price, dtype=float)[rows],
+        current_quantity=current,
+        free_cash=total_value - float(np.asarray(current_value)[rows].sum()),
+        budget=target_base,
+        safety_ratio=safety_ratio,
+        initial_quantity=truncated,
+    )
+    delta = optimized - current
+    columns['required_quantity'][rows] = np.abs(delta)
+    columns['required_transaction'][rows] = np.select([delta > 0, delta < 0], [_BUY, _SELL], default=None)
+    return truncated, optimized
+
+
+def drop_within_drift_band(
+    columns: dict,
+    rows: np.ndarray,
+    liquidate: np.ndarray,
+    price: np.ndarray,
+    total_value: float,
+    policy: ExecutionPolicy,
+) -> np.ndarray:
+    """포트폴리오 하나(rows)에서 허용 범위 안·소액 주문을 수량 0·방향 None으로 (columns 제자리 갱신).
+
+    Returns:
+        주문이 있다가 제거된 행 인덱스 (호출부 로그용). 정책 미설정이면 빈 배열.
+    """
+    if not has_drift_band(policy):
+        return rows[:0]
+    liquidate_rows = np.asarray(liquidate, dtype=bool)[rows]
+    keep = within_drift_band(
+        current_pct=columns['current_pct'][rows],
+        target_pct=columns['target_value'][rows] / total_value * 100,
+        trade_value=columns['required_quantity'][rows] * np.where(liquidate_rows, 0.0, np.asarray(price)[rows]),
+        liquidate=liquidate_rows,
+        abs_band_pct=policy.drift_band_abs_pct,
+        rel_band=policy.drift_band_rel,
+        min_trade_value=policy.min_trade_value,
+    )
+    dropped = rows[keep]
+    skipped = dropped[columns['required_quantity'][dropped] > 0]
+    columns['required_quantity'][dropped] = 0
+    columns['required_transaction'][dropped] = None
+    return skipped
+
+
+def apply_policy(
+    columns: dict,
+    rows: np.ndarray,
+    liquidate: np.ndarray,
+    price: np.ndarray,
+    current_quantity: np.ndarray,
+    current_value: np.ndarray,
+    total_value: float,
+    target_base: float,
+    policy: ExecutionPolicy,
+) -> np.ndarray:
+    """포트폴리오 하나(rows)에 정수 최적화(optimize)·허용 범위를 차례로 적용 (columns 제자리 갱신).
+
+    Returns:
+        허용 범위로 주문이 제거된 행 인덱스.
+    """
+    rows = np.asarray(rows)
+    if policy.planner_mode == 'optimize':
+        optimize_quantities(
+            columns, rows[~np.asarray(liquidate, dtype=bool)[rows]], price, current_quantity, current_value,
+            total_value, target_base, policy.buy_cash_safety_ratio,
+        )
+    return drop_within_drift_band(columns, rows, liquidate, price, total_value, policy)
@@ -28,11 +28,87 @@ class ExecutionPolicy:
             매수 시 보수단가(psbl_qty_calc_unpr) 기준 가용현금에 곱하는 안전 마진.
             1.0 미만이어야 보수적. 0.99면 KIS 보수단가 기반 잔여추적이 1% 마진을 둔다.
             (기존: src.executor._get_orderable_qty 의 0.99 매직 넘버)
+
+        prefetch_orderable:
+            True면 매도/매수 단계 시작 전 대상 종목의 매수·매도 가능 조회를 동시에
+            선조회한다 (AsyncKISClient). False(기본)면 종전처럼 주문마다 직렬 조회.
+
+        sell_max_workers:
+            매도 주문 동시 제출 스레드 수. 1이면 종전처럼 직렬. 요청 수는 KISClient의
+            rate limiter가 app key 한도 이내로 조절하므로 값을 키워도 한도를 넘지 않는다.
+
+        settlement_wait_mode:
+            sell → buy 사이 대기 방식.
+            - 'fixed': sell_to_buy_wait_seconds만큼 고정 sleep (기존 동작).
+            - 'poll': fetch_buy_orderable_cash를 지수 백오프로 폴링해, 매수 가능 한도가
+              예상 매도 대금 × settlement_expected_ratio만큼 늘면 즉시 진행. 마감
+              (settlement_poll_timeout_seconds)을 넘기면 그 시점 한도로 진행.
+
+        settlement_poll_initial_seconds / settlement_poll_max_interval_seconds:
+            폴링 간격의 시작값과 상한(초). 간격은 매 회 2배로 늘어난다.
+
+        settlement_poll_timeout_seconds:
+            폴링 마감(초). 첫 조회는 대기 없이 즉시 수행.
+
+        settlement_expected_ratio:
+            예상 매도 대금(체결 수량 × 계획 단가) 중 반영되어야 할 비율.
+            수수료·세금·체결가 차이를 흡수하도록 1.0보다 약간 작게 둔다.
+
+        reconcile_fills:
+            True면 매도·매수 단계가 끝날 때마다 당일 주문체결 조회(inquire-daily-ccld)를 한 번의
+            페이지 순회로 호출해 주문번호별 실제 체결 수량·평균 체결가를 결과에 반영한다.
+            False면 종전처럼 rt_cd='0'이면 요청 수량 전량 체결로 간주.
+
+        fill_poll_interval_seconds / fill_poll_timeout_seconds:
+            미체결 잔량이 남은 주문이 있을 때 체결 조회를 반복하는 간격과 마감(초).
+            마감 후에도 남은 잔량은 미체결로 두고 그 시점 체결 수량을 기록한다.
+
+        planner_mode:
+            종목별 목표 수량 결정 방식.
+            - 'truncate': 종목마다 필요 금액 / 현재가를 0 방향 절사 (기존 동작).
+            - 'optimize': `src/optimizer.py`로 종목 전체 수량을 함께 골라 목표 비중 대비 오차를
+              최소화 (buffer_cash·buy_cash_safety_ratio 제약 포함).
+
+        drift_band_abs_pct / drift_band_rel:
+            허용 범위(drift band). 총자산 대비 현재 비중이 목표 비중에서 abs_pct(%p) 또는
+            rel × 목표 비중 이내면 그 종목은 주문하지 않는다. 둘 다 설정하면 좁은 쪽 적용.
+            범위를 벗어난 종목은 목표 비중까지 리밸런싱. 0이면 해당 범위 미사용 (기본: 모든 이탈 거래).
+
+        min_trade_value:
+            계획 거래 금액(수량 × 현재가)이 이 값(원) 미만인 주문은 내지 않는다. 0이면 미사용.
+            allocation 미등록 종목 전량 매도는 범위·최소 금액과 무관하게 항상 실행.
+
+        orderable_price_mode:
+            매수 가능수량 산정 단가(보수단가) 출처.
+            - 'kis': 매수 종목마다 inquire-psbl-order의 psbl_qty_calc_unpr 조회 (기존 동작).
+            - 'local': 플래너 시세 조회가 받아 둔 당일 상한가(`KISClient.upper_limit_price`, 응답에
+              없으면 기준가 × 1.3 KRX 규칙 — `src/kis/price_rule.py`)를 사용. 앞쪽 orderable_verify_sample
+              종목과 상한가를 모르는 종목만 KIS로 조회하고, 표본의 로컬 값이 KIS보다 낮은 종목이 하나라도
+              있으면 나머지도 KIS 조회로 되돌린다.
+
+        orderable_verify_sample:
+            'local' 모드에서 KIS 응답과 대조할 매수 종목 수 (>= 1 — 검증 없는 로컬 값만의 매수는 허용하지 않음).
     """
 
     buffer_cash: int = 10_000
     sell_to_buy_wait_seconds: int = 3
     buy_cash_safety_ratio: float = 0.99
+    prefetch_orderable: bool = False
+    sell_max_workers: int = 1
+    settlement_wait_mode: str = 'fixed'
+    settlement_poll_initial_seconds: float = 0.2
+    settlement_poll_max_interval_seconds: float = 2.0
+    settlement_poll_timeout_seconds: float = 30.0
+    settlement_expected_ratio: float = 0.95
+    reconcile_fills: bool = True
+    fill_poll_interval_seconds: float = 0.5
+    fill_poll_timeout_seconds: float = 5.0
+    planner_mode: str = 'truncate'
+    drift_band_abs_pct: float = 0.0
+    drift_band_rel: float = 0.0
+    min_trade_value: int = 0
+    orderable_price_mode: str = 'kis'
+    orderable_verify_sample: int = 2
 
     def __post_init__(self) -> None:
         if self.buffer_cash < 0:
@@ -45,6 +121,43 @@ class ExecutionPolicy:
             raise ValueError(
                 f"buy_cash_safety_ratio는 (0, 1] 범위여야 합니다: {self.buy_cash_safety_ratio}"
             )
+        if self.sell_max_workers < 1:
+            raise ValueError(f"sell_max_workers >= 1이어야 합니다: {self.sell_max_workers}")
+        if self.settlement_wait_mode not in ('fixed', 'poll'):
+            raise ValueError(
+                f"settlement_wait_mode는 'fixed' 또는 'poll'이어야 합니다: {self.settlement_wait_mode!r}"
+            )
+        if not (0 < self.settlement_poll_initial_seconds <= self.settlement_poll_max_interval_seconds):
+            raise ValueError(
+                "0 < settlement_poll_initial_seconds <= settlement_poll_max_interval_seconds여야 합니다: "
+                f"{self.settlement_poll_initial_seconds}/{self.settlement_poll_max_interval_seconds}"
+            )
+        if self.settlement_poll_timeout_seconds < 0:
+            raise ValueError(
+                f"settlement_poll_timeout_seconds >= 0이어야 합니다: {self.settlement_poll_timeout_seconds}"
+            )
+        if not (0.0 < self.settlement_expected_ratio <= 1.0):
+            raise ValueError(
+                f"settlement_expected_ratio는 (0, 1] 범위여야 합니다: {self.settlement_expected_ratio}"
+            )
+        if self.fill_poll_interval_seconds <= 0:
+            raise ValueError(f"fill_poll_interval_seconds > 0이어야 합니다: {self.fill_poll_interval_seconds}")
+        if self.fill_poll_timeout_seconds < 0:
+            raise ValueError(f"fill_poll_timeout_seconds >= 0이어야 합니다: {self.fill_poll_timeout_seconds}")
+        if self.planner_mode not in ('truncate', 'optimize'):
+            raise ValueError(f"planner_mode는 'truncate' 또는 'optimize'이어야 합니다: {self.planner_mode!r}")
+        if not (0.0 <= self.drift_band_abs_pct < 100.0):
+            raise ValueError(f"drift_band_abs_pct는 [0, 100) 범위여야 합니다: {self.drift_band_abs_pct}")
+        if self.drift_band_rel < 0:
+            raise ValueError(f"drift_band_rel >= 0이어야 합니다: {self.drift_band_rel}")
+        if self.min_trade_value < 0:
+            raise ValueError(f"min_trade_value >= 0이어야 합니다: {self.min_trade_value}")
+        if self.orderable_price_mode not in ('kis', 'local'):
+            raise ValueError(
+                f"orderable_price_mode는 'kis' 또는 'local'이어야 합니다: {self.orderable_price_mode!r}"
+            )
+        if self.orderable_verify_sample < 1:
+            raise ValueError(f"orderable_verify_sample >= 1이어야 합니다: {self.orderable_verify_sample}")
 
 
 # 모듈 전역 기본 인스턴스. 호출부에서 명시 주입이 없을 때 사용.
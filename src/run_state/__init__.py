@@ -0,0 +1,18 @@
+from pathlib import Path
+from typing import Optional
+
+from src.config.env import PROJECT_ROOT, RUN_STATE_BACKEND, RUN_STATE_SQLITE_PATH
+from src.run_state.base import RunStateStore
+from src.run_state.bigquery_store import BigQueryRunStateStore
+from src.run_state.sqlite_store import SQLiteRunStateStore
+
+__all__ = ['RunStateStore', 'BigQueryRunStateStore', 'SQLiteRunStateStore', 'make_run_state_store']
+
+
+def make_run_state_store(bq_client=None) -> Optional[RunStateStore]:
+    """RUN_STATE_BACKEND에 맞는 저장소. 'sqlite'면 로컬 파일, 그 외에는 bq_client가 있을 때만 BigQuery."""
+    if RUN_STATE_BACKEND == 'sqlite':
+        return SQLiteRunStateStore(Path(RUN_STATE_SQLITE_PATH) if RUN_STATE_SQLITE_PATH else PROJECT_ROOT / 'run_state.sqlite3')
+    if RUN_STATE_BACKEND != 'bigquery':
+        raise ValueError(f"RUN_STATE_BACKEND는 'bigquery' 또는 'sqlite'여야 합니다: {RUN_STATE_BACKEND}")
+    return BigQueryRunStateStore(bq_client) if bq_client is not None else None
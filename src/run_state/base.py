@@ -0,0 +1,53 @@
+"""실행 상태 저장소 인터페이스 (중복 실행 방지, ARCH-003).
+
+run_id 단위로 'started' → 'completed' 상태를 기록한다 (SQLite는 행 1개 UPSERT, BigQuery는 run당
+최대 2행의 이벤트 스트리밍 insert). 중복 실행 판정은 trade_log 전체를 run_id로 집계하는 대신
+(account_type, run_date) 범위에서 차단 조건을 만족하는 run 1개만 찾는 조회가 된다.
+
+차단 조건은 종전 `BigQueryClient.is_already_executed`와 동일:
+- completed 행이 within_days 안에 있음 (정상 완료)
+- started 후 STALE_MINUTES 미경과 (진행 중, 동시 실행 방지)
+started 후 STALE_MINUTES가 지났는데 completed가 아니면 좀비로 보고 차단하지 않는다 (다음 cron 재시도).
+"""
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from src.bigquery.client import STALE_MINUTES
+
+KST = pytz.timezone('Asia/Seoul')
+RUN_STATUSES = ('started', 'completed')
+
+__all__ = ['KST', 'RUN_STATUSES', 'STALE_MINUTES', 'RunStateStore', 'cutoff_date']
+
+
+def cutoff_date(target_date: date, within_days: int) -> date:
+    """target_date 포함 within_days일 구간의 시작일."""
+    if within_days < 1:
+        raise ValueError(f"within_days >= 1이어야 합니다: {within_days}")
+    if isinstance(target_date, datetime):
+        target_date = target_date.date()
+    return target_date - timedelta(days=within_days - 1)
+
+
+class RunStateStore:
+    """실행 상태 저장소 인터페이스. 구현: `SQLiteRunStateStore`, `BigQueryRunStateStore`."""
+
+    def mark_run(self, run_id: str, account_type: str, status: str) -> None:
+        """run_id 상태를 status로 기록한다. 한 번 'completed'가 된 run은 다시 'started'로 되돌리지 않는다.
+
+        Args:
+            run_id (str): main.py에서 발급한 실행 단위 식별자 (uuid).
+            account_type (str): 계좌 식별자.
+            status (str): 'started' 또는 'completed'.
+        """
+        raise NotImplementedError
+
+    def is_already_executed(self, account_type: str, target_date: date, within_days: int = 7) -> bool:
+        """target_date 포함 within_days일 안에 차단 조건을 만족하는 run이 있는지."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _validate_status(status: str) -> None:
+        if status not in RUN_STATUSES:
+            raise ValueError(f"status는 {RUN_STATUSES} 중 하나여야 합니다: {status}")
@@ -0,0 +1,166 @@
+"""BigQuery `run_state` 테이블 실행 상태 저장소.
+
+종전에는 started/completed marker를 trade_log에 행으로 추가하고, 판정 때마다 within_days 구간의
+모든 marker·trade 행을 run_id로 GROUP BY했다. 본 저장소는 run 이벤트(started·completed, run당 최대
+2행)만 담은 전용 테이블에 기록하고, 판정은 `run_date` 파티션 + `account_type` 클러스터 안의 소량 행에서
+조건을 만족하는 run 1개만 찾는다.
+
+쓰기는 `BigQueryClient.stream_rows`(스트리밍 insert, insertId=`{run_id}:{status}`) — 주문 직전
+임계 경로에서 load/DML job 완료를 기다리지 않는다 (수십 ms). 스트리밍 버퍼의 행은 MERGE/UPDATE할 수
+없으므로 행 갱신 대신 이벤트 추가(append-only)로 기록하고, 판정 쿼리가 run_id로 합친다.
+
+전환 기간: `run_state` 테이블이 판정 구간(within_days)보다 늦게 생성됐으면, 그 이전 실행 이력은
+trade_log에만 있으므로 run_state에서 못 찾은 경우에 한해 종전 `BigQueryClient.is_already_executed`로
+한 번 더 확인한다 (legacy_fallback). 테이블 생성 후 within_days가 지나면 이 경로는 타지 않는다.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+from src.config.env import BQ_DATASET_ID, BQ_PROJECT_ID
+from src.logger import get_logger
+from src.run_state.base import KST, STALE_MINUTES, RunStateStore, cutoff_date
+
+logger = get_logger(__name__)
+
+CLUSTERING_FIELDS = ['account_type', 'run_id']
+
+
+class BigQueryRunStateStore(RunStateStore):
+    """`{BQ_PROJECT_ID}.{BQ_DATASET_ID}.run_state` 테이블 (run_date 일 파티션, account_type·run_id 클러스터).
+
+    Args:
+        bq_client: BigQueryClient. `.client`(google.cloud.bigquery.Client)·`stream_rows`를 공유하고,
+            전환 기간 판정에 `is_already_executed`(trade_log)를 사용.
+        table_ref: 테이블 경로. None이면 trade_log와 같은 데이터셋의 run_state.
+        legacy_fallback: 전환 기간 trade_log 판정 병행 여부.
+    """
+
+    def __init__(self, bq_client, table_ref: Optional[str] = None, legacy_fallback: bool = True) -> None:
+        self.bq_client = bq_client
+        self.table_ref = table_ref or f'{BQ_PROJECT_ID}.{BQ_DATASET_ID}.run_state'
+        self.legacy_fallback = legacy_fallback
+        self._created_date: Optional[date] = None
+
+    @property
+    def client(self):
+        return self.bq_client.client
+
+    def ensure_table(self) -> None:
+        """run_state 테이블이 없으면 생성 (멱등)."""
+        from google.cloud import bigquery
+        table = bigquery.Table(self.table_ref, schema=[
+            bigquery.SchemaField('run_id', 'STRING', mode='REQUIRED'),
+            bigquery.SchemaField('account_type', 'STRING', mode='REQUIRED'),
+            bigquery.SchemaField('run_date', 'DATE', mode='REQUIRED'),
+            bigquery.SchemaField('status', 'STRING', mode='REQUIRED'),
+            bigquery.SchemaField('event_at', 'TIMESTAMP', mode='REQUIRED'),
+        ])
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY, field='run_date',
+        )
+        table.clustering_fields = CLUSTERING_FIELDS
+        self.client.create_table(table, exists_ok=True)
+        logger.info('run_state 테이블 확인/생성: %s', self.table_ref)
+
+    def _insert_query(self, row: dict):
+        """테이블을 막 만든 직후용 DML INSERT (스트리밍 insert는 새 테이블에 바로 쓰지 못할 수 있음)."""
+        from google.cloud import bigquery
+        query = f"""
+            INSERT INTO `{self.table_ref}` (run_id, account_type, run_date, status, event_at)
+            VALUES (@run_id, @account_type, @run_date, @status, @event_at)
+        """
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter('run_id', 'STRING', row['run_id']),
+            bigquery.ScalarQueryParameter('account_type', 'STRING', row['account_type']),
+            bigquery.ScalarQueryParameter('run_date', 'DATE', row['run_date']),
+            bigquery.ScalarQueryParameter('status', 'STRING', row['status']),
+            bigquery.ScalarQueryParameter('event_at', 'TIMESTAMP', row['event_at']),
+        ])
+        return query, job_config
+
+    def mark_run(self, run_id: str, account_type: str, status: str) -> None:
+        from google.api_core.exceptions import NotFound
+        self._validate_status(status)
+        now = datetime.now(KST)
+        row = {
+            'run_id': run_id,
+            'account_type': account_type,
+            'run_date': now.date().isoformat(),
+            'status': status,
+            'event_at': now.isoformat(),
+        }
+        try:
+            # insertId = run_id:status → 재시도로 같은 이벤트가 두 번 적재되지 않는다.
+            self.bq_client.stream_rows(self.table_ref, [row], row_ids=[f'{run_id}:{status}'])
+        except NotFound:
+            # 첫 실행: 테이블 생성 후 DML INSERT로 1회 기록
+            self.ensure_table()
+            query, job_config = self._insert_query(row)
+            self.client.query(query, job_config=job_config).result()
+        logger.info('run_state %s: run_id=%s, account_type=%s', status, run_id, account_type)
+
+    def _lookup_query(self, account_type: str, target_date: date, within_days: int, dry_run: bool = False):
+        """차단 조건을 만족하는 run 1개를 찾는 쿼리와 QueryJobConfig. dry_run=True면 스캔 바이트 추정용."""
+        from google.cloud import bigquery
+        # run당 이벤트는 started·completed 최대 2행 → run_date 파티션·account_type 클러스터 안의 소량 행만 읽는다.
+        query = f"""
+            SELECT run_id
+            FROM `{self.table_ref}`
+            WHERE run_date BETWEEN @cutoff_date AND @target_date
+              AND account_type = @account_type
+            GROUP BY run_id
+            HAVING LOGICAL_OR(status = 'completed')
+                OR TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), MIN(IF(status = 'started', event_at, NULL)), MINUTE)
+                   < @stale_minutes
+            LIMIT 1
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter('account_type', 'STRING', account_type),
+                bigquery.ScalarQueryParameter('cutoff_date', 'DATE', cutoff_date(target_date, within_days)),
+                bigquery.ScalarQueryParameter(
+                    'target_date', 'DATE', target_date.date() if isinstance(target_date, datetime) else target_date,
+                ),
+                bigquery.ScalarQueryParameter('stale_minutes', 'INT64', STALE_MINUTES),
+            ],
+            dry_run=dry_run,
+            use_query_cache=False,   # 진행 중 판정이 CURRENT_TIMESTAMP에 의존
+        )
+        return query, job_config
+
+    def _table_created_date(self) -> Optional[date]:
+        """run_state 테이블 생성일(KST). 미존재면 None. 인스턴스당 1회 조회."""
+        if self._created_date is None:
+            from google.api_core.exceptions import NotFound
+            try:
+                created = self.client.get_table(self.table_ref).created
+            except NotFound:
+                return None
+            self._created_date = created.astimezone(KST).date()
+        return self._created_date
+
+    def _needs_legacy_check(self, target_date: date, within_days: int) -> bool:
+        if not self.legacy_fallback:
+            return False
+        created = self._table_created_date()
+        return created is None or created > cutoff_date(target_date, within_days)
+
+    def is_already_executed(self, account_type: str, target_date: date, within_days: int = 7) -> bool:
+        from google.api_core.exceptions import NotFound
+        query, job_config = self._lookup_query(account_type, target_date, within_days)
+        try:
+            executed = any(True for _ in self.client.query(query, job_config=job_config).result())
+        except NotFound:
+            logger.info('run_state 테이블 미존재: %s', self.table_ref)
+            executed = False
+        if not executed and self._needs_legacy_check(target_date, within_days):
+            logger.info('run_state 이력이 판정 구간보다 짧음 → trade_log 판정 병행')
+            executed = self.bq_client.is_already_executed(account_type, target_date, within_days)
+        logger.info('is_already_executed(%s, within=%d days, stale=%dmin): %s (run_state)',
+                    account_type, within_days, STALE_MINUTES, executed)
+        return executed
+
+    def estimate_lookup_bytes(self, account_type: str, target_date: date, within_days: int = 7) -> int:
+        """판정 쿼리의 스캔 바이트를 dry run으로 추정 (과금·실행 없음)."""
+        query, job_config = self._lookup_query(account_type, target_date, within_days, dry_run=True)
+        return int(self.client.query(query, job_config=job_config).total_bytes_processed or 0)
@@ -0,0 +1,84 @@
+"""로컬 SQLite 실행 상태 저장소 — 클라우드 없이 개발·테스트용 중복 실행 방지."""
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Union
+
+from src.logger import get_logger
+from src.run_state.base import KST, STALE_MINUTES, RunStateStore, cutoff_date
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_state (
+    run_id       TEXT PRIMARY KEY,
+    account_type TEXT NOT NULL,
+    run_date     TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    started_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS run_state_account_date ON run_state (account_type, run_date);
+"""
+
+
+class SQLiteRunStateStore(RunStateStore):
+    """`run_state` 테이블 1개짜리 SQLite 파일. (account_type, run_date) 인덱스로 판정.
+
+    Args:
+        path: DB 파일 경로. ':memory:'면 프로세스 메모리.
+        clock: epoch 초 제공자 (테스트 주입용).
+    """
+
+    def __init__(self, path: Union[str, Path], clock: Callable[[], float] = time.time) -> None:
+        if str(path) != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # 배치 모드는 계좌별 스레드에서 같은 저장소를 쓴다 → 연결 1개 + 락으로 직렬화.
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.executescript(_SCHEMA)
+
+    def mark_run(self, run_id: str, account_type: str, status: str) -> None:
+        self._validate_status(status)
+        now = self._clock()
+        run_date = datetime.fromtimestamp(now, KST).date().isoformat()
+        completed_at = now if status == 'completed' else None
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO run_state (run_id, account_type, run_date, status, started_at, updated_at, completed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (run_id) DO UPDATE SET
+                    status = CASE WHEN run_state.status = 'completed' THEN run_state.status ELSE excluded.status END,
+                    updated_at = excluded.updated_at,
+                    completed_at = COALESCE(run_state.completed_at, excluded.completed_at)
+                """,
+                (run_id, account_type, run_date, status, now, now, completed_at),
+            )
+        logger.info('run_state: run_id=%s, status=%s, account_type=%s', run_id, status, account_type)
+
+    def is_already_executed(self, account_type: str, target_date: date, within_days: int = 7) -> bool:
+        cutoff = cutoff_date(target_date, within_days)
+        stale_before = self._clock() - STALE_MINUTES * 60
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT run_id FROM run_state
+                WHERE account_type = ? AND run_date >= ?
+                  AND (status = 'completed' OR (status = 'started' AND started_at > ?))
+                LIMIT 1
+                """,
+                (account_type, cutoff.isoformat(), stale_before),
+            ).fetchone()
+        executed = row is not None
+        logger.info('is_already_executed(%s, within=%d days, stale=%dmin): %s (sqlite)',
+                    account_type, within_days, STALE_MINUTES, executed)
+        return executed
+
+    def close(self) -> None:
+        self._conn.close()
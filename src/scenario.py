@@ -0,0 +1,192 @@
+"""시나리오 일괄 평가 (what-if 리밸런싱 계획).
+
+여러 allocation 시트·buffer_cash·가격 충격에서 계획이 어떻게 달라지는지 비교하려면 종전에는
+시나리오마다 `main.py --test`를 실행해 KIS 시세·잔고를 다시 조회해야 했다. 본 모듈은 계좌
+스냅샷(현재가·잔고) 하나와 시나리오 M개를 받아 모든 계획을 한 번의 배열 연산으로 계산한다.
+
+핵심 설계:
+- `Scenario`: 이름 + 선택적 대체 목표 비중(weights)·정책(policy)·가격(prices 절대값, price_shock
+  상대 변화). 지정하지 않은 항목은 플래너의 allocation·정책·스냅샷 가격을 그대로 쓴다.
+- 종목 축(N) = 기본 allocation ∪ 시나리오 비중 종목 ∪ 보유 종목. 시나리오별 비중·가격·평가금액을
+  M×N 행렬로 쌓고, 각 시나리오의 계획 행(allocation 종목 + 보유 중인 미등록 종목)만 평탄화해
+  `planning_kernel.compute_rebalance_arrays`를 1회 호출한다 → PortfolioPlanner와 같은 계산식.
+- 가격 시나리오는 보유 평가금액도 같은 비율로 바꾼다 (현금은 그대로) → 총자산·목표 금액이 함께 변한다.
+- 정책 후처리(`planner_mode='optimize'`, 허용 범위)는 해당 정책을 쓰는 시나리오만 시나리오별로
+  `planning_kernel.apply_policy`(플래너와 같은 구현)로 적용한다 (정수 최적화는 포트폴리오 단위
+  탐색이라 벡터화 대상이 아님).
+- 순수 계산: KIS 조회는 호출부(`PortfolioPlanner.evaluate_scenarios`)가 스냅샷당 1회만 수행.
+"""
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.planning_kernel import apply_policy, compute_rebalance_arrays, needs_policy_pass, validate_weights
+from src.policy import ExecutionPolicy
+
+# 결과 프레임 컬럼 순서 (scenario 다음은 get_rebalancing_plan과 같은 이름).
+SCENARIO_COLUMNS = [
+    'scenario', 'ticker', 'stock_nm', 'category_1', 'category_2', 'weight',
+    'current_price', 'current_quantity', 'current_value',
+    'target_value', 'required_value', 'required_quantity', 'required_transaction', 'current_pct',
+]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """what-if 시나리오 하나.
+
+    Attributes:
+        name: 결과 프레임의 scenario 값 (시나리오 간 중복 불가).
+        weights: {ticker: weight} 대체 목표 비중. 주어지면 allocation 전체를 대체 (없는 보유 종목은
+            전량 매도). None이면 플래너의 allocation_info 비중.
+        policy: 대체 실행 정책 (buffer_cash·planner_mode·허용 범위). None이면 플래너 정책.
+        prices: {ticker: 가격} 절대 가격 지정. price_shock보다 우선.
+        price_shock: 스냅샷 가격 대비 상대 변화. 스칼라면 전 종목(예: -0.1 = 10% 하락),
+            {ticker: 변화율}이면 해당 종목만.
+    """
+
+    name: str
+    weights: Optional[Mapping[str, float]] = None
+    policy: Optional[ExecutionPolicy] = None
+    prices: Optional[Mapping[str, float]] = None
+    price_shock: Union[float, Mapping[str, float]] = 0.0
+
+
+def evaluate_scenarios(
+    scenarios: Sequence[Scenario],
+    allocation_info: pd.DataFrame,
+    balance: pd.DataFrame,
+    prices: Mapping[str, float],
+    policy: ExecutionPolicy,
+) -> pd.DataFrame:
+    """계좌 스냅샷 하나로 시나리오별 리밸런싱 계획을 계산해 세로로 쌓아 반환한다.
+
+    Args:
+        scenarios: 평가할 시나리오 (이름 중복 불가).
+        allocation_info: 기본 목표 비중 (ticker, weight, 선택적으로 stock_nm·category_1·category_2).
+        balance: `fetch_domestic_total_balance` 형식 잔고 (CASH 행 포함).
+        prices: allocation·시나리오 종목 현재가. 보유만 한 종목은 잔고의 current_price를 쓴다.
+        policy: 시나리오에 정책이 없을 때 쓰는 기본 정책.
+
+    Returns:
+        pd.DataFrame: SCENARIO_COLUMNS. 시나리오 입력 순서, 시나리오 안에서는 required_value 오름차순
+        (get_rebalancing_plan과 같은 sell 우선 정렬).
+    """
+    names = [s.name for s in scenarios]
+    if not names:
+        return pd.DataFrame(columns=SCENARIO_COLUMNS)
+    if len(set(names)) != len(names):
+        raise ValueError(f"시나리오 이름이 중복됩니다: {names}")
+    for s in scenarios:
+        if s.weights is not None:
+            validate_weights(s.name, s.weights)
+
+    # ---- 종목 축 정렬 ------------------------------------------------------- #
+    held = balance[balance['ticker'] != 'CASH']
+    base_tickers = list(allocation_info['ticker'])
+    tickers = list(dict.fromkeys(
+        base_tickers
+        + [t for s in scenarios if s.weights is not None for t in s.weights]
+        + list(held['ticker'])
+    ))
+    index = {t: i for i, t in enumerate(tickers)}
+    m, n = len(scenarios), len(tickers)
+
+    held_qty = np.zeros(n)
+    held_value = np.zeros(n)
+    held_price = np.zeros(n)
+    cols = [index[t] for t in held['ticker']]
+    held_qty[cols] = held['current_quantity'].to_numpy(dtype=float)
+    held_value[cols] = held['current_value'].to_numpy(dtype=float)
+    held_price[cols] = held['current_price'].to_numpy(dtype=float)
+    cash = float(balance['current_value'].sum()) - float(held_value.sum())
+    base_price = np.array([float(prices[t]) if t in prices else held_price[index[t]] for t in tickers])
+
+    # ---- 시나리오 행렬 (M×N) ------------------------------------------------ #
+    default_weight = np.zeros(n)
+    default_weight[[index[t] for t in base_tickers]] = allocation_info['weight'].to_numpy(dtype=float)
+    default_alloc = np.zeros(n, dtype=bool)
+    default_alloc[[index[t] for t in base_tickers]] = True
+
+    weight = np.tile(default_weight, (m, 1))
+    allocated = np.tile(default_alloc, (m, 1))
+    price = np.tile(base_price, (m, 1))
+    policies = [s.policy or policy for s in scenarios]
+    for k, s in enumerate(scenarios):
+        if s.weights is not None:
+            weight[k] = 0.0
+            allocated[k] = False
+            cols = [index[t] for t in s.weights]
+            weight[k, cols] = list(s.weights.values())
+            allocated[k, cols] = True
+        if isinstance(s.price_shock, Mapping):
+            for t, shock in s.price_shock.items():
+                price[k, index[t]] *= 1 + shock
+        elif s.price_shock:
+            price[k] *= 1 + s.price_shock
+        for t, p in (s.prices or {}).items():
+            price[k, index[t]] = p
+
+    invalid = allocated & ~(price > 0)
+    if invalid.any():
+        bad = {names[k]: [tickers[j] for j in np.flatnonzero(invalid[k])] for k in np.flatnonzero(invalid.any(axis=1))}
+        raise ValueError(f"유효하지 않은 가격(0 또는 NaN)이 있는 종목: {bad}")
+
+    # 가격 변화는 보유 평가금액에 같은 비율로 반영 (스냅샷 가격이 없는 종목은 그대로)
+    ratio = np.divide(price, base_price, out=np.ones_like(price), where=base_price > 0)
+    value = held_value * ratio
+    total = cash + value.sum(axis=1)
+    buffer = np.array([p.buffer_cash for p in policies], dtype=float)
+    if (total <= buffer).any():
+        k = int(np.argmax(total <= buffer))
+        raise ValueError(
+            f"[{names[k]}] 총 평가금액({total[k]:,.0f}원)이 버퍼({buffer[k]:,.0f}원) 이하입니다."
+        )
+    target_base = np.trunc(total - buffer)
+
+    # ---- 계획 행만 평탄화해 커널 1회 호출 ------------------------------------ #
+    quantity = np.broadcast_to(held_qty, (m, n))
+    rows = allocated | (quantity > 0)
+    scenario_idx, ticker_idx = np.nonzero(rows)
+    liquidate = ~allocated[rows]
+    row_price, row_quantity, row_value = price[rows], quantity[rows], value[rows]
+    columns = compute_rebalance_arrays(
+        weight=weight[rows],
+        current_price=row_price,
+        current_quantity=row_quantity,
+        current_value=row_value,
+        liquidate=liquidate,
+        total_value=total[scenario_idx],
+        target_base=target_base[scenario_idx],
+    )
+
+    # ---- 정책 후처리 (해당 시나리오만) -------------------------------------- #
+    for k, scenario_policy in enumerate(policies):
+        if not needs_policy_pass(scenario_policy):
+            continue
+        part = np.flatnonzero(scenario_idx == k)
+        apply_policy(columns, part, liquidate, row_price, row_quantity, row_value,
+                      float(total[k]), float(target_base[k]), scenario_policy)
+
+    table = pd.DataFrame({
+        'scenario': np.array(names, dtype=object)[scenario_idx],
+        'ticker': np.array(tickers, dtype=object)[ticker_idx],
+        'weight': np.where(liquidate, 0.0, weight[rows]),
+        'current_price': row_price,
+        'current_quantity': row_quantity,
+        'current_value': row_value,
+        **columns,
+    })
+    # 종목명은 allocation 기준(없으면 잔고), 분류는 allocation 종목만 (미등록 종목은 None — 플래너와 동일)
+    labels = allocation_info.set_index('ticker')
+    held_names = held.set_index('ticker')['stock_nm'] if 'stock_nm' in held else pd.Series(dtype=object)
+    stock_nm = table['ticker'].map(labels['stock_nm']) if 'stock_nm' in labels else table['ticker'].map(held_names)
+    table['stock_nm'] = stock_nm.fillna(table['ticker'].map(held_names))
+    for name in ('category_1', 'category_2'):
+        mapped = table['ticker'].map(labels[name]) if name in labels else pd.Series(None, index=table.index)
+        table[name] = mapped.astype(object).where(~liquidate, None)
+    order = np.lexsort((table['required_value'].to_numpy(), scenario_idx))
+    return table.iloc[order][SCENARIO_COLUMNS].reset_index(drop=True)
+
@@ -11,15 +11,25 @@
 - NaN/None은 빈 문자열로 변환해 'NaN' 문자열이 시트에 박히는 것을 방지.
 - 빈 DataFrame이어도 헤더는 기록 (스키마 보존).
 - 신규 시트는 add_worksheet로 자동 생성 (rows≥100, cols≥10 여유분 확보).
+- 지연 import: gspread·google-auth는 클라이언트 생성/예외 처리 시점에 import →
+  main.py의 동시 초기화 스레드 안에서 로딩되어 다른 초기화와 겹친다.
 """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pandas as pd
-import gspread
-from google.auth import default
-from google.oauth2.service_account import Credentials
 from src.config.env import GCP_KEY_PATH, EXECUTE_ENV
 
+if TYPE_CHECKING:
+    import gspread
+
 class GoogleSheetsClient():
     def __init__(self, url) -> None:
+        import gspread
+        from google.auth import default
+        from google.oauth2.service_account import Credentials
+
         self.gs_url = url
         # 읽기·쓰기 모두 필요 (overwrite_dataframe). readonly 스코프로는 add_worksheet/clear/update 불가.
         self.scope = [
@@ -44,6 +54,7 @@ class GoogleSheetsClient():
 
     def get_worksheet_url(self, sheet: str) -> str:
         """특정 시트 탭의 URL을 반환한다. 탭이 없으면 스프레드시트 기본 URL을 반환한다."""
+        import gspread
         try:
             ws = self.get_worksheet(sheet)
             return f'{self.spreadsheet.url}#gid={ws.id}'
@@ -67,6 +78,7 @@ class GoogleSheetsClient():
         Returns:
             gspread.Worksheet: 작성된 워크시트 객체.
         """
+        import gspread
         try:
             ws = self.spreadsheet.worksheet(sheet_name)
             is_new_sheet = False
@@ -0,0 +1,123 @@
+"""주문 실행 이후 결과 전달(sink) 파이프라인.
+
+`allocator.run()` 이후 main.py는 Slack 요약·발송 → BigQuery trade_log load job → completed 기록
+(IRP는 Sheets 덮어쓰기 → URL 조회 → Slack)을 직렬로 수행했다. 각 목적지는 같은 결과 객체만 읽고
+서로의 출력에 의존하지 않으므로, 목적지별 sink로 나눠 동시에 실행한다.
+
+핵심 설계:
+- `Sink`는 이름 + 인자 없는 쓰기 함수 + 재시도(max_attempts, 지수 backoff)·타임아웃 설정.
+  쓰기 함수는 재시도해도 안전해야 한다 (BigQuery: 결정적 job_id / insertId, Sheets: 덮어쓰기).
+- `dispatch`는 sink마다 daemon 스레드를 띄우고 각자의 마감까지 기다린다 → 전체 시간은 sink 시간의
+  합이 아니라 최댓값, 느린 sink가 다른 sink의 완료를 늦추지 않는다. 마감을 넘긴 sink는 TimeoutError로
+  기록하고 더 기다리지 않는다 (스레드는 daemon이라 프로세스 종료를 막지 않음).
+- 실패는 삼키지 않는다: `SinkOutcome.error`로 돌려주고 호출부가 모든 sink 종료 후 전파한다.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Sink:
+    """결과 전달 목적지 1개.
+
+    Attributes:
+        name: 로그·결과 키.
+        write: 인자 없는 쓰기 함수. 실패 시 예외를 던진다.
+        max_attempts: 최대 시도 횟수 (1이면 재시도 없음).
+        timeout_seconds: 재시도를 포함한 전체 마감.
+        backoff_seconds: 첫 재시도 전 대기. 이후 매 회 2배.
+    """
+    name: str
+    write: Callable[[], Any]
+    max_attempts: int = 3
+    timeout_seconds: float = 60.0
+    backoff_seconds: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts >= 1이어야 합니다: {self.max_attempts}")
+        if self.timeout_seconds <= 0:
+            raise ValueError(f"timeout_seconds > 0이어야 합니다: {self.timeout_seconds}")
+        if self.backoff_seconds < 0:
+            raise ValueError(f"backoff_seconds >= 0이어야 합니다: {self.backoff_seconds}")
+
+
+@dataclass
+class SinkOutcome:
+    name: str
+    attempts: int = 0
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_with_retry(sink: Sink, outcome: SinkOutcome, started: float, sleep: Callable[[float], None]) -> None:
+    deadline = started + sink.timeout_seconds
+    delay = sink.backoff_seconds
+    try:
+        while True:
+            outcome.attempts += 1
+            try:
+                sink.write()
+                outcome.error = None
+                return
+            except Exception as e:
+                outcome.error = e
+                if outcome.attempts >= sink.max_attempts or deadline - time.monotonic() <= delay:
+                    logger.error('sink %s 실패 (%d회 시도): %s', sink.name, outcome.attempts, e)
+                    return
+                logger.warning('sink %s 실패 → %.1fs 후 재시도 (%d/%d): %s',
+                               sink.name, delay, outcome.attempts, sink.max_attempts, e)
+                sleep(delay)
+                delay *= 2
+    finally:
+        outcome.elapsed = time.monotonic() - started
+
+
+def dispatch(sinks: list[Sink], sleep: Callable[[float], None] = time.sleep) -> dict[str, SinkOutcome]:
+    """sink들을 동시에 실행하고 {이름: SinkOutcome}을 등록 순서대로 반환한다.
+
+    Args:
+        sinks: 실행할 sink 목록 (이름 중복 불가).
+        sleep: 재시도 대기 함수 (테스트 주입용).
+    """
+    names = [sink.name for sink in sinks]
+    if len(set(names)) != len(names):
+        raise ValueError(f"sink 이름이 중복됩니다: {names}")
+
+    started = time.monotonic()
+    outcomes = {sink.name: SinkOutcome(sink.name) for sink in sinks}
+    threads = {}
+    for sink in sinks:
+        thread = threading.Thread(
+            target=_run_with_retry, args=(sink, outcomes[sink.name], started, sleep),
+            name=f'sink-{sink.name}', daemon=True,
+        )
+        thread.start()
+        threads[sink.name] = thread
+
+    for sink in sinks:
+        thread = threads[sink.name]
+        thread.join(max(0.0, started + sink.timeout_seconds - time.monotonic()))
+        outcome = outcomes[sink.name]
+        if thread.is_alive():
+            # 아직 실행 중인 스레드가 원본을 계속 고치므로 반환값은 별도 객체로 고정.
+            outcome = outcomes[sink.name] = SinkOutcome(
+                sink.name, attempts=outcome.attempts, elapsed=sink.timeout_seconds,
+                error=TimeoutError(f'sink {sink.name}: {sink.timeout_seconds}s 안에 끝나지 않음'),
+            )
+            logger.error('%s', outcome.error)
+        else:
+            logger.info('sink %s: %s (%d회, %.2fs)', sink.name, 'ok' if outcome.ok else 'failed',
+                        outcome.attempts, outcome.elapsed)
+    logger.info('sink 전체 %.2fs (%s 동시 실행)', time.monotonic() - started, ', '.join(names))
+    return outcomes
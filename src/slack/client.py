@@ -9,13 +9,14 @@
 - IRP (`format_irp_plan_summary`): 거래 없이 plan만 생성됨을 명시. 매수/매도
   카운트 + 종목 액션 + Sheets URL 포함. 필수 컬럼 누락 시 KeyError 즉시 실패
   (silent failure 방지). required_quantity=0 종목은 출력에서 제외.
+- 지연 import: slack_sdk와 `WebClient`는 첫 발송 시점에 생성 (import 시 네트워크·토큰 불필요).
+  포맷 함수만 쓰는 경로(--test 요약 로그, 테스트)는 slack_sdk를 로드하지 않는다.
 """
 from datetime import datetime
+from typing import Union
 
 import pandas as pd
 import pytz
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
 
 from src.config.env import SLACK_BOT_TOKEN, SLACK_CHANNEL_ID
 from src.logger import get_logger
@@ -24,9 +25,17 @@ logger = get_logger(__name__)
 
 
 class SlackClient:
-    client = WebClient(token=SLACK_BOT_TOKEN, timeout=90)
+    _client = None   # 프로세스 공유 WebClient (첫 사용 시 생성)
+
+    @property
+    def client(self):
+        if SlackClient._client is None:
+            from slack_sdk import WebClient
+            SlackClient._client = WebClient(token=SLACK_BOT_TOKEN, timeout=90)
+        return SlackClient._client
 
     def upload_files(self, file: str, msg: str = None):
+        from slack_sdk.errors import SlackApiError
         try:
             result = self.client.files_upload_v2(
                 channels=SLACK_CHANNEL_ID,
@@ -37,14 +46,19 @@ class SlackClient:
         except SlackApiError as e:
             logger.error('Error uploading file: %s', e)
 
-    def chat_postMessage(self, title: str, contents: str):
+    def chat_postMessage(self, title: str, contents: Union[str, list]):
+        """contents가 list면 항목마다 section 블록을 만들고 divider로 구분 (멀티 계좌 다이제스트)."""
+        sections = [contents] if isinstance(contents, str) else list(contents)
         slack_msg_blocks = [
             {
                 'type': 'header',
                 'text': {'type': 'plain_text', 'text': title, 'emoji': True},
             },
-            {'type': 'section', 'text': {'type': 'mrkdwn', 'text': contents}},
         ]
+        for i, section in enumerate(sections):
+            if i > 0:
+                slack_msg_blocks.append({'type': 'divider'})
+            slack_msg_blocks.append({'type': 'section', 'text': {'type': 'mrkdwn', 'text': section}})
         self.client.chat_postMessage(
             channel=SLACK_CHANNEL_ID,
             blocks=slack_msg_blocks,
@@ -52,11 +66,14 @@ class SlackClient:
         )
 
 
-def slack_notify(title: str, contents: str) -> None:
+def slack_notify(title: str, contents: Union[str, list], raise_errors: bool = False) -> None:
+    """Slack 발송. 기본은 실패를 로그로만 남기고, raise_errors=True면 예외를 전파 (sink 재시도용)."""
     try:
         SlackClient().chat_postMessage(title, contents)
     except Exception as e:
         logger.error('Slack notify failed: %s', e)
+        if raise_errors:
+            raise
 
 
 def _format_stock_header(row) -> str:
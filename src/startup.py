@@ -0,0 +1,56 @@
+"""시작 단계 클라이언트 동시 초기화.
+
+main.py는 Sheets(OAuth + open_by_url) → BigQuery → allocation 시트 조회 → KIS(토큰 확인·발급)
+순으로 서로 독립적인 네트워크 I/O를 직렬로 수행했다. Cloud Run cron은 매 실행이 콜드 컨테이너라
+이 대기 시간이 그대로 실행 지연이 된다. 본 모듈은 독립 초기화 작업을 스레드로 동시에 실행하고
+실제 의존(allocation 시트 → planner)이 있는 지점에서만 합류(join)한다.
+
+핵심 설계:
+- 작업은 이름 → 인자 없는 팩토리(callable) dict. 의존 관계가 있는 작업(Sheets 클라이언트 생성 →
+  allocation 시트 조회)은 하나의 팩토리 안에서 순차 실행해 그래프를 단순하게 유지.
+- 실패 시 나머지 작업 완료를 기다린 뒤 등록 순서상 첫 예외를 그대로 전파 (예외 타입 보존 →
+  호출부의 기존 에러 처리/로그 동작 동일).
+- 작업별 소요 시간을 로그로 남겨 콜드 스타트 병목을 확인할 수 있게 한다.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def init_concurrently(
+    factories: dict[str, Optional[Callable[[], Any]]],
+    max_workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """독립 초기화 팩토리들을 동시에 실행하고 {이름: 결과}를 반환한다.
+
+    Args:
+        factories: {이름: 팩토리}. 팩토리가 None이면 실행하지 않고 결과 None (예: --test의 BigQuery).
+        max_workers: 스레드 수. None이면 실행할 작업 수.
+
+    Raises:
+        팩토리가 던진 예외 (여러 개면 factories 순서상 첫 번째).
+    """
+    tasks = {name: factory for name, factory in factories.items() if factory is not None}
+    results: dict[str, Any] = {name: None for name in factories}
+    if not tasks:
+        return results
+
+    def _timed(name: str, factory: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return factory()
+        finally:
+            logger.info('startup: %s 초기화 %.2fs', name, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks), thread_name_prefix='startup') as pool:
+        futures = {name: pool.submit(_timed, name, factory) for name, factory in tasks.items()}
+    # with 블록 종료 = 모든 작업 완료. 실패가 있어도 다른 작업의 부분 초기화가 중단되지 않는다.
+    for name, future in futures.items():
+        results[name] = future.result()
+    logger.info('startup: 전체 %.2fs (%s 동시 초기화)', time.perf_counter() - started, ', '.join(tasks))
+    return results
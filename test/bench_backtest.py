@@ -0,0 +1,68 @@
+"""백테스트 엔진 벤치마크: 기간·종목 수·리밸런싱 주기별 실행 시간.
+
+합성 일별 종가(기하 브라운 운동)로 run_backtest를 실행해 소요 시간(best of repeat)과 요약 지표를
+출력한다. 네트워크 없음 (yfinance 미사용).
+
+실행: `uv run python test/bench_backtest.py [--years 10 20] [--positions 20 50] [--repeat 3]`
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.backtest import TRADING_DAYS_PER_YEAR, BacktestConfig, run_backtest
+from src.policy import ExecutionPolicy
+
+
+def _prices(years: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    days = years * TRADING_DAYS_PER_YEAR
+    paths = rng.integers(5_000, 200_000, size=n) * np.exp(np.cumsum(rng.normal(0.0003, 0.012, size=(days, n)), axis=0))
+    return pd.DataFrame(np.round(paths), index=pd.bdate_range('2005-01-03', periods=days),
+                        columns=[f'{i:06d}' for i in range(n)])
+
+
+def _best_of(fn, repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, nargs='+', default=[10, 20])
+    parser.add_argument('--positions', type=int, nargs='+', default=[20, 50])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    cases = {
+        '월별': BacktestConfig(initial_cash=300_000_000),
+        '월별 optimize': BacktestConfig(initial_cash=300_000_000, policy=ExecutionPolicy(planner_mode='optimize')),
+        '일별 band 20%': BacktestConfig(initial_cash=300_000_000, rebalance=1, policy=ExecutionPolicy(drift_band_rel=0.2)),
+    }
+    print(f'{"년":>3} {"N":>4} {"설정":<14} {"시간(s)":>8} {"CAGR":>7} {"연 회전율":>9} {"체결":>7}')
+    for years in args.years:
+        for n in args.positions:
+            prices = _prices(years, n)
+            allocation = pd.DataFrame({'ticker': prices.columns, 'weight': np.full(n, 0.98 / n)})
+            for label, config in cases.items():
+                seconds, result = _best_of(lambda: run_backtest(allocation, prices, config), args.repeat)
+                summary = result.summary()
+                print(f'{years:>3} {n:>4} {label:<14} {seconds:8.2f} {summary["cagr"]:7.2%} '
+                      f'{summary["annual_turnover"]:9.2f} {len(result.trades):>7}')
+
+
+if __name__ == '__main__':
+    main()
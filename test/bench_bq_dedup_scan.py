@@ -0,0 +1,62 @@
+"""is_already_executed 스캔 바이트 벤치마크 (BigQuery dry run — 과금 없음).
+
+실제 trade_log 테이블에 대해 종전 쿼리(DATE(update_dt) 필터, 전체 스캔)와 현재 쿼리
+(reg_date 파티션 필터)의 스캔 바이트를 dry run으로 비교한다. 기준일을 과거로 옮겨 가며
+측정하면 이력 길이와 무관하게 현재 쿼리의 바이트가 within_days 파티션 크기로 일정함을 확인할 수 있다
+(두 쿼리 모두 기준일 상한이 있어 과거 기준일도 그날까지의 구간만 읽는다 — 종전 쿼리는 전체 스캔).
+마지막 열은 run_state 테이블 조회(`BigQueryRunStateStore`, run_id당 1행)의 스캔 바이트.
+
+실행 (GCP 자격 증명 + BQ_PROJECT_ID 필요):
+    `uv run python test/bench_bq_dedup_scan.py --account_type ISA [--within_days 7] [--points 6]`
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv(project_root / '.env')
+
+from src.bigquery.client import BigQueryClient
+from src.run_state import BigQueryRunStateStore
+
+
+def _legacy_bytes(bq: BigQueryClient, account_type: str, target_date: date, within_days: int) -> int:
+    """reg_date 필터가 없던 종전 쿼리의 dry run 스캔 바이트."""
+    query, job_config = bq._already_executed_query(account_type, target_date, within_days, dry_run=True)
+    legacy_query = query.replace(
+        'WHERE reg_date BETWEEN @cutoff_date AND @target_date\n                AND account_type', 'WHERE account_type',
+    )
+    assert legacy_query != query, '쿼리 형태가 바뀌어 종전 쿼리를 재구성할 수 없음'
+    return int(bq.client.query(legacy_query, job_config=job_config).total_bytes_processed or 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--account_type', required=True)
+    parser.add_argument('--within_days', type=int, default=7)
+    parser.add_argument('--points', type=int, default=6, help='측정 기준일 개수 (30일 간격으로 과거로 이동)')
+    args = parser.parse_args()
+
+    bq = BigQueryClient()
+    table = bq.client.get_table(bq._table_ref)
+    print(f'{bq._table_ref}: {table.num_rows:,} rows, {table.num_bytes:,} bytes, '
+          f'partition={table.time_partitioning.field if table.time_partitioning else None}, '
+          f'clustering={table.clustering_fields}')
+    run_state = BigQueryRunStateStore(bq)
+    print(f'{"기준일":>12} {"종전 (bytes)":>16} {"파티션 (bytes)":>16} {"run_state (bytes)":>18}')
+    today = date.today()
+    for i in range(args.points):
+        target = today - timedelta(days=30 * i)
+        legacy = _legacy_bytes(bq, args.account_type, target, args.within_days)
+        pruned = bq.estimate_already_executed_bytes(args.account_type, target, args.within_days)
+        lookup = run_state.estimate_lookup_bytes(args.account_type, target, args.within_days)
+        print(f'{target.isoformat():>12} {legacy:16,} {pruned:16,} {lookup:18,}')
+
+
+if __name__ == '__main__':
+    main()
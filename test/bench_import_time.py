@@ -0,0 +1,56 @@
+"""main.py import 시간 벤치마크 (`python -X importtime`).
+
+새 인터프리터에서 `import main`을 실행하고 importtime 로그를 집계해 main 누적 시간과
+상위 모듈을 출력한다. --budget-ms를 주면 초과 시 종료 코드 1 (CI·로컬 회귀 확인용).
+
+실행: `uv run python test/bench_import_time.py [--repeat 5] [--budget-ms 1500] [--top 10]`
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def _importtime(module: str) -> dict:
+    """{모듈: 누적 μs} — 최상위(들여쓰기 1단) import만."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    ).stderr
+    totals = {}
+    for match in _LINE.finditer(stderr):
+        _, cumulative, indent, name = match.groups()
+        if len(indent) <= 3:
+            totals[name] = int(cumulative)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='main')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [_importtime(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda r: r[args.module])
+    total_ms = best[args.module] / 1000
+    print(f'import {args.module}: best of {args.repeat} = {total_ms:,.1f} ms')
+    children = sorted(((v, k) for k, v in best.items() if k != args.module), reverse=True)[:args.top]
+    for micros, name in children:
+        print(f'  {micros / 1000:8.1f} ms  {name}')
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f'❌ 예산 초과: {total_ms:,.1f} ms > {args.budget_ms:,.1f} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""정수 수량 결정 벤치마크: 종전 절사(planner_mode='truncate') vs 정수 최적화('optimize').
+
+무작위 포트폴리오(allocation N종목 + 미등록 보유 종목)에서 두 방식의 리밸런싱 후
+(1) 목표 비중 대비 추적 오차 RMS (%p), (2) 목표 금액 중 배분되지 못한 금액(끝수 현금, 음수는
+목표 초과 — buffer_cash 이내), (3) 매수 한도(buy_cash_safety_ratio) 만족 여부, (4) 수량 결정 소요
+시간(best of repeat)을 비교한다. 시간은 절사 = planning_kernel 계산, 최적화 = planning_kernel +
+optimize_integer_lots. 네트워크 없음 (KISClient는 MagicMock).
+
+실행: `uv run python test/bench_optimizer.py [--positions 50 200] [--seeds 20] [--repeat 5]`
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.optimizer import optimize_integer_lots
+from src.planner import PortfolioPlanner
+from src.planning_kernel import compute_rebalance_arrays
+from src.policy import DEFAULT_EXECUTION_POLICY
+from test_planning_kernel import _random_portfolio
+
+_RATIO = DEFAULT_EXECUTION_POLICY.buy_cash_safety_ratio
+
+
+def _post_stats(table, n_allocated: int, quantity: np.ndarray, budget: float) -> tuple:
+    """(추적 오차 RMS %p, 미배분 금액, 매수 한도 만족 여부)."""
+    rows = table.iloc[:n_allocated]
+    price = rows['current_price'].to_numpy(dtype=float)
+    current = rows['current_quantity'].to_numpy().astype(np.int64)
+    post_weight = quantity * price / budget
+    rms = float(np.sqrt(np.mean((post_weight - rows['weight'].to_numpy()) ** 2))) * 100
+    free_cash = float(table['current_value'].sum()) - float(rows['current_value'].sum())
+    delta = (quantity - current) * price
+    feasible = delta[delta > 0].sum() <= _RATIO * (free_cash - delta[delta < 0].sum()) + 1e-6
+    return rms, float(rows['target_value'].sum()) - float(quantity @ price), bool(feasible)
+
+
+def _aligned(seed: int, n: int):
+    """_create_total_info 직후 상태 (truncate 모드) + 최적화 입력."""
+    allocation, full_balance = _random_portfolio(seed, n_allocated=n, n_unallocated=max(1, n // 10))
+    planner = PortfolioPlanner(MagicMock(), allocation.drop(columns=['current_price']), account_type='ISA')
+    balance = full_balance.drop(columns=['stock_nm', 'current_price'])
+    unallocated = full_balance[~full_balance['ticker'].isin(allocation['ticker']) & (full_balance['ticker'] != 'CASH')]
+    table = planner._create_total_info(allocation=allocation, balance=balance, unallocated=unallocated)
+    total = float(balance['current_value'].sum())
+    return table, total, int(total - DEFAULT_EXECUTION_POLICY.buffer_cash)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', type=int, nargs='+', default=[50, 200])
+    parser.add_argument('--seeds', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"N":>5} {"방식":<9} {"오차 RMS(%p)":>13} {"미배분(원)":>14} {"한도 만족":>9} {"시간(ms)":>9}')
+    for n in args.positions:
+        stats = {'truncate': [], 'optimize': []}
+        times = {'truncate': [], 'optimize': []}
+        for seed in range(args.seeds):
+            table, total, budget = _aligned(seed, n)
+            rows = table.iloc[:n]
+            price = rows['current_price'].to_numpy(dtype=float)
+            current = rows['current_quantity'].to_numpy().astype(np.int64)
+            sign = np.where(rows['required_transaction'] == 'sell', -1, 1)
+            truncated = current + sign * rows['required_quantity'].to_numpy()
+            free_cash = total - float(rows['current_value'].sum())
+
+            def solve():
+                return optimize_integer_lots(
+                    rows['target_value'].to_numpy(), price, current, free_cash, budget, _RATIO,
+                    initial_quantity=truncated,
+                )
+
+            def kernel():
+                return compute_rebalance_arrays(
+                    weight=table['weight'].to_numpy(), current_price=table['current_price'].to_numpy(),
+                    current_quantity=table['current_quantity'].to_numpy(),
+                    current_value=table['current_value'].to_numpy(),
+                    liquidate=np.arange(len(table)) >= n, total_value=total, target_base=budget,
+                )
+
+            optimized = solve()
+            stats['truncate'].append(_post_stats(table, n, truncated, budget))
+            stats['optimize'].append(_post_stats(table, n, optimized, budget))
+            kernel_time = _best_of(kernel, args.repeat)
+            times['truncate'].append(kernel_time)
+            times['optimize'].append(kernel_time + _best_of(solve, args.repeat))
+        for mode in ('truncate', 'optimize'):
+            rms, leftover, feasible = zip(*stats[mode])
+            print(f'{n:>5} {mode:<9} {np.mean(rms):13.4f} {np.mean(leftover):14,.0f} '
+                  f'{sum(feasible):>4}/{len(feasible):<4} {np.median(times[mode]) * 1000:9.2f}')
+
+
+if __name__ == '__main__':
+    main()
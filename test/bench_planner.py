@@ -0,0 +1,108 @@
+"""플래너 계산 벤치마크: 종전 DataFrame/lambda 경로 vs planning_kernel.
+
+10,000 종목(allocation) + 미등록 보유 종목 포트폴리오에서 결과 동일성을 확인한 뒤
+(1) 컬럼 계산 단계(목표·필요 금액/수량/방향/비중)와 (2) merge·정렬을 포함한 전체 계획
+계산 시간을 비교한다. 네트워크 없음 (KISClient는 MagicMock, 시세·잔고 조회 제외).
+
+실행: `uv run python test/bench_planner.py [--positions 10000] [--repeat 5]`
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.planner import PortfolioPlanner
+from src.planning_kernel import compute_rebalance_arrays
+from test_planning_kernel import _BUFFER, _legacy_plan, _planner_plan, _random_portfolio
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _aligned_table(allocation: pd.DataFrame, full_balance: pd.DataFrame):
+    """컬럼 계산 직전 상태: (allocation left join 잔고, 미등록 종목, 총자산)."""
+    balance = full_balance.drop(columns=['stock_nm', 'current_price'])
+    merged = pd.merge(left=allocation, right=balance, on=['ticker'], how='left')
+    merged[['current_quantity', 'current_value']] = merged[['current_quantity', 'current_value']].fillna(0)
+    unallocated = full_balance[~full_balance['ticker'].isin(allocation['ticker']) & (full_balance['ticker'] != 'CASH')]
+    return merged, unallocated, balance['current_value'].sum()
+
+
+def _legacy_columns(merged: pd.DataFrame, unallocated: pd.DataFrame, total: float) -> None:
+    result = merged.copy()
+    result['target_value'] = result['weight'] * int(total - _BUFFER)
+    result['required_value'] = result['target_value'] - result['current_value']
+    result['required_quantity'] = abs((result['required_value'] / result['current_price']).astype(int))
+    result['required_transaction'] = result['required_value'].apply(lambda x: 'buy' if x > 0 else 'sell' if x < 0 else None)
+    result['current_pct'] = result['current_value'] / total * 100
+    extra = unallocated.copy()
+    extra['target_value'] = 0.0
+    extra['required_value'] = -extra['current_value']
+    extra['required_quantity'] = extra['current_quantity'].astype(int)
+    extra['required_transaction'] = 'sell'
+    extra['current_pct'] = extra['current_value'] / total * 100
+
+
+def _kernel_columns(combined: pd.DataFrame, liquidate: np.ndarray, total: float) -> None:
+    compute_rebalance_arrays(
+        weight=combined['weight'].to_numpy(),
+        current_price=combined['current_price'].to_numpy(),
+        current_quantity=combined['current_quantity'].to_numpy(),
+        current_value=combined['current_value'].to_numpy(),
+        liquidate=liquidate,
+        total_value=total,
+        target_base=int(total - _BUFFER),
+    )
+
+
+def _kernel_plan(planner: PortfolioPlanner, allocation: pd.DataFrame, full_balance: pd.DataFrame) -> pd.DataFrame:
+    """get_rebalancing_plan에서 시세·잔고 조회를 뺀 계산 경로 (_legacy_plan과 같은 범위)."""
+    balance = full_balance.drop(columns=['stock_nm', 'current_price'])
+    unallocated = full_balance[~full_balance['ticker'].isin(allocation['ticker']) & (full_balance['ticker'] != 'CASH')]
+    result = planner._create_total_info(allocation=allocation, balance=balance, unallocated=unallocated)
+    return result.sort_values(by='required_value', ascending=True).reset_index(drop=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    allocation, full_balance = _random_portfolio(0, n_allocated=args.positions, n_unallocated=args.positions // 10)
+    pd.testing.assert_frame_equal(_planner_plan(allocation, full_balance), _legacy_plan(allocation, full_balance, _BUFFER))
+
+    merged, unallocated, total = _aligned_table(allocation, full_balance)
+    combined = pd.concat([merged, unallocated[merged.columns.intersection(unallocated.columns)]], ignore_index=True)
+    liquidate = np.arange(len(combined)) >= len(merged)
+    planner = PortfolioPlanner(MagicMock(), allocation.drop(columns=['current_price']), account_type='ISA')
+
+    rows = [
+        ('컬럼 계산', _best_of(lambda: _legacy_columns(merged, unallocated, total), args.repeat),
+         _best_of(lambda: _kernel_columns(combined, liquidate, total), args.repeat)),
+        ('전체 계획', _best_of(lambda: _legacy_plan(allocation, full_balance, _BUFFER), args.repeat),
+         _best_of(lambda: _kernel_plan(planner, allocation, full_balance), args.repeat)),
+    ]
+    print(f'positions={args.positions:,} (+미등록 {args.positions // 10:,}), best of {args.repeat}')
+    print(f'  {"단계":<8} {"종전 (ms)":>12} {"kernel (ms)":>12} {"배속":>6}')
+    for name, legacy, kernel in rows:
+        print(f'  {name:<8} {legacy * 1000:12.2f} {kernel * 1000:12.2f} {legacy / kernel:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""시나리오 일괄 평가 벤치마크: 시나리오별 get_rebalancing_plan 반복 vs evaluate_scenarios 1회.
+
+무작위 포트폴리오(allocation N종목 + 미등록 보유 종목)에 가격 충격·buffer_cash 시나리오 M개를
+만들어 (1) 시나리오마다 플래너를 다시 돌리는 방식(가격 충격을 반영한 시세·잔고를 매번 조회)과
+(2) 스냅샷 1회 + 일괄 평가의 소요 시간을 비교한다. 네트워크 없음 (KISClient는 MagicMock이라
+(1)의 실제 KIS 왕복 비용은 포함되지 않는다 — 실환경에서는 시나리오마다 시세·잔고 조회가 더해진다).
+
+실행: `uv run python test/bench_scenarios.py [--positions 50] [--scenarios 100 500] [--repeat 3]`
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.policy import ExecutionPolicy
+from src.scenario import Scenario
+from test_planning_kernel import _mock_planner, _random_portfolio
+
+
+def _scenarios(m: int) -> list:
+    rng = np.random.default_rng(0)
+    return [
+        Scenario(f's{i}', price_shock=float(rng.normal(0, 0.05)),
+                 policy=ExecutionPolicy(buffer_cash=int(rng.integers(1, 100)) * 10_000))
+        for i in range(m)
+    ]
+
+
+def _loop(allocation, full_balance, scenarios) -> None:
+    """시나리오마다 충격 반영 시세·잔고로 플래너를 새로 만들어 계획 계산."""
+    for s in scenarios:
+        shocked = allocation.assign(current_price=allocation['current_price'] * (1 + s.price_shock))
+        balance = full_balance.copy()
+        stocks = balance['ticker'] != 'CASH'
+        balance.loc[stocks, 'current_price'] *= 1 + s.price_shock
+        balance.loc[stocks, 'current_value'] *= 1 + s.price_shock
+        _mock_planner(shocked, balance, s.policy).get_rebalancing_plan()
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--positions', type=int, default=50)
+    parser.add_argument('--scenarios', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)   # 플래너 INFO 로그가 반복 측정을 지배하지 않도록
+
+    allocation, full_balance = _random_portfolio(0, n_allocated=args.positions, n_unallocated=max(1, args.positions // 10))
+    print(f'{"M":>5} {"반복(ms)":>10} {"일괄(ms)":>10} {"배속":>7}')
+    for m in args.scenarios:
+        scenarios = _scenarios(m)
+        loop = _best_of(lambda: _loop(allocation, full_balance, scenarios), args.repeat)
+        batch = _best_of(lambda: _mock_planner(allocation, full_balance).evaluate_scenarios(scenarios), args.repeat)
+        print(f'{m:>5} {loop * 1000:10.1f} {batch * 1000:10.1f} {loop / batch:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""trade_log 테이블 클러스터링(account_type, run_id) 1회성 마이그레이션.
+
+`BigQueryClient.ensure_clustering()`을 한 번 실행한다 (멱등 — 이미 설정돼 있으면 변경 없음).
+실행 경로(BigQueryClient 생성자)에서는 cold start마다 get_table 왕복이 생기므로 호출하지 않는다.
+bigquery.tables.update 권한이 있는 자격 증명으로 실행.
+
+실행:
+    uv run python -m test.migrate_trade_log_clustering
+"""
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv(project_root / '.env')
+
+from src.bigquery.client import CLUSTERING_FIELDS, BigQueryClient
+
+
+def main() -> None:
+    bq = BigQueryClient()
+    changed = bq.ensure_clustering()
+    status = '설정 완료' if changed else '변경 없음 (이미 설정됐거나 테이블 미존재)'
+    print(f'{bq._table_ref} 클러스터링 {CLUSTERING_FIELDS}: {status}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""정적 자산배분 백테스트(src/backtest.py) 단위 테스트.
+
+네트워크 없이 합성 가격으로 다음을 검증한다:
+- 첫 리밸런싱(초기 매수) 수량 = PortfolioPlanner 계획 (buffer_cash·정수 수량)
+- 일별 평가: equity = 예수금 + Σ 보유 수량 × 종가, 보유 수량은 정수, 예수금 음수 없음
+- 매도 먼저: 같은 날 매도 대금으로 매수, D+0 결제 현금은 2거래일 뒤 반영
+- 회전율: 가격 불변이면 초기 매수 뒤 거래 없음, 허용 범위는 거래를 줄임
+- 매수 수량 상한: 전일 종가 기준 상한가로 계산 (실거래 psbl_qty_calc_unpr), 체결은 종가
+- 입력 검증: 설정값·가격 누락 종목, 늦게 상장한 종목은 가격이 생긴 날부터 시작
+
+실행: `uv run python -m test.test_backtest`
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.backtest import SETTLEMENT_LAG_DAYS, BacktestConfig, run_backtest
+from src.planner import PortfolioPlanner
+from src.policy import ExecutionPolicy
+
+_TICKERS = ['069500', '114260', '148070', '305080']
+
+
+def _prices(days: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2020-01-01', periods=days)
+    start = np.array([30_000.0, 100_000.0, 110_000.0, 8_000.0])
+    paths = start * np.exp(np.cumsum(rng.normal(0.0002, 0.012, size=(days, len(start))), axis=0))
+    return pd.DataFrame(np.round(paths), index=index, columns=_TICKERS)
+
+
+def _allocation() -> pd.DataFrame:
+    return pd.DataFrame({'ticker': _TICKERS, 'weight': [0.4, 0.2, 0.2, 0.15]})
+
+
+def test_initial_purchase_matches_planner():
+    prices = _prices()
+    config = BacktestConfig(initial_cash=30_000_000, fee_rate=0.0, limit_up_sizing=False)
+    result = run_backtest(_allocation(), prices, config)
+
+    kis_client = MagicMock()
+    kis_client.fetch_prices.return_value = prices.iloc[0]
+    kis_client.fetch_domestic_total_balance.return_value = pd.DataFrame([{
+        'ticker': 'CASH', 'stock_nm': '예수금', 'current_quantity': 1, 'current_price': 1.0,
+        'current_value': 30_000_000, 'currency_type': 'KRW',
+    }])
+    allocation = _allocation().assign(stock_nm=_TICKERS, category_1=None, category_2=None)
+    plan = PortfolioPlanner(kis_client, allocation, account_type='ISA').get_rebalancing_plan()
+    expected = plan.set_index('ticker')['required_quantity'].reindex(_TICKERS)
+    assert list(result.holdings.iloc[0]) == list(expected), (list(result.holdings.iloc[0]), list(expected))
+    print('✅ 백테스트: 초기 매수 수량 = PortfolioPlanner 계획')
+
+
+def test_daily_valuation_identity():
+    prices = _prices()
+    result = run_backtest(_allocation(), prices, BacktestConfig(initial_cash=30_000_000, rebalance='Q'))
+    quantity = result.holdings.reindex(prices.index).ffill()
+    np.testing.assert_allclose(result.daily['holdings_value'], (quantity * prices).sum(axis=1))
+    np.testing.assert_allclose(result.daily['equity'], result.daily['cash'] + result.daily['holdings_value'])
+    assert (result.holdings.dtypes == np.int64).all()
+    assert (result.daily['cash'] >= 0).all() and (result.daily['settled_cash'] >= 0).all()
+    assert result.holdings.index.equals(pd.DatetimeIndex(['2020-01-01', '2020-04-01', '2020-07-01', '2020-10-01', '2021-01-01']))
+    print('✅ 백테스트: 일별 equity = 예수금 + 보유 평가, 분기 첫 거래일 리밸런싱')
+
+
+def test_sell_before_buy_and_t_plus_2_settlement():
+    index = pd.bdate_range('2021-03-01', periods=6)
+    prices = pd.DataFrame({'A': [10_000.0, 10_000, 20_000, 20_000, 20_000, 20_000],
+                           'B': [10_000.0] * 6}, index=index)
+    allocation = pd.DataFrame({'ticker': ['A', 'B'], 'weight': [0.5, 0.5]})
+    config = BacktestConfig(initial_cash=10_010_000, rebalance=1, fee_rate=0.0, limit_up_sizing=False)
+    result = run_backtest(allocation, prices, config)
+
+    day2 = result.trades[result.trades['date'] == index[2]]
+    assert list(day2['side']) == ['sell', 'buy'], '매도 먼저'
+    assert day2['value'].iloc[1] > result.daily['cash'].iloc[1], '매도 대금으로 같은 날 매수 (D+2 예수금 기준)'
+    # 거래일별 순현금흐름이 SETTLEMENT_LAG_DAYS 거래일 뒤 D+0 현금에 반영
+    signed = np.where(result.trades['side'] == 'sell', 1, -1) * result.trades['value']
+    flows = signed.groupby(result.trades['date']).sum().reindex(index, fill_value=0.0)
+    expected = config.initial_cash + flows.shift(SETTLEMENT_LAG_DAYS, fill_value=0.0).cumsum()
+    np.testing.assert_allclose(result.daily['settled_cash'], expected)
+    assert result.daily['settled_cash'].iloc[1] == config.initial_cash, '결제 전에는 초기 매수 대금도 미차감'
+    assert result.daily['settled_cash'].iloc[-1] == result.daily['cash'].iloc[-1], '결제 완료 후 D+0 = D+2'
+    print('✅ 백테스트: 매도 대금으로 당일 매수, D+0 결제 현금은 2거래일 뒤 반영')
+
+
+def test_turnover_and_drift_band():
+    flat = pd.DataFrame(np.tile([30_000.0, 100_000, 110_000, 8_000], (60, 1)),
+                        index=pd.bdate_range('2022-01-03', periods=60), columns=_TICKERS)
+    result = run_backtest(_allocation(), flat, BacktestConfig(initial_cash=30_000_000, rebalance=5, limit_up_sizing=False))
+    assert result.turnover.iloc[0] > 0.4 and (result.turnover.iloc[1:] == 0).all(), '가격 불변이면 초기 매수 뒤 거래 없음'
+
+    prices = _prices(days=500, seed=3)
+    plain = run_backtest(_allocation(), prices, BacktestConfig(initial_cash=30_000_000, rebalance=1))
+    banded = run_backtest(_allocation(), prices, BacktestConfig(
+        initial_cash=30_000_000, rebalance=1, policy=ExecutionPolicy(drift_band_rel=0.2)))
+    assert len(banded.trades) < len(plain.trades) / 3
+    assert banded.summary()['annual_turnover'] < plain.summary()['annual_turnover']
+    print('✅ 백테스트: 가격 불변 시 회전율 0, 허용 범위가 거래·회전율을 줄임')
+
+
+def test_buy_sized_at_prior_close_limit_up():
+    index = pd.bdate_range('2021-03-01', periods=2)
+    prices = pd.DataFrame({'A': [10_000.0, 12_000.0]}, index=index)
+    allocation = pd.DataFrame({'ticker': ['A'], 'weight': [1.0]})
+    config = BacktestConfig(initial_cash=10_010_000, rebalance=1, fee_rate=0.0)
+    result = run_backtest(allocation, prices, config)
+    # 1일차: 9,909,900원(× 0.99) // 상한가 13,000원(기준가 10,000) = 762주 (종가 기준이면 990주)
+    # 2일차: 기준가 = 전일 종가 10,000 → 상한가 13,000. 잔여 2,390,000원 × 0.99 // 13,000 = 182주 추가
+    assert list(result.holdings['A']) == [762, 944]
+    assert (result.trades['price'] == prices['A'].to_numpy()).all(), '체결은 종가'
+
+    close_sized = run_backtest(allocation, prices, BacktestConfig(
+        initial_cash=10_010_000, rebalance=1, fee_rate=0.0, limit_up_sizing=False))
+    assert close_sized.holdings['A'].iloc[0] == 990
+    print('✅ 백테스트: 매수 수량은 전일 종가 기준 상한가로 산정, 체결은 종가')
+
+
+def test_input_validation_and_late_listing():
+    prices = _prices(days=40)
+    prices.loc[prices.index[:10], '305080'] = np.nan   # 11번째 거래일 상장
+    result = run_backtest(_allocation(), prices, BacktestConfig(initial_cash=30_000_000))
+    assert result.daily.index[0] == prices.index[10]
+
+    for bad in (lambda: BacktestConfig(rebalance='D'), lambda: BacktestConfig(rebalance=0),
+                lambda: BacktestConfig(fee_rate=-0.1), lambda: BacktestConfig(initial_cash=5_000),
+                lambda: run_backtest(_allocation(), prices.drop(columns=['069500'])),
+                lambda: run_backtest(pd.DataFrame({'ticker': _TICKERS, 'weight': [0.5] * 4}), prices)):
+        try:
+            bad()
+        except ValueError:
+            continue
+        raise AssertionError('ValueError가 발생하지 않음')
+    print('✅ 백테스트: 늦게 상장한 종목은 가격이 생긴 날부터 시작, 잘못된 설정·입력 거부')
+
+
+if __name__ == '__main__':
+    test_initial_purchase_matches_planner()
+    test_daily_valuation_identity()
+    test_sell_before_buy_and_t_plus_2_settlement()
+    test_turnover_and_drift_band()
+    test_buy_sized_at_prior_close_limit_up()
+    test_input_validation_and_late_listing()
+    print('\n전체 테스트 통과')
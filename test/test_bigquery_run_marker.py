@@ -2,7 +2,6 @@
 
 검증:
 - append_trade_log: 모든 row에 run_id, row_type='trade', account_type, update_dt, reg_date 자동 부여
-- append_run_marker: row_type='run_marker', run_status, account_type, run_id 단일 행 적재
 - is_already_executed: row_type 필터(run_marker/trade/NULL)가 SQL에 포함되어 진행 중인 run도 인식
 - schema_update_options=ALLOW_FIELD_ADDITION 적용 — 신규 컬럼 자동 확장
 
@@ -84,34 +83,34 @@ def test_append_trade_log_uses_schema_update_options():
     print('✅ append_trade_log: schema_update_options=ALLOW_FIELD_ADDITION 적용')
 
 
-# ---------------------------------------------------------------------------- #
-# append_run_marker                                                            #
-# ---------------------------------------------------------------------------- #
-
-def test_append_run_marker_writes_single_row():
-    """append_run_marker: row_type='run_marker', run_status, run_id, account_type 1행 적재."""
+def test_append_trade_log_retry_with_same_job_id_waits_existing_job():
+    """같은 job_id 재시도 → Conflict → 먼저 제출된 job 완료 대기 (trade 행 중복 적재 없음)."""
+    from google.api_core.exceptions import Conflict
     bq = _make_bq_client()
-    bq.append_run_marker(run_id='run_xyz', account_type='ISA', status='started')
+    bq.client.load_table_from_dataframe.side_effect = Conflict('Already Exists: Job trade_log_r1')
+    bq.client.get_job.return_value = MagicMock(state='RUNNING', error_result=None)
+    bq.append_trade_log(pd.DataFrame([{'ticker': '005930'}]), account_type='ISA', run_id='r1', job_id='trade_log_r1')
 
-    assert bq.client.load_table_from_dataframe.call_count == 1
-    df = bq.client.load_table_from_dataframe.call_args.args[0]
-    assert len(df) == 1, 'run_marker는 단일 행 적재'
-    row = df.iloc[0]
-    assert row['run_id'] == 'run_xyz'
-    assert row['row_type'] == 'run_marker', "row_type='run_marker' 필수 (is_already_executed 필터에 사용)"
-    assert row['run_status'] == 'started'
-    assert row['account_type'] == 'ISA'
-    print('✅ append_run_marker: row_type/run_status/run_id/account_type 1행 적재')
-
-
-def test_append_run_marker_completed_status():
-    """status='completed'도 동일하게 동작."""
+    assert bq.client.load_table_from_dataframe.call_args.kwargs['job_id'] == 'trade_log_r1'
+    bq.client.get_job.assert_called_once_with('trade_log_r1')
+    assert bq.client.get_job.return_value.result.call_count == 1
+    print('✅ append_trade_log: job_id 충돌 시 기존 job 대기 (재시도 안전)')
+
+
+def test_append_trade_log_resubmits_when_existing_job_failed():
+    """같은 job_id의 기존 job이 실패(DONE + error_result) → 적재된 행이 없으므로 접미사 job ID로 재제출."""
+    from google.api_core.exceptions import Conflict
     bq = _make_bq_client()
-    bq.append_run_marker(run_id='run_xyz', account_type='ISA', status='completed')
+    new_job = MagicMock()
+    bq.client.load_table_from_dataframe.side_effect = [Conflict('Already Exists: Job trade_log_r1'), new_job]
+    bq.client.get_job.return_value = MagicMock(state='DONE', error_result={'reason': 'invalid'})
+    bq.append_trade_log(pd.DataFrame([{'ticker': '005930'}]), account_type='ISA', run_id='r1', job_id='trade_log_r1')
 
-    df = bq.client.load_table_from_dataframe.call_args.args[0]
-    assert df.iloc[0]['run_status'] == 'completed'
-    print('✅ append_run_marker: status=completed 정상 적재')
+    job_ids = [c.kwargs['job_id'] for c in bq.client.load_table_from_dataframe.call_args_list]
+    assert job_ids == ['trade_log_r1', 'trade_log_r1_1'], job_ids
+    assert bq.client.get_job.return_value.result.call_count == 0, '실패한 job은 대기하지 않음'
+    assert new_job.result.call_count == 1
+    print('✅ append_trade_log: 기존 job 실패 시 접미사 job ID로 재제출')
 
 
 # ---------------------------------------------------------------------------- #
@@ -217,12 +216,67 @@ def test_is_already_executed_blocks_when_runs_present():
     print('✅ is_already_executed: 차단 조건 만족 run 있음 → True')
 
 
+# ---------------------------------------------------------------------------- #
+# 파티션 프루닝 + 클러스터링                                                      #
+# ---------------------------------------------------------------------------- #
+
+def test_is_already_executed_prunes_on_reg_date_partition():
+    """WHERE에 파티션 컬럼 reg_date 하한·상한이 있어야 target_date까지 within_days 파티션만 스캔."""
+    bq = _make_bq_client()
+    fake_result = MagicMock()
+    fake_result.__iter__ = lambda self: iter([MagicMock(cnt=0)])
+    bq.client.query.return_value.result.return_value = fake_result
+
+    bq.is_already_executed(account_type='ISA', target_date=date(2026, 5, 9))
+
+    sql = bq.client.query.call_args.args[0]
+    assert 'reg_date BETWEEN @cutoff_date AND @target_date' in sql, f'reg_date 파티션 필터 누락. SQL:\n{sql}'
+    job_config = bq.client.query.call_args.kwargs['job_config']
+    params = {p.name: str(p.value) for p in job_config.query_parameters}
+    assert params['cutoff_date'] == '2026-05-03', f'within_days=7 → 2026-05-03, 실제 {params["cutoff_date"]}'
+    assert params['target_date'] == '2026-05-09', '상한 = 기준일 (과거 기준일 조회도 within_days 구간만)'
+    assert not job_config.dry_run
+    print('✅ is_already_executed: reg_date 파티션 프루닝 필터 포함')
+
+
+def test_ensure_clustering_is_idempotent():
+    from src.bigquery.client import CLUSTERING_FIELDS
+    bq = _make_bq_client()
+    table = MagicMock(clustering_fields=None)
+    bq.client.get_table.return_value = table
+    assert bq.ensure_clustering() is True
+    assert table.clustering_fields == CLUSTERING_FIELDS == ['account_type', 'run_id']
+    bq.client.update_table.assert_called_once_with(table, ['clustering_fields'])
+
+    assert bq.ensure_clustering() is False, '이미 설정됨 → 변경 없음'
+    assert bq.client.update_table.call_count == 1
+    print('✅ ensure_clustering: account_type, run_id 클러스터링 멱등 적용')
+
+
+def test_ensure_clustering_skips_missing_table():
+    from google.api_core.exceptions import NotFound
+    bq = _make_bq_client()
+    bq.client.get_table.side_effect = NotFound('trade_log')
+    assert bq.ensure_clustering() is False
+    assert bq.client.update_table.call_count == 0
+    print('✅ ensure_clustering: 테이블 미존재(첫 실행) → 변경 없음')
+
+
+def test_estimate_bytes_uses_dry_run():
+    bq = _make_bq_client()
+    bq.client.query.return_value.total_bytes_processed = 4096
+    assert bq.estimate_already_executed_bytes('ISA', date(2026, 5, 9)) == 4096
+    job_config = bq.client.query.call_args.kwargs['job_config']
+    assert job_config.dry_run and not job_config.use_query_cache
+    print('✅ estimate_already_executed_bytes: dry run으로 스캔 바이트 추정')
+
+
 if __name__ == '__main__':
     test_append_trade_log_attaches_run_id_and_row_type()
     test_append_trade_log_without_run_id_omits_column()
     test_append_trade_log_uses_schema_update_options()
-    test_append_run_marker_writes_single_row()
-    test_append_run_marker_completed_status()
+    test_append_trade_log_retry_with_same_job_id_waits_existing_job()
+    test_append_trade_log_resubmits_when_existing_job_failed()
     test_is_already_executed_includes_row_type_filter()
     test_is_already_executed_returns_true_for_running_run_marker()
     test_is_already_executed_returns_false_when_count_zero()
@@ -230,4 +284,8 @@ if __name__ == '__main__':
     test_is_already_executed_query_uses_stale_window_logic()
     test_stale_minutes_constant_is_30()
     test_is_already_executed_blocks_when_runs_present()
+    test_is_already_executed_prunes_on_reg_date_partition()
+    test_ensure_clustering_is_idempotent()
+    test_ensure_clustering_skips_missing_table()
+    test_estimate_bytes_uses_dry_run()
     print('\n전체 테스트 통과')
@@ -0,0 +1,96 @@
+"""허용 범위(drift band)·최소 거래 금액 단위 테스트.
+
+- within_drift_band: 절대(%p)·상대(목표 비중 배수) 범위, 둘 다 설정 시 좁은 쪽, 최소 거래 금액, 전량 매도 유지
+- PortfolioPlanner 연동: 기본 정책은 종전 계획과 동일, 범위 안 종목은 수량 0·방향 None
+- ExecutionPolicy: 음수·범위 밖 값 거부
+
+실행: `uv run python -m test.test_drift_band`
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.planning_kernel import within_drift_band
+from src.policy import ExecutionPolicy
+from test_planning_kernel import _mock_planner, _random_portfolio
+
+# 목표 20% 종목 4개: 이탈 0.5%p / 3%p / 6%p, 마지막은 미등록 전량 매도
+_CURRENT = np.array([20.5, 23.0, 14.0, 1.0])
+_TARGET = np.array([20.0, 20.0, 20.0, 0.0])
+_TRADE = np.array([50_000.0, 300_000.0, 600_000.0, 0.0])
+_LIQUIDATE = np.array([False, False, False, True])
+
+
+def test_absolute_and_relative_bands():
+    absolute = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE, abs_band_pct=5.0)
+    assert absolute.tolist() == [True, True, False, False], '절대 5%p 범위'
+    relative = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE, rel_band=0.1)
+    assert relative.tolist() == [True, False, False, False], '상대 10% (= 2%p) 범위'
+    both = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE, abs_band_pct=5.0, rel_band=0.1)
+    assert both.tolist() == relative.tolist(), '둘 다 설정하면 좁은 쪽'
+    none = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE)
+    assert not none.any(), '범위 미설정이면 모두 거래'
+    print('✅ within_drift_band: 절대·상대 범위, 둘 다 설정 시 좁은 쪽')
+
+
+def test_min_trade_value_and_liquidation():
+    small = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE, min_trade_value=100_000)
+    assert small.tolist() == [True, False, False, False], '10만원 미만 주문 제외'
+    wide = within_drift_band(_CURRENT, _TARGET, _TRADE, _LIQUIDATE, abs_band_pct=50.0, min_trade_value=10**9)
+    assert wide.tolist() == [True, True, True, False], '전량 매도는 항상 실행'
+    print('✅ within_drift_band: 최소 거래 금액 제외, 미등록 종목 전량 매도 유지')
+
+
+def _plan(allocation: pd.DataFrame, full_balance: pd.DataFrame, policy: ExecutionPolicy) -> pd.DataFrame:
+    return _mock_planner(allocation, full_balance, policy).get_rebalancing_plan()
+
+
+def test_planner_skips_in_band_positions():
+    allocation, full_balance = _random_portfolio(7, n_allocated=20, n_unallocated=2)
+    base = _plan(allocation, full_balance, ExecutionPolicy())
+    disabled = _plan(allocation, full_balance, ExecutionPolicy(drift_band_abs_pct=0.0, min_trade_value=0))
+    pd.testing.assert_frame_equal(base, disabled)
+
+    banded = _plan(allocation, full_balance, ExecutionPolicy(drift_band_abs_pct=1.0, min_trade_value=50_000))
+    pd.testing.assert_series_equal(banded['target_value'], base['target_value'])
+    pd.testing.assert_series_equal(banded['required_value'], base['required_value'])
+
+    total = full_balance['current_value'].sum()
+    drift = (banded['current_pct'] - banded['target_value'] / total * 100).abs()
+    liquidated = banded['weight'] == 0
+    trade_value = base['required_quantity'] * base['current_price']
+    skipped = ~liquidated & ((drift <= 1.0) | (trade_value < 50_000))
+    assert skipped.any() and (~skipped & ~liquidated).any(), '테스트 데이터에 범위 안·밖 종목이 모두 있어야 함'
+    assert (banded.loc[skipped, 'required_quantity'] == 0).all()
+    assert banded.loc[skipped, 'required_transaction'].isna().all()
+    kept = ~skipped
+    pd.testing.assert_series_equal(banded.loc[kept, 'required_quantity'], base.loc[kept, 'required_quantity'])
+    assert (banded.loc[liquidated, 'required_transaction'] == 'sell').all()
+    assert banded['required_quantity'].dtype == np.int64
+    print('✅ PortfolioPlanner: 범위 안·소액 종목은 주문 없음, 범위 밖 종목은 목표까지 리밸런싱')
+
+
+def test_policy_rejects_invalid_bands():
+    for kwargs in ({'drift_band_abs_pct': -1.0}, {'drift_band_abs_pct': 100.0},
+                   {'drift_band_rel': -0.1}, {'min_trade_value': -1}):
+        try:
+            ExecutionPolicy(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'ValueError가 발생하지 않음: {kwargs}')
+    print('✅ ExecutionPolicy: 음수·범위 밖 허용 범위 거부')
+
+
+if __name__ == '__main__':
+    test_absolute_and_relative_bands()
+    test_min_trade_value_and_liquidation()
+    test_planner_skips_in_band_positions()
+    test_policy_rejects_invalid_bands()
+    print('\n전체 테스트 통과')
@@ -257,6 +257,100 @@ def test_executor_default_safety_ratio_regression():
     print('✅ 3-4 OrderExecutor: 기본 정책 회귀 — 0.99 ratio 동작 보존')
 
 
+def _poll_fixture(orderable_sequence, policy):
+    """sell 1건(10주 × 1,000원) + buy 1건 plan과, 폴링 응답이 순서대로 나오는 executor."""
+    ex = _make_executor(policy=policy)
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_transaction': 'sell', 'required_quantity': 10, 'current_price': 1000},
+        {'ticker': '035720', 'required_transaction': 'buy',  'required_quantity': 1, 'current_price': 100},
+    ])
+    ex.kis_client.fetch_domestic_cash_balance.return_value = 100_000
+    ex.kis_client.fetch_buy_orderable_cash.side_effect = list(orderable_sequence)
+    ex.kis_client.fetch_domestic_enable_buy.return_value = {'psbl_qty_calc_unpr': '100'}
+    ex.kis_client.fetch_domestic_enable_sell.return_value = {'ord_psbl_qty': '10'}
+    ex.kis_client.create_domestic_order.return_value = {'rt_cd': '0', 'msg1': 'ok'}
+    return ex, plan_df
+
+
+class _FakeTime:
+    """time.monotonic/time.sleep 대체. sleep은 시계만 전진."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_policy_rejects_invalid_settlement_config():
+    """3-5. settlement_* 비정상 값 → ValueError."""
+    for kwargs in (
+        {'settlement_wait_mode': 'sleep'},
+        {'settlement_poll_initial_seconds': 0},
+        {'settlement_poll_initial_seconds': 3, 'settlement_poll_max_interval_seconds': 2},
+        {'settlement_poll_timeout_seconds': -1},
+        {'settlement_expected_ratio': 1.5},
+    ):
+        try:
+            ExecutionPolicy(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'{kwargs}가 통과됨')
+    assert ExecutionPolicy().settlement_wait_mode == 'fixed', '기본은 종전 고정 대기'
+    print('✅ 3-5 ExecutionPolicy: settlement_* 검증, 기본 fixed')
+
+
+def test_poll_settlement_fast_path():
+    """3-6. poll 모드: 매도 직후 첫 조회에 대금 반영 → sleep 없이 진행."""
+    from unittest.mock import patch
+    import time as time_mod
+    policy = ExecutionPolicy(settlement_wait_mode='poll')
+    # 기준선 50,000 → 첫 폴링 60,000 (예상 10,000 × 0.95 = 9,500 이상 증가) → 매수용 재조회
+    ex, plan_df = _poll_fixture([50_000, 60_000, 60_000], policy)
+    fake = _FakeTime()
+    with patch.object(time_mod, 'sleep', fake.sleep), patch.object(time_mod, 'monotonic', fake.monotonic):
+        ex.run_rebalancing(plan_df)
+    assert fake.sleeps == [], f'즉시 반영이면 sleep 없음, 실제 {fake.sleeps}'
+    assert ex.last_settlement_seconds == 0.0
+    print('✅ 3-6 poll 모드: 즉시 반영 → 대기 0초')
+
+
+def test_poll_settlement_backoff_until_reflected():
+    """3-7. poll 모드: 반영 전에는 0.2 → 0.4 → 0.8초 지수 백오프, 반영 시점에 종료."""
+    from unittest.mock import patch
+    import time as time_mod
+    policy = ExecutionPolicy(settlement_wait_mode='poll')
+    ex, plan_df = _poll_fixture([50_000, 50_000, 50_000, 55_000, 59_600, 59_600], policy)
+    fake = _FakeTime()
+    with patch.object(time_mod, 'sleep', fake.sleep), patch.object(time_mod, 'monotonic', fake.monotonic):
+        ex.run_rebalancing(plan_df)
+    assert [round(x, 6) for x in fake.sleeps] == [0.2, 0.4, 0.8], fake.sleeps
+    assert abs(ex.last_settlement_seconds - 1.4) < 1e-9, ex.last_settlement_seconds
+    print('✅ 3-7 poll 모드: 지수 백오프 후 반영 시점 종료 (1.4초 기록)')
+
+
+def test_poll_settlement_deadline():
+    """3-8. poll 모드: 마감까지 미반영이면 마감 시점에 진행 (무한 대기 없음)."""
+    from unittest.mock import patch
+    import time as time_mod
+    policy = ExecutionPolicy(
+        settlement_wait_mode='poll', settlement_poll_timeout_seconds=1.0,
+        settlement_poll_initial_seconds=0.5, settlement_poll_max_interval_seconds=0.5,
+    )
+    ex, plan_df = _poll_fixture([50_000] * 10, policy)
+    fake = _FakeTime()
+    with patch.object(time_mod, 'sleep', fake.sleep), patch.object(time_mod, 'monotonic', fake.monotonic):
+        ex.run_rebalancing(plan_df)
+    assert abs(ex.last_settlement_seconds - 1.0) < 1e-9, ex.last_settlement_seconds
+    assert ex.kis_client.create_domestic_order.call_count == 2, '마감 후에도 매수 진행'
+    print('✅ 3-8 poll 모드: 마감 시점(1.0초)에 매수 단계 진행')
+
+
 # ---------------------------------------------------------------------------- #
 # 세트 4 — StaticAllocator 합성 주입 (E2E)                                        #
 # ---------------------------------------------------------------------------- #
@@ -298,5 +392,9 @@ if __name__ == '__main__':
     test_executor_safety_ratio_used_in_orderable_qty()
     test_executor_wait_seconds_used_in_run_rebalancing()
     test_executor_default_safety_ratio_regression()
+    test_policy_rejects_invalid_settlement_config()
+    test_poll_settlement_fast_path()
+    test_poll_settlement_backoff_until_reflected()
+    test_poll_settlement_deadline()
     test_static_allocator_propagates_policy_to_both()
     print('\n🎉 모든 ARCH-007 ExecutionPolicy 주입 테스트 통과')
@@ -5,6 +5,9 @@
 - _execute_order: 계획수량과 가능수량의 min 제한, zero_quantity skip
 - is_test=True 경로: 실제 주문 미호출
 - run_rebalancing: 연속 매수 시 잔여 현금 차감 추적
+- run_rebalancing: sell_max_workers > 1이면 매도 동시 제출, 결과는 plan 순서 유지
+- 체결 확인: 단계별 체결 조회 1회로 filled_quantity·avg_fill_price 갱신, 매도 체결가는 결제 대기 목표에 반영
+- 로컬 보수단가: 표본만 KIS 대조 후 나머지 매수 가능 조회 생략, 과소 추정이면 KIS 조회로 되돌림
 
 실행: `uv run python -m test.test_executor`
 """
@@ -343,6 +346,280 @@ def test_run_rebalancing_failed_order_no_deduction():
     print('✅ 4-4 ARCH-008: 실패 주문(filled=0)은 잔여 차감 안 됨 (요청 수량 보존)')
 
 
+# ---------------------------------------------------------------------------- #
+# 세트 5 — 매도 동시 제출 (sell_max_workers)                                      #
+# ---------------------------------------------------------------------------- #
+
+def _make_parallel_sell_executor(sell_max_workers: int, delay: float = 0.1):
+    """매도 주문이 delay초 걸리는 MagicMock KIS 클라이언트 + 정책 주입 executor."""
+    import threading
+    import time as time_mod
+    from src.policy import ExecutionPolicy
+
+    state = {'in_flight': 0, 'max_in_flight': 0}
+    lock = threading.Lock()
+
+    def slow_order(transaction_type, ticker, ord_qty, ord_dvsn, price=-1):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        time_mod.sleep(delay)
+        with lock:
+            state['in_flight'] -= 1
+        # 종목 '000003'은 KIS 거절 → filled=0
+        if ticker == '000003':
+            return {'rt_cd': '1', 'msg1': 'rejected'}
+        return {'rt_cd': '0', 'msg1': 'ok'}
+
+    kis_client = MagicMock()
+    kis_client.fetch_domestic_cash_balance.return_value = 0
+    kis_client.fetch_domestic_enable_sell.return_value = {'ord_psbl_qty': '10'}
+    kis_client.create_domestic_order.side_effect = slow_order
+    ex = OrderExecutor(
+        kis_client, account_type='ISA',
+        policy=ExecutionPolicy(sell_max_workers=sell_max_workers),
+    )
+    return ex, state
+
+
+def test_parallel_sells_keep_plan_order():
+    """5-1. workers=4, 매도 8건: 동시 제출되며 결과는 plan 순서·스키마 그대로."""
+    import time as time_mod
+    ex, state = _make_parallel_sell_executor(sell_max_workers=4)
+    plan_df = pd.DataFrame([
+        {'ticker': f'{i:06d}', 'required_quantity': i + 1, 'required_transaction': 'sell', 'current_price': 1000}
+        for i in range(8)
+    ])
+    start = time_mod.perf_counter()
+    result, _ = ex.run_rebalancing(plan_df)
+    elapsed = time_mod.perf_counter() - start
+
+    assert 1 < state['max_in_flight'] <= 4, f'동시 제출 상한 4, 실제 {state["max_in_flight"]}'
+    assert elapsed < 0.6, f'8건 × 0.1초를 4 workers로 ≈0.2초 기대, 실제 {elapsed:.2f}초'
+    assert result['ticker'].tolist() == [f'{i:06d}' for i in range(8)]
+    assert result['transaction_order'].tolist() == list(range(8))
+    assert result['requested_quantity'].tolist() == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert result['filled_quantity'].tolist() == [1, 2, 3, 0, 5, 6, 7, 8], '거절 주문만 filled=0'
+    print(f'✅ 5-1 매도 동시 제출: 최대 {state["max_in_flight"]}건 동시, {elapsed:.2f}초, 결과 plan 순서 유지')
+
+
+def test_single_worker_is_serial():
+    """5-2. 기본 sell_max_workers=1: 종전처럼 직렬 제출."""
+    ex, state = _make_parallel_sell_executor(sell_max_workers=1, delay=0.01)
+    plan_df = pd.DataFrame([
+        {'ticker': f'{i:06d}', 'required_quantity': 1, 'required_transaction': 'sell', 'current_price': 1000}
+        for i in range(3)
+    ])
+    ex.run_rebalancing(plan_df)
+    assert state['max_in_flight'] == 1
+    print('✅ 5-2 sell_max_workers=1: 직렬 제출 (기본 동작 보존)')
+
+
+# ---------------------------------------------------------------------------- #
+# 세트 6 — 체결 확인 (inquire-daily-ccld)                                          #
+# ---------------------------------------------------------------------------- #
+
+def _make_reconcile_executor(fills: list, **policy_kwargs):
+    """주문번호를 돌려주는 MagicMock KIS 클라이언트. fills는 체결 조회 호출별 응답 목록."""
+    from src.policy import ExecutionPolicy
+
+    orders = iter(range(1, 100))
+
+    def order(transaction_type, ticker, ord_qty, ord_dvsn, price=-1):
+        return {'rt_cd': '0', 'msg1': 'ok', 'output': {'ODNO': f'{next(orders):010d}'}}
+
+    kis_client = MagicMock()
+    kis_client.fetch_domestic_cash_balance.return_value = 1_000_000
+    kis_client.fetch_buy_orderable_cash.return_value = 1_000_000
+    kis_client.fetch_domestic_enable_sell.return_value = {'ord_psbl_qty': '10'}
+    kis_client.fetch_domestic_enable_buy.return_value = {'psbl_qty_calc_unpr': '10000', 'nrcvb_buy_qty': '100'}
+    kis_client.create_domestic_order.side_effect = order
+    kis_client.fetch_daily_order_fills.side_effect = fills
+    policy = ExecutionPolicy(prefetch_orderable=False, sell_to_buy_wait_seconds=0, **policy_kwargs)
+    return OrderExecutor(kis_client, account_type='ISA', policy=policy)
+
+
+def _fill(ticker: str, ordered: int, filled: int, avg_price: float = None) -> dict:
+    return {'ticker': ticker, 'order_quantity': ordered, 'filled_quantity': filled,
+            'remaining_quantity': ordered - filled, 'avg_price': avg_price}
+
+
+def test_reconcile_updates_filled_and_avg_price_with_one_sweep():
+    """6-1. 매수 2건 → 체결 조회 1회(주문번호 2개)로 부분 체결·평균 체결가 반영."""
+    ex = _make_reconcile_executor(
+        fills=[{'1': _fill('005930', 5, 5, 9950.0), '2': _fill('000660', 3, 1, 20100.0)}],
+        fill_poll_timeout_seconds=0,
+    )
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 10000},
+        {'ticker': '000660', 'required_quantity': 3, 'required_transaction': 'buy', 'current_price': 20000},
+    ])
+    result, _ = ex.run_rebalancing(plan_df)
+
+    assert ex.kis_client.fetch_daily_order_fills.call_count == 1, '주문별 조회가 아닌 단계별 1회'
+    assert set(ex.kis_client.fetch_daily_order_fills.call_args.args[0]) == {'1', '2'}
+    assert list(result['requested_quantity']) == [5, 3]
+    assert list(result['filled_quantity']) == [5, 1], '부분 체결은 실제 체결 수량으로'
+    assert list(result['transaction_quantity']) == [5, 1], 'alias도 갱신'
+    assert list(result['avg_fill_price']) == [9950.0, 20100.0]
+    print('✅ 6-1 체결 확인: 단계별 조회 1회로 부분 체결·평균 체결가 반영')
+
+
+def test_reconcile_polls_until_remaining_filled():
+    """6-2. 첫 조회에 잔량이 남으면 간격을 두고 다시 조회, 전량 체결 확인 시 종료."""
+    ex = _make_reconcile_executor(
+        fills=[{'1': _fill('005930', 5, 2, 10000.0)}, {'1': _fill('005930', 5, 5, 10010.0)}],
+        fill_poll_interval_seconds=0.01, fill_poll_timeout_seconds=5,
+    )
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 5, 'required_transaction': 'sell', 'current_price': 10000},
+    ])
+    result, _ = ex.run_rebalancing(plan_df)
+    assert ex.kis_client.fetch_daily_order_fills.call_count == 2
+    assert result['filled_quantity'].iloc[0] == 5
+    assert result['avg_fill_price'].iloc[0] == 10010.0
+    print('✅ 6-2 체결 확인: 잔량이 남으면 재조회, 전량 체결 시 종료')
+
+
+def test_sell_fills_feed_settlement_target():
+    """6-3. 매도 부분 체결 → 결제 대기 목표(예상 매도 대금)가 실제 체결 수량 × 평균 체결가."""
+    ex = _make_reconcile_executor(
+        fills=[{'1': _fill('005930', 10, 4, 9900.0)}, {'2': _fill('000660', 1, 1, 20000.0)}],
+        settlement_wait_mode='poll', fill_poll_timeout_seconds=0,
+    )
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 10, 'required_transaction': 'sell', 'current_price': 10000},
+        {'ticker': '000660', 'required_quantity': 1, 'required_transaction': 'buy', 'current_price': 20000},
+    ])
+    with patch.object(ex, '_wait_for_settlement', return_value=0.0) as mock_wait:
+        ex.run_rebalancing(plan_df)
+    expected_proceeds = mock_wait.call_args.args[1]
+    assert expected_proceeds == 4 * 9900.0, f'계획(10×10,000)이 아닌 체결(4×9,900) 기준, 실제 {expected_proceeds}'
+    print('✅ 6-3 체결 확인: 매도 체결 수량·평균가가 결제 대기 목표에 반영')
+
+
+def test_reconcile_disabled_or_lookup_failure_keeps_accepted_quantity():
+    """6-4. reconcile_fills=False면 조회 없음, 조회 실패는 접수 수량 그대로 (주문 흐름 유지)."""
+    from src.kis.client import KISAPIError
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 10000},
+    ])
+    ex = _make_reconcile_executor(fills=[], reconcile_fills=False)
+    result, _ = ex.run_rebalancing(plan_df)
+    assert ex.kis_client.fetch_daily_order_fills.call_count == 0
+    assert result['filled_quantity'].iloc[0] == 5
+
+    ex = _make_reconcile_executor(fills=KISAPIError('ccld down'))
+    result, _ = ex.run_rebalancing(plan_df)
+    assert result['filled_quantity'].iloc[0] == 5
+    assert pd.isna(result['avg_fill_price'].iloc[0])
+    print('✅ 6-4 체결 확인: 비활성·조회 실패 시 접수 수량 유지')
+
+
+# ---------------------------------------------------------------------------- #
+# 세트 7 — 로컬 보수단가 (orderable_price_mode='local')                            #
+# ---------------------------------------------------------------------------- #
+
+def _make_local_price_executor(upper_limits: dict = None, **policy_kwargs):
+    """upper_limits: KISClient.upper_limit_price 응답 {ticker: 상한가}. 기본은 전 종목 13,000."""
+    from src.policy import ExecutionPolicy
+
+    kis_client = MagicMock()
+    kis_client.upper_limit_price.side_effect = (
+        (lambda t: 13_000) if upper_limits is None else (lambda t: upper_limits.get(t))
+    )
+    kis_client.fetch_domestic_cash_balance.return_value = 1_000_000
+    kis_client.fetch_buy_orderable_cash.return_value = 1_000_000
+    kis_client.create_domestic_order.return_value = {'rt_cd': '0', 'msg1': 'ok'}
+    policy = ExecutionPolicy(orderable_price_mode='local', reconcile_fills=False, **policy_kwargs)
+    return OrderExecutor(kis_client, account_type='ISA', policy=policy)
+
+
+def _local_plan() -> pd.DataFrame:
+    return pd.DataFrame([
+        {'ticker': f'00000{i}', 'required_quantity': 1, 'required_transaction': 'buy', 'current_price': 10_000}
+        for i in range(5)
+    ])
+
+
+def test_local_price_skips_per_ticker_enable_buy():
+    """7-1. 표본 2종목만 KIS 조회, 나머지 3종목은 시세 조회로 받은 상한가(13,000) — 종목별 매수 가능 조회 생략."""
+    ex = _make_local_price_executor(orderable_verify_sample=2)
+    kis = {'000000': {'psbl_qty_calc_unpr': '12950'}, '000001': {'psbl_qty_calc_unpr': '13000'}}
+    with patch('src.executor.fetch_orderable_concurrently', return_value=kis) as mock_fetch:
+        result, _ = ex.run_rebalancing(_local_plan())
+
+    assert mock_fetch.call_count == 1 and mock_fetch.call_args.args[2] == ['000000', '000001']
+    assert ex.kis_client.fetch_domestic_enable_buy.call_count == 0, '주문 시점 조회도 없음'
+    assert list(result['filled_quantity']) == [1] * 5
+    print('✅ 7-1 로컬 보수단가: KIS 조회는 표본 2종목뿐, 나머지 종목 조회 생략')
+
+
+def test_local_price_underestimate_falls_back_to_kis():
+    """7-2. 표본에서 로컬 값(13,000) < KIS(13,500) → 나머지 종목도 KIS 조회."""
+    ex = _make_local_price_executor(orderable_verify_sample=1, prefetch_orderable=True)
+    calls = []
+
+    def fetch(client, transaction_type, tickers):
+        calls.append(list(tickers))
+        return {t: {'psbl_qty_calc_unpr': '13500'} for t in tickers}
+
+    with patch('src.executor.fetch_orderable_concurrently', side_effect=fetch), \
+         patch.object(ex, '_get_orderable_qty', wraps=ex._get_orderable_qty) as mock_qty:
+        ex.run_rebalancing(_local_plan())
+    assert calls == [['000000'], ['000001', '000002', '000003', '000004']]
+    assert all(c.kwargs['enable']['psbl_qty_calc_unpr'] == '13500' for c in mock_qty.call_args_list)
+    print('✅ 7-2 로컬 보수단가: 과소 추정 시 나머지 종목 KIS 조회로 되돌림')
+
+
+def test_local_price_deducts_local_calc_price():
+    """7-3. 잔여 현금 차감은 로컬 보수단가 기준 (calc_price ≥ 실제 체결가 → 미수 위험 없음)."""
+    ex = _make_local_price_executor(orderable_verify_sample=1)
+    kis = {'000000': {'psbl_qty_calc_unpr': '13000'}}
+    with patch('src.executor.fetch_orderable_concurrently', return_value=kis) as mock_fetch, \
+         patch.object(ex, '_get_orderable_qty', wraps=ex._get_orderable_qty) as mock_qty:
+        ex.run_rebalancing(_local_plan().head(3))
+    assert mock_fetch.call_args.args[2] == ['000000']
+    assert mock_qty.call_args_list[1].kwargs['enable'] == {'psbl_qty_calc_unpr': 13_000}
+    assert mock_qty.call_args_list[2].kwargs['available_cash'] == 1_000_000 - 2 * 13_000
+    print('✅ 7-3 로컬 보수단가: 잔여 현금을 로컬 단가로 차감')
+
+
+def test_local_price_uses_upper_limit_not_current_price():
+    """7-4. 당일 하락 종목(현재가 7,000, 상한가 13,000)도 상한가 사용, 상한가 미상 종목은 표본과 함께 KIS 조회."""
+    ex = _make_local_price_executor(
+        upper_limits={'000000': 13_000, '000001': 13_000, '000003': 13_000, '000004': 13_000},
+        orderable_verify_sample=1,
+    )
+    plan = _local_plan().assign(current_price=7_000)
+    calls = []
+
+    def fetch(client, transaction_type, tickers):
+        calls.append(list(tickers))
+        return {t: {'psbl_qty_calc_unpr': '13000'} for t in tickers}
+
+    with patch('src.executor.fetch_orderable_concurrently', side_effect=fetch), \
+         patch.object(ex, '_get_orderable_qty', wraps=ex._get_orderable_qty) as mock_qty:
+        ex.run_rebalancing(plan)
+    assert calls == [['000000', '000002']], '표본 + 상한가 미상 종목을 한 번에 조회'
+    enables = {c.kwargs['ticker']: c.kwargs['enable'] for c in mock_qty.call_args_list}
+    assert enables['000001'] == {'psbl_qty_calc_unpr': 13_000}, '현재가 × 1.3(9,100)이 아닌 상한가'
+    assert ex.kis_client.fetch_domestic_enable_buy.call_count == 0
+    print('✅ 7-4 로컬 보수단가: 하락 종목도 상한가 기준, 상한가 미상 종목은 KIS 조회')
+
+
+def test_local_price_policy_requires_verify_sample():
+    """7-5. 검증 표본 0(로컬 값만으로 매수)·알 수 없는 모드는 ValueError."""
+    from src.policy import ExecutionPolicy
+    for kwargs in ({'orderable_verify_sample': 0}, {'orderable_price_mode': 'estimate'}):
+        try:
+            ExecutionPolicy(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'{kwargs}가 통과됨')
+    print('✅ 7-5 로컬 보수단가: orderable_verify_sample >= 1 강제')
+
+
 if __name__ == '__main__':
     test_orderable_qty_basic()
     test_orderable_qty_buffer_boundary()
@@ -357,4 +634,15 @@ if __name__ == '__main__':
     test_run_rebalancing_zero_fill_keeps_remaining_cash()
     test_run_rebalancing_uses_calc_price_for_deduction()
     test_run_rebalancing_failed_order_no_deduction()
+    test_parallel_sells_keep_plan_order()
+    test_single_worker_is_serial()
+    test_reconcile_updates_filled_and_avg_price_with_one_sweep()
+    test_reconcile_polls_until_remaining_filled()
+    test_sell_fills_feed_settlement_target()
+    test_reconcile_disabled_or_lookup_failure_keeps_accepted_quantity()
+    test_local_price_skips_per_ticker_enable_buy()
+    test_local_price_underestimate_falls_back_to_kis()
+    test_local_price_deducts_local_calc_price()
+    test_local_price_uses_upper_limit_not_current_price()
+    test_local_price_policy_requires_verify_sample()
     print('\n전체 테스트 통과')
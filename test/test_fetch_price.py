@@ -3,6 +3,8 @@
 거래 없이 모킹된 응답으로 다음을 검증한다:
 - 6자리 숫자 종목코드('379800')와 영문자 섞인 KRX 단축코드('0091C0') 모두
   fetch_domestic_price에 그대로 전달되어 현재가(stck_prpr)를 반환
+- fetch_prices: 멀티종목 시세조회 1회로 일괄 조회, 중복 제거, float64 Series(index=ticker)
+- fetch_prices: 30종목 단위 분할, 누락 종목·조회 실패·모의투자는 단건 조회 폴백
 
 실행: `uv run python test/test_fetch_price.py`
 """
@@ -14,7 +16,7 @@ current_dir = Path(__file__).resolve()
 project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
-from src.kis.client import KISClient
+from src.kis.client import KISAPIError, KISClient
 
 
 def _make_client() -> KISClient:
@@ -30,6 +32,82 @@ def test_fetch_price_passes_ticker_to_domestic_quote():
     print('✅ fetch_price: 숫자/영숫자 KRX 단축코드 모두 국내 시세 조회로 그대로 전달')
 
 
+def _multi_payload(prices: dict) -> dict:
+    return {
+        'rt_cd': '0',
+        'output': [{'inter_shrn_iscd': t, 'inter2_prpr': str(p)} for t, p in prices.items()],
+    }
+
+
+def test_fetch_prices_single_multi_call():
+    """3종목(중복 1) → 멀티종목 시세 1회, 단건 조회 없음, float64 Series."""
+    c = _make_client()
+    c.mock = False
+    c._get_json = MagicMock(return_value=_multi_payload({'379800': 12345, '0091C0': 10250}))
+    c.fetch_price = MagicMock()
+    prices = c.fetch_prices(['379800', '0091C0', '379800'])
+    assert c._get_json.call_count == 1
+    params = c._get_json.call_args.args[2]
+    assert params == {
+        'FID_COND_MRKT_DIV_CODE_1': 'J', 'FID_INPUT_ISCD_1': '379800',
+        'FID_COND_MRKT_DIV_CODE_2': 'J', 'FID_INPUT_ISCD_2': '0091C0',
+    }, params
+    c.fetch_price.assert_not_called()
+    assert prices.index.tolist() == ['379800', '0091C0']
+    assert prices.dtype == 'float64'
+    assert prices['0091C0'] == 10250.0
+    print('✅ fetch_prices: 멀티종목 시세 1회, 중복 제거, float64 Series')
+
+
+def test_fetch_prices_chunks_by_30():
+    c = _make_client()
+    c.mock = False
+    tickers = [f'{i:06d}' for i in range(65)]
+    c._get_json = MagicMock(side_effect=lambda path, tr_id, params, **kw: _multi_payload({
+        v: 1000 for k, v in params.items() if k.startswith('FID_INPUT_ISCD_')
+    }))
+    prices = c.fetch_prices(tickers)
+    assert c._get_json.call_count == 3, f'65종목 → 30/30/5 분할, 실제 {c._get_json.call_count}회'
+    assert len(prices) == 65
+    print('✅ fetch_prices: 30종목 단위 분할 조회')
+
+
+def test_fetch_prices_fallback_for_missing_and_failure():
+    """멀티 응답 누락 종목 → 단건 폴백. 멀티 조회 자체 실패 → 전 종목 단건 폴백."""
+    c = _make_client()
+    c.mock = False
+    c._get_json = MagicMock(return_value=_multi_payload({'379800': 12345}))
+    c.fetch_price = MagicMock(return_value=8800.0)
+    prices = c.fetch_prices(['379800', '449170'])
+    c.fetch_price.assert_called_once_with('449170')
+    assert prices.tolist() == [12345.0, 8800.0]
+
+    c = _make_client()
+    c.mock = False
+    c._get_json = MagicMock(side_effect=KISAPIError('KIS 응답 비정상', kis_rt_cd='1'))
+    c.fetch_price = MagicMock(return_value=100.0)
+    prices = c.fetch_prices(['379800', '449170'])
+    assert c.fetch_price.call_count == 2
+    assert prices.tolist() == [100.0, 100.0]
+    print('✅ fetch_prices: 누락·실패 종목 단건 조회 폴백')
+
+
+def test_fetch_prices_mock_env_skips_multi():
+    """모의투자는 멀티종목 시세 미지원 → 단건 조회만."""
+    c = _make_client()
+    c.mock = True
+    c._get_json = MagicMock()
+    c.fetch_price = MagicMock(return_value=500.0)
+    prices = c.fetch_prices(['379800'])
+    c._get_json.assert_not_called()
+    assert prices.tolist() == [500.0]
+    print('✅ fetch_prices: 모의투자 → 단건 조회')
+
+
 if __name__ == '__main__':
     test_fetch_price_passes_ticker_to_domestic_quote()
+    test_fetch_prices_single_multi_call()
+    test_fetch_prices_chunks_by_30()
+    test_fetch_prices_fallback_for_missing_and_failure()
+    test_fetch_prices_mock_env_skips_multi()
     print('\n전체 테스트 통과')
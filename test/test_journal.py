@@ -0,0 +1,213 @@
+"""ExecutionJournal(실행 저널) 단위 테스트.
+
+임시 디렉터리 저널과 모킹된 KIS 응답으로 다음을 검증한다:
+- 기록 → load 왕복: 계획·제출·결과·단계 표시 복원, 크래시로 잘린 마지막 줄 무시
+- find_unfinished: max_age_seconds 이내 저널은 재개, 오래된 저널은 .abandoned 보관
+- complete: 저널 파일 삭제 (다시 탐색되지 않음)
+- OrderExecutor 재개: 결과 기록된 주문은 재주문 없이 재사용, 응답 없는 제출은 in_doubt,
+  주문 전 write-ahead 기록, 재사용 매수는 잔여 현금에서 다시 차감하지 않음, settled 기록 시 대기 생략,
+  재사용 매도 대금은 결제 대기 목표에서 제외
+
+실행: `uv run python -m test.test_journal`
+"""
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.executor import OrderExecutor
+from src.journal import ExecutionJournal, order_key
+from src.kis.client import KISClient
+
+
+def _plan_df() -> pd.DataFrame:
+    return pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 3, 'required_transaction': 'sell', 'current_price': 70000},
+        {'ticker': '000660', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 10000},
+    ])
+
+
+def _make_executor() -> OrderExecutor:
+    """KISClient.__init__의 인증·토큰 흐름을 우회한 OrderExecutor 인스턴스 생성."""
+    kis_client = KISClient.__new__(KISClient)  # __init__ 스킵
+    kis_client.acc_no_postfix = '01'
+    kis_client.acc_no_prefix = '00000000'
+    kis_client.mock = False
+    return OrderExecutor(kis_client, account_type='ISA')
+
+
+def _result(ticker: str, filled: int, calc_price: int = 10000) -> dict:
+    return {
+        'ticker': ticker, 'enable_quantity': filled, 'requested_quantity': filled, 'filled_quantity': filled,
+        'transaction_quantity': filled, 'calc_price': calc_price, 'skipped_reason': None,
+        'is_success': True, 'response_msg': 'ok', 'transaction_order': 0,
+    }
+
+
+# ---------------------------------------------------------------------------- #
+# 세트 1 — 저널 기록·탐색                                                           #
+# ---------------------------------------------------------------------------- #
+
+def test_record_and_load_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1', clock=lambda: 1000.0)
+        journal.record_plan(_plan_df())
+        journal.record_submitted(order_key('sell', '005930'), 3)
+        journal.record_result(order_key('sell', '005930'), _result('005930', 3))
+        journal.mark('settled')
+        journal.record_submitted(order_key('buy', '000660'), 5)
+
+        loaded = ExecutionJournal.load(journal.path)
+    assert (loaded.run_id, loaded.account_type, loaded.started_at) == ('run_1', 'ISA', 1000.0)
+    pd.testing.assert_frame_equal(loaded.plan, _plan_df())
+    assert loaded.result_for('sell:005930')['filled_quantity'] == 3
+    assert loaded.has_mark('settled')
+    assert loaded.in_doubt_keys() == ['buy:000660'], '응답 없는 제출만 in_doubt'
+    assert loaded.in_doubt_quantity('buy:000660') == 5
+    assert loaded.in_doubt_quantity('sell:005930') is None
+    print('✅ 저널: 계획·제출·결과·단계 표시 기록 → load 왕복 복원')
+
+
+def test_load_ignores_torn_last_line():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1')
+        journal.record_submitted('buy:000660', 5)
+        with journal.path.open('a', encoding='utf-8') as f:
+            f.write('{"event": "order_res')   # 쓰는 중 크래시
+        loaded = ExecutionJournal.load(journal.path)
+    assert loaded.in_doubt_keys() == ['buy:000660']
+    print('✅ 저널: 잘린 마지막 줄만 버리고 읽음')
+
+
+def test_find_unfinished_resumes_recent_and_abandons_old():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        ExecutionJournal.open(directory, 'ISA', 'old_run', clock=lambda: 0.0)
+        ExecutionJournal.open(directory, 'ISA', 'recent_run', clock=lambda: 5000.0)
+        ExecutionJournal.open(directory, 'PPA', 'other_account', clock=lambda: 5000.0)
+
+        found = ExecutionJournal.find_unfinished(directory, 'ISA', max_age_seconds=1800, clock=lambda: 5600.0)
+        assert found is not None and found.run_id == 'recent_run'
+        assert (directory / 'ISA_old_run.abandoned').exists(), '오래된 저널은 보관 처리'
+        assert (directory / 'PPA_other_account.jsonl').exists(), '다른 계좌 저널은 건드리지 않음'
+
+        found.complete()
+        assert not found.path.exists()
+        assert ExecutionJournal.find_unfinished(directory, 'ISA', clock=lambda: 5600.0) is None
+    print('✅ 저널: 최근 미완료 저널만 재개, 오래된 저널 보관, complete 후 재탐색 없음')
+
+
+# ---------------------------------------------------------------------------- #
+# 세트 2 — OrderExecutor 재개                                                      #
+# ---------------------------------------------------------------------------- #
+
+def test_execute_order_writes_ahead_and_records_result():
+    ex = _make_executor()
+    plan_row = {'ticker': '000660', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 10000}
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1')
+        ex._journal = journal
+
+        def _order(*args, **kwargs):
+            assert journal.in_doubt_quantity('buy:000660') == 5, '주문 전에 제출 기록이 있어야 함'
+            return {'rt_cd': '0', 'msg1': 'ok'}
+
+        with patch.object(ex, '_get_orderable_qty', return_value=(5, 10_000)), \
+             patch.object(type(ex.kis_client), 'create_domestic_order', MagicMock(side_effect=_order)):
+            ex._execute_order(plan_row, order_index=0, available_cash=1_000_000)
+        assert journal.result_for('buy:000660')['filled_quantity'] == 5
+    print('✅ 재개: 주문 전 write-ahead 기록 → 주문 후 결과 기록')
+
+
+def test_resume_reuses_results_and_skips_in_doubt():
+    ex = _make_executor()
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1')
+        journal.record_submitted('sell:005930', 3)
+        journal.record_result('sell:005930', _result('005930', 3, calc_price=70000))
+        journal.mark('settled')
+        journal.record_submitted('buy:000660', 5)   # 응답 전에 크래시
+
+        mock_order = MagicMock()
+        with patch.object(type(ex.kis_client), 'fetch_domestic_cash_balance', return_value=1_000_000), \
+             patch.object(type(ex.kis_client), 'fetch_buy_orderable_cash', return_value=1_000_000), \
+             patch.object(type(ex.kis_client), 'create_domestic_order', mock_order), \
+             patch.object(ex, '_prefetch_orderable', return_value={}), \
+             patch('src.executor.time.sleep') as mock_sleep:
+            result, _ = ex.run_rebalancing(_plan_df(), journal=journal)
+
+    assert mock_order.call_count == 0, '기록된 주문·응답 없는 제출 모두 재주문 금지'
+    assert mock_sleep.call_count == 0, 'settled 기록 → 매도 대금 대기 생략'
+    assert list(result['filled_quantity']) == [3, 0]
+    assert list(result['skipped_reason']) == [None, 'in_doubt']
+    print('✅ 재개: 기록된 결과 재사용 + 응답 없는 제출은 in_doubt (재주문 0회)')
+
+
+def test_resumed_buy_not_deducted_from_remaining_cash():
+    ex = _make_executor()
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 10, 'required_transaction': 'buy', 'current_price': 5000},
+        {'ticker': '000660', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 4000},
+    ])
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1')
+        journal.record_submitted('buy:005930', 10)
+        journal.record_result('buy:005930', _result('005930', 10, calc_price=5500))
+
+        with patch.object(type(ex.kis_client), 'fetch_domestic_cash_balance', return_value=1_000_000), \
+             patch.object(type(ex.kis_client), 'fetch_buy_orderable_cash', return_value=945_000), \
+             patch.object(ex, '_prefetch_orderable', return_value={}), \
+             patch.object(ex, '_get_orderable_qty', return_value=(5, 4500)) as mock_qty, \
+             patch.object(type(ex.kis_client), 'create_domestic_order', return_value={'rt_cd': '0', 'msg1': 'ok'}):
+            ex.run_rebalancing(plan_df, journal=journal)
+
+    assert mock_qty.call_count == 1, '재사용 주문은 가능 수량 조회도 생략'
+    # 재시작 후 조회한 한도(945,000)에 첫 매수가 이미 반영 → 다시 차감하면 이중 차감
+    assert mock_qty.call_args.kwargs['available_cash'] == 945_000
+    print('✅ 재개: 재사용 매수는 잔여 현금에서 다시 차감하지 않음')
+
+
+def test_resumed_sell_excluded_from_settlement_target():
+    """재개 실행의 폴링 목표: 저널에서 재사용한 매도 대금은 기준선에 이미 반영 → 새 매도분만 더한다."""
+    ex = _make_executor()
+    ex.policy = ex.policy.__class__(settlement_wait_mode='poll', reconcile_fills=False)
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 3, 'required_transaction': 'sell', 'current_price': 70000},
+        {'ticker': '035720', 'required_quantity': 2, 'required_transaction': 'sell', 'current_price': 50000},
+        {'ticker': '000660', 'required_quantity': 5, 'required_transaction': 'buy', 'current_price': 10000},
+    ])
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = ExecutionJournal.open(Path(tmp), 'ISA', 'run_1')
+        journal.record_submitted('sell:005930', 3)
+        journal.record_result('sell:005930', _result('005930', 3, calc_price=70000))
+
+        with patch.object(type(ex.kis_client), 'fetch_domestic_cash_balance', return_value=1_000_000), \
+             patch.object(type(ex.kis_client), 'fetch_buy_orderable_cash', return_value=1_210_000), \
+             patch.object(ex, '_prefetch_orderable', return_value={}), \
+             patch.object(ex, '_prefetch_sell_hashkeys'), \
+             patch.object(ex, '_get_orderable_qty', side_effect=[(2, 50000), (5, 10000)]), \
+             patch.object(type(ex.kis_client), 'create_domestic_order', return_value={'rt_cd': '0', 'msg1': 'ok'}), \
+             patch.object(ex, '_wait_for_settlement', return_value=0.0) as mock_wait:
+            ex.run_rebalancing(plan_df, journal=journal)
+
+    baseline, expected_proceeds = mock_wait.call_args.args
+    assert baseline == 1_210_000
+    assert expected_proceeds == 2 * 50000, f'재사용 매도(3×70,000) 제외, 새 매도 2×50,000만, 실제 {expected_proceeds}'
+    print('✅ 재개: 재사용 매도 대금은 결제 대기 목표에서 제외 (이중 계상 없음)')
+
+
+if __name__ == '__main__':
+    test_record_and_load_round_trip()
+    test_load_ignores_torn_last_line()
+    test_find_unfinished_resumes_recent_and_abandons_old()
+    test_execute_order_writes_ahead_and_records_result()
+    test_resume_reuses_results_and_skips_in_doubt()
+    test_resumed_buy_not_deducted_from_remaining_cash()
+    test_resumed_sell_excluded_from_settlement_target()
+    print('\n전체 테스트 통과')
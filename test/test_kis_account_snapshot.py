@@ -0,0 +1,122 @@
+"""AccountSnapshot + KISClient 계좌 스냅샷 단위 테스트.
+
+모킹된 잔고 페이지로 다음을 검증한다:
+- fetch_domestic_total_balance: 잔고 페이지를 페이지당 1회만 조회 (예수금용 첫 페이지 재조회 없음)
+- fetch_buy_orderable_cash: 반복 호출 시 inquire-psbl-order 1회, refresh=True면 재조회
+  (실제 QuoteCache TTL 안에서도 캐시 항목까지 버리고 새 응답을 읽음)
+- create_domestic_order 직후 스냅샷 무효화 → 다음 조회는 KIS에서 다시
+- 반환값 복사본: 호출부 수정이 스냅샷을 오염시키지 않음
+
+실행: `uv run python -m test.test_kis_account_snapshot`
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.cache import QuoteCache
+from src.kis.client import KISClient
+
+_SUMMARY = {
+    'dnca_tot_amt': '500000', 'nxdy_excc_amt': '700000', 'prvs_rcdl_excc_amt': '900000',
+    'scts_evlu_amt': '2000000', 'tot_evlu_amt': '2900000',
+}
+_PAGE_1 = {
+    'output1': [{'pdno': '005930', 'prdt_name': 'A', 'hldg_qty': '10', 'prpr': '100000', 'evlu_amt': '1000000'}],
+    'output2': [_SUMMARY],
+    'tr_cont': 'M', 'ctx_area_fk100': 'fk', 'ctx_area_nk100': 'nk',
+}
+_PAGE_2 = {
+    'output1': [{'pdno': '000660', 'prdt_name': 'B', 'hldg_qty': '5', 'prpr': '200000', 'evlu_amt': '1000000'}],
+    'output2': [_SUMMARY],
+    'tr_cont': 'D',
+}
+
+
+def _make_client() -> KISClient:
+    c = KISClient.__new__(KISClient)  # __init__ 스킵
+    c.acc_no_prefix = '00000000'
+    c.acc_no_postfix = '01'
+    c.mock = False
+    return c
+
+
+def _page_side_effect(self, ctx_area_fk100='', ctx_area_nk100=''):
+    return dict(_PAGE_2 if ctx_area_fk100 else _PAGE_1)
+
+
+def test_total_balance_fetches_each_page_once():
+    c = _make_client()
+    with patch.object(KISClient, '_domestic_balance_page', autospec=True, side_effect=_page_side_effect) as page:
+        df = c.fetch_domestic_total_balance()
+        c.fetch_domestic_cash_breakdown()
+    assert page.call_count == 2, f'2페이지 → 2회 조회 기대, 실제 {page.call_count}회'
+    assert df['ticker'].tolist() == ['005930', '000660', 'CASH']
+    assert df.loc[df['ticker'] == 'CASH', 'current_value'].iloc[0] == 900_000
+    print('✅ 스냅샷: 총잔고·예수금 요약이 잔고 페이지를 페이지당 1회만 조회')
+
+
+def test_orderable_cash_memoized_and_refresh():
+    c = _make_client()
+    with patch.object(KISClient, 'fetch_domestic_enable_buy', return_value={'nrcvb_buy_amt': '510632'}) as enable:
+        assert c.fetch_buy_orderable_cash() == 510_632
+        assert c.fetch_buy_orderable_cash() == 510_632
+        assert enable.call_count == 1, '계좌 단위 상수 → 1회 조회'
+        c.fetch_buy_orderable_cash(refresh=True)
+        assert enable.call_count == 2, 'refresh=True면 재조회'
+    print('✅ 스냅샷: fetch_buy_orderable_cash 메모이즈 + refresh')
+
+
+def test_orderable_cash_refresh_bypasses_quote_cache():
+    """refresh=True는 실제 QuoteCache의 inquire-psbl-order 항목까지 버려 TTL 안에서도 새 응답을 읽는다."""
+    c = _make_client()
+    c._quote_cache = QuoteCache(ttl_seconds=60.0)
+    c._orderable_url = MagicMock(return_value='url')
+    c._orderable_tr_id = MagicMock(return_value='tr')
+    responses = iter([{'output': {'nrcvb_buy_amt': str(v)}} for v in (100_000, 250_000, 400_000)])
+    c._get_json = MagicMock(side_effect=lambda *a, **k: next(responses))
+
+    assert c.fetch_buy_orderable_cash() == 100_000
+    assert c.fetch_buy_orderable_cash() == 100_000, '스냅샷 메모이즈'
+    assert c.fetch_buy_orderable_cash(refresh=True) == 250_000
+    c.invalidate_account_snapshot()  # 고정 대기 경로
+    assert c.fetch_buy_orderable_cash() == 400_000
+    assert c._get_json.call_count == 3, f'재조회마다 HTTP 1회 기대, 실제 {c._get_json.call_count}회'
+    print('✅ 스냅샷: refresh·무효화가 inquire-psbl-order 캐시까지 버림 (TTL 안에서도 새 한도)')
+
+
+def test_order_invalidates_snapshot():
+    c = _make_client()
+    c.auth_config = MagicMock()
+    c.issue_hashkey = MagicMock(return_value='hash')
+    c._post_json = MagicMock(return_value={'rt_cd': '0', 'msg1': 'ok'})
+    with patch.object(KISClient, '_domestic_balance_page', autospec=True, side_effect=_page_side_effect) as page:
+        c.fetch_domestic_cash_balance()
+        c.create_domestic_order('sell', '005930', ord_qty=1, ord_dvsn='01')
+        c.fetch_domestic_cash_balance()
+    assert page.call_count == 4, f'주문 전·후 각각 2페이지 조회 기대, 실제 {page.call_count}회'
+    print('✅ 스냅샷: create_domestic_order 직후 무효화')
+
+
+def test_returned_values_are_copies():
+    c = _make_client()
+    with patch.object(KISClient, '_domestic_balance_page', autospec=True, side_effect=_page_side_effect):
+        first = c.fetch_domestic_stock_balance()
+        first['output1'][0]['hldg_qty'] = '999'
+        first['output1'].clear()
+        second = c.fetch_domestic_stock_balance()
+    assert len(second['output1']) == 2
+    assert second['output1'][0]['hldg_qty'] == '10'
+    print('✅ 스냅샷: 반환값 수정이 스냅샷을 오염시키지 않음')
+
+
+if __name__ == '__main__':
+    test_total_balance_fetches_each_page_once()
+    test_orderable_cash_memoized_and_refresh()
+    test_orderable_cash_refresh_bypasses_quote_cache()
+    test_order_invalidates_snapshot()
+    test_returned_values_are_copies()
+    print('\n전체 테스트 통과')
@@ -0,0 +1,154 @@
+"""AsyncKISClient 단위 테스트.
+
+거래 없이 지연을 흉내 낸 가짜 클라이언트로 다음을 검증한다:
+- fetch_prices: 종목 동시 조회 → 총 지연 ≈ 가장 느린 1건 (합이 아님), 입력 순서 유지·중복 제거
+- max_concurrency: 동시 진행 요청 수 상한 준수
+- KISAPIError: 변환 없이 그대로 전파
+- fetch_orderable: buy/sell 분기 및 잘못된 transaction_type ValueError
+- OrderExecutor: 선조회 응답(enable)이 있으면 KIS 재조회 없이 사용
+
+실행: `uv run python -m test.test_kis_async_client`
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.async_client import AsyncKISClient, fetch_orderable_concurrently, fetch_prices_concurrently, run_sync
+from src.kis.client import KISAPIError
+
+
+class _SlowClient:
+    """요청마다 delay초 걸리는 가짜 KISClient. 동시 진행 수의 최댓값을 기록한다."""
+
+    def __init__(self, delay: float = 0.2, fail_ticker: str = None) -> None:
+        self.delay = delay
+        self.fail_ticker = fail_ticker
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, ticker):
+        with self._lock:
+            self.calls.append(ticker)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if ticker == self.fail_ticker:
+            raise KISAPIError('KIS 응답 비정상 (rt_cd != 0)', path='uapi/x', kis_rt_cd='1')
+
+    def fetch_price(self, ticker):
+        self._enter(ticker)
+        return float(len(self.calls))
+
+    def fetch_domestic_enable_buy(self, ticker, ord_dvsn='01', price=-1):
+        self._enter(ticker)
+        return {'psbl_qty_calc_unpr': '1000'}
+
+    def fetch_domestic_enable_sell(self, ticker):
+        self._enter(ticker)
+        return {'ord_psbl_qty': '3'}
+
+
+def test_fetch_prices_concurrent_latency():
+    """5종목 × 0.2초: 직렬이면 1.0초, 동시 조회면 ≈0.2초."""
+    client = _SlowClient(delay=0.2)
+    tickers = ['005930', '000660', '035720', '069500', '360750']
+    start = time.perf_counter()
+    prices = fetch_prices_concurrently(client, tickers)
+    elapsed = time.perf_counter() - start
+    assert list(prices) == tickers, '입력 순서 유지'
+    assert elapsed < 0.6, f'동시 조회 기대(≈0.2초), 실제 {elapsed:.2f}초'
+    print(f'✅ fetch_prices: 5종목 {elapsed:.2f}초 (직렬 1.0초 대비)')
+
+
+def test_fetch_prices_dedup():
+    client = _SlowClient(delay=0.0)
+    prices = fetch_prices_concurrently(client, ['A', 'B', 'A'])
+    assert list(prices) == ['A', 'B']
+    assert sorted(client.calls) == ['A', 'B'], '중복 ticker는 1회만 조회'
+    print('✅ fetch_prices: 중복 ticker 1회 조회')
+
+
+def test_max_concurrency_respected():
+    client = _SlowClient(delay=0.05)
+    async_client = AsyncKISClient(client, max_concurrency=2)
+    run_sync(async_client.fetch_prices([str(i) for i in range(6)]))
+    assert client.max_in_flight <= 2, f'동시 진행 상한 2, 실제 {client.max_in_flight}'
+    print(f'✅ max_concurrency=2: 최대 동시 진행 {client.max_in_flight}건')
+
+
+def test_kis_api_error_propagates():
+    client = _SlowClient(delay=0.0, fail_ticker='BAD')
+    try:
+        fetch_prices_concurrently(client, ['005930', 'BAD'])
+    except KISAPIError as e:
+        assert e.kis_rt_cd == '1'
+    else:
+        raise AssertionError('KISAPIError 전파 기대')
+    print('✅ KISAPIError: 변환 없이 그대로 전파')
+
+
+def test_fetch_orderable_branches():
+    client = _SlowClient(delay=0.0)
+    buys = fetch_orderable_concurrently(client, 'buy', ['A', 'B'])
+    sells = fetch_orderable_concurrently(client, 'sell', ['C'])
+    assert buys == {'A': {'psbl_qty_calc_unpr': '1000'}, 'B': {'psbl_qty_calc_unpr': '1000'}}
+    assert sells == {'C': {'ord_psbl_qty': '3'}}
+    try:
+        fetch_orderable_concurrently(client, 'hold', ['A'])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("transaction_type='hold'가 통과됨")
+    print('✅ fetch_orderable: buy/sell 분기, 비정상 transaction_type ValueError')
+
+
+def test_invalid_max_concurrency():
+    try:
+        AsyncKISClient(MagicMock(), max_concurrency=0)
+    except ValueError:
+        print('✅ max_concurrency=0 → ValueError')
+        return
+    raise AssertionError('max_concurrency=0이 통과됨')
+
+
+def test_executor_uses_prefetched_enable():
+    """run_rebalancing: 선조회한 가능 조회 응답을 _get_orderable_qty가 재사용 (종목당 1회 조회)."""
+    from src.executor import OrderExecutor
+    kis_client = MagicMock()
+    kis_client.fetch_domestic_cash_balance.return_value = 1_000_000
+    kis_client.fetch_buy_orderable_cash.return_value = 1_000_000
+    kis_client.fetch_domestic_enable_buy.return_value = {'psbl_qty_calc_unpr': '10000'}
+    kis_client.fetch_domestic_enable_sell.return_value = {'ord_psbl_qty': '5'}
+    kis_client.create_domestic_order.return_value = {'rt_cd': '0', 'msg1': 'ok'}
+    ex = OrderExecutor(kis_client, account_type='ISA')
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_transaction': 'buy', 'required_quantity': 3},
+        {'ticker': '000660', 'required_transaction': 'buy', 'required_quantity': 2},
+    ])
+    result, _ = ex.run_rebalancing(plan_df)
+    assert kis_client.fetch_domestic_enable_buy.call_count == 2, '종목당 1회 (선조회만)'
+    assert result['filled_quantity'].tolist() == [3, 2]
+    print('✅ OrderExecutor: 선조회 응답 재사용 → 종목당 가능 조회 1회')
+
+
+if __name__ == '__main__':
+    test_fetch_prices_concurrent_latency()
+    test_fetch_prices_dedup()
+    test_max_concurrency_respected()
+    test_kis_api_error_propagates()
+    test_fetch_orderable_branches()
+    test_invalid_max_concurrency()
+    test_executor_uses_prefetched_enable()
+    print('\n전체 테스트 통과')
@@ -0,0 +1,134 @@
+"""주문 해시키 제공자 단위 테스트.
+
+거래 없이 가짜 issue_hashkey로 다음을 검증한다:
+- RemoteHashkeyProvider: 같은 body는 1회 발급, prefetch는 중복 제거 후 동시 발급
+- LocalHashkeyProvider: 첫 사용 시 원격 결과로 후보 방식 검증 → 이후 원격 호출 0회
+- LocalHashkeyProvider: 후보가 모두 불일치하면 원격 폴백 (로컬 값 미사용)
+- KISClient: prefetch_hashkeys 후 create_domestic_order는 해시키 왕복 없음
+- OrderExecutor: 매도 body(min(계획, 가능 수량))로 해시키 선발급
+
+실행: `uv run python -m test.test_kis_hashkey`
+"""
+import hashlib
+import hmac
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.client import KISClient
+from src.kis.hashkey import LocalHashkeyProvider, RemoteHashkeyProvider, serialize_body
+
+_SECRET = 'dummy-secret'
+
+
+def _hmac_hex(data: dict) -> str:
+    return hmac.new(_SECRET.encode(), serialize_body(data).encode(), hashlib.sha256).hexdigest()
+
+
+class _FakeClient:
+    """issue_hashkey 호출을 기록하는 가짜 클라이언트. remote_scheme으로 원격 해시 방식을 흉내."""
+
+    def __init__(self, remote_scheme=_hmac_hex) -> None:
+        self.auth_config = MagicMock(app_secret=_SECRET)
+        self.remote_scheme = remote_scheme
+        self.issued = []
+        self._lock = threading.Lock()
+
+    def issue_hashkey(self, data: dict) -> str:
+        with self._lock:
+            self.issued.append(serialize_body(data))
+        return self.remote_scheme(data)
+
+
+def _body(ticker: str, qty: int = 1) -> dict:
+    return {'CANO': '00000000', 'ACNT_PRDT_CD': '01', 'PDNO': ticker,
+            'ORD_DVSN': '01', 'ORD_QTY': str(qty), 'ORD_UNPR': '0'}
+
+
+def test_remote_caches_and_prefetches():
+    client = _FakeClient()
+    provider = RemoteHashkeyProvider(client, max_workers=3)
+    provider.prefetch([_body('A'), _body('B'), _body('A'), _body('C')])
+    assert len(client.issued) == 3, f'중복 제거 후 3건 발급, 실제 {len(client.issued)}'
+    assert provider.get(_body('B')) == _hmac_hex(_body('B'))
+    assert len(client.issued) == 3, 'prefetch된 body는 재발급 없음'
+    provider.get(_body('D'))
+    assert len(client.issued) == 4
+    print('✅ RemoteHashkeyProvider: body 단위 캐시 + prefetch 중복 제거')
+
+
+def test_local_verified_then_no_round_trip():
+    client = _FakeClient()
+    provider = LocalHashkeyProvider(client)
+    for ticker in ('A', 'B', 'C'):
+        assert provider.get(_body(ticker)) == _hmac_hex(_body(ticker))
+    assert provider.is_local and provider.scheme_name == 'hmac_sha256_hex'
+    assert len(client.issued) == 1, f'검증용 1회만 원격 발급, 실제 {len(client.issued)}'
+    print('✅ LocalHashkeyProvider: 첫 주문 검증 후 로컬 계산 (원격 1회)')
+
+
+def test_local_mismatch_falls_back_to_remote():
+    client = _FakeClient(remote_scheme=lambda data: 'opaque-' + data['PDNO'])
+    provider = LocalHashkeyProvider(client)
+    assert provider.get(_body('A')) == 'opaque-A'
+    assert provider.get(_body('B')) == 'opaque-B'
+    assert not provider.is_local
+    assert len(client.issued) == 2, '폴백 후 주문마다 원격 발급'
+    provider.prefetch([_body('C'), _body('D')])
+    assert provider.get(_body('C')) == 'opaque-C'
+    assert len(client.issued) == 4, '폴백 상태의 prefetch는 원격 선발급'
+    print('✅ LocalHashkeyProvider: 후보 불일치 → 원격 폴백 (로컬 값 미사용)')
+
+
+def test_client_order_uses_prefetched_hashkey():
+    c = KISClient.__new__(KISClient)  # __init__ 스킵
+    c.acc_no_prefix = '00000000'
+    c.acc_no_postfix = '01'
+    c.mock = False
+    c.issue_hashkey = MagicMock(return_value='HASHKEY')
+    c._post_json = MagicMock(return_value={'rt_cd': '0', 'msg1': 'ok'})
+    c.prefetch_hashkeys([{'ticker': '005930', 'ord_qty': 3, 'ord_dvsn': '01'}])
+    assert c.issue_hashkey.call_count == 1
+    c.create_domestic_order('sell', '005930', ord_qty=3, ord_dvsn='01')
+    assert c.issue_hashkey.call_count == 1, '선발급된 body → 주문 시 해시키 왕복 없음'
+    assert c._post_json.call_args.kwargs['hashkey'] == 'HASHKEY'
+    c.create_domestic_order('sell', '005930', ord_qty=2, ord_dvsn='01')
+    assert c.issue_hashkey.call_count == 2, 'body가 다르면 주문 시점 발급'
+    print('✅ KISClient: prefetch_hashkeys 후 주문은 해시키 왕복 없음')
+
+
+def test_executor_prefetches_sell_hashkeys():
+    from src.executor import OrderExecutor
+    from src.policy import ExecutionPolicy
+    kis_client = MagicMock()
+    kis_client.fetch_domestic_cash_balance.return_value = 0
+    kis_client.fetch_domestic_enable_sell.return_value = {'ord_psbl_qty': '5'}
+    kis_client.create_domestic_order.return_value = {'rt_cd': '0', 'msg1': 'ok'}
+    ex = OrderExecutor(kis_client, account_type='ISA', policy=ExecutionPolicy(prefetch_orderable=True))
+    plan_df = pd.DataFrame([
+        {'ticker': '005930', 'required_quantity': 3, 'required_transaction': 'sell', 'current_price': 100},
+        {'ticker': '000660', 'required_quantity': 9, 'required_transaction': 'sell', 'current_price': 100},
+    ])
+    ex.run_rebalancing(plan_df)
+    planned = kis_client.prefetch_hashkeys.call_args.args[0]
+    assert planned == [
+        {'ticker': '005930', 'ord_qty': 3, 'ord_dvsn': '01'},
+        {'ticker': '000660', 'ord_qty': 5, 'ord_dvsn': '01'},   # min(계획 9, 가능 5)
+    ], planned
+    print('✅ OrderExecutor: 매도 해시키 선발급 (수량 = min(계획, 가능))')
+
+
+if __name__ == '__main__':
+    test_remote_caches_and_prefetches()
+    test_local_verified_then_no_round_trip()
+    test_local_mismatch_falls_back_to_remote()
+    test_client_order_uses_prefetched_hashkey()
+    test_executor_prefetches_sell_hashkeys()
+    print('\n전체 테스트 통과')
@@ -6,6 +6,8 @@
 - _check_rt_cd: rt_cd != '0' → KISAPIError, rt_cd == '0' → 통과
 - _get_json/_post_json: 정상 path + rt_cd 검증 path
 - create_domestic_order: rt_cd != '0'에서도 raise하지 않고 dict 반환 (executor 호환)
+- fetch_daily_order_fills: 주문번호를 모두 찾으면 남은 페이지를 읽지 않음, 연속 조회는 tr_cont='N'
+- 커넥션 풀: 모든 호출이 단일 keep-alive 세션을 공유, 풀 크기 설정 반영
 
 실행: `uv run python -m test.test_kis_http`
 """
@@ -19,7 +21,9 @@ current_dir = Path(__file__).resolve()
 project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
-from src.kis.client import KISClient, KISAPIError, DEFAULT_REQUEST_TIMEOUT
+from src.kis.client import (
+    KISClient, KISAPIError, DEFAULT_REQUEST_TIMEOUT, DEFAULT_POOL_MAXSIZE, build_http_session,
+)
 
 
 def _make_client() -> KISClient:
@@ -58,7 +62,7 @@ def _ok_response(payload: dict, status: int = 200, headers: dict | None = None):
 def test_get_passes_default_timeout():
     """1-1. _get은 DEFAULT_REQUEST_TIMEOUT을 timeout 인자로 전달."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', return_value=_ok_response({'rt_cd': '0'})) as mock_get:
+    with patch.object(c.session, 'get', return_value=_ok_response({'rt_cd': '0'})) as mock_get:
         c._get('uapi/path', 'TR_ID', {'k': 'v'})
     _, kwargs = mock_get.call_args
     assert kwargs.get('timeout') == DEFAULT_REQUEST_TIMEOUT, \
@@ -69,7 +73,7 @@ def test_get_passes_default_timeout():
 def test_post_passes_default_timeout():
     """1-2. _post도 timeout 인자 강제."""
     c = _make_client()
-    with patch('src.kis.client.requests.post', return_value=_ok_response({'rt_cd': '0'})) as mock_post:
+    with patch.object(c.session, 'post', return_value=_ok_response({'rt_cd': '0'})) as mock_post:
         c._post('uapi/path', 'TR_ID', {'k': 'v'})
     _, kwargs = mock_post.call_args
     assert kwargs.get('timeout') == DEFAULT_REQUEST_TIMEOUT
@@ -79,7 +83,7 @@ def test_post_passes_default_timeout():
 def test_get_wraps_request_exception():
     """1-3. RequestException(연결 실패·타임아웃 등)은 KISAPIError로 래핑."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', side_effect=requests.ConnectionError('boom')):
+    with patch.object(c.session, 'get', side_effect=requests.ConnectionError('boom')):
         try:
             c._get('uapi/x', 'TR_ID', {})
         except KISAPIError as e:
@@ -94,7 +98,7 @@ def test_get_wraps_request_exception():
 def test_get_wraps_http_error():
     """1-4. raise_for_status() HTTPError → KISAPIError."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', return_value=_ok_response({}, status=500)):
+    with patch.object(c.session, 'get', return_value=_ok_response({}, status=500)):
         try:
             c._get('uapi/x', 'TR_ID', {})
         except KISAPIError as e:
@@ -108,7 +112,7 @@ def test_get_wraps_http_error():
 def test_post_wraps_http_error():
     """1-5. _post HTTP 비정상도 동일 패턴."""
     c = _make_client()
-    with patch('src.kis.client.requests.post', return_value=_ok_response({}, status=503)):
+    with patch.object(c.session, 'post', return_value=_ok_response({}, status=503)):
         try:
             c._post('uapi/x', 'TR_ID', {})
         except KISAPIError as e:
@@ -175,7 +179,7 @@ def test_check_rt_cd_raises_for_missing():
 def test_get_json_returns_payload_when_rt_cd_zero():
     """3-1. _get_json: 정상 응답이면 payload dict 그대로 반환."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', return_value=_ok_response({'rt_cd': '0', 'output': {'x': 1}})):
+    with patch.object(c.session, 'get', return_value=_ok_response({'rt_cd': '0', 'output': {'x': 1}})):
         payload = c._get_json('uapi/x', 'TR_ID', {})
     assert payload['output'] == {'x': 1}
     print('✅ 3-1 _get_json: 정상 path → payload 반환')
@@ -184,7 +188,7 @@ def test_get_json_returns_payload_when_rt_cd_zero():
 def test_get_json_raises_when_rt_cd_nonzero():
     """3-2. _get_json: rt_cd != '0'이면 KISAPIError."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', return_value=_ok_response({'rt_cd': '7', 'msg1': 'fail'})):
+    with patch.object(c.session, 'get', return_value=_ok_response({'rt_cd': '7', 'msg1': 'fail'})):
         try:
             c._get_json('uapi/x', 'TR_ID', {})
         except KISAPIError as e:
@@ -197,7 +201,7 @@ def test_get_json_raises_when_rt_cd_nonzero():
 def test_get_json_skips_validation_when_disabled():
     """3-3. _get_json(validate_rt_cd=False): 비정상 rt_cd여도 통과."""
     c = _make_client()
-    with patch('src.kis.client.requests.get', return_value=_ok_response({'rt_cd': '7', 'msg1': 'fail'})):
+    with patch.object(c.session, 'get', return_value=_ok_response({'rt_cd': '7', 'msg1': 'fail'})):
         payload = c._get_json('uapi/x', 'TR_ID', {}, validate_rt_cd=False)
     assert payload['rt_cd'] == '7'
     print('✅ 3-3 _get_json(validate_rt_cd=False): 비정상 rt_cd도 통과')
@@ -206,7 +210,7 @@ def test_get_json_skips_validation_when_disabled():
 def test_post_json_skips_validation_for_orders():
     """3-4. _post_json(validate_rt_cd=False): create_domestic_order 호환 — 실패 응답도 dict 반환."""
     c = _make_client()
-    with patch('src.kis.client.requests.post', return_value=_ok_response({'rt_cd': '8', 'msg1': '주문 거부'})):
+    with patch.object(c.session, 'post', return_value=_ok_response({'rt_cd': '8', 'msg1': '주문 거부'})):
         payload = c._post_json('uapi/order', 'TR_ID', {}, validate_rt_cd=False)
     assert payload['rt_cd'] == '8'
     assert payload['msg1'] == '주문 거부'
@@ -226,7 +230,7 @@ def test_create_order_returns_dict_on_failure():
     c = _make_client()
     failure_payload = {'rt_cd': '1', 'msg1': '주문 거부됨'}
     with patch.object(c, 'issue_hashkey', return_value='HASH'):
-        with patch('src.kis.client.requests.post', return_value=_ok_response(failure_payload)):
+        with patch.object(c.session, 'post', return_value=_ok_response(failure_payload)):
             result = c.create_domestic_order(
                 transaction_type='buy', ticker='005930',
                 ord_qty=1, ord_dvsn='01',
@@ -236,6 +240,80 @@ def test_create_order_returns_dict_on_failure():
     print('✅ 4-1 create_domestic_order: rt_cd=1여도 raise 안 함 (executor 호환)')
 
 
+def test_daily_order_fills_stops_paging_when_all_found():
+    """4-2. 주문번호 2건: 1페이지에서 1건, 2페이지에서 나머지 → 3페이지는 조회하지 않음."""
+    c = _make_client()
+    pages = [
+        _ok_response({'rt_cd': '0', 'ctx_area_fk100': 'F1', 'ctx_area_nk100': 'N1', 'output1': [
+            {'odno': '0000000099', 'pdno': '111111', 'ord_qty': '1', 'tot_ccld_qty': '1', 'rmn_qty': '0', 'avg_prvs': '100'},
+            {'odno': '0000000002', 'pdno': '000660', 'ord_qty': '3', 'tot_ccld_qty': '1', 'rmn_qty': '2', 'avg_prvs': '20100.5'},
+        ]}, headers={'tr_cont': 'M'}),
+        _ok_response({'rt_cd': '0', 'ctx_area_fk100': 'F2', 'ctx_area_nk100': 'N2', 'output1': [
+            {'odno': '0000000001', 'pdno': '005930', 'ord_qty': '5', 'tot_ccld_qty': '0', 'rmn_qty': '5', 'avg_prvs': ''},
+        ]}, headers={'tr_cont': 'M'}),
+        _ok_response({'rt_cd': '0', 'output1': []}, headers={'tr_cont': 'D'}),
+    ]
+    with patch.object(c.session, 'get', side_effect=pages) as mock_get:
+        fills = c.fetch_daily_order_fills(['0000000001', '2'])
+    assert mock_get.call_count == 2, '모두 찾으면 남은 페이지 미조회'
+    assert mock_get.call_args_list[0].kwargs['headers'].get('tr_cont') is None
+    assert mock_get.call_args_list[1].kwargs['headers']['tr_cont'] == 'N', '연속 조회 헤더'
+    assert mock_get.call_args_list[1].kwargs['params']['CTX_AREA_NK100'] == 'N1'
+    assert fills['2'] == {'ticker': '000660', 'order_quantity': 3, 'filled_quantity': 1,
+                          'remaining_quantity': 2, 'avg_price': 20100.5}
+    assert fills['1']['filled_quantity'] == 0 and fills['1']['avg_price'] is None
+    assert '99' not in fills, '대상이 아닌 주문은 제외'
+    print('✅ 4-2 fetch_daily_order_fills: 페이지 순회 1회, 모두 찾으면 조기 종료')
+
+
+# ---------------------------------------------------------------------------- #
+# 세트 5 — keep-alive 세션 풀                                                      #
+# ---------------------------------------------------------------------------- #
+
+def test_session_is_shared_across_calls():
+    """5-1. _get/_post/issue_hashkey가 같은 세션 인스턴스를 재사용 (핸드셰이크 1회)."""
+    c = _make_client()
+    session = c.session
+    assert c.session is session, 'session 프로퍼티는 동일 인스턴스를 반환해야 함'
+    with patch.object(session, 'get', return_value=_ok_response({'rt_cd': '0'})) as mock_get, \
+         patch.object(session, 'post', return_value=_ok_response({'rt_cd': '0', 'HASH': 'H'})) as mock_post:
+        c._get('uapi/a', 'TR_A', {})
+        c._get('uapi/b', 'TR_B', {})
+        c._post('uapi/c', 'TR_C', {})
+        assert c.issue_hashkey({'k': 'v'}) == 'H'
+    assert mock_get.call_count == 2
+    assert mock_post.call_count == 2
+    print('✅ 5-1 session: _get/_post/issue_hashkey 모두 단일 세션 공유')
+
+
+def test_build_http_session_pool_config():
+    """5-2. build_http_session: https 어댑터에 pool_maxsize 반영, 잘못된 값은 ValueError."""
+    session = build_http_session(pool_connections=1, pool_maxsize=4)
+    adapter = session.get_adapter('https://openapi.koreainvestment.com:9443/uapi')
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_connections == 1
+    assert adapter.max_retries.total == 0, '주문 중복 방지 — 자동 재시도 금지'
+    assert build_http_session().get_adapter('https://x')._pool_maxsize == DEFAULT_POOL_MAXSIZE
+    try:
+        build_http_session(pool_maxsize=0)
+    except ValueError:
+        print('✅ 5-2 build_http_session: 풀 크기 설정 반영 + 재시도 0 + 0 이하 거부')
+        return
+    raise AssertionError('ValueError가 발생하지 않음')
+
+
+def test_injected_session_and_close():
+    """5-3. 주입한 세션을 그대로 사용하고, close() 후에는 새 세션을 지연 생성."""
+    c = _make_client()
+    injected = MagicMock(spec=requests.Session)
+    c._session = injected
+    assert c.session is injected
+    c.close()
+    injected.close.assert_called_once()
+    assert c.session is not injected
+    print('✅ 5-3 session 주입 + close() 후 지연 재생성')
+
+
 # ---------------------------------------------------------------------------- #
 # Runner                                                                       #
 # ---------------------------------------------------------------------------- #
@@ -254,4 +332,8 @@ if __name__ == '__main__':
     test_get_json_skips_validation_when_disabled()
     test_post_json_skips_validation_for_orders()
     test_create_order_returns_dict_on_failure()
+    test_daily_order_fills_stops_paging_when_all_found()
+    test_session_is_shared_across_calls()
+    test_build_http_session_pool_config()
+    test_injected_session_and_close()
     print('\n🎉 모든 ARCH-005 HTTP 견고성 테스트 통과')
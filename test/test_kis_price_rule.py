@@ -0,0 +1,85 @@
+"""KRX 호가단위·가격제한폭 규칙(src/kis/price_rule.py) 단위 테스트.
+
+- tick_size: 가격대 경계값에서 호가단위 전환
+- round_down_to_tick: 호가단위 절사, 이미 유효 호가면 그대로
+- upper_limit_price: 기준가 × 1.3 절사 (KRX 상한가), 0 이하 가격 거부
+- KISClient.upper_limit_price: 시세 응답의 상한가 기록, 없으면 기준가로 산정
+
+실행: `uv run python -m test.test_kis_price_rule`
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.client import KISClient
+from src.kis.price_rule import round_down_to_tick, tick_size, upper_limit_price
+
+
+def test_tick_size_boundaries():
+    cases = {1_999: 1, 2_000: 5, 4_995: 5, 5_000: 10, 19_990: 10, 20_000: 50,
+             49_950: 50, 50_000: 100, 199_900: 100, 200_000: 500, 499_500: 500, 500_000: 1_000}
+    for price, tick in cases.items():
+        assert tick_size(price) == tick, (price, tick_size(price), tick)
+    print('✅ tick_size: 가격대 경계에서 호가단위 전환')
+
+
+def test_round_down_to_tick():
+    assert round_down_to_tick(12_345) == 12_340
+    assert round_down_to_tick(12_340) == 12_340, '유효 호가는 그대로'
+    assert round_down_to_tick(20_049) == 20_000, '경계 위 가격대 단위로 절사'
+    assert round_down_to_tick(123_456.7) == 123_400
+    print('✅ round_down_to_tick: 호가단위 절사')
+
+
+def test_upper_limit_price():
+    assert upper_limit_price(10_000) == 13_000
+    assert upper_limit_price(9_995) == 12_990, '12,993.5 → 12,990 (10원 단위 절사)'
+    assert upper_limit_price(55_300) == 71_800, '71,890 → 71,800 (100원 단위 절사)'
+    assert upper_limit_price(10_000, limit_ratio=0.0) == 10_000
+    for base in range(1_000, 600_000, 777):
+        limit = upper_limit_price(base)
+        assert limit <= base * 1.3 < limit + tick_size(limit) and limit % tick_size(limit) == 0
+    try:
+        upper_limit_price(0)
+    except ValueError:
+        print('✅ upper_limit_price: 기준가 × 1.3 호가 절사, 0 이하 거부')
+        return
+    raise AssertionError('ValueError가 발생하지 않음')
+
+
+def test_client_records_upper_limit_from_quotes():
+    """시세 응답의 상한가를 기록 — 당일 하락 종목도 현재가가 아닌 실제 상한가."""
+    c = KISClient.__new__(KISClient)
+    c.fetch_domestic_price = MagicMock(side_effect=lambda market, ticker: {'output': {
+        '005930': {'stck_prpr': '7000', 'stck_mxpr': '13000', 'stck_sdpr': '10000'},  # 당일 -30%
+        '000660': {'stck_prpr': '9000', 'stck_sdpr': '10000'},                        # 상한가 필드 없음
+        '035720': {'stck_prpr': '9000'},
+    }[ticker]})
+    for ticker in ('005930', '000660', '035720'):
+        c.fetch_price(ticker)
+    assert c.upper_limit_price('005930') == 13_000, '현재가 × 1.3(9,100)이 아닌 상한가'
+    assert c.upper_limit_price('000660') == 13_000, '상한가 없으면 기준가로 산정'
+    assert c.upper_limit_price('035720') is None, '상한가·기준가 모두 없으면 미기록 → KIS 조회'
+    assert c.upper_limit_price('999999') is None
+
+    c.mock = False
+    c._get_json = MagicMock(return_value={'rt_cd': '0', 'output': [
+        {'inter_shrn_iscd': '379800', 'inter2_prpr': '12000', 'inter2_mxpr': '15600'},
+        {'inter_shrn_iscd': '449170', 'inter2_prpr': '8000', 'inter2_prdy_clpr': '9995'},
+    ]})
+    c.fetch_prices(['379800', '449170'])
+    assert c.upper_limit_price('379800') == 15_600
+    assert c.upper_limit_price('449170') == 12_990, '멀티 응답에 상한가가 없으면 전일 종가로 산정'
+    print('✅ KISClient.upper_limit_price: 시세 응답의 상한가 기록 (없으면 기준가·전일 종가로 산정)')
+
+
+if __name__ == '__main__':
+    test_tick_size_boundaries()
+    test_round_down_to_tick()
+    test_upper_limit_price()
+    test_client_records_upper_limit_from_quotes()
+    print('\n전체 테스트 통과')
@@ -0,0 +1,136 @@
+"""QuoteCache + KISClient 시세 캐시 단위 테스트.
+
+가짜 시계로 실제 대기 없이 다음을 검증한다:
+- TTL 이내 재조회는 hit, 만료 후 miss (hit/miss 카운터)
+- max_entries 초과 시 LRU 축출, ttl_seconds=0이면 비활성
+- invalidate: endpoint/ticker 조건부·전체 제거
+- KISClient: fetch_price / fetch_domestic_enable_buy 반복 호출 시 네트워크 1회
+- KISClient: create_domestic_order 직후 캐시 전체 무효화 (전송 실패 시에도)
+
+실행: `uv run python -m test.test_kis_quote_cache`
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.cache import QuoteCache
+from src.kis.client import KISAPIError, KISClient
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_client(clock: _FakeClock) -> KISClient:
+    c = KISClient.__new__(KISClient)  # __init__ 스킵
+    c.acc_no_prefix = '00000000'
+    c.acc_no_postfix = '01'
+    c.mock = False
+    c._quote_cache = QuoteCache(ttl_seconds=5, clock=clock)
+    return c
+
+
+def test_ttl_hit_then_expire():
+    clock = _FakeClock()
+    cache = QuoteCache(ttl_seconds=5, clock=clock)
+    fetch = MagicMock(return_value=100.0)
+    assert cache.get_or_fetch('price', 'A', fetch) == 100.0
+    clock.now = 4.9
+    assert cache.get_or_fetch('price', 'A', fetch) == 100.0
+    assert fetch.call_count == 1, 'TTL 이내 재조회는 hit'
+    clock.now = 5.0
+    cache.get_or_fetch('price', 'A', fetch)
+    assert fetch.call_count == 2, 'TTL 만료 후 재조회'
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 1}, cache.stats()
+    print('✅ QuoteCache: TTL 이내 hit, 만료 후 miss')
+
+
+def test_size_bound_lru_and_disabled():
+    cache = QuoteCache(ttl_seconds=60, max_entries=2, clock=_FakeClock())
+    cache.set('price', 'A', 1)
+    cache.set('price', 'B', 2)
+    assert cache.get('price', 'A') == 1      # A를 최근 사용으로
+    cache.set('price', 'C', 3)               # 가장 오래된 B 축출
+    assert cache.get('price', 'B') is None
+    assert cache.get('price', 'A') == 1 and cache.get('price', 'C') == 3
+
+    disabled = QuoteCache(ttl_seconds=0)
+    disabled.set('price', 'A', 1)
+    assert disabled.get('price', 'A') is None
+    print('✅ QuoteCache: max_entries LRU 축출, ttl_seconds=0 비활성')
+
+
+def test_invalidate_filters():
+    cache = QuoteCache(ttl_seconds=60, clock=_FakeClock())
+    cache.set('price', 'A', 1)
+    cache.set('price', 'B', 2)
+    cache.set('inquire-psbl-sell', 'A', {'ord_psbl_qty': '3'})
+    cache.invalidate(ticker='A')
+    assert cache.stats()['size'] == 1
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
+    print('✅ QuoteCache: 조건부·전체 invalidate')
+
+
+def test_invalid_config_rejected():
+    for kwargs in ({'ttl_seconds': -1}, {'max_entries': 0}):
+        try:
+            QuoteCache(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'{kwargs}가 통과됨')
+    print('✅ QuoteCache: 비정상 설정 ValueError')
+
+
+def test_client_reuses_quotes_within_ttl():
+    clock = _FakeClock()
+    c = _make_client(clock)
+    c.fetch_domestic_price = MagicMock(return_value={'output': {'stck_prpr': '12345'}})
+    c._get_json = MagicMock(return_value={'rt_cd': '0', 'output': {'psbl_qty_calc_unpr': '12400'}})
+    for _ in range(3):
+        assert c.fetch_price('379800') == 12345.0
+        assert c.fetch_domestic_enable_buy('379800')['psbl_qty_calc_unpr'] == '12400'
+    assert c.fetch_domestic_price.call_count == 1
+    assert c._get_json.call_count == 1
+    # 지정가 조회는 캐시하지 않음
+    c.fetch_domestic_enable_buy('379800', ord_dvsn='00', price=12000)
+    assert c._get_json.call_count == 2
+    print(f'✅ KISClient: TTL 이내 시세·주문가능 재조회는 캐시 사용 ({c.quote_cache.stats()})')
+
+
+def test_client_order_invalidates_cache():
+    clock = _FakeClock()
+    c = _make_client(clock)
+    c.auth_config = MagicMock()
+    c.quote_cache.set('inquire-psbl-sell', '379800', {'ord_psbl_qty': '10'})
+    c.issue_hashkey = MagicMock(return_value='hash')
+    c._post_json = MagicMock(return_value={'rt_cd': '0', 'msg1': 'ok'})
+    c.create_domestic_order('sell', '379800', ord_qty=10, ord_dvsn='01')
+    assert c.quote_cache.stats()['size'] == 0, '주문 후 캐시 전체 무효화'
+
+    c.quote_cache.set('price', '379800', 1.0)
+    c._post_json = MagicMock(side_effect=KISAPIError('KIS POST 요청 실패: Timeout'))
+    try:
+        c.create_domestic_order('buy', '379800', ord_qty=1, ord_dvsn='01')
+    except KISAPIError:
+        pass
+    assert c.quote_cache.stats()['size'] == 0, '전송 실패 시에도 무효화 (체결 여부 불명)'
+    print('✅ KISClient: create_domestic_order 직후 캐시 무효화 (실패 포함)')
+
+
+if __name__ == '__main__':
+    test_ttl_hit_then_expire()
+    test_size_bound_lru_and_disabled()
+    test_invalidate_filters()
+    test_invalid_config_rejected()
+    test_client_reuses_quotes_within_ttl()
+    test_client_order_invalidates_cache()
+    print('\n전체 테스트 통과')
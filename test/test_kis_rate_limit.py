@@ -0,0 +1,147 @@
+"""KIS token bucket rate limiter 단위 테스트.
+
+가짜 시계(clock/sleep 주입)로 실제 대기 없이 다음을 검증한다:
+- burst까지는 즉시 통과, 초과분은 (부족 토큰 / rate)초 대기
+- endpoint_weights: path별 소비 토큰 수 반영
+- state_file: 두 limiter 인스턴스(=두 프로세스)가 한 버킷 예산을 공유
+- 손상된 상태 파일은 가득 찬 버킷으로 초기화
+- KISClient._get/_post/issue_hashkey가 요청 직전 limiter.acquire(path) 호출
+
+실행: `uv run python -m test.test_kis_rate_limit`
+"""
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.kis.rate_limit import KISRateLimiter
+
+
+class _FakeClock:
+    """time.time/time.sleep 대체. sleep은 시계를 앞으로 돌리기만 한다."""
+
+    def __init__(self, start: float = 1_000.0) -> None:
+        self.now = start
+        self.sleeps = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _make_limiter(clock: _FakeClock, **kwargs) -> KISRateLimiter:
+    return KISRateLimiter(clock=clock.time, sleep=clock.sleep, **kwargs)
+
+
+def test_burst_then_paced():
+    """burst=2, rate=10/s: 처음 2건 즉시, 3번째는 0.1초 대기."""
+    clock = _FakeClock()
+    limiter = _make_limiter(clock, rate_per_second=10, burst=2)
+    assert limiter.acquire('uapi/a') == 0.0
+    assert limiter.acquire('uapi/a') == 0.0
+    waited = limiter.acquire('uapi/a')
+    assert abs(waited - 0.1) < 1e-9, f'0.1초 대기 기대, 실제 {waited}'
+    print('✅ rate limit: burst 즉시 통과 후 rate 간격으로 대기')
+
+
+def test_one_second_window_never_exceeds_quota():
+    """기본값(rate 18 + burst 2)으로 1초 구간 요청 수가 KIS 한도 20을 넘지 않음."""
+    clock = _FakeClock()
+    limiter = _make_limiter(clock)
+    start = clock.now
+    count = 0
+    while True:
+        limiter.acquire('uapi/x')
+        if clock.now - start >= 1.0:
+            break
+        count += 1
+    assert count <= 20, f'1초 내 {count}건 — 한도 20 초과'
+    assert count >= 19, f'1초 내 {count}건 — 한도까지 활용하지 못함'
+    print(f'✅ rate limit: 1초 구간 {count}건 (한도 20 이내, 한도 근접 활용)')
+
+
+def test_endpoint_weight():
+    """가중치 2인 path는 토큰 2개 소비."""
+    clock = _FakeClock()
+    limiter = _make_limiter(
+        clock, rate_per_second=10, burst=2,
+        endpoint_weights={'uapi/heavy': 2},
+    )
+    assert limiter.acquire('uapi/heavy') == 0.0
+    waited = limiter.acquire('uapi/light')
+    assert abs(waited - 0.1) < 1e-9, '무거운 호출이 버킷을 비웠으므로 대기 필요'
+    print('✅ rate limit: endpoint_weights 반영')
+
+
+def test_invalid_config_rejected():
+    for kwargs in ({'rate_per_second': 0}, {'burst': 0}, {'burst': 2, 'endpoint_weights': {'x': 3}}):
+        try:
+            KISRateLimiter(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'{kwargs}가 통과됨')
+    print('✅ rate limit: 비정상 설정 ValueError')
+
+
+def test_state_file_shared_between_instances():
+    """같은 state_file을 쓰는 두 limiter(= 두 프로세스)는 한 예산을 공유."""
+    clock = _FakeClock()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = Path(tmpdir) / 'kis_token_ratelimit_test.json'
+        a = _make_limiter(clock, rate_per_second=10, burst=2, state_file=state_file)
+        b = _make_limiter(clock, rate_per_second=10, burst=2, state_file=state_file)
+        assert a.acquire() == 0.0
+        assert b.acquire() == 0.0
+        waited = a.acquire()
+        assert abs(waited - 0.1) < 1e-9, f'공유 버킷 소진 → 대기 기대, 실제 {waited}'
+        assert state_file.exists()
+    print('✅ rate limit: state_file로 인스턴스 간 버킷 공유')
+
+
+def test_corrupted_state_file_resets():
+    clock = _FakeClock()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = Path(tmpdir) / 'state.json'
+        state_file.write_text('{ not json', encoding='utf-8')
+        limiter = _make_limiter(clock, rate_per_second=10, burst=2, state_file=state_file)
+        assert limiter.acquire() == 0.0
+    print('✅ rate limit: 손상된 상태 파일 → 초기화 후 정상 동작')
+
+
+def test_kis_client_throttles_before_request():
+    """KISClient._get/_post/issue_hashkey는 HTTP 전송 전에 rate_limiter.acquire(path)를 호출."""
+    from src.kis.client import KISClient
+    c = KISClient.__new__(KISClient)
+    c.base_url = 'https://openapi.koreainvestment.com:9443'
+    c.access_token = 'Bearer dummy'
+    c.auth_config = MagicMock()
+    c.rate_limiter = MagicMock()
+    resp = MagicMock()
+    resp.raise_for_status.return_value = None
+    resp.json.return_value = {'HASH': 'dummy-hash'}
+    with patch.object(c.session, 'get', return_value=resp), \
+         patch.object(c.session, 'post', return_value=resp):
+        c._get('uapi/get-path', 'TR', {})
+        c._post('uapi/post-path', 'TR', {})
+        assert c.issue_hashkey({'PDNO': '005930'}) == 'dummy-hash'
+    called_paths = [call.args[0] for call in c.rate_limiter.acquire.call_args_list]
+    assert called_paths == ['uapi/get-path', 'uapi/post-path', 'uapi/hashkey'], called_paths
+    print('✅ KISClient: _get/_post/issue_hashkey 전송 전 rate_limiter.acquire(path) 호출')
+
+
+if __name__ == '__main__':
+    test_burst_then_paced()
+    test_one_second_window_never_exceeds_quota()
+    test_endpoint_weight()
+    test_invalid_config_rejected()
+    test_state_file_shared_between_instances()
+    test_corrupted_state_file_resets()
+    test_kis_client_throttles_before_request()
+    print('\n전체 테스트 통과')
@@ -124,7 +124,7 @@ def test_issue_access_token_writes_json_without_app_key_or_secret():
         'access_token': 'NEW_TOKEN',
         'access_token_token_expired': '2099-12-31 23:59:59',
     }
-    with patch('src.kis.client.requests.post', return_value=fake_resp):
+    with patch.object(c.session, 'post', return_value=fake_resp):
         c.issue_access_token()
 
     # 파일이 JSON으로 저장됨
@@ -158,7 +158,7 @@ def test_issue_access_token_chmod_token_file_to_0600():
     fake_resp.json.return_value = {
         'access_token': 'TOK', 'access_token_token_expired': '2099-12-31 23:59:59',
     }
-    with patch('src.kis.client.requests.post', return_value=fake_resp):
+    with patch.object(c.session, 'post', return_value=fake_resp):
         c.issue_access_token()
 
     import stat
@@ -201,7 +201,7 @@ def test_initialize_recovers_from_corrupted_cache():
         'access_token': 'RECOVERED_TOKEN',
         'access_token_token_expired': '2099-12-31 23:59:59',
     }
-    with patch('src.kis.client.requests.post', return_value=fake_resp):
+    with patch.object(c.session, 'post', return_value=fake_resp):
         c.initialize_access_token()
 
     assert c.access_token == 'Bearer RECOVERED_TOKEN', '손상 캐시 → 재발급 → load 흐름 통과'
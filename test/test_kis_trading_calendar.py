@@ -0,0 +1,135 @@
+"""TradingCalendar(거래일 캘린더 캐시) 단위 테스트.
+
+가짜 fetch_holiday(CTCA0903R 응답 형식)와 임시 디렉터리 저장소로 다음을 검증한다:
+- is_trading_day: 종전 판정(opnd_yn='Y' and sttl_day_yn='Y')과 동일, 같은 달 재조회 0회
+- 영속 캐시: 새 인스턴스(새 프로세스)도 저장된 월 파일로 네트워크 호출 없이 판정
+- 증분 갱신: refresh_days 경과한 진행 중인 달은 재조회, 지난 달은 확정으로 재조회 없음
+- next_trading_day / settlement_date(T+2): 주말·공휴일 건너뜀
+- KISClient.is_trading_day → trading_calendar 위임
+- 기본 today는 KST (UTC 컨테이너에서 00~09시 KST에도 당일)
+
+실행: `uv run python -m test.test_kis_trading_calendar`
+"""
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+import src.kis.calendar as calendar_module
+from src.kis.calendar import LocalCalendarStore, TradingCalendar, kst_today
+
+# 2026-09-24(목)~26(토) 추석 연휴 가정 + 주말 휴장.
+_HOLIDAYS = {date(2026, 9, 24), date(2026, 9, 25)}
+
+
+def _fake_fetch_holiday(days: int = 25):
+    """base_dt부터 days일치 응답을 돌려주는 가짜 fetch_holiday. 호출 내역은 .calls에 기록."""
+    calls = []
+
+    def _fetch(base_dt: str) -> list:
+        calls.append(base_dt)
+        start = date(int(base_dt[:4]), int(base_dt[4:6]), int(base_dt[6:]))
+        rows = []
+        for i in range(days):
+            d = start + timedelta(days=i)
+            is_open = d.weekday() < 5 and d not in _HOLIDAYS
+            yn = 'Y' if is_open else 'N'
+            rows.append({'bass_dt': d.strftime('%Y%m%d'), 'wday_dvsn_cd': str((d.weekday() + 1) % 7 + 1),
+                         'bzdy_yn': yn, 'tr_day_yn': yn, 'opnd_yn': yn, 'sttl_day_yn': yn})
+        return rows
+
+    _fetch.calls = calls
+    return _fetch
+
+
+def test_is_trading_day_matches_legacy_and_memoizes():
+    fetch = _fake_fetch_holiday()
+    cal = TradingCalendar(fetch, today=lambda: date(2026, 9, 21))
+    assert cal.is_trading_day(date(2026, 9, 21)) is True     # 월
+    assert cal.is_trading_day(date(2026, 9, 24)) is False    # 추석
+    assert cal.is_trading_day(date(2026, 9, 26)) is False    # 토
+    assert cal.is_trading_day(date(2026, 9, 29)) is True
+    assert fetch.calls == ['20260921'], f'같은 구간은 1회 조회, 실제 {fetch.calls}'
+    print('✅ 캘린더: 종전 판정과 동일 + 응답 구간 재조회 0회')
+
+
+def test_persistent_store_serves_new_instance_without_network():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalCalendarStore(Path(tmp))
+        TradingCalendar(_fake_fetch_holiday(), store=store, today=lambda: date(2026, 9, 21)).is_trading_day(date(2026, 9, 22))
+        assert (Path(tmp) / 'trading_calendar_202609.json').exists()
+        assert (Path(tmp) / 'trading_calendar_202610.json').exists(), '응답이 걸친 다음 달도 저장'
+
+        fetch = _fake_fetch_holiday()
+        cal = TradingCalendar(fetch, store=store, today=lambda: date(2026, 9, 23))
+        assert cal.is_trading_day(date(2026, 9, 23)) is True
+        assert cal.is_trading_day(date(2026, 10, 2)) is True
+        assert fetch.calls == [], f'저장된 월 파일로 판정 → 호출 0회, 실제 {fetch.calls}'
+    print('✅ 캘린더: 월 파일 영속 캐시 → 새 프로세스도 네트워크 호출 0회')
+
+
+def test_stale_current_month_refreshes_but_past_month_does_not():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalCalendarStore(Path(tmp))
+        TradingCalendar(_fake_fetch_holiday(days=45), store=store, today=lambda: date(2026, 8, 20)).is_trading_day(date(2026, 8, 20))
+
+        # 10일 뒤(refresh_days=7 경과): 8월 중 남은 날이 있으므로 재조회
+        fetch = _fake_fetch_holiday()
+        cal = TradingCalendar(fetch, store=store, today=lambda: date(2026, 8, 30))
+        cal.is_trading_day(date(2026, 8, 31))
+        assert fetch.calls == ['20260830'], f'오늘 이후 구간만 재조회, 실제 {fetch.calls}'
+
+        # 9월 말 기준 8월은 확정된 과거 → 재조회 없음
+        fetch = _fake_fetch_holiday()
+        cal = TradingCalendar(fetch, store=store, today=lambda: date(2026, 9, 30))
+        assert cal.is_trading_day(date(2026, 8, 31)) is True
+        assert fetch.calls == []
+    print('✅ 캘린더: 진행 중인 달은 refresh_days 경과 시 증분 재조회, 지난 달은 확정')
+
+
+def test_next_trading_day_and_settlement_date():
+    cal = TradingCalendar(_fake_fetch_holiday(), today=lambda: date(2026, 9, 21))
+    assert cal.next_trading_day(date(2026, 9, 23)) == date(2026, 9, 28), '추석(24·25)+주말 건너뜀'
+    assert cal.settlement_date(date(2026, 9, 22)) == date(2026, 9, 28), 'T+2: 23일, 28일'
+    assert cal.settlement_date(date(2026, 9, 21), days=1) == date(2026, 9, 22)
+    print('✅ 캘린더: next_trading_day / settlement_date(T+2) 휴장일 건너뜀')
+
+
+def test_client_delegates_to_calendar():
+    from src.kis.client import KISClient
+    c = KISClient.__new__(KISClient)  # __init__ 스킵
+    c.fetch_holiday = MagicMock(side_effect=_fake_fetch_holiday())
+    c._trading_calendar = TradingCalendar(c.fetch_holiday, today=lambda: date(2026, 9, 21))
+    assert c.is_trading_day(date(2026, 9, 21)) is True
+    assert c.is_trading_day(date(2026, 9, 22)) is True
+    assert c.fetch_holiday.call_count == 1
+    assert c.next_trading_day(date(2026, 9, 23)) == date(2026, 9, 28)
+    print('✅ KISClient: is_trading_day → trading_calendar 위임 (1회 조회)')
+
+
+def test_default_today_is_kst():
+    class _UTCClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            # UTC 2026-09-21 16:00 = KST 2026-09-22 01:00
+            return datetime(2026, 9, 21, 16, 0, tzinfo=timezone.utc).astimezone(tz)
+
+    with patch.object(calendar_module, 'datetime', _UTCClock):
+        assert kst_today() == date(2026, 9, 22)
+        assert TradingCalendar(_fake_fetch_holiday())._today() == date(2026, 9, 22)
+    print('✅ 캘린더: 기본 today는 KST (UTC 16시 → KST 다음날)')
+
+
+if __name__ == '__main__':
+    test_is_trading_day_matches_legacy_and_memoizes()
+    test_persistent_store_serves_new_instance_without_network()
+    test_stale_current_month_refreshes_but_past_month_does_not()
+    test_next_trading_day_and_settlement_date()
+    test_client_delegates_to_calendar()
+    test_default_today_is_kst()
+    print('\n전체 테스트 통과')
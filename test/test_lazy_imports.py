@@ -0,0 +1,46 @@
+"""무거운 외부 SDK 지연 import 회귀 테스트.
+
+main.py를 새 인터프리터에서 import한 직후 google-cloud-bigquery·gspread·slack_sdk가
+로드되지 않았는지 확인한다 (--test·IRP 실행이 쓰지 않는 SDK 로딩 비용 제거).
+실제 사용 시점(클라이언트 생성·발송)에는 정상 import되는지도 확인.
+
+실행: `uv run python -m test.test_lazy_imports`
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+HEAVY_MODULES = ('google.cloud.bigquery', 'gspread', 'slack_sdk')
+
+
+def _loaded_after(code: str) -> list:
+    probe = code + f"\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, '-c', probe], cwd=project_root, capture_output=True, text=True, check=True,
+    ).stdout.strip().splitlines()
+    return [m for m in (out[-1] if out else '').split(',') if m]
+
+
+def test_main_import_does_not_load_heavy_sdks():
+    loaded = _loaded_after('import main')
+    assert loaded == [], f'main import 시 무거운 SDK 로드됨: {loaded}'
+    print('✅ lazy import: main import 시 bigquery/gspread/slack_sdk 미로드')
+
+
+def test_slack_client_loads_sdk_on_first_use():
+    loaded = _loaded_after(
+        "import os\nos.environ.setdefault('SLACK_BOT_TOKEN', 'xoxb-test')\n"
+        "from src.slack.client import SlackClient\nSlackClient().client"
+    )
+    assert loaded == ['slack_sdk'], loaded
+    print('✅ lazy import: SlackClient.client 첫 접근 시 slack_sdk 로드')
+
+
+if __name__ == '__main__':
+    test_main_import_does_not_load_heavy_sdks()
+    test_slack_client_loads_sdk_on_first_use()
+    print('\n전체 테스트 통과')
@@ -2,7 +2,7 @@
 
 검증:
 - ARCH-002: --force일 때 is_market_open/is_already_executed 외부 호출 자체를 건너뛴다.
-- ARCH-003: 실행 시 run_id가 발급되고 BQ marker(started/completed) + trade_log에 동일 run_id로 그룹.
+- ARCH-003: 실행 시 run_id가 발급되고 run_state(started→completed) + trade_log에 동일 run_id로 그룹.
 - IRP·is_test 케이스에서 BQ 호출 스킵 회귀.
 
 main.py를 직접 import해 main()을 호출 — 외부 I/O는 모두 모킹.
@@ -35,7 +35,13 @@ def _mock_main_dependencies(account_type: str = 'ISA', acc_no_postfix: str = '01
 
     # BigQueryClient
     mock_bq = MagicMock()
-    mock_bq.is_already_executed.return_value = False
+
+    # RunStateStore (중복 실행 방지 상태 저장소)
+    mock_state = MagicMock()
+    mock_state.is_already_executed.return_value = False
+
+    # 실행 저널: 기본은 재개할 저널 없음 + 새 저널은 mock
+    mock_journal = MagicMock()
 
     # StaticAllocator
     mock_allocator = MagicMock()
@@ -56,24 +62,31 @@ def _mock_main_dependencies(account_type: str = 'ISA', acc_no_postfix: str = '01
     # 가짜 args
     fake_args = MagicMock()
     fake_args.account_type = account_type
+    fake_args.account_types = None
     fake_args.test = args_test
     fake_args.force = args_force
 
     return {
-        'mock_gs': mock_gs, 'mock_bq': mock_bq,
+        'mock_gs': mock_gs, 'mock_bq': mock_bq, 'mock_state': mock_state, 'mock_kis': MagicMock(),
+        'mock_journal': mock_journal, 'unfinished_journal': None,
         'mock_allocator': mock_allocator, 'fake_args': fake_args,
     }
 
 
 def _run_main_with_mocks(deps: dict):
-    """main()을 deps 모킹과 함께 호출."""
+    """main()을 deps 모킹과 함께 호출. StaticAllocator 생성자 mock을 반환."""
     import main as main_module
     with patch.object(main_module, 'GoogleSheetsClient', return_value=deps['mock_gs']), \
          patch.object(main_module, 'BigQueryClient', return_value=deps['mock_bq']), \
-         patch.object(main_module, 'StaticAllocator', return_value=deps['mock_allocator']), \
-         patch.object(main_module, 'slack_notify'), \
+         patch.object(main_module, 'make_run_state_store', return_value=deps['mock_state']), \
+         patch.object(main_module, 'find_unfinished_journal', return_value=deps['unfinished_journal']), \
+         patch.object(main_module, 'open_journal', return_value=deps['mock_journal']), \
+         patch.object(main_module, 'StaticAllocator', return_value=deps['mock_allocator']) as allocator_cls, \
+         patch.object(main_module, 'KISClient', return_value=deps['mock_kis']), \
+         patch.object(main_module, 'slack_notify', deps.setdefault('notify', MagicMock())), \
          patch.object(main_module, '_parse_args', return_value=deps['fake_args']):
         main_module.main()
+    return allocator_cls
 
 
 # ---------------------------------------------------------------------------- #
@@ -88,7 +101,7 @@ def test_force_skips_is_trading_day_and_is_already_executed():
     # 핵심: 외부 조회 메서드는 한 번도 호출되면 안 됨
     assert deps['mock_allocator'].is_trading_day.call_count == 0, \
         '--force 시 is_trading_day 호출 금지'
-    assert deps['mock_bq'].is_already_executed.call_count == 0, \
+    assert deps['mock_state'].is_already_executed.call_count == 0, \
         '--force 시 is_already_executed 호출 금지 (외부 BQ 트래픽 절약)'
     # allocator.run은 정상 호출됨
     assert deps['mock_allocator'].run.call_count == 1
@@ -101,7 +114,7 @@ def test_test_mode_skips_only_is_already_executed():
     _run_main_with_mocks(deps)
 
     assert deps['mock_allocator'].is_trading_day.call_count == 1, '--test 시도 is_trading_day는 호출'
-    assert deps['mock_bq'].is_already_executed.call_count == 0, '--test 시 BQ 조회 금지'
+    assert deps['mock_state'].is_already_executed.call_count == 0, '--test 시 BQ 조회 금지'
     print('✅ --test: is_trading_day 호출 + is_already_executed 스킵')
 
 
@@ -111,7 +124,7 @@ def test_normal_mode_calls_both_external_checks():
     _run_main_with_mocks(deps)
 
     assert deps['mock_allocator'].is_trading_day.call_count == 1
-    assert deps['mock_bq'].is_already_executed.call_count == 1, \
+    assert deps['mock_state'].is_already_executed.call_count == 1, \
         '일반 모드는 BQ 중복 체크 필수'
     print('✅ 일반 모드: is_trading_day + is_already_executed 모두 호출 (회귀)')
 
@@ -122,7 +135,7 @@ def test_irp_skips_is_already_executed_even_without_force():
     _run_main_with_mocks(deps)
 
     assert deps['mock_allocator'].is_trading_day.call_count == 1, 'IRP도 is_trading_day는 호출'
-    assert deps['mock_bq'].is_already_executed.call_count == 0, 'IRP는 BQ 조회 스킵 (회귀)'
+    assert deps['mock_state'].is_already_executed.call_count == 0, 'IRP는 BQ 조회 스킵 (회귀)'
     print('✅ IRP: is_already_executed 호출 0 (회귀)')
 
 
@@ -131,15 +144,15 @@ def test_irp_skips_is_already_executed_even_without_force():
 # ---------------------------------------------------------------------------- #
 
 def test_run_id_propagates_to_marker_and_trade_log():
-    """ISA 정상 흐름: run_id 발급 후 marker(started/completed) + trade_log 모두 동일 run_id로 적재."""
+    """ISA 정상 흐름: run_id 발급 후 run_state(started/completed) + trade_log 모두 동일 run_id로 적재."""
     deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
     _run_main_with_mocks(deps)
 
-    bq = deps['mock_bq']
+    bq, state = deps['mock_bq'], deps['mock_state']
     # marker 호출 2회: started + completed
-    assert bq.append_run_marker.call_count == 2, f'marker 2회(started+completed) 기대, 실제 {bq.append_run_marker.call_count}'
-    started_call = bq.append_run_marker.call_args_list[0]
-    completed_call = bq.append_run_marker.call_args_list[1]
+    assert state.mark_run.call_count == 2, f'marker 2회(started+completed) 기대, 실제 {state.mark_run.call_count}'
+    started_call = state.mark_run.call_args_list[0]
+    completed_call = state.mark_run.call_args_list[1]
     assert started_call.kwargs.get('status') == 'started' or 'started' in started_call.args, \
         f'첫 marker는 started여야 함, 실제 {started_call}'
     assert completed_call.kwargs.get('status') == 'completed' or 'completed' in completed_call.args, \
@@ -165,7 +178,7 @@ def test_irp_skips_run_marker_and_trade_log():
     _run_main_with_mocks(deps)
 
     bq = deps['mock_bq']
-    assert bq.append_run_marker.call_count == 0, 'IRP는 run_marker 적재 금지'
+    assert deps['mock_state'].mark_run.call_count == 0, 'IRP는 run_marker 적재 금지'
     assert bq.append_trade_log.call_count == 0, 'IRP는 trade_log 적재 금지'
     # IRP는 Sheets에 IRP_action_plan 덮어쓰기
     assert deps['mock_gs'].overwrite_dataframe.call_count == 1
@@ -180,11 +193,224 @@ def test_test_mode_skips_run_marker():
     _run_main_with_mocks(deps)
 
     bq = deps['mock_bq']
-    assert bq.append_run_marker.call_count == 0, '--test에서는 run_marker 적재 금지'
+    assert deps['mock_state'].mark_run.call_count == 0, '--test에서는 run_marker 적재 금지'
     assert bq.append_trade_log.call_count == 0
     print('✅ --test: run_marker / trade_log 적재 0')
 
 
+# ---------------------------------------------------------------------------- #
+# 멀티 계좌 배치 (--account_types)                                               #
+# ---------------------------------------------------------------------------- #
+
+def _run_batch_with_mocks(account_types: list, allocators: dict, deps: dict = None, kis_factory=None):
+    """--account_types 모드로 main() 호출. (mock_gs, mock_bq, slack_notify, BigQueryClient, KISClient) mock 반환.
+
+    kis_factory: 계좌별 KISClient 대체 (기본: 계좌명 MagicMock).
+    """
+    import main as main_module
+    deps = deps or _mock_main_dependencies()
+    deps['notify'] = MagicMock()
+    deps['fake_args'].account_type = None
+    deps['fake_args'].account_types = account_types
+    with patch.object(main_module, 'GoogleSheetsClient', return_value=deps['mock_gs']), \
+         patch.object(main_module, 'BigQueryClient', return_value=deps['mock_bq']) as bq_cls, \
+         patch.object(main_module, 'make_run_state_store', return_value=deps['mock_state']), \
+         patch.object(main_module, 'find_unfinished_journal', return_value=None), \
+         patch.object(main_module, 'open_journal', side_effect=lambda account_type, run_id: MagicMock(name=f'journal:{account_type}')), \
+         patch.object(main_module, 'StaticAllocator', side_effect=lambda account_type, **kw: allocators[account_type]), \
+         patch.object(main_module, 'KISClient', side_effect=kis_factory or (lambda account_type: MagicMock(name=account_type))) as kis_cls, \
+         patch.object(main_module, 'slack_notify', deps['notify']), \
+         patch.object(main_module, '_parse_args', return_value=deps['fake_args']):
+        main_module.main()
+    return deps['mock_gs'], deps['mock_bq'], deps['notify'], bq_cls, kis_cls
+
+
+def _batch_allocators(account_types: list) -> dict:
+    allocators = {}
+    for account_type in account_types:
+        postfix = '29' if account_type == 'IRP' else '01'
+        allocators[account_type] = _mock_main_dependencies(account_type, acc_no_postfix=postfix)['mock_allocator']
+    return allocators
+
+
+def test_batch_shares_clients_and_trading_day_check():
+    """공유: Sheets·BQ 클라이언트 1개, 거래일 조회 1회. 계좌별: KISClient·run()·중복 체크."""
+    account_types = ['ISA', 'PPA', 'IRP']
+    allocators = _batch_allocators(account_types)
+    deps = _mock_main_dependencies()
+    gs, bq, notify, bq_cls, kis_cls = _run_batch_with_mocks(account_types, allocators, deps=deps)
+
+    assert bq_cls.call_count == 1, 'BigQueryClient는 1개만 생성'
+    assert sorted(c.args[0] for c in kis_cls.call_args_list) == sorted(account_types), '계좌별 KISClient'
+    assert sum(a.is_trading_day.call_count for a in allocators.values()) == 1, '거래일 조회 1회'
+    assert all(a.run.call_count == 1 for a in allocators.values())
+    assert deps['mock_state'].is_already_executed.call_count == 2, 'ISA·PPA만 중복 체크 (IRP 스킵)'
+    assert gs.get_df_from_google_sheets.call_count == 3
+    assert gs.overwrite_dataframe.call_count == 1, 'IRP action plan만 Sheets 기록'
+    assert bq.append_trade_log.call_count == 2, 'IRP는 trade_log 미적재'
+    print('✅ 배치: 공유 Sheets/BQ/거래일 + 계좌별 동시 실행')
+
+
+def test_batch_sends_single_digest():
+    account_types = ['ISA', 'PPA']
+    _, _, notify, _, _ = _run_batch_with_mocks(account_types, _batch_allocators(account_types))
+
+    assert notify.call_count == 1, 'Slack 다이제스트 1건'
+    title, sections = notify.call_args.args
+    assert title == '[ISA,PPA] 리밸런싱 결과'
+    assert len(sections) == 2 and '[ISA]' in sections[0] and '[PPA]' in sections[1], '계좌 순서대로 섹션'
+    print('✅ 배치: 계좌별 요약을 Slack 다이제스트 1건으로 발송')
+
+
+def test_batch_failure_does_not_block_other_accounts():
+    """한 계좌 실패 → 나머지 계좌는 적재·발송 후, 마지막에 원래 예외 전파."""
+    account_types = ['ISA', 'PPA']
+    allocators = _batch_allocators(account_types)
+    allocators['ISA'].run.side_effect = ConnectionError('KIS down')
+    deps = _mock_main_dependencies()
+    try:
+        _run_batch_with_mocks(account_types, allocators, deps=deps)
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError('실패 계좌의 예외가 전파되어야 함')
+
+    assert allocators['PPA'].run.call_count == 1
+    trade_logs = deps['mock_bq'].append_trade_log.call_args_list
+    assert [c.kwargs['account_type'] for c in trade_logs] == ['PPA'], '성공 계좌만 trade_log 적재'
+    sections = deps['notify'].call_args.args[1]
+    assert '리밸런싱 실패' in sections[0] and 'KIS down' in sections[0]
+    print('✅ 배치: 한 계좌 실패가 다른 계좌 실행을 막지 않고, 예외는 마지막에 전파')
+
+
+def test_batch_init_failure_is_per_account():
+    """KIS 초기화·allocation 시트 조회 실패 → 그 계좌만 실패로 수집, 나머지는 실행·적재 후 예외 전파."""
+    account_types = ['ISA', 'PPA', 'IRP']
+    allocators = _batch_allocators(account_types)
+    deps = _mock_main_dependencies()
+    sheet = deps['mock_gs'].get_df_from_google_sheets.return_value
+
+    def _sheet(name):
+        if name == 'IRP_allocation':
+            raise KeyError('IRP_allocation 탭 없음')
+        return sheet.copy()
+
+    def _kis(account_type):
+        if account_type == 'ISA':
+            raise ConnectionError('ISA 토큰 발급 실패')
+        return MagicMock(name=account_type)
+
+    deps['mock_gs'].get_df_from_google_sheets.side_effect = _sheet
+    try:
+        _run_batch_with_mocks(account_types, allocators, deps=deps, kis_factory=_kis)
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError('초기화 실패 계좌의 예외가 전파되어야 함')
+
+    assert allocators['ISA'].run.call_count == 0 and allocators['IRP'].run.call_count == 0
+    assert allocators['PPA'].run.call_count == 1, '초기화에 성공한 계좌는 실행'
+    trade_logs = deps['mock_bq'].append_trade_log.call_args_list
+    assert [c.kwargs['account_type'] for c in trade_logs] == ['PPA']
+    sections = deps['notify'].call_args.args[1]
+    assert len(sections) == 3
+    assert '리밸런싱 실패' in sections[0] and '토큰 발급 실패' in sections[0]
+    assert '리밸런싱 실패' in sections[2] and 'IRP_allocation' in sections[2]
+    print('✅ 배치: 계좌별 초기화 실패는 그 계좌만 실패로 수집, 나머지 계좌는 실행')
+
+
+# ---------------------------------------------------------------------------- #
+# 시작 단계 동시 초기화                                                          #
+# ---------------------------------------------------------------------------- #
+
+def test_startup_injects_preinitialized_kis_client():
+    """동시 초기화한 KISClient·allocation을 StaticAllocator에 그대로 주입 (토큰 재확인 없음)."""
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    allocator_cls = _run_main_with_mocks(deps)
+
+    kwargs = allocator_cls.call_args.kwargs
+    assert kwargs['kis_client'] is deps['mock_kis'], 'main이 만든 KISClient를 주입해야 함'
+    assert kwargs['allocation_info']['weight'].dtype == float, 'allocation 시트 타입 변환 유지'
+    deps['mock_gs'].get_df_from_google_sheets.assert_called_once_with('ISA_allocation')
+    print('✅ startup: Sheets/BQ/KIS 동시 초기화 → StaticAllocator에 kis_client 주입')
+
+
+# ---------------------------------------------------------------------------- #
+# 결과 sink 파이프라인                                                            #
+# ---------------------------------------------------------------------------- #
+
+def test_failed_bigquery_sink_does_not_block_slack():
+    """BigQuery 적재 실패 → Slack은 그대로 발송, 모든 sink 종료 후 원래 예외 전파."""
+    import main as main_module
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    deps['mock_bq'].append_trade_log.side_effect = RuntimeError('BQ down')
+    with patch.dict(main_module._SINK_OPTIONS['bigquery'], max_attempts=1):
+        try:
+            _run_main_with_mocks(deps)
+        except RuntimeError as e:
+            assert 'BQ down' in str(e)
+        else:
+            raise AssertionError('BigQuery sink 실패가 전파되어야 함')
+    assert deps['notify'].call_count == 1, 'Slack sink는 정상 발송'
+    assert deps['mock_state'].mark_run.call_count == 1, 'trade_log 실패 시 completed 기록 없음 (started만)'
+    print('✅ sink: BigQuery 실패가 Slack 발송을 막지 않고, 예외는 마지막에 전파')
+
+
+def test_trade_log_uses_run_scoped_job_id():
+    """trade_log load job ID = run_id 기반 → sink 재시도 시 중복 적재 없음."""
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    _run_main_with_mocks(deps)
+
+    kwargs = deps['mock_bq'].append_trade_log.call_args.kwargs
+    assert kwargs['job_id'] == f"trade_log_{kwargs['run_id']}"
+    print('✅ sink: trade_log job_id = trade_log_{run_id}')
+
+
+# ---------------------------------------------------------------------------- #
+# 실행 저널 (크래시 재개)                                                          #
+# ---------------------------------------------------------------------------- #
+
+def test_journal_opened_with_run_id_and_completed_after_delivery():
+    """새 run: 저널 생성 → run(journal=...) → 결과 전달 후 complete."""
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    _run_main_with_mocks(deps)
+
+    deps['mock_allocator'].run.assert_called_once_with(journal=deps['mock_journal'])
+    assert deps['mock_journal'].complete.call_count == 1, '결과 전달 후 저널 종료'
+    print('✅ 저널: 새 run은 저널 생성 → run(journal=...) → 전달 후 complete')
+
+
+def test_unfinished_journal_resumes_without_guard():
+    """미완료 저널 → 중복 실행 확인·started 기록 없이 같은 run_id로 재개."""
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    unfinished = MagicMock(run_id='crashed_run')
+    deps['unfinished_journal'] = unfinished
+    deps['mock_state'].is_already_executed.return_value = True   # 30분 안 started → 종전에는 차단
+    _run_main_with_mocks(deps)
+
+    assert deps['mock_state'].is_already_executed.call_count == 0, '재개는 중복 실행 확인 생략'
+    deps['mock_allocator'].run.assert_called_once_with(journal=unfinished)
+    assert deps['mock_bq'].append_trade_log.call_args.kwargs['run_id'] == 'crashed_run'
+    statuses = [c.kwargs.get('status') for c in deps['mock_state'].mark_run.call_args_list]
+    assert statuses == ['completed'], f'started 재기록 없이 completed만, 실제 {statuses}'
+    assert unfinished.complete.call_count == 1
+    print('✅ 저널: 미완료 저널 재개 — 30분 대기 없이 같은 run_id로 이어서 실행')
+
+
+def test_failed_delivery_keeps_journal_for_resume():
+    """결과 전달 실패 → 저널 유지 (다음 실행이 주문 없이 결과 전달부터 재개)."""
+    import main as main_module
+    deps = _mock_main_dependencies(account_type='ISA', acc_no_postfix='01')
+    deps['mock_bq'].append_trade_log.side_effect = RuntimeError('BQ down')
+    with patch.dict(main_module._SINK_OPTIONS['bigquery'], max_attempts=1):
+        try:
+            _run_main_with_mocks(deps)
+        except RuntimeError:
+            pass
+    assert deps['mock_journal'].complete.call_count == 0, '전달 실패 시 저널 유지'
+    print('✅ 저널: 결과 전달 실패 시 저널 유지')
+
+
 if __name__ == '__main__':
     test_force_skips_is_trading_day_and_is_already_executed()
     test_test_mode_skips_only_is_already_executed()
@@ -193,4 +419,14 @@ if __name__ == '__main__':
     test_run_id_propagates_to_marker_and_trade_log()
     test_irp_skips_run_marker_and_trade_log()
     test_test_mode_skips_run_marker()
+    test_batch_shares_clients_and_trading_day_check()
+    test_batch_sends_single_digest()
+    test_batch_failure_does_not_block_other_accounts()
+    test_batch_init_failure_is_per_account()
+    test_startup_injects_preinitialized_kis_client()
+    test_failed_bigquery_sink_does_not_block_slack()
+    test_trade_log_uses_run_scoped_job_id()
+    test_journal_opened_with_run_id_and_completed_after_delivery()
+    test_unfinished_journal_resumes_without_guard()
+    test_failed_delivery_keeps_journal_for_resume()
     print('\n전체 테스트 통과')
@@ -0,0 +1,126 @@
+"""정수 주식 수 최적화(planner_mode='optimize') 단위 테스트.
+
+- 제약: 무작위 포트폴리오에서 buffer_cash 보존·매수 금액 ≤ safety_ratio × (현금 + 매도 대금)
+- 품질: 절사 방식보다 오차가 같거나 작음, 3종목 소규모 문제는 완전 탐색 최적과 비교
+- 끝수 예시: 절사는 현금이 남지만 최적화는 목표에 더 가깝게 배분
+- PortfolioPlanner 연동: 수량·방향만 바뀌고 목표·필요 금액 컬럼은 동일, 미등록 종목 전량 매도 유지
+
+실행: `uv run python -m test.test_optimizer`
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.optimizer import optimize_integer_lots, tracking_error
+from src.policy import ExecutionPolicy
+from test_planning_kernel import _mock_planner, _random_portfolio
+
+_BUFFER = 10_000
+_RATIO = 0.99
+
+
+def _random_problem(seed: int, n: int):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(5_000, 200_000, size=n).astype(float)
+    current = rng.integers(0, 20, size=n)
+    cash = float(rng.integers(0, 2_000_000))
+    budget = cash + current @ price - _BUFFER
+    target = rng.dirichlet(np.ones(n)) * rng.uniform(0.8, 1.0) * budget
+    return target, price, current, cash, budget
+
+
+def _check_constraints(q, price, current, cash, budget) -> None:
+    delta = (q - current) * price
+    buys, sells = delta[delta > 0].sum(), -delta[delta < 0].sum()
+    assert (q >= 0).all()
+    assert q @ price <= budget + 1e-6, 'buffer_cash 보존'
+    assert buys <= _RATIO * (cash + sells) + 1e-6, '매수 금액 ≤ safety_ratio × (현금 + 매도 대금)'
+
+
+def test_constraints_hold_and_never_worse_than_truncation():
+    for seed in range(30):
+        target, price, current, cash, budget = _random_problem(seed, n=20)
+        truncated = current + np.trunc((target - current * price) / price).astype(np.int64)
+        q = optimize_integer_lots(target, price, current, cash, budget, _RATIO, initial_quantity=truncated)
+        _check_constraints(q, price, current, cash, budget)
+        assert tracking_error(q, price, target) <= tracking_error(truncated, price, target) + 1e-6
+    print('✅ 최적화: 무작위 30개 — 제약 만족 + 절사 대비 오차 같거나 작음')
+
+
+def test_close_to_exhaustive_optimum_on_small_problems():
+    gaps = []
+    for seed in range(40):
+        target, price, current, cash, budget = _random_problem(seed, n=3)
+        q = optimize_integer_lots(target, price, current, cash, budget, _RATIO)
+        # 완전 탐색 (격자 전체를 배열로 한 번에 평가)
+        grid = np.stack(np.meshgrid(*[np.arange(int(budget // p) + 1) for p in price], indexing='ij'), axis=-1)
+        cand = grid.reshape(-1, len(price))
+        delta = (cand - current) * price
+        buys = np.where(delta > 0, delta, 0).sum(axis=1)
+        sells = np.where(delta < 0, -delta, 0).sum(axis=1)
+        feasible = (cand @ price <= budget) & (buys <= _RATIO * (cash + sells))
+        errors = ((cand * price - target) ** 2).sum(axis=1)
+        best = errors[feasible].min()
+        gaps.append((tracking_error(q, price, target) - best) / max(best, 1.0))   # 상대 오차 (원² 단위 부동소수 잡음 제거)
+    assert min(gaps) >= -1e-9
+    assert sum(g <= 1e-9 for g in gaps) >= 36, f'대부분 완전 탐색 최적과 동일, 실제 {sum(g <= 1e-9 for g in gaps)}/40'
+    print('✅ 최적화: 3종목 40개 중 대부분 완전 탐색 최적과 동일 (지역 최적)')
+
+
+def test_rounding_leftover_is_reallocated():
+    # 목표 50:50, 가격 60,000 — 절사는 각 1주(120,000원), 남는 80,000원으로 1주 더 살 수 있다.
+    price = np.array([60_000.0, 60_000.0])
+    budget = 200_000.0
+    q = optimize_integer_lots(np.array([100_000.0, 100_000.0]), price, np.array([0, 0]), budget + _BUFFER, budget, 1.0)
+    assert q.sum() == 3, f'끝수 현금으로 1주 추가, 실제 {q.tolist()}'
+    print('✅ 최적화: 절사 끝수 현금을 목표에 가까운 종목에 재배분')
+
+
+def _plan(allocation: pd.DataFrame, full_balance: pd.DataFrame, mode: str) -> pd.DataFrame:
+    return _mock_planner(allocation, full_balance, ExecutionPolicy(planner_mode=mode)).get_rebalancing_plan()
+
+
+def test_planner_optimize_mode():
+    allocation, full_balance = _random_portfolio(3, n_allocated=15, n_unallocated=2)
+    truncate = _plan(allocation, full_balance, 'truncate')
+    optimize = _plan(allocation, full_balance, 'optimize')
+
+    pd.testing.assert_series_equal(optimize['target_value'], truncate['target_value'])
+    liquidated = optimize['weight'] == 0
+    assert (optimize.loc[liquidated, 'required_transaction'] == 'sell').all(), '미등록 종목은 전량 매도 유지'
+    assert (optimize.loc[liquidated, 'required_quantity'] == optimize.loc[liquidated, 'current_quantity']).all()
+
+    def post_error(plan: pd.DataFrame) -> float:
+        rows = plan[~liquidated]
+        sign = np.where(rows['required_transaction'] == 'sell', -1, 1)
+        post = rows['current_quantity'] + sign * rows['required_quantity']
+        return tracking_error(post.to_numpy(), rows['current_price'].to_numpy(), rows['target_value'].to_numpy())
+
+    assert post_error(optimize) <= post_error(truncate)
+    assert optimize['required_quantity'].dtype == np.int64
+    print('✅ PortfolioPlanner: optimize 모드 — 목표 금액 동일, 수량만 교체, 미등록 종목 전량 매도 유지')
+
+
+def test_policy_rejects_unknown_planner_mode():
+    try:
+        ExecutionPolicy(planner_mode='ilp')
+    except ValueError:
+        print('✅ ExecutionPolicy: 알 수 없는 planner_mode 거부')
+        return
+    raise AssertionError('ValueError가 발생하지 않음')
+
+
+if __name__ == '__main__':
+    test_constraints_hold_and_never_worse_than_truncation()
+    test_close_to_exhaustive_optimum_on_small_problems()
+    test_rounding_leftover_is_reallocated()
+    test_planner_optimize_mode()
+    test_policy_rejects_unknown_planner_mode()
+    print('\n전체 테스트 통과')
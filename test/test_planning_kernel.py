@@ -0,0 +1,171 @@
+"""벡터화 플래너 커널 회귀 테스트.
+
+종전 DataFrame/lambda 구현(아래 `_legacy_plan`, 리팩터링 전 코드 그대로)과
+`PortfolioPlanner.get_rebalancing_plan` 결과가 값·dtype·행 순서까지 동일한지 검증한다:
+- 무작위 포트폴리오 (미보유 종목, 미등록 종목, 0 수량 포함) 다수 시드
+- 미등록 종목이 없는 경우 (concat 없음)
+- 커널 단독: 방향 None(required_value == 0) 및 전량 매도 행의 가격 0 처리
+
+실행: `uv run python -m test.test_planning_kernel`
+"""
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.planner import PortfolioPlanner
+from src.planning_kernel import apply_policy, compute_rebalance_arrays
+from src.policy import DEFAULT_EXECUTION_POLICY, ExecutionPolicy
+
+_BUFFER = DEFAULT_EXECUTION_POLICY.buffer_cash
+
+
+def _legacy_plan(allocation_info: pd.DataFrame, full_balance: pd.DataFrame, buffer_cash: int) -> pd.DataFrame:
+    """리팩터링 전 _create_total_info + get_rebalancing_plan 계산 경로 (참조 구현)."""
+    balance = full_balance.drop(columns=['stock_nm', 'current_price'])
+    total_balance_value = balance['current_value'].sum()
+    result = pd.merge(left=allocation_info, right=balance, on=['ticker'], how='left')
+    result[['current_quantity', 'current_value']] = result[['current_quantity', 'current_value']].fillna(0)
+    result['target_value'] = result['weight'] * int(total_balance_value - buffer_cash)
+    result['required_value'] = result['target_value'] - result['current_value']
+    result['required_quantity'] = abs((result['required_value'] / result['current_price']).astype(int))
+    result['required_transaction'] = result['required_value'].apply(lambda x: 'buy' if x > 0 else 'sell' if x < 0 else None)
+    result['current_pct'] = result['current_value'] / total_balance_value * 100
+
+    unallocated = full_balance[
+        ~full_balance['ticker'].isin(allocation_info['ticker']) &
+        (full_balance['ticker'] != 'CASH')
+    ].copy()
+    if not unallocated.empty:
+        total_balance = full_balance['current_value'].sum()
+        unallocated['category_1'] = None
+        unallocated['category_2'] = None
+        unallocated['weight'] = 0.0
+        unallocated['target_value'] = 0.0
+        unallocated['required_value'] = -unallocated['current_value']
+        unallocated['required_quantity'] = unallocated['current_quantity'].astype(int)
+        unallocated['required_transaction'] = 'sell'
+        unallocated['current_pct'] = unallocated['current_value'] / total_balance * 100
+        result = pd.concat([result, unallocated[result.columns]], ignore_index=True)
+    return result.sort_values(by='required_value', ascending=True).reset_index(drop=True)
+
+
+def _random_portfolio(seed: int, n_allocated: int, n_unallocated: int):
+    """(allocation_info, full_balance) 무작위 생성. allocation 일부는 미보유, 잔고 일부는 미등록."""
+    rng = np.random.default_rng(seed)
+    tickers = [f'{i:06d}' for i in range(n_allocated + n_unallocated)]
+    weights = rng.dirichlet(np.ones(n_allocated)) * rng.uniform(0.8, 1.0)
+    prices = rng.integers(1_000, 500_000, size=len(tickers)).astype(float)
+    allocation = pd.DataFrame({
+        'ticker': tickers[:n_allocated],
+        'stock_nm': [f'종목{i}' for i in range(n_allocated)],
+        'category_1': rng.choice(['주식', '채권'], size=n_allocated),
+        'category_2': rng.choice(['국내', '해외'], size=n_allocated),
+        'weight': weights,
+        'current_price': prices[:n_allocated],
+    })
+    held = [t for t in tickers[:n_allocated] if rng.random() < 0.7] + tickers[n_allocated:]
+    qty = rng.integers(0, 300, size=len(held))
+    held_prices = prices[[tickers.index(t) for t in held]]
+    full_balance = pd.DataFrame({
+        'ticker': held + ['CASH'],
+        'stock_nm': [f'보유{t}' for t in held] + ['예수금'],
+        'current_quantity': np.append(qty, 1),
+        'current_price': np.append(held_prices, 1.0),
+        'current_value': np.append(qty * held_prices, rng.integers(100_000, 5_000_000)),
+        'currency_type': 'KRW',
+    })
+    return allocation, full_balance
+
+
+def _mock_planner(allocation: pd.DataFrame, full_balance: pd.DataFrame, policy: ExecutionPolicy = None) -> PortfolioPlanner:
+    """_random_portfolio 결과로 PortfolioPlanner 생성 (KISClient는 MagicMock — 네트워크 없음).
+
+    시세 조회는 allocation의 current_price를 돌려주고, allocation에 없는 종목은 10,000원.
+    """
+    prices = allocation.set_index('ticker')['current_price']
+    kis_client = MagicMock()
+    kis_client.fetch_prices.side_effect = lambda tickers: prices.reindex(list(dict.fromkeys(tickers))).fillna(10_000.0)
+    kis_client.fetch_domestic_total_balance.return_value = full_balance
+    return PortfolioPlanner(kis_client, allocation.drop(columns=['current_price']), account_type='ISA', policy=policy)
+
+
+def _planner_plan(allocation: pd.DataFrame, full_balance: pd.DataFrame) -> pd.DataFrame:
+    return _mock_planner(allocation, full_balance).get_rebalancing_plan()
+
+
+def test_matches_legacy_on_random_portfolios():
+    for seed in range(20):
+        allocation, full_balance = _random_portfolio(seed, n_allocated=12, n_unallocated=seed % 4)
+        expected = _legacy_plan(allocation, full_balance, _BUFFER)
+        actual = _planner_plan(allocation, full_balance)
+        pd.testing.assert_frame_equal(actual, expected)
+    print('✅ 커널: 무작위 20개 포트폴리오에서 종전 구현과 값·dtype·순서 동일')
+
+
+def test_matches_legacy_with_integer_weights():
+    allocation = pd.DataFrame({'ticker': ['A', 'B'], 'weight': [1, 0], 'current_price': [100.0, 50.0]})
+    full_balance = pd.DataFrame({
+        'ticker': ['A', 'CASH'], 'stock_nm': ['a', '예수금'], 'current_quantity': [3, 1],
+        'current_price': [100.0, 1.0], 'current_value': [300.0, 1_000_000.0], 'currency_type': 'KRW',
+    })
+    expected = _legacy_plan(allocation, full_balance, _BUFFER)
+    actual = _planner_plan(allocation, full_balance)
+    pd.testing.assert_frame_equal(actual, expected)
+    print('✅ 커널: 정수 weight·미등록 종목 없음 → 종전 dtype 유지')
+
+
+def test_kernel_direction_and_liquidation():
+    out = compute_rebalance_arrays(
+        weight=np.array([0.5, 0.5, 0.0]),
+        current_price=np.array([100.0, 100.0, 0.0]),
+        current_quantity=np.array([5, 0, 7]),
+        current_value=np.array([500.0, 0.0, 0.0]),
+        liquidate=np.array([False, False, True]),
+        total_value=1_000.0,
+        target_base=1_000,
+    )
+    assert out['required_transaction'].tolist() == [None, 'buy', 'sell']
+    assert out['required_quantity'].tolist() == [0, 5, 7]
+    assert out['required_quantity'].dtype == np.int64
+    assert out['target_value'].tolist() == [500.0, 500.0, 0.0]
+    print('✅ 커널: 0 → None, 전량 매도 행은 가격 0이어도 보유 수량 그대로')
+
+
+def test_apply_policy_only_touches_given_rows():
+    """apply_policy(공용 후처리)는 rows 행만 바꾸고, 단독 포트폴리오로 계산한 결과와 같다."""
+    policy = ExecutionPolicy(planner_mode='optimize', drift_band_abs_pct=1.0, buffer_cash=0)
+    price = np.array([1_000.0, 3_000.0, 7_000.0])
+    quantity = np.array([40, 10, 0])
+    value = quantity * price
+    no_liquidation = np.zeros(3, dtype=bool)
+    kwargs = dict(weight=np.array([0.2, 0.3, 0.5]), current_price=price, current_quantity=quantity,
+                  current_value=value, liquidate=no_liquidation, total_value=200_000.0, target_base=200_000)
+
+    alone = compute_rebalance_arrays(**kwargs)
+    apply_policy(alone, np.arange(3), no_liquidation, price, quantity, value, 200_000.0, 200_000, policy)
+
+    # 같은 포트폴리오 두 개를 이어 붙이고 뒤쪽만 후처리
+    stacked_kwargs = {k: np.concatenate([v, v]) if isinstance(v, np.ndarray) else v for k, v in kwargs.items()}
+    stacked = compute_rebalance_arrays(**stacked_kwargs)
+    untouched = compute_rebalance_arrays(**kwargs)
+    apply_policy(stacked, np.arange(3, 6), np.zeros(6, dtype=bool), np.concatenate([price, price]),
+                 np.concatenate([quantity, quantity]), np.concatenate([value, value]), 200_000.0, 200_000, policy)
+    for name in ('required_quantity', 'required_transaction'):
+        assert stacked[name][:3].tolist() == untouched[name].tolist()
+        assert stacked[name][3:].tolist() == alone[name].tolist()
+    print('✅ 커널: apply_policy는 지정 행만 갱신, 단독 계산과 동일')
+
+
+if __name__ == '__main__':
+    test_matches_legacy_on_random_portfolios()
+    test_matches_legacy_with_integer_weights()
+    test_kernel_direction_and_liquidation()
+    test_apply_policy_only_touches_given_rows()
+    print('\n전체 테스트 통과')
@@ -0,0 +1,161 @@
+"""RunStateStore(실행 상태 저장소) 단위 테스트.
+
+검증:
+- SQLiteRunStateStore: run_id당 1행 (started → completed 갱신), completed는 started로 되돌리지 않음
+- 판정: completed 차단 / started 30분 미경과 차단 / 좀비(30분 경과) 허용 / 다른 계좌·구간 밖 허용
+- BigQueryRunStateStore: 스트리밍 insert(insertId), 테이블 미존재 시 생성 후 DML INSERT, 판정 쿼리 파티션 필터,
+  전환 기간(테이블이 판정 구간보다 새것)에만 trade_log 판정 병행
+
+실행: `uv run python -m test.test_run_state`
+"""
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytz
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.run_state import BigQueryRunStateStore, SQLiteRunStateStore
+
+_KST = pytz.timezone('Asia/Seoul')
+
+
+class _Clock:
+    def __init__(self, dt: datetime):
+        self.now = dt.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, minutes: float) -> None:
+        self.now += minutes * 60
+
+
+def _sqlite_store(tmp: str, clock: _Clock) -> SQLiteRunStateStore:
+    return SQLiteRunStateStore(Path(tmp) / 'run_state.sqlite3', clock=clock)
+
+
+# ---------------------------------------------------------------------------- #
+# SQLiteRunStateStore                                                          #
+# ---------------------------------------------------------------------------- #
+
+def test_sqlite_one_row_per_run_and_no_downgrade():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _sqlite_store(tmp, _Clock(_KST.localize(datetime(2026, 9, 21, 9, 5))))
+        store.mark_run('r1', 'ISA', status='started')
+        store.mark_run('r1', 'ISA', status='completed')
+        store.mark_run('r1', 'ISA', status='started')
+        rows = store._conn.execute('SELECT run_id, status, completed_at FROM run_state').fetchall()
+        store.close()
+    assert len(rows) == 1 and rows[0][1] == 'completed' and rows[0][2] is not None, rows
+    print('✅ SQLite: run_id당 1행, completed는 started로 되돌리지 않음')
+
+
+def test_sqlite_guard_semantics():
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = _Clock(_KST.localize(datetime(2026, 9, 21, 9, 5)))
+        store = _sqlite_store(tmp, clock)
+        today = date(2026, 9, 21)
+        assert store.is_already_executed('ISA', today) is False, '이력 없음'
+
+        store.mark_run('r1', 'ISA', status='started')
+        assert store.is_already_executed('ISA', today) is True, '진행 중(started 30분 미경과) 차단'
+        assert store.is_already_executed('PPA', today) is False, '다른 계좌는 무관'
+
+        clock.advance(31)
+        assert store.is_already_executed('ISA', today) is False, '좀비(30분 경과) → 재시도 허용'
+
+        store.mark_run('r2', 'ISA', status='started')
+        store.mark_run('r2', 'ISA', status='completed')
+        clock.advance(120)
+        assert store.is_already_executed('ISA', today) is True, 'completed 차단'
+        assert store.is_already_executed('ISA', today + timedelta(days=6)) is True, '7일 구간 안'
+        assert store.is_already_executed('ISA', today + timedelta(days=7)) is False, '7일 구간 밖'
+        store.close()
+    print('✅ SQLite: completed / 진행 중 차단, 좀비·다른 계좌·구간 밖 허용')
+
+
+# ---------------------------------------------------------------------------- #
+# BigQueryRunStateStore                                                        #
+# ---------------------------------------------------------------------------- #
+
+def _bq_store(created: datetime = None, found: bool = False) -> BigQueryRunStateStore:
+    bq_client = MagicMock()
+    bq_client.client.query.return_value.result.return_value = [MagicMock(run_id='r1')] if found else []
+    bq_client.client.get_table.return_value.created = created or datetime(2020, 1, 1, tzinfo=pytz.utc)
+    bq_client.is_already_executed.return_value = True
+    return BigQueryRunStateStore(bq_client, table_ref='p.d.run_state')
+
+
+def _params(job_config) -> dict:
+    return {p.name: p.value for p in job_config.query_parameters}
+
+
+def test_bq_mark_run_streams_event_with_insert_id():
+    store = _bq_store()
+    store.mark_run('r1', 'ISA', status='completed')
+
+    table_ref, rows = store.bq_client.stream_rows.call_args.args
+    assert table_ref == 'p.d.run_state'
+    assert store.bq_client.stream_rows.call_args.kwargs['row_ids'] == ['r1:completed'], 'insertId로 재시도 중복 제거'
+    assert rows[0]['run_id'] == 'r1' and rows[0]['account_type'] == 'ISA' and rows[0]['status'] == 'completed'
+    assert store.client.query.call_count == 0, 'query/load job 대기 없음'
+    assert store.client.load_table_from_dataframe.call_count == 0, 'trade_log marker 행 적재 없음'
+    print('✅ BigQuery: mark_run → run_state 스트리밍 insert 1건 (job 없음)')
+
+
+def test_bq_mark_run_creates_table_on_first_run():
+    from google.api_core.exceptions import NotFound
+    store = _bq_store()
+    store.bq_client.stream_rows.side_effect = NotFound('run_state')
+    store.mark_run('r1', 'ISA', status='started')
+
+    table = store.client.create_table.call_args.args[0]
+    assert store.client.create_table.call_args.kwargs['exists_ok'] is True
+    assert table.time_partitioning.field == 'run_date'
+    assert table.clustering_fields == ['account_type', 'run_id']
+    query = store.client.query.call_args.args[0]
+    assert 'INSERT INTO `p.d.run_state`' in query, '새 테이블은 DML INSERT로 1회 기록'
+    print('✅ BigQuery: 테이블 미존재 → 파티션·클러스터 테이블 생성 후 DML INSERT')
+
+
+def test_bq_guard_is_partition_pruned_lookup():
+    store = _bq_store(found=True)
+    assert store.is_already_executed('ISA', date(2026, 9, 21)) is True
+
+    query = store.client.query.call_args.args[0]
+    params = _params(store.client.query.call_args.kwargs['job_config'])
+    assert 'FROM `p.d.run_state`' in query and 'run_date BETWEEN @cutoff_date AND @target_date' in query and 'LIMIT 1' in query
+    assert "LOGICAL_OR(status = 'completed')" in query
+    assert params['cutoff_date'] == date(2026, 9, 15) and params['target_date'] == date(2026, 9, 21)
+    assert params['stale_minutes'] == 30
+    assert store.bq_client.is_already_executed.call_count == 0, '찾으면 trade_log 조회 없음'
+    print('✅ BigQuery: 판정 = run_state run_date 파티션 + LIMIT 1 조회')
+
+
+def test_bq_guard_legacy_fallback_only_during_transition():
+    # 테이블이 판정 구간보다 오래됨 → run_state만으로 판정
+    store = _bq_store(created=datetime(2026, 9, 1, tzinfo=pytz.utc))
+    assert store.is_already_executed('ISA', date(2026, 9, 21)) is False
+    assert store.bq_client.is_already_executed.call_count == 0
+
+    # 테이블이 어제 생성됨 → 그 이전 이력은 trade_log에만 있으므로 병행 판정
+    store = _bq_store(created=datetime(2026, 9, 20, tzinfo=pytz.utc))
+    assert store.is_already_executed('ISA', date(2026, 9, 21)) is True
+    store.bq_client.is_already_executed.assert_called_once_with('ISA', date(2026, 9, 21), 7)
+    print('✅ BigQuery: 전환 기간에만 trade_log 판정 병행')
+
+
+if __name__ == '__main__':
+    test_sqlite_one_row_per_run_and_no_downgrade()
+    test_sqlite_guard_semantics()
+    test_bq_mark_run_streams_event_with_insert_id()
+    test_bq_mark_run_creates_table_on_first_run()
+    test_bq_guard_is_partition_pruned_lookup()
+    test_bq_guard_legacy_fallback_only_during_transition()
+    print('\n전체 테스트 통과')
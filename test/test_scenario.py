@@ -0,0 +1,142 @@
+"""시나리오 일괄 평가(src/scenario.py, PortfolioPlanner.evaluate_scenarios) 단위 테스트.
+
+- 기본 시나리오: get_rebalancing_plan과 같은 계획 (목표·필요 금액/수량/방향/비중)
+- 가격 충격: 보유 평가금액·총자산·목표 금액이 함께 변함
+- 대체 비중·정책: 비중에서 빠진 보유 종목은 전량 매도, 신규 종목은 매수, buffer_cash 반영
+- 정책 후처리: optimize·허용 범위 시나리오는 해당 정책 플래너와 같은 계획
+- 시나리오 수와 무관하게 시세·잔고 조회 각 1회, 잘못된 입력 거부
+
+실행: `uv run python -m test.test_scenario`
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_dir.parent))
+
+from src.policy import ExecutionPolicy
+from src.scenario import Scenario
+from test_planning_kernel import _mock_planner, _random_portfolio
+
+_PLAN_COLUMNS = ['ticker', 'required_quantity', 'required_transaction']
+_VALUE_COLUMNS = ['target_value', 'required_value', 'current_pct']
+
+
+def _assert_same_plan(scenario_rows: pd.DataFrame, plan: pd.DataFrame) -> None:
+    scenario_rows = scenario_rows.reset_index(drop=True)
+    for name in _PLAN_COLUMNS:
+        assert list(scenario_rows[name]) == list(plan[name]), name
+    for name in _VALUE_COLUMNS:
+        np.testing.assert_allclose(scenario_rows[name].to_numpy(dtype=float), plan[name].to_numpy(dtype=float))
+
+
+def test_default_scenario_matches_rebalancing_plan():
+    allocation, full_balance = _random_portfolio(3, n_allocated=15, n_unallocated=2)
+    planner = _mock_planner(allocation, full_balance)
+    plan = planner.get_rebalancing_plan()
+    result = planner.evaluate_scenarios([Scenario('base')])
+    assert set(result['scenario']) == {'base'}
+    _assert_same_plan(result, plan)
+    assert list(result['stock_nm']) == list(plan['stock_nm'])
+    print('✅ 시나리오: 기본 시나리오 = get_rebalancing_plan')
+
+
+def test_price_shock_reprices_holdings():
+    allocation, full_balance = _random_portfolio(5, n_allocated=10, n_unallocated=1)
+    result = _mock_planner(allocation, full_balance).evaluate_scenarios(
+        [Scenario('base'), Scenario('crash', price_shock=-0.2)],
+    )
+    base, crash = (result[result['scenario'] == s].set_index('ticker').sort_index() for s in ('base', 'crash'))
+    np.testing.assert_allclose(crash['current_price'], base['current_price'] * 0.8)
+    np.testing.assert_allclose(crash['current_value'], base['current_value'] * 0.8)
+
+    cash = float(full_balance.loc[full_balance['ticker'] == 'CASH', 'current_value'].iloc[0])
+    stocks = float(full_balance['current_value'].sum()) - cash
+    crash_total = cash + 0.8 * stocks
+    np.testing.assert_allclose(crash['current_pct'], crash['current_value'] / crash_total * 100)
+    np.testing.assert_allclose(crash['target_value'], crash['weight'] * np.trunc(crash_total - 10_000))
+    print('✅ 시나리오: 가격 충격 → 보유 평가금액·총자산·목표 금액 재계산')
+
+
+def test_alternative_weights_and_buffer():
+    allocation, full_balance = _random_portfolio(7, n_allocated=6, n_unallocated=0)
+    held = full_balance.loc[(full_balance['ticker'] != 'CASH') & (full_balance['current_quantity'] > 0), 'ticker']
+    dropped = held.iloc[0]
+    weights = {t: 0.15 for t in allocation['ticker'] if t != dropped}
+    weights['NEW001'] = 0.1
+    result = _mock_planner(allocation, full_balance).evaluate_scenarios([
+        Scenario('rotate', weights=weights),
+        Scenario('big_buffer', policy=ExecutionPolicy(buffer_cash=1_000_000)),
+        Scenario('base'),
+    ])
+    assert list(dict.fromkeys(result['scenario'])) == ['rotate', 'big_buffer', 'base'], '입력 순서대로 쌓음'
+    rotate = result[result['scenario'] == 'rotate'].set_index('ticker')
+    assert rotate.loc[dropped, 'required_transaction'] == 'sell'
+    assert rotate.loc[dropped, 'required_quantity'] == rotate.loc[dropped, 'current_quantity'], '비중에서 빠진 보유 종목 전량 매도'
+    assert rotate.loc['NEW001', 'required_transaction'] == 'buy' and rotate.loc['NEW001', 'current_quantity'] == 0
+
+    targets = result.groupby('scenario')['target_value'].sum()
+    weight_sum = allocation['weight'].sum()
+    np.testing.assert_allclose(targets['base'] - targets['big_buffer'], (1_000_000 - 10_000) * weight_sum, atol=weight_sum)
+    print('✅ 시나리오: 대체 비중(전량 매도·신규 매수)·buffer_cash 정책 반영')
+
+
+def test_policy_scenarios_match_planner_with_that_policy():
+    allocation, full_balance = _random_portfolio(11, n_allocated=12, n_unallocated=2)
+    policies = {
+        'optimize': ExecutionPolicy(planner_mode='optimize'),
+        'banded': ExecutionPolicy(drift_band_abs_pct=1.0, min_trade_value=50_000),
+    }
+    result = _mock_planner(allocation, full_balance).evaluate_scenarios(
+        [Scenario(name, policy=policy) for name, policy in policies.items()],
+    )
+    for name, policy in policies.items():
+        plan = _mock_planner(allocation, full_balance, policy).get_rebalancing_plan()
+        rows = result[result['scenario'] == name].set_index('ticker').loc[plan['ticker']].reset_index()
+        _assert_same_plan(rows, plan)
+    print('✅ 시나리오: optimize·허용 범위 정책 시나리오 = 해당 정책 플래너 계획')
+
+
+def test_many_scenarios_fetch_snapshot_once():
+    allocation, full_balance = _random_portfolio(13, n_allocated=30, n_unallocated=3)
+    planner = _mock_planner(allocation, full_balance)
+    rng = np.random.default_rng(0)
+    scenarios = [Scenario(f'shock_{i}', price_shock=float(rng.normal(0, 0.05))) for i in range(300)]
+    result = planner.evaluate_scenarios(scenarios)
+    assert planner.kis_client.fetch_prices.call_count == 1
+    assert planner.kis_client.fetch_domestic_total_balance.call_count == 1
+    assert result['scenario'].nunique() == 300 and len(result) == 300 * 33
+    print('✅ 시나리오: 300개 평가에 시세·잔고 조회 각 1회')
+
+
+def test_invalid_scenarios_rejected():
+    allocation, full_balance = _random_portfolio(1, n_allocated=5, n_unallocated=0)
+    planner = _mock_planner(allocation, full_balance)
+    invalid = [
+        [Scenario('a'), Scenario('a')],
+        [Scenario('over', weights={allocation['ticker'][0]: 0.7, allocation['ticker'][1]: 0.5})],
+        [Scenario('zero_price', prices={allocation['ticker'][0]: 0.0})],
+        [Scenario('no_cash', policy=ExecutionPolicy(buffer_cash=10**12))],
+    ]
+    for scenarios in invalid:
+        try:
+            planner.evaluate_scenarios(scenarios)
+        except ValueError:
+            continue
+        raise AssertionError(f'ValueError가 발생하지 않음: {scenarios}')
+    print('✅ 시나리오: 이름 중복·비중 초과·가격 0·버퍼 초과 거부')
+
+
+if __name__ == '__main__':
+    test_default_scenario_matches_rebalancing_plan()
+    test_price_shock_reprices_holdings()
+    test_alternative_weights_and_buffer()
+    test_policy_scenarios_match_planner_with_that_policy()
+    test_many_scenarios_fetch_snapshot_once()
+    test_invalid_scenarios_rejected()
+    print('\n전체 테스트 통과')
@@ -0,0 +1,103 @@
+"""결과 sink 파이프라인(src/sinks.py) 단위 테스트.
+
+검증:
+- 동시 실행: 전체 시간 ≈ max(sink), sum 아님
+- sink별 재시도: 실패 후 backoff(2배)로 재시도, max_attempts 소진 시 error로 반환 (예외 삼키지 않음)
+- sink별 마감: 느린 sink는 TimeoutError로 기록되고 다른 sink 결과를 막지 않음
+- 설정 검증: 이름 중복·잘못된 재시도/마감 값 → ValueError
+
+실행: `uv run python -m test.test_sinks`
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.sinks import Sink, dispatch
+
+
+def test_sinks_run_concurrently():
+    delays = {'slack': 0.2, 'sheets': 0.2, 'bigquery': 0.3}
+    sinks = [Sink(name, lambda d=d: time.sleep(d)) for name, d in delays.items()]
+    started = time.perf_counter()
+    outcomes = dispatch(sinks)
+    elapsed = time.perf_counter() - started
+
+    assert all(o.ok and o.attempts == 1 for o in outcomes.values())
+    assert elapsed < sum(delays.values()) - 0.2, f'max(sink) 수준이어야 함, 실제 {elapsed:.2f}s'
+    assert list(outcomes) == list(delays), '등록 순서 유지'
+    print(f'✅ sink 동시 실행: {elapsed:.2f}s (합 {sum(delays.values()):.1f}s)')
+
+
+def test_retry_with_backoff_then_success():
+    calls, sleeps = [], []
+
+    def _flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError('일시 오류')
+
+    outcomes = dispatch([Sink('slack', _flaky, max_attempts=3, backoff_seconds=0.5)], sleep=sleeps.append)
+    assert outcomes['slack'].ok and outcomes['slack'].attempts == 3
+    assert sleeps == [0.5, 1.0], f'지수 backoff, 실제 {sleeps}'
+    print('✅ sink 재시도: 실패 2회 후 성공, backoff 0.5→1.0')
+
+
+def test_exhausted_retries_return_error_without_blocking_others():
+    done = threading.Event()
+
+    def _broken():
+        raise RuntimeError('BQ down')
+
+    outcomes = dispatch([
+        Sink('bigquery', _broken, max_attempts=2, backoff_seconds=0),
+        Sink('slack', done.set),
+    ], sleep=lambda s: None)
+    assert outcomes['bigquery'].attempts == 2 and isinstance(outcomes['bigquery'].error, RuntimeError)
+    assert outcomes['slack'].ok and done.is_set(), '다른 sink는 정상 완료'
+    print('✅ sink 실패: 재시도 소진 후 error 반환, 다른 sink 영향 없음')
+
+
+def test_slow_sink_times_out_without_delaying_others():
+    release = threading.Event()
+    started = time.perf_counter()
+    outcomes = dispatch([
+        Sink('sheets', lambda: release.wait(5), timeout_seconds=0.2),
+        Sink('slack', lambda: None),
+    ])
+    elapsed = time.perf_counter() - started
+    release.set()
+
+    assert isinstance(outcomes['sheets'].error, TimeoutError)
+    assert outcomes['slack'].ok
+    assert elapsed < 1.0, f'마감(0.2s) 뒤 바로 반환, 실제 {elapsed:.2f}s'
+    print('✅ sink 마감: 느린 sink는 TimeoutError, 전체 대기는 마감까지만')
+
+
+def test_invalid_sink_config_rejected():
+    for kwargs in ({'max_attempts': 0}, {'timeout_seconds': 0}, {'backoff_seconds': -1}):
+        try:
+            Sink('x', lambda: None, **kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f'{kwargs} → ValueError 기대')
+    try:
+        dispatch([Sink('x', lambda: None), Sink('x', lambda: None)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('이름 중복 → ValueError 기대')
+    print('✅ sink 설정 검증: 잘못된 값·이름 중복 거부')
+
+
+if __name__ == '__main__':
+    test_sinks_run_concurrently()
+    test_retry_with_backoff_then_success()
+    test_exhausted_retries_return_error_without_blocking_others()
+    test_slow_sink_times_out_without_delaying_others()
+    test_invalid_sink_config_rejected()
+    print('\n전체 테스트 통과')
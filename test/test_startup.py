@@ -0,0 +1,70 @@
+"""시작 단계 동시 초기화(init_concurrently) 단위 테스트.
+
+네트워크 없이 sleep 팩토리로 다음을 검증한다:
+- 독립 작업은 동시에 실행 (총 소요 ≈ 가장 느린 작업)
+- 팩토리 None → 실행하지 않고 결과 None (--test의 BigQuery)
+- 실패 시 다른 작업은 끝까지 실행되고, 원래 예외 타입이 전파
+
+실행: `uv run python -m test.test_startup`
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve()
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from src.startup import init_concurrently
+
+
+def _slow(value, seconds: float = 0.2):
+    def _factory():
+        time.sleep(seconds)
+        return value
+    return _factory
+
+
+def test_independent_factories_run_concurrently():
+    started = time.perf_counter()
+    results = init_concurrently({'sheets': _slow('gs'), 'bigquery': _slow('bq'), 'kis': _slow('kis')})
+    elapsed = time.perf_counter() - started
+    assert results == {'sheets': 'gs', 'bigquery': 'bq', 'kis': 'kis'}
+    assert elapsed < 0.5, f'0.2s × 3 작업이 동시 실행되어야 함, 실제 {elapsed:.2f}s'
+    print(f'✅ startup: 3개 작업 동시 초기화 ({elapsed:.2f}s < 직렬 0.6s)')
+
+
+def test_none_factory_is_skipped():
+    results = init_concurrently({'sheets': _slow('gs', 0), 'bigquery': None})
+    assert results == {'sheets': 'gs', 'bigquery': None}
+    assert init_concurrently({'bigquery': None}) == {'bigquery': None}
+    print('✅ startup: 팩토리 None → 미실행, 결과 None')
+
+
+def test_failure_propagates_after_others_finish():
+    finished = threading.Event()
+
+    def _kis():
+        time.sleep(0.1)
+        finished.set()
+        return 'kis'
+
+    def _sheets():
+        raise PermissionError('sheet 권한 없음')
+
+    try:
+        init_concurrently({'sheets': _sheets, 'kis': _kis})
+    except PermissionError as e:
+        assert 'sheet' in str(e)
+    else:
+        raise AssertionError('PermissionError가 전파되어야 함')
+    assert finished.is_set(), '실패와 무관한 작업은 끝까지 실행'
+    print('✅ startup: 실패 예외 타입 보존 + 다른 작업 완료 후 전파')
+
+
+if __name__ == '__main__':
+    test_independent_factories_run_concurrently()
+    test_none_factory_is_skipped()
+    test_failure_propagates_after_others_finish()
+    print('\n전체 테스트 통과')